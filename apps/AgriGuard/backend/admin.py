@@ -39,6 +39,27 @@ class AdminAuth(AuthenticationBackend):
 # ── Model Views ─────────────────────────────────────────────
 
 
+class _InvalidatesDashboardSummary:
+    """Admin edits bypass the API write paths, so mark the materialized summary stale."""
+
+    async def after_model_change(self, data: dict, model, is_created: bool, request: Request) -> None:
+        _mark_dashboard_summary_stale()
+
+    async def after_model_delete(self, model, request: Request) -> None:
+        _mark_dashboard_summary_stale()
+
+
+def _mark_dashboard_summary_stale() -> None:
+    from database import SessionLocal
+    from services.dashboard_summary import mark_summary_stale
+
+    db = SessionLocal()
+    try:
+        mark_summary_stale(db)
+    finally:
+        db.close()
+
+
 class UserAdmin(ModelView, model=User):
     name = "User"
     name_plural = "Users"
@@ -52,7 +73,7 @@ class UserAdmin(ModelView, model=User):
     page_size = 25
 
 
-class ProductAdmin(ModelView, model=Product):
+class ProductAdmin(_InvalidatesDashboardSummary, ModelView, model=Product):
     name = "Product"
     name_plural = "Products"
     icon = "fa-solid fa-box"
@@ -87,7 +108,7 @@ class ProductAdmin(ModelView, model=Product):
             db.close()
 
 
-class TrackingEventAdmin(ModelView, model=TrackingEvent):
+class TrackingEventAdmin(_InvalidatesDashboardSummary, ModelView, model=TrackingEvent):
     name = "Tracking Event"
     name_plural = "Tracking Events"
     icon = "fa-solid fa-truck"
@@ -106,7 +127,7 @@ class TrackingEventAdmin(ModelView, model=TrackingEvent):
     page_size = 50
 
 
-class CertificateAdmin(ModelView, model=Certificate):
+class CertificateAdmin(_InvalidatesDashboardSummary, ModelView, model=Certificate):
     name = "Certificate"
     name_plural = "Certificates"
     icon = "fa-solid fa-certificate"
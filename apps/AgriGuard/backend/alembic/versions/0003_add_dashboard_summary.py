@@ -0,0 +1,39 @@
+"""Add materialized dashboard summary tables
+
+Revision ID: 0003_add_dashboard_summary
+Revises: 0002_add_qr_scan_events
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0003_add_dashboard_summary"
+down_revision = "0002_add_qr_scan_events"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Counters start empty; the first dashboard read rebuilds them from the source tables.
+    op.create_table(
+        "dashboard_counters",
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("value", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    op.create_table(
+        "product_latest_status",
+        sa.Column("product_id", sa.String(), nullable=False),
+        sa.Column("status", sa.String(), nullable=True),
+        sa.Column("timestamp", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("product_id"),
+    )
+    op.create_index("ix_product_latest_status_status", "product_latest_status", ["status"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_product_latest_status_status", table_name="product_latest_status")
+    op.drop_table("product_latest_status")
+    op.drop_table("dashboard_counters")
@@ -2,7 +2,7 @@ import uuid
 from datetime import UTC, datetime
 
 from database import Base
-from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Index, String, Text
+from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 
@@ -34,6 +34,7 @@ class Product(Base):
     # Relationships
     tracking_history = relationship("TrackingEvent", back_populates="product", cascade="all, delete-orphan")
     certificates = relationship("Certificate", back_populates="product", cascade="all, delete-orphan")
+    latest_status = relationship("ProductLatestStatus", cascade="all, delete-orphan", uselist=False)
 
 
 class TrackingEvent(Base):
@@ -85,6 +86,26 @@ class Certificate(Base):
     product = relationship("Product", back_populates="certificates")
 
 
+class DashboardCounter(Base):
+    """Materialized supply-chain dashboard counters (see services/dashboard_summary.py)."""
+
+    __tablename__ = "dashboard_counters"
+
+    key = Column(String, primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+
+
+class ProductLatestStatus(Base):
+    """Latest tracking status per product, maintained alongside DashboardCounter."""
+
+    __tablename__ = "product_latest_status"
+    __table_args__ = (Index("ix_product_latest_status_status", "status"),)
+
+    product_id = Column(String, ForeignKey("products.id", ondelete="CASCADE"), primary_key=True)
+    status = Column(String)
+    timestamp = Column(DateTime)
+
+
 class SensorReading(Base):
     __tablename__ = "sensor_readings"
     __table_args__ = (
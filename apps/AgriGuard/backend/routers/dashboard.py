@@ -4,7 +4,9 @@ import models
 import schemas
 from dependencies import get_cache, get_db
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session, selectinload
+from services.dashboard_summary import read_supply_chain_summary
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
 
 
 router = APIRouter()
@@ -17,29 +19,6 @@ DEMO_ACTIVE_CYCLES = 25
 DEMO_COMPLETED_CYCLES = 102
 
 
-def _get_latest_status_per_product(product: models.Product) -> str | None:
-    if not product.tracking_history:
-        return None
-    return max(product.tracking_history, key=lambda event: event.timestamp).status
-
-
-def _build_status_distribution(products: list[models.Product]) -> dict:
-    distribution = {}
-    for product in products:
-        latest_status = _get_latest_status_per_product(product)
-        if latest_status:
-            distribution[latest_status] = distribution.get(latest_status, 0) + 1
-    return distribution
-
-
-def _build_origin_distribution(products: list[models.Product]) -> dict:
-    distribution = {}
-    for product in products:
-        origin = product.origin or "Unknown"
-        distribution[origin] = distribution.get(origin, 0) + 1
-    return distribution
-
-
 def _format_tracking_event_as_activity(event: models.TrackingEvent) -> dict:
     return {
         "timestamp": event.timestamp.isoformat() + "Z",
@@ -59,13 +38,11 @@ async def get_frontend_dashboard_summary(db: Session = Depends(get_db)):
     if cached is not None:
         return cached
 
-    farmer_count = db.query(models.User).filter(models.User.role == "Farmer").count()
-    total_products = db.query(models.Product).count()
-    harvested_products = (
-        db.query(models.Product)
-        .filter(models.Product.harvest_date != None)  # noqa: E711 - SQLAlchemy uses IS NOT NULL here
-        .count()
-    )
+    farmers = select(func.count(models.User.id)).where(models.User.role == "Farmer").scalar_subquery()
+    # One round trip: COUNT(harvest_date) skips NULLs, i.e. counts harvested products
+    total_products, harvested_products, farmer_count = db.execute(
+        select(func.count(models.Product.id), func.count(models.Product.harvest_date), farmers)
+    ).one()
     active_cycles = total_products - harvested_products
 
     recent_events = (
@@ -109,26 +86,6 @@ async def get_supply_chain_summary(db: Session = Depends(get_db)):
     if cached is not None:
         return cached
 
-    products = (
-        db.query(models.Product)
-        .options(
-            selectinload(models.Product.certificates),
-            selectinload(models.Product.tracking_history),
-        )
-        .all()
-    )
-
-    certified_count = sum(1 for product in products if product.certificates)
-    cold_chain_count = sum(1 for product in products if product.requires_cold_chain)
-    total_tracking_events = sum(len(product.tracking_history) for product in products)
-
-    result = {
-        "total_products": len(products),
-        "certified_products": certified_count,
-        "cold_chain_products": cold_chain_count,
-        "total_tracking_events": total_tracking_events,
-        "status_distribution": _build_status_distribution(products),
-        "origin_distribution": _build_origin_distribution(products),
-    }
+    result = read_supply_chain_summary(db)
     await cache.set("agriguard:dashboard:supply_chain", result, ttl=30)
     return result
@@ -8,6 +8,7 @@ from auth import get_current_user
 from dependencies import get_db
 from fastapi import APIRouter, Depends, HTTPException
 from services.chain_simulator import get_chain
+from services.dashboard_summary import record_certification, record_product_created, record_tracking_event
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
@@ -44,6 +45,7 @@ def create_product(
     )
     try:
         db.add(db_product)
+        record_product_created(db, db_product)
         db.commit()
         db.refresh(db_product)
     except Exception as e:
@@ -90,6 +92,7 @@ def add_certification(
         raise HTTPException(status_code=404, detail="Product not found")
 
     try:
+        record_certification(db, product_id)
         cert_id = f"CERT-{uuid.uuid4().hex[:8].upper()}"
         new_cert = models.Certificate(
             cert_id=cert_id,
@@ -140,6 +143,7 @@ def add_tracking_event(
             handler_id=handler_id,
         )
         db.add(event)
+        record_tracking_event(db, event)
         db.commit()
         db.refresh(event)
     except Exception as e:
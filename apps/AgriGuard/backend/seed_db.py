@@ -4,6 +4,7 @@ from datetime import UTC, datetime, timedelta
 
 import models
 from database import SessionLocal, initialize_database
+from services.dashboard_summary import mark_summary_stale
 
 initialize_database()
 
@@ -72,6 +73,8 @@ def seed_db():
             db.add(event)
 
         db.commit()
+        # Bulk inserts bypass the API write paths; rebuild dashboard counters on next read
+        mark_summary_stale(db)
         print("Database seeded successfully with Users, Products, and Events.")
 
     except Exception as e:
@@ -0,0 +1,217 @@
+"""
+Materialized supply-chain summary for the dashboard.
+
+Counters live in ``dashboard_counters`` and the latest tracking status per
+product in ``product_latest_status``. Write paths (product creation, tracking
+events, certifications) update them in the same transaction, so reading the
+summary costs a handful of rows regardless of catalogue size.
+
+When the counters have never been built (fresh DB, seed script, admin edits
+that bypass the API) the first read rebuilds them with SQL-side aggregation:
+a ``ROW_NUMBER()`` window for the latest status and grouped counts for the rest.
+Rebuilds take a lock row first, so concurrent first reads run one after the
+other and the later ones find the summary already built.
+"""
+
+from datetime import UTC, datetime
+
+import models
+from sqlalchemy import case, delete, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+BUILT_KEY = "_meta:built"
+REBUILD_LOCK_KEY = "_meta:rebuild_lock"
+TOTAL_PRODUCTS = "products:total"
+CERTIFIED_PRODUCTS = "products:certified"
+COLD_CHAIN_PRODUCTS = "products:cold_chain"
+TOTAL_TRACKING_EVENTS = "tracking_events:total"
+STATUS_PREFIX = "status:"
+ORIGIN_PREFIX = "origin:"
+
+
+def _naive_utc(value: datetime | None) -> datetime | None:
+    # DateTime columns are stored without tzinfo; compare on the same footing.
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
+
+
+def _origin_label(origin: str | None) -> str:
+    return origin or "Unknown"
+
+
+def is_summary_built(db: Session) -> bool:
+    return db.get(models.DashboardCounter, BUILT_KEY) is not None
+
+
+def _bump(db: Session, key: str, delta: int = 1) -> None:
+    # Single-statement upsert: concurrent first writes of the same key both
+    # succeed instead of one failing on the primary key.
+    upsert = postgresql_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    stmt = upsert(models.DashboardCounter).values(key=key, value=delta)
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[models.DashboardCounter.key],
+            set_={"value": models.DashboardCounter.value + stmt.excluded.value},
+        )
+    )
+
+
+def _lock_rebuild(db: Session) -> None:
+    # No-op upsert on a dedicated row: holds its row lock (SQLite: the write
+    # lock) until the transaction ends, so rebuilds never interleave.
+    _bump(db, REBUILD_LOCK_KEY, 0)
+
+
+def rebuild_summary(db: Session) -> None:
+    """Recompute every counter from the source tables and commit."""
+    _lock_rebuild(db)
+    _rebuild_locked(db)
+
+
+def _rebuild_locked(db: Session) -> None:
+    db.execute(delete(models.DashboardCounter).where(models.DashboardCounter.key != REBUILD_LOCK_KEY))
+    db.execute(delete(models.ProductLatestStatus))
+
+    ranked = select(
+        models.TrackingEvent.product_id,
+        models.TrackingEvent.status,
+        models.TrackingEvent.timestamp,
+        func.row_number()
+        .over(
+            partition_by=models.TrackingEvent.product_id,
+            order_by=(models.TrackingEvent.timestamp.desc(), models.TrackingEvent.id.desc()),
+        )
+        .label("rn"),
+    ).subquery()
+    db.execute(
+        insert(models.ProductLatestStatus).from_select(
+            ["product_id", "status", "timestamp"],
+            select(ranked.c.product_id, ranked.c.status, ranked.c.timestamp).where(ranked.c.rn == 1),
+        )
+    )
+
+    total_products, cold_chain_products = db.execute(
+        select(
+            func.count(models.Product.id),
+            func.count(case((models.Product.requires_cold_chain.is_(True), 1))),
+        )
+    ).one()
+    certified_products = db.scalar(select(func.count(func.distinct(models.Certificate.product_id))))
+    total_tracking_events = db.scalar(select(func.count(models.TrackingEvent.id)))
+
+    counters = {
+        TOTAL_PRODUCTS: total_products,
+        CERTIFIED_PRODUCTS: certified_products or 0,
+        COLD_CHAIN_PRODUCTS: cold_chain_products,
+        TOTAL_TRACKING_EVENTS: total_tracking_events or 0,
+        BUILT_KEY: 1,
+    }
+
+    status_counts = db.execute(
+        select(models.ProductLatestStatus.status, func.count())
+        .where(models.ProductLatestStatus.status.is_not(None), models.ProductLatestStatus.status != "")
+        .group_by(models.ProductLatestStatus.status)
+    ).all()
+    for status, count in status_counts:
+        counters[STATUS_PREFIX + status] = count
+
+    origin = func.coalesce(func.nullif(models.Product.origin, ""), "Unknown")
+    for origin_label, count in db.execute(select(origin, func.count()).group_by(origin)).all():
+        counters[ORIGIN_PREFIX + origin_label] = count
+
+    db.add_all(models.DashboardCounter(key=key, value=value) for key, value in counters.items())
+    db.commit()
+
+
+def mark_summary_stale(db: Session) -> None:
+    """Force a rebuild on the next read (after writes that bypass the API)."""
+    db.execute(delete(models.DashboardCounter).where(models.DashboardCounter.key == BUILT_KEY))
+    db.commit()
+
+
+def record_product_created(db: Session, product: models.Product) -> None:
+    """Account for a new product. Call before committing the product insert."""
+    if not is_summary_built(db):
+        return
+    _bump(db, TOTAL_PRODUCTS)
+    _bump(db, ORIGIN_PREFIX + _origin_label(product.origin))
+    if product.requires_cold_chain:
+        _bump(db, COLD_CHAIN_PRODUCTS)
+
+
+def record_tracking_event(db: Session, event: models.TrackingEvent) -> None:
+    """Account for a new tracking event. Call before committing the event insert."""
+    if not is_summary_built(db):
+        return
+    _bump(db, TOTAL_TRACKING_EVENTS)
+
+    event_ts = _naive_utc(event.timestamp)
+    latest = db.get(models.ProductLatestStatus, event.product_id)
+    if latest is None:
+        db.add(models.ProductLatestStatus(product_id=event.product_id, status=event.status, timestamp=event_ts))
+        previous_status = None
+    elif latest.timestamp is None or event_ts is None or event_ts >= _naive_utc(latest.timestamp):
+        previous_status = latest.status
+        latest.status = event.status
+        latest.timestamp = event_ts
+    else:
+        return  # back-dated event; the latest status is unchanged
+
+    if previous_status == event.status:
+        return
+    if previous_status:
+        _bump(db, STATUS_PREFIX + previous_status, -1)
+    if event.status:
+        _bump(db, STATUS_PREFIX + event.status)
+
+
+def record_certification(db: Session, product_id: str) -> None:
+    """Account for a new certificate. Call before the certificate is added to the session."""
+    if not is_summary_built(db):
+        return
+    # Lock the counter row first (a no-op upsert), so concurrent first
+    # certificates of one product are serialized and only one of them sees
+    # no earlier certificate.
+    _bump(db, CERTIFIED_PRODUCTS, 0)
+    already_certified = db.scalar(
+        select(models.Certificate.cert_id).where(models.Certificate.product_id == product_id).limit(1)
+    )
+    if already_certified is None:
+        _bump(db, CERTIFIED_PRODUCTS)
+
+
+def read_supply_chain_summary(db: Session) -> dict:
+    """Return the supply-chain summary from the materialized counters."""
+    if not is_summary_built(db):
+        _lock_rebuild(db)
+        # Another request may have rebuilt the summary while we waited for the lock.
+        if is_summary_built(db):
+            db.commit()
+        else:
+            _rebuild_locked(db)
+
+    status_distribution: dict[str, int] = {}
+    origin_distribution: dict[str, int] = {}
+    counters: dict[str, int] = {}
+    rows = db.execute(
+        select(models.DashboardCounter.key, models.DashboardCounter.value).where(models.DashboardCounter.value > 0)
+    ).all()
+    for key, value in rows:
+        if key.startswith(STATUS_PREFIX):
+            status_distribution[key[len(STATUS_PREFIX) :]] = value
+        elif key.startswith(ORIGIN_PREFIX):
+            origin_distribution[key[len(ORIGIN_PREFIX) :]] = value
+        else:
+            counters[key] = value
+
+    return {
+        "total_products": counters.get(TOTAL_PRODUCTS, 0),
+        "certified_products": counters.get(CERTIFIED_PRODUCTS, 0),
+        "cold_chain_products": counters.get(COLD_CHAIN_PRODUCTS, 0),
+        "total_tracking_events": counters.get(TOTAL_TRACKING_EVENTS, 0),
+        "status_distribution": status_distribution,
+        "origin_distribution": origin_distribution,
+    }
@@ -6,7 +6,7 @@ Dashboard Router 통합 테스트 — demo mode fallback, 캐시 동작, 집계
   - GET / : health check
   - GET /api/v1/dashboard/summary : 실데이터 + demo mode fallback + 캐시 히트
   - GET /dashboard/summary : 공급망 집계, eager-load 결과 검증
-  - _build_status_distribution / _build_origin_distribution : 헬퍼 함수 엣지 케이스
+  - services/dashboard_summary : 분포 집계 엣지 케이스, 증분 갱신 == 재구성
 """
 
 from __future__ import annotations
@@ -17,7 +17,7 @@ import os
 os.environ["DATABASE_URL"] = "sqlite://"
 
 from datetime import UTC, datetime
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import models
 import pytest
@@ -273,50 +273,61 @@ def test_supply_chain_summary_with_data(client, db_session):
 # ══════════════════════════════════════════════════════════════════════════════
 
 
-class TestBuildStatusDistribution:
+class TestSummaryStatusDistribution:
 
-    def test_empty_products(self):
-        assert dashboard._build_status_distribution([]) == {}
+    def test_empty_products(self, db_session):
+        from services.dashboard_summary import read_supply_chain_summary
+
+        assert read_supply_chain_summary(db_session)["status_distribution"] == {}
 
     def test_products_without_tracking_history(self, db_session):
         """tracking_history가 빈 제품 → distribution에 포함되지 않음."""
-        p = _seed_product(db_session, product_id="no-history")
-        # SQLAlchemy lazy-load를 위해 refresh
-        db_session.refresh(p)
-        result = dashboard._build_status_distribution([p])
-        assert result == {}
+        from services.dashboard_summary import read_supply_chain_summary
+
+        _seed_product(db_session, product_id="no-history")
+        assert read_supply_chain_summary(db_session)["status_distribution"] == {}
 
     def test_multiple_products_aggregation(self, db_session):
-        p1 = _seed_product(db_session, product_id="agg-1")
-        p2 = _seed_product(db_session, product_id="agg-2")
+        from services.dashboard_summary import read_supply_chain_summary
+
+        _seed_product(db_session, product_id="agg-1")
+        _seed_product(db_session, product_id="agg-2")
         _seed_tracking_event(db_session, "agg-1", status="delivered")
         _seed_tracking_event(db_session, "agg-2", status="delivered")
-        db_session.refresh(p1)
-        db_session.refresh(p2)
 
-        result = dashboard._build_status_distribution([p1, p2])
-        assert result == {"delivered": 2}
+        assert read_supply_chain_summary(db_session)["status_distribution"] == {"delivered": 2}
+
 
+class TestSummaryOriginDistribution:
 
-class TestBuildOriginDistribution:
+    def test_empty_products(self, db_session):
+        from services.dashboard_summary import read_supply_chain_summary
 
-    def test_empty_products(self):
-        assert dashboard._build_origin_distribution([]) == {}
+        assert read_supply_chain_summary(db_session)["origin_distribution"] == {}
 
     def test_null_origin_defaults_to_unknown(self, db_session):
-        """origin이 None인 제품 → 'Unknown'으로 집계."""
-        p = _seed_product(db_session, product_id="null-origin", origin=None)
-        db_session.refresh(p)
-        result = dashboard._build_origin_distribution([p])
-        assert result == {"Unknown": 1}
+        """origin이 None인 제품 → 'Unknown'으로 집계 (재구성과 증분 갱신 모두)."""
+        from services.dashboard_summary import read_supply_chain_summary, record_product_created
+
+        _seed_product(db_session, product_id="null-origin", origin=None)
+        assert read_supply_chain_summary(db_session)["origin_distribution"] == {"Unknown": 1}
+
+        product = models.Product(
+            id="null-origin-2", owner_id="farmer-1", qr_code="agri://verify/null-origin-2", name="n", origin=None
+        )
+        db_session.add(product)
+        record_product_created(db_session, product)
+        db_session.commit()
+        assert read_supply_chain_summary(db_session)["origin_distribution"] == {"Unknown": 2}
 
     def test_diverse_origins(self, db_session):
+        from services.dashboard_summary import read_supply_chain_summary
+
         _seed_product(db_session, product_id="o-1", origin="Naju")
         _seed_product(db_session, product_id="o-2", origin="Naju")
         _seed_product(db_session, product_id="o-3", origin="Jeju")
-        products = db_session.query(models.Product).all()
 
-        result = dashboard._build_origin_distribution(products)
+        result = read_supply_chain_summary(db_session)["origin_distribution"]
         assert result["Naju"] == 2
         assert result["Jeju"] == 1
 
@@ -333,3 +344,175 @@ class TestFormatTrackingEventAsActivity:
         assert "in_transit" in result["event"]
         assert "Seoul Hub" in result["event"]
         assert result["timestamp"].endswith("Z")
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  Materialized summary — services/dashboard_summary.py
+# ══════════════════════════════════════════════════════════════════════════════
+
+
+class TestMaterializedSummary:
+
+    def test_latest_status_per_product_from_window_rebuild(self, client, db_session):
+        """윈도 함수 재구성: 제품별 가장 최근 이벤트의 status만 집계."""
+        _seed_product(db_session, product_id="w-1")
+        _seed_product(db_session, product_id="w-2")
+        for product_id, status, hour in [
+            ("w-1", "in_transit", 1),
+            ("w-1", "delivered", 3),
+            ("w-1", "inspected", 2),
+            ("w-2", "in_transit", 5),
+        ]:
+            db_session.add(
+                models.TrackingEvent(
+                    product_id=product_id,
+                    status=status,
+                    location="Seoul",
+                    handler_id="h",
+                    timestamp=datetime(2026, 1, 1, hour, tzinfo=UTC),
+                )
+            )
+        db_session.commit()
+
+        with patch.object(dashboard, "get_cache", return_value=_NoOpCache()):
+            payload = client.get("/dashboard/summary").json()
+
+        assert payload["status_distribution"] == {"delivered": 1, "in_transit": 1}
+        assert payload["total_tracking_events"] == 4
+
+    def test_summary_served_from_counters_until_marked_stale(self, client, db_session):
+        """API를 우회한 쓰기는 stale 표시 전까지 반영되지 않음 → rebuild 후 반영."""
+        from services.dashboard_summary import mark_summary_stale
+
+        _seed_product(db_session, product_id="m-1", origin="Naju")
+        with patch.object(dashboard, "get_cache", return_value=_NoOpCache()):
+            assert client.get("/dashboard/summary").json()["total_products"] == 1
+
+            _seed_product(db_session, product_id="m-2", origin="Jeju")
+            assert client.get("/dashboard/summary").json()["total_products"] == 1
+
+            mark_summary_stale(db_session)
+            payload = client.get("/dashboard/summary").json()
+
+        assert payload["total_products"] == 2
+        assert payload["origin_distribution"] == {"Naju": 1, "Jeju": 1}
+
+    def test_write_paths_keep_counters_in_sync_with_rebuild(self, db_session, monkeypatch):
+        """create_product / track / certify 증분 갱신 결과 == 전체 재구성 결과."""
+        from routers import products
+        from services.dashboard_summary import read_supply_chain_summary, rebuild_summary
+
+        app = FastAPI()
+
+        def override_get_db():
+            yield db_session
+
+        app.dependency_overrides[dashboard.get_db] = override_get_db
+        app.dependency_overrides[products.get_db] = override_get_db
+        app.dependency_overrides[products.get_current_user] = lambda: {"uid": "tester"}
+        app.include_router(dashboard.router)
+        app.include_router(products.router)
+        monkeypatch.setattr(products, "get_chain", lambda: MagicMock())
+
+        _seed_product(db_session, product_id="pre-1", origin="Naju")
+        with TestClient(app) as client, patch.object(dashboard, "get_cache", return_value=_NoOpCache()):
+            assert client.get("/dashboard/summary").json()["total_products"] == 1
+
+            body = {"name": "Apple", "description": "d", "category": "Fruit", "origin": "Jeju"}
+            created = client.post("/products/?owner_id=farmer-1", json={**body, "requires_cold_chain": True})
+            new_id = created.json()["id"]
+            for product_id, status in [("pre-1", "in_transit"), (new_id, "in_transit"), ("pre-1", "delivered")]:
+                resp = client.post(
+                    f"/products/{product_id}/track",
+                    params={"status": status, "location": "Busan", "handler_id": "h"},
+                )
+                assert resp.status_code == 200
+            for _ in range(2):
+                resp = client.post(
+                    f"/products/{new_id}/certifications", params={"cert_type": "GAP", "issued_by": "Korea GAP"}
+                )
+                assert resp.status_code == 200
+
+            incremental = client.get("/dashboard/summary").json()
+
+        rebuild_summary(db_session)
+        assert incremental == read_supply_chain_summary(db_session)
+        assert incremental["status_distribution"] == {"delivered": 1, "in_transit": 1}
+        assert incremental["certified_products"] == 1
+        assert incremental["cold_chain_products"] == 1
+        assert incremental["total_tracking_events"] == 3
+
+    def test_backdated_event_does_not_replace_latest_status(self, db_session):
+        from services.dashboard_summary import read_supply_chain_summary, record_tracking_event
+
+        _seed_product(db_session, product_id="b-1")
+        _seed_tracking_event(db_session, "b-1", status="delivered")
+        assert read_supply_chain_summary(db_session)["status_distribution"] == {"delivered": 1}
+
+        event = models.TrackingEvent(
+            product_id="b-1", status="planted", location="Farm", handler_id="h", timestamp=datetime(2020, 1, 1)
+        )
+        db_session.add(event)
+        record_tracking_event(db_session, event)
+        db_session.commit()
+
+        summary = read_supply_chain_summary(db_session)
+        assert summary["status_distribution"] == {"delivered": 1}
+        assert summary["total_tracking_events"] == 2
+
+    def test_bump_upserts_missing_and_existing_keys(self, db_session):
+        from services.dashboard_summary import _bump
+
+        _bump(db_session, "status:new")
+        _bump(db_session, "status:new", 2)
+        db_session.add(models.DashboardCounter(key="status:old", value=5))
+        db_session.flush()
+        _bump(db_session, "status:old", -1)
+        db_session.commit()
+
+        values = dict(db_session.query(models.DashboardCounter.key, models.DashboardCounter.value).all())
+        assert values == {"status:new": 3, "status:old": 4}
+
+    def test_first_read_skips_rebuild_finished_while_waiting_for_lock(self, db_session, monkeypatch):
+        """동시 첫 조회: 락을 기다리는 동안 다른 요청이 재구성을 끝냈으면 다시 지우고 쓰지 않음."""
+        from services import dashboard_summary
+
+        _seed_product(db_session, product_id="l-1")
+        real_lock = dashboard_summary._lock_rebuild
+
+        def lock_after_concurrent_rebuild(db):
+            real_lock(db)
+            db.add_all(
+                [
+                    models.DashboardCounter(key=dashboard_summary.BUILT_KEY, value=1),
+                    models.DashboardCounter(key=dashboard_summary.TOTAL_PRODUCTS, value=7),
+                ]
+            )
+            db.flush()
+
+        monkeypatch.setattr(dashboard_summary, "_lock_rebuild", lock_after_concurrent_rebuild)
+        rebuild = MagicMock(wraps=dashboard_summary._rebuild_locked)
+        monkeypatch.setattr(dashboard_summary, "_rebuild_locked", rebuild)
+
+        assert dashboard_summary.read_supply_chain_summary(db_session)["total_products"] == 7
+        rebuild.assert_not_called()
+
+    def test_deleting_product_removes_latest_status(self, db_session):
+        """제품 삭제 시 tracking history와 함께 product_latest_status도 삭제 (FK 위반 없음)."""
+        from services.dashboard_summary import read_supply_chain_summary
+        from sqlalchemy import text
+
+        db_session.execute(text("PRAGMA foreign_keys=ON"))
+        _seed_product(db_session, product_id="d-1")
+        _seed_tracking_event(db_session, "d-1", status="in_transit")
+        _seed_tracking_event(db_session, "d-1", status="delivered")
+        read_supply_chain_summary(db_session)
+        assert db_session.get(models.ProductLatestStatus, "d-1") is not None
+
+        db_session.delete(db_session.get(models.Product, "d-1"))
+        db_session.commit()
+
+        assert db_session.query(models.TrackingEvent).count() == 0
+        assert db_session.query(models.ProductLatestStatus).count() == 0
+        fk = next(iter(models.ProductLatestStatus.__table__.c.product_id.foreign_keys))
+        assert fk.ondelete == "CASCADE"
@@ -155,8 +155,9 @@ def test_run_migrations_script_applies_head_revision():
                 row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
             }
 
-        assert revision == ("0002_add_qr_scan_events",)
+        assert revision == ("0003_add_dashboard_summary",)
         assert "qr_scan_events" in tables
+        assert {"dashboard_counters", "product_latest_status"} <= tables
     finally:
         try:
             os.remove(db_path)
@@ -10,16 +10,19 @@ Route modules:
     routers/gdt.py        — GetDayTrends, A/B, QA, Quality
     routers/projects.py   — CIE, AgriGuard, DailyNews, Costs, SLA, MCP
     db_utils.py           — SQLite/PostgreSQL helpers
+    overview_snapshot.py  — /api/overview 병렬 집계 + TTL 스냅샷 캐시
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import contextlib
 import io
 import logging
 import os
 import sys
-from datetime import datetime
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 # Windows cp949 인코딩 문제 해결 — pytest capture와 충돌하므로
@@ -54,7 +57,24 @@ _DASHBOARD_DIR = str(Path(__file__).resolve().parent)
 if _DASHBOARD_DIR not in sys.path:
     sys.path.insert(0, _DASHBOARD_DIR)
 
-app = FastAPI(title="AI Projects Dashboard API", version="1.0")
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    """Overview 스냅샷 주기 갱신 시작 / 종료 시 SQLite 풀 정리."""
+    from db_utils import close_sqlite_pools
+    from overview_snapshot import overview_cache
+
+    refresher = asyncio.create_task(overview_cache.run_refresher())
+    try:
+        yield
+    finally:
+        refresher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await refresher
+        await close_sqlite_pools()
+
+
+app = FastAPI(title="AI Projects Dashboard API", version="1.0", lifespan=_lifespan)
 
 _raw_origins = os.environ.get("DASHBOARD_ALLOWED_ORIGINS", "http://localhost:3000,http://localhost:5173")
 _allowed_origins = [o.strip() for o in _raw_origins.split(",") if o.strip()]
@@ -112,59 +132,18 @@ from db_utils import (
     CIE_DB,
     DN_DB,
     GDT_DB,
-    _pg_scalar,
-    _sqlite_read,
-    _sqlite_scalar,
 )
 
 
 @app.get("/api/overview")
 async def overview():
-    """전체 프로젝트 건강 상태 종합."""
-    gdt_runs = await _sqlite_scalar(GDT_DB, "SELECT COUNT(*) FROM runs") or 0
-    gdt_latest = await _sqlite_read(
-        GDT_DB,
-        "SELECT started_at, trends_collected, tweets_generated FROM runs ORDER BY id DESC LIMIT 1",
-    )
-    cie_contents = await _sqlite_scalar(CIE_DB, "SELECT COUNT(*) FROM generated_contents") or 0
-    cie_avg_qa = await _sqlite_scalar(CIE_DB, "SELECT AVG(qa_total_score) FROM generated_contents") or 0
-    ag_sensors = await _pg_scalar("SELECT COUNT(*) FROM sensor_readings") or 0
-    ag_products = await _pg_scalar("SELECT COUNT(*) FROM products") or 0
-    dn_exists = DN_DB.exists()
-
-    # Cost
-    try:
-        from routers.projects import _get_cost_summary
-
-        cost_data = _get_cost_summary()
-    except Exception:
-        cost_data = {"total_cost": 0, "total_calls": 0}
-
-    return {
-        "timestamp": datetime.now().isoformat(),
-        "projects": {
-            "getdaytrends": {
-                "status": "OK" if gdt_runs > 0 else "WARN",
-                "total_runs": gdt_runs,
-                "latest_run": gdt_latest[0] if gdt_latest else None,
-            },
-            "cie": {
-                "status": "OK" if cie_contents > 0 else "WARN",
-                "total_contents": cie_contents,
-                "avg_qa_score": round(cie_avg_qa, 1),
-            },
-            "agriguard": {
-                "status": "OK" if ag_sensors > 0 else "ERROR",
-                "sensor_readings": ag_sensors,
-                "products": ag_products,
-            },
-            "dailynews": {
-                "status": "OK" if dn_exists else "WARN",
-                "db_exists": dn_exists,
-            },
-            "costs": cost_data,
-        },
-    }
+    """전체 프로젝트 건강 상태 종합.
+
+    스냅샷 캐시에서 바로 반환한다 — 집계는 백그라운드에서 병렬로 갱신된다.
+    """
+    from overview_snapshot import overview_cache
+
+    return await overview_cache.get()
 
 
 # ══════════════════════════════════════════════
@@ -2,15 +2,24 @@
 Dashboard — Database Utilities
 
 Centralized SQLite and PostgreSQL read helpers extracted from api.py.
+
+SQLite reads go through a small per-database pool of read-only aiosqlite
+connections instead of opening a fresh connection for every query.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+import sqlite3
 import aiosqlite
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
 
 log = logging.getLogger("dashboard")
 
@@ -31,16 +40,113 @@ else:
     AG_PG_URL = _RAW_URL
 
 
+SQLITE_POOL_SIZE = int(os.environ.get("DASHBOARD_SQLITE_POOL_SIZE", "4"))
+
+
+class SQLiteReadPool:
+    """Read-only aiosqlite 연결 풀 (DB 파일 1개당 1개).
+
+    연결은 필요할 때 최대 ``max_size``개까지 열고, 사용 후 풀에 반환한다.
+    쿼리 중 오류가 난 연결은 재사용하지 않고 닫는다.
+    """
+
+    def __init__(self, db_path: Path, max_size: int = SQLITE_POOL_SIZE):
+        self.db_path = db_path
+        self.max_size = max(1, max_size)
+        self._idle: list[aiosqlite.Connection] = []
+        self._opened = 0
+        self._available: asyncio.Condition | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _condition(self) -> asyncio.Condition:
+        # asyncio 프리미티브는 루프에 묶이므로 루프가 바뀌면 새로 만든다.
+        # (aiosqlite 연결 자체는 전용 스레드를 쓰므로 루프 간 재사용 가능)
+        loop = asyncio.get_running_loop()
+        if self._available is None or self._loop is not loop:
+            self._available = asyncio.Condition()
+            self._loop = loop
+        return self._available
+
+    async def _open(self) -> aiosqlite.Connection:
+        uri = self.db_path.resolve().as_uri() + "?mode=ro"
+        conn = await aiosqlite.connect(uri, uri=True, timeout=10)
+        conn.row_factory = aiosqlite.Row
+        return conn
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiosqlite.Connection]:
+        cond = self._condition()
+        async with cond:
+            while not self._idle and self._opened >= self.max_size:
+                await cond.wait()
+            if self._idle:
+                conn = self._idle.pop()
+            else:
+                self._opened += 1
+                conn = None
+        if conn is None:
+            try:
+                conn = await self._open()
+            except BaseException:
+                # 취소(wait_for 타임아웃)도 포함 — 예약한 슬롯을 돌려놓지 않으면
+                # max_size번 뒤에는 모든 acquire()가 영원히 대기한다.
+                async with cond:
+                    self._opened -= 1
+                    cond.notify()
+                raise
+
+        healthy = False
+        try:
+            yield conn
+            healthy = True
+        except sqlite3.Error:
+            # 쿼리 오류(테이블 없음 등)는 연결 상태와 무관 — 재사용
+            healthy = True
+            raise
+        finally:
+            if not healthy:
+                await conn.close()
+            async with cond:
+                if healthy:
+                    self._idle.append(conn)
+                else:
+                    self._opened -= 1
+                cond.notify()
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        self._opened -= len(idle)
+        for conn in idle:
+            await conn.close()
+
+
+_sqlite_pools: dict[Path, SQLiteReadPool] = {}
+
+
+def _get_sqlite_pool(db_path: Path) -> SQLiteReadPool:
+    pool = _sqlite_pools.get(db_path)
+    if pool is None:
+        pool = SQLiteReadPool(db_path)
+        _sqlite_pools[db_path] = pool
+    return pool
+
+
+async def close_sqlite_pools() -> None:
+    """모든 SQLite 풀의 유휴 연결을 닫는다 (서버 종료 시)."""
+    pools = list(_sqlite_pools.values())
+    _sqlite_pools.clear()
+    for pool in pools:
+        await pool.close()
+
+
 async def _sqlite_read(db_path: Path, query: str, params: tuple = ()) -> list[dict]:
     """SQLite에서 비동기로 읽어 dict 리스트로 반환."""
     if not db_path.exists():
         return []
     try:
-        async with aiosqlite.connect(str(db_path)) as conn:
-            conn.row_factory = aiosqlite.Row
-            async with conn.execute(query, params) as cursor:
-                rows = await cursor.fetchall()
-                return [dict(r) for r in rows]
+        async with _get_sqlite_pool(db_path).acquire() as conn, conn.execute(query, params) as cursor:
+            rows = await cursor.fetchall()
+            return [dict(r) for r in rows]
     except Exception as e:
         log.warning("SQLite read failed (%s): %s", db_path.name, e)
         return []
@@ -51,10 +157,9 @@ async def _sqlite_scalar(db_path: Path, query: str, params: tuple = ()) -> Any:
     if not db_path.exists():
         return None
     try:
-        async with aiosqlite.connect(str(db_path)) as conn:
-            async with conn.execute(query, params) as cursor:
-                row = await cursor.fetchone()
-                return row[0] if row else None
+        async with _get_sqlite_pool(db_path).acquire() as conn, conn.execute(query, params) as cursor:
+            row = await cursor.fetchone()
+            return row[0] if row else None
     except Exception as e:
         log.warning("SQLite scalar failed (%s): %s", db_path.name, e)
         return None
@@ -0,0 +1,194 @@
+"""
+Dashboard — Overview Snapshot
+
+/api/overview 집계를 병렬로 수행하고, 짧은 TTL 스냅샷으로 캐시한다.
+
+- GDT / CIE / AgriGuard 쿼리는 ``asyncio.gather``로 동시에 실행
+- 소스별 타임아웃: 느린 DB 하나가 전체 응답을 붙잡지 않음 (기본값으로 대체)
+- 스냅샷이 TTL을 넘기면 기존 값을 즉시 반환하고 백그라운드에서 갱신
+  (stale-while-revalidate). 서버 기동 시 ``run_refresher``가 주기 갱신.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from db_utils import CIE_DB, DN_DB, GDT_DB, _pg_scalar, _sqlite_read, _sqlite_scalar
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+log = logging.getLogger("dashboard")
+
+OVERVIEW_TTL_SECONDS = float(os.environ.get("DASHBOARD_OVERVIEW_TTL", "15"))
+OVERVIEW_SOURCE_TIMEOUT = float(os.environ.get("DASHBOARD_OVERVIEW_SOURCE_TIMEOUT", "2.0"))
+
+
+async def _bounded(name: str, awaitable: Awaitable[Any], default: Any, timeout: float) -> Any:
+    """소스 하나를 타임아웃 안에서 실행. 초과/실패 시 기본값."""
+    try:
+        return await asyncio.wait_for(awaitable, timeout)
+    except TimeoutError:
+        log.warning("Overview source timed out after %.1fs: %s", timeout, name)
+    except Exception as e:
+        log.warning("Overview source failed (%s): %s", name, e)
+    return default
+
+
+def _get_cost_data() -> dict:
+    try:
+        from routers.projects import _get_cost_summary
+
+        return _get_cost_summary()
+    except Exception:
+        return {"total_cost": 0, "total_calls": 0}
+
+
+async def collect_overview(source_timeout: float = OVERVIEW_SOURCE_TIMEOUT) -> dict:
+    """전체 프로젝트 건강 상태 종합 — 모든 소스를 동시에 조회."""
+    (
+        gdt_runs,
+        gdt_latest,
+        cie_contents,
+        cie_avg_qa,
+        ag_sensors,
+        ag_products,
+        cost_data,
+    ) = await asyncio.gather(
+        _bounded("gdt_runs", _sqlite_scalar(GDT_DB, "SELECT COUNT(*) FROM runs"), None, source_timeout),
+        _bounded(
+            "gdt_latest",
+            _sqlite_read(
+                GDT_DB,
+                "SELECT started_at, trends_collected, tweets_generated FROM runs ORDER BY id DESC LIMIT 1",
+            ),
+            [],
+            source_timeout,
+        ),
+        _bounded(
+            "cie_contents", _sqlite_scalar(CIE_DB, "SELECT COUNT(*) FROM generated_contents"), None, source_timeout
+        ),
+        _bounded(
+            "cie_avg_qa",
+            _sqlite_scalar(CIE_DB, "SELECT AVG(qa_total_score) FROM generated_contents"),
+            None,
+            source_timeout,
+        ),
+        _bounded("ag_sensors", _pg_scalar("SELECT COUNT(*) FROM sensor_readings"), None, source_timeout),
+        _bounded("ag_products", _pg_scalar("SELECT COUNT(*) FROM products"), None, source_timeout),
+        _bounded(
+            "costs",
+            asyncio.to_thread(_get_cost_data),
+            {"total_cost": 0, "total_calls": 0},
+            source_timeout,
+        ),
+    )
+    gdt_runs = gdt_runs or 0
+    cie_contents = cie_contents or 0
+    cie_avg_qa = cie_avg_qa or 0
+    ag_sensors = ag_sensors or 0
+    ag_products = ag_products or 0
+    dn_exists = DN_DB.exists()
+
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "projects": {
+            "getdaytrends": {
+                "status": "OK" if gdt_runs > 0 else "WARN",
+                "total_runs": gdt_runs,
+                "latest_run": gdt_latest[0] if gdt_latest else None,
+            },
+            "cie": {
+                "status": "OK" if cie_contents > 0 else "WARN",
+                "total_contents": cie_contents,
+                "avg_qa_score": round(cie_avg_qa, 1),
+            },
+            "agriguard": {
+                "status": "OK" if ag_sensors > 0 else "ERROR",
+                "sensor_readings": ag_sensors,
+                "products": ag_products,
+            },
+            "dailynews": {
+                "status": "OK" if dn_exists else "WARN",
+                "db_exists": dn_exists,
+            },
+            "costs": cost_data,
+        },
+    }
+
+
+class OverviewSnapshotCache:
+    """Short-TTL 스냅샷 + 단일 비행(single-flight) 백그라운드 갱신."""
+
+    def __init__(
+        self,
+        collector: Callable[[], Awaitable[dict]] = collect_overview,
+        ttl_seconds: float = OVERVIEW_TTL_SECONDS,
+    ):
+        self._collector = collector
+        self.ttl_seconds = ttl_seconds
+        self._snapshot: dict | None = None
+        self._refreshed_at = 0.0
+        self._refresh_task: asyncio.Task | None = None
+
+    @property
+    def age_seconds(self) -> float | None:
+        if self._snapshot is None:
+            return None
+        return time.monotonic() - self._refreshed_at
+
+    def is_stale(self) -> bool:
+        age = self.age_seconds
+        return age is None or age >= self.ttl_seconds
+
+    async def refresh(self) -> dict:
+        """즉시 재집계. 동시에 여러 번 호출돼도 수집은 1회만 실행."""
+        task = self._refresh_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._do_refresh())
+            self._refresh_task = task
+        return await asyncio.shield(task)
+
+    async def _do_refresh(self) -> dict:
+        snapshot = await self._collector()
+        self._snapshot = snapshot
+        self._refreshed_at = time.monotonic()
+        return snapshot
+
+    def _refresh_in_background(self) -> None:
+        task = self._refresh_task
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            return
+        self._refresh_task = asyncio.create_task(self._do_refresh())
+        self._refresh_task.add_done_callback(self._log_refresh_failure)
+
+    @staticmethod
+    def _log_refresh_failure(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            log.warning("Overview snapshot refresh failed: %s", task.exception())
+
+    async def get(self) -> dict:
+        """스냅샷 반환. 만료됐으면 기존 값을 주고 백그라운드에서 갱신."""
+        if self._snapshot is None:
+            return await self.refresh()
+        if self.is_stale():
+            self._refresh_in_background()
+        return self._snapshot
+
+    async def run_refresher(self, interval: float | None = None) -> None:
+        """TTL 주기로 스냅샷을 갱신하는 루프 (lifespan 태스크로 실행)."""
+        interval = interval if interval is not None else max(1.0, self.ttl_seconds * 0.8)
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                log.warning("Overview snapshot refresh failed: %s", e)
+            await asyncio.sleep(interval)
+
+
+overview_cache = OverviewSnapshotCache()
@@ -138,6 +138,8 @@ class JobSnapshot(BaseModel):
     completed_at: datetime | None = None
     updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     events: list[JobEvent] = Field(default_factory=list)
+    # Index of the latest event; SSE clients resume from ``version + 1``.
+    version: int = Field(0, ge=0)
 
 
 class JobAcceptedResponse(BaseModel):
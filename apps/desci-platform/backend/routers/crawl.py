@@ -5,7 +5,7 @@ Service imports stay inside endpoint handlers so the app can boot in lean
 smoke environments that do not install every crawler dependency.
 """
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Query, Request
 from limiter import limiter
 
 router = APIRouter()
@@ -58,11 +58,12 @@ async def get_notices(
     request: Request,
     source: str | None = None,
     limit: int = 30,
+    offset: int = Query(0, ge=0, description="Number of newest notices to skip"),
 ):
-    """Return previously collected government RFP notices."""
+    """Return previously collected government RFP notices, newest first."""
 
     scheduler = get_scheduler()
-    return scheduler.get_notices(source=source, limit=limit)
+    return scheduler.get_notices(source=source, limit=limit, offset=offset)
 
 
 @router.post("/notices/collect", tags=["Crawling"])
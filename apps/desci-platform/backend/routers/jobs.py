@@ -9,7 +9,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
 from fastapi.responses import StreamingResponse
 from limiter import limiter
 from models import (
@@ -86,9 +86,9 @@ def _assert_owned_paper(paper_id: str, user: dict[str, Any], *, require_indexed_
     return paper_record
 
 
-def _require_job_access(job_id: str, user: dict[str, Any] | None):
+async def _require_job_access(job_id: str, user: dict[str, Any] | None):
     manager = get_job_manager()
-    record = manager.get_record(job_id)
+    record = await manager.load_record(job_id)
     if record is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
@@ -282,7 +282,7 @@ async def get_job(
     job_id: str,
     user: dict | None = Depends(get_optional_current_user),
 ):
-    record = _require_job_access(job_id, user)
+    record = await _require_job_access(job_id, user)
     return record.snapshot()
 
 
@@ -293,14 +293,19 @@ async def get_job(
 )
 async def stream_job_events(
     job_id: str,
+    offset: int | None = Query(None, ge=0, description="Resume from this event index"),
+    last_event_id: str | None = Header(None, alias="Last-Event-ID"),
     user: dict | None = Depends(get_optional_current_user),
 ):
-    _require_job_access(job_id, user)
+    await _require_job_access(job_id, user)
     manager = get_job_manager()
+    # EventSource reconnects send the last ``id:`` they saw; resume right after it.
+    if offset is None and last_event_id and last_event_id.isdigit():
+        offset = int(last_event_id) + 1
 
     async def event_stream():
-        async for snapshot in manager.stream(job_id):
-            yield f"data: {snapshot.model_dump_json()}\n\n"
+        async for snapshot in manager.stream(job_id, offset=offset):
+            yield f"id: {snapshot.version}\ndata: {snapshot.model_dump_json()}\n\n"
 
     return StreamingResponse(
         event_stream(),
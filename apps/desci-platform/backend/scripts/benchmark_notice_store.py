@@ -0,0 +1,162 @@
+"""Benchmark the SQLite notice store against the legacy whole-file JSON store.
+
+Seeds ``--notices`` notices (default 100k) into a temporary directory and
+times the NoticeScheduler operations on both backends:
+
+    python scripts/benchmark_notice_store.py --notices 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from services.notice_store import NoticeStore  # noqa: E402
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+SOURCES = ("KDDF", "NTIS", "NTIS_EXTRA")
+
+
+def make_notices(count: int, *, start: int = 0) -> list[dict]:
+    base = datetime(2025, 1, 1)
+    return [
+        {
+            "title": f"Bio R&D notice {index}",
+            "url": f"https://example.org/notice/{index}",
+            "source": SOURCES[index % len(SOURCES)],
+            "deadline": "2026-12-31",
+            "collected_at": (base + timedelta(seconds=index)).isoformat(),
+            "is_new": index % 10 == 0,
+        }
+        for index in range(start, start + count)
+    ]
+
+
+class LegacyJsonStore:
+    """The pre-SQLite NoticeScheduler behaviour, kept here for comparison only."""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def _load(self) -> list[dict]:
+        with open(self.path, encoding="utf-8") as handle:
+            return json.load(handle)
+
+    def _dump(self, notices: list[dict]) -> None:
+        with open(self.path, "w", encoding="utf-8") as handle:
+            json.dump(notices, handle, ensure_ascii=False, indent=2)
+
+    def add_new(self, notices: list[dict]) -> list[dict]:
+        existing = self._load()
+        existing_urls = {notice["url"] for notice in existing}
+        new_items = [notice for notice in notices if notice["url"] not in existing_urls]
+        for notice in new_items:
+            notice["collected_at"] = datetime.now().isoformat()
+            notice["is_new"] = True
+        if new_items:
+            self._dump(existing + new_items)
+        return new_items
+
+    def recent(self, *, source: str | None = None, limit: int = 50, offset: int = 0) -> list[dict]:
+        notices = self._load()
+        if source:
+            notices = [notice for notice in notices if notice.get("source") == source]
+        notices.sort(key=lambda item: item.get("collected_at", ""), reverse=True)
+        return notices[offset : offset + limit]
+
+    def unread(self) -> list[dict]:
+        return [notice for notice in self._load() if notice.get("is_new", False)]
+
+    def mark_as_read(self, url: str) -> None:
+        notices = self._load()
+        for notice in notices:
+            if notice.get("url") == url:
+                notice["is_new"] = False
+        self._dump(notices)
+
+
+def timed(fn: Callable[[], object], repeat: int) -> float:
+    """Median wall time in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def run(count: int, repeat: int) -> list[tuple[str, float, float]]:
+    seed = make_notices(count)
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = Path(tmp) / "legacy.json"
+        legacy_path.write_text(json.dumps(seed, ensure_ascii=False, indent=2), encoding="utf-8")
+        legacy = LegacyJsonStore(legacy_path)
+
+        migrate_json = Path(tmp) / "notices.json"
+        migrate_json.write_text(legacy_path.read_text(encoding="utf-8"), encoding="utf-8")
+        store = NoticeStore(Path(tmp) / "notices.db", legacy_json=migrate_json)
+        started = time.perf_counter()
+        assert store.count() == count
+        migration_ms = (time.perf_counter() - started) * 1000
+
+        batches = iter(range(count, count + 50 * repeat * 2, 50))
+        cases: list[tuple[str, Callable[[], object], Callable[[], object]]] = [
+            (
+                "save 50 new notices",
+                lambda: legacy.add_new(make_notices(50, start=next(batches))),
+                lambda: store.add_new(make_notices(50, start=next(batches))),
+            ),
+            ("list latest 30", lambda: legacy.recent(limit=30), lambda: store.recent(limit=30)),
+            (
+                "list source page 50 (offset 1000)",
+                lambda: legacy.recent(source="NTIS", limit=50, offset=1000),
+                lambda: store.recent(source="NTIS", limit=50, offset=1000),
+            ),
+            ("unread notices", legacy.unread, store.unread),
+            (
+                "mark one as read",
+                lambda: legacy.mark_as_read(f"https://example.org/notice/{count // 2}"),
+                lambda: store.mark_as_read(f"https://example.org/notice/{count // 2}"),
+            ),
+        ]
+        results = [("json -> sqlite migration (once)", float("nan"), migration_ms)]
+        for name, legacy_fn, store_fn in cases:
+            results.append((name, timed(legacy_fn, repeat), timed(store_fn, repeat)))
+        store.close()
+    return results
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark NoticeStore vs the legacy notices.json.")
+    parser.add_argument("--notices", type=int, default=100_000, help="Number of seeded notices.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per operation (median reported).")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    results = run(args.notices, args.repeat)
+    print(f"notices={args.notices:,} repeat={args.repeat} (median ms)")
+    print(f"{'operation':<36}{'json':>12}{'sqlite':>12}{'speedup':>10}")
+    for name, legacy_ms, store_ms in results:
+        measured = not math.isnan(legacy_ms)
+        speedup = f"{legacy_ms / store_ms:.0f}x" if measured and store_ms > 0 else "-"
+        legacy_text = f"{legacy_ms:.1f}" if measured else "-"
+        print(f"{name:<36}{legacy_text:>12}{store_ms:>12.2f}{speedup:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
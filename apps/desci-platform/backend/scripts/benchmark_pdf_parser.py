@@ -0,0 +1,135 @@
+"""Benchmark pypdf parsing paths of PDFParser on generated multi-hundred-page PDFs.
+
+Compares, per document size:
+
+- legacy: two serial passes (text, then metadata), each opening the PDF
+- single pass: one open, serial page extraction
+- parallel: one open, pages extracted by the process pool
+- cache hit: the same bytes parsed again
+
+    python scripts/benchmark_pdf_parser.py --pages 200 400 800 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pypdf  # noqa: E402
+from services.pdf_parser import PDFParser  # noqa: E402
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+WORDS = ["protein", "assay", "cohort", "biomarker", "sequencing", "antibody", "dosage", "trial", "efficacy", "genome"]
+
+
+def build_pdf(pages: int, lines_per_page: int = 45) -> bytes:
+    """Uncompressed text-only PDF with ``pages`` pages (Helvetica, no dependencies)."""
+    bodies: dict[int, bytes] = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    kids = []
+    next_id = 4
+    for page in range(pages):
+        page_id, content_id = next_id, next_id + 1
+        next_id += 2
+        lines = " ".join(
+            f"({' '.join(WORDS[(page + line + i) % len(WORDS)] for i in range(9))} p{page} l{line}) Tj T*"
+            for line in range(lines_per_page)
+        )
+        stream = f"BT /F1 10 Tf 14 TL 50 770 Td {lines} ET".encode()
+        bodies[content_id] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        bodies[page_id] = (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        kids.append(b"%d 0 R" % page_id)
+    bodies[2] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), pages)
+    info_id = next_id
+    bodies[info_id] = b"<< /Title (Generated benchmark paper) /Author (BioLinker) >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for obj_id in range(1, info_id + 1):
+        offsets[obj_id] = len(out)
+        out += b"%d 0 obj\n%s\nendobj\n" % (obj_id, bodies[obj_id])
+    xref_at = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (info_id + 1)
+    out += b"".join(b"%010d 00000 n \n" % offsets[obj_id] for obj_id in range(1, info_id + 1))
+    out += b"trailer\n<< /Size %d /Root 1 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        info_id + 1,
+        info_id,
+        xref_at,
+    )
+    return bytes(out)
+
+
+def legacy_parse(content: bytes) -> tuple[str, dict]:
+    """The pre-pipeline behaviour: text pass and metadata pass each open the PDF."""
+    reader = pypdf.PdfReader(io.BytesIO(content))
+    text = "\n".join(page.extract_text() or "" for page in reader.pages)
+    metadata = dict(pypdf.PdfReader(io.BytesIO(content)).metadata or {})
+    return text, metadata
+
+
+def timed(fn: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000
+
+
+def run(page_counts: list[int], workers: int) -> list[tuple[int, float, float, float, float]]:
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        serial = PDFParser(cache_dir="", workers=1)
+        parallel = PDFParser(cache_dir="", workers=workers, parallel_min_pages=1)
+        cached = PDFParser(cache_dir=tmp, workers=workers)
+        parallel.parse_document(build_pdf(workers * 2))  # start the pool outside the timings
+        try:
+            for pages in page_counts:
+                content = build_pdf(pages)
+                cached.parse_document(content)
+                rows.append(
+                    (
+                        pages,
+                        timed(lambda content=content: legacy_parse(content)),
+                        timed(lambda content=content: serial.parse_document(content)),
+                        timed(lambda content=content: parallel.parse_document(content)),
+                        timed(lambda content=content: cached.parse_document(content)),
+                    )
+                )
+        finally:
+            parallel.close()
+            cached.close()
+    return rows
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark PDFParser pypdf paths on generated PDFs.")
+    parser.add_argument("--pages", type=int, nargs="+", default=[200, 400, 800], help="Page counts to generate.")
+    parser.add_argument("--workers", type=int, default=4, help="Process pool size for the parallel path.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    rows = run(args.pages, args.workers)
+    print(f"workers={args.workers} (ms)")
+    print(f"{'pages':>6}{'legacy':>11}{'single':>11}{'parallel':>11}{'cache hit':>11}{'speedup':>9}")
+    for pages, legacy_ms, single_ms, parallel_ms, cache_ms in rows:
+        speedup = f"{legacy_ms / parallel_ms:.1f}x" if parallel_ms > 0 else "-"
+        print(f"{pages:>6}{legacy_ms:>11.0f}{single_ms:>11.0f}{parallel_ms:>11.0f}{cache_ms:>11.1f}{speedup:>9}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,3 +1,4 @@
+import asyncio
 import hashlib
 import json
 import os
@@ -123,7 +124,7 @@ class AssetManager:
             },
         }
 
-    def _extract_text_and_metadata(
+    async def _extract_text_and_metadata(
         self,
         file: UploadFile,
         file_ext: str,
@@ -135,8 +136,15 @@ class AssetManager:
         parser_name = "none"
 
         if file_ext.lower() == ".pdf":
-            if hasattr(self.pdf_parser, "parse_document"):
-                parse_result = self.pdf_parser.parse_document(content, filename=file.filename)
+            # Parsing is CPU/IO heavy; keep it off the event loop.
+            if hasattr(self.pdf_parser, "parse_document_async"):
+                parse_result = await self.pdf_parser.parse_document_async(content, filename=file.filename)
+            elif hasattr(self.pdf_parser, "parse_document"):
+                parse_result = await asyncio.to_thread(self.pdf_parser.parse_document, content, filename=file.filename)
+            else:
+                parse_result = None
+
+            if parse_result is not None:
                 text_content = parse_result.text
                 parsed_metadata = parse_result.metadata
                 parser_name = parse_result.parser
@@ -217,7 +225,7 @@ class AssetManager:
         """
         content = await file.read()
         asset_id, file_ext, _file_path = self._save_upload(file, content)
-        text_content, parsed_metadata, parser_name = self._extract_text_and_metadata(file, file_ext, content)
+        text_content, parsed_metadata, parser_name = await self._extract_text_and_metadata(file, file_ext, content)
 
         extracted_text = bool(text_content)
         if not text_content:
@@ -276,7 +284,7 @@ class AssetManager:
         """Upload a research paper, pin it to IPFS, and index structured metadata."""
         content = await file.read()
         fallback_id, file_ext, file_path = self._save_upload(file, content)
-        text_content, parsed_metadata, parser_name = self._extract_text_and_metadata(file, file_ext, content)
+        text_content, parsed_metadata, parser_name = await self._extract_text_and_metadata(file, file_ext, content)
 
         extracted_text = bool(text_content)
         if not text_content:
@@ -387,7 +395,9 @@ class AssetManager:
 
             stored_file = StoredFile(filename)
             file_ext = os.path.splitext(filename)[1]
-            text_content, parsed_metadata, parser_name = self._extract_text_and_metadata(stored_file, file_ext, content)
+            text_content, parsed_metadata, parser_name = await self._extract_text_and_metadata(
+                stored_file, file_ext, content
+            )
             extracted_text = bool(text_content)
             if not text_content:
                 text_content = "No text content extracted."
@@ -0,0 +1,196 @@
+"""
+BioLinker - 회사 자산 프로필 벡터 (Company Asset Profile)
+
+회사 자산(IR, 논문, 특허 등) 임베딩의 가중 centroid를 메모리에 유지합니다.
+처음 사용할 때 벡터 저장소에서 한 번 적재하고, 이후에는 자산 추가/삭제
+알림(``VectorStore.add_asset_listener``)으로 합계만 증분 갱신하므로
+매칭 요청마다 자산 전체를 다시 읽거나 재임베딩하지 않습니다.
+
+다른 프로세스(API 워커 여러 개, 배치 스크립트)가 쓴 자산은 이 알림으로
+들어오지 않으므로, ``check_interval``초마다 저장소의 자산 개수
+(``count_by_metadata``)를 리비전 표시로 확인해 달라졌으면 다시 적재합니다.
+같은 ID의 내용 교체처럼 개수가 변하지 않는 변경은 ``max_age``초 뒤 재적재로 반영됩니다.
+
+- 각 자산 벡터는 단위 길이로 정규화한 뒤 가중치를 곱해 합산
+- 가중치는 자산 메타데이터의 ``profile_weight`` (기본 1.0)
+- ``score_matrix``: 여러 공고 임베딩을 한 번의 행렬 곱으로 점수화
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+import numpy as np  # type: ignore
+
+ASSET_TYPE = "company_asset"
+
+
+def _asset_weight(metadata: dict[str, Any] | None) -> float:
+    try:
+        weight = float((metadata or {}).get("profile_weight", 1.0))
+    except (TypeError, ValueError):
+        return 1.0
+    return weight if weight > 0 else 1.0
+
+
+def _unit(vector: Any) -> np.ndarray | None:
+    array = np.asarray(vector, dtype=np.float64).ravel()
+    norm = float(np.linalg.norm(array))
+    if array.size == 0 or norm == 0.0:
+        return None
+    return array / norm
+
+
+class CompanyAssetProfile:
+    """회사 자산 임베딩의 증분 가중 centroid"""
+
+    def __init__(self, vector_store: Any, *, check_interval: float = 5.0, max_age: float = 600.0):
+        self.vector_store = vector_store
+        self.check_interval = check_interval
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._vectors: dict[str, tuple[np.ndarray, float]] = {}
+        self._sum: np.ndarray | None = None
+        self._total_weight = 0.0
+        self._loaded = False
+        self._asset_ids: set[str] = set()  # 저장소의 자산 ID (임베딩이 없는 것 포함)
+        self._marker: int | None = None  # 저장소 자산 개수의 기대값
+        self._loaded_at = 0.0
+        self._checked_at = 0.0
+        self.revision = 0  # 자산 추가/삭제마다 증가
+        if hasattr(vector_store, "add_asset_listener"):
+            vector_store.add_asset_listener(self._on_asset_change)
+
+    # ── 갱신 ──
+
+    def _store_marker(self) -> int | None:
+        count = getattr(self.vector_store, "count_by_metadata", None)
+        return count("type", ASSET_TYPE) if count is not None else None
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            self._revalidate()
+            return
+        # 개수를 먼저 읽어야 적재 중에 추가된 자산이 다음 확인에서 드러난다
+        marker = self._store_marker()
+        items = self.vector_store.get_embeddings_by_metadata("type", ASSET_TYPE)
+        with self._lock:
+            if self._loaded:
+                return
+            for item in items:
+                asset_id = str(item["id"])
+                self._asset_ids.add(asset_id)
+                self._add_locked(asset_id, item.get("embedding"), _asset_weight(item.get("metadata")))
+            self._marker = marker
+            self._loaded_at = self._checked_at = time.monotonic()
+            self._loaded = True
+
+    def _revalidate(self) -> None:
+        """다른 프로세스의 변경 확인: 개수가 기대값과 다르거나 max_age가 지나면 재적재"""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._checked_at < self.check_interval:
+                return
+            self._checked_at = now
+            expired = now - self._loaded_at >= self.max_age
+        if not expired:
+            marker = self._store_marker()
+            with self._lock:
+                expired = marker is not None and self._marker is not None and marker != self._marker
+        if expired:
+            self.invalidate()
+            self._ensure_loaded()
+
+    def _on_asset_change(self, asset_id: str, embedding: list[float] | None, metadata: dict[str, Any] | None) -> None:
+        if embedding is None:
+            self.remove(asset_id)
+        elif (metadata or {}).get("type") == ASSET_TYPE:
+            self.add(asset_id, embedding, weight=_asset_weight(metadata))
+
+    def _add_locked(self, asset_id: str, embedding: Any, weight: float) -> None:
+        vector = _unit(embedding) if embedding is not None else None
+        if vector is None:
+            return
+        self._remove_locked(asset_id)
+        if self._sum is not None and self._sum.shape != vector.shape:
+            # 임베딩 모델이 바뀐 경우: 이전 차원의 벡터는 섞을 수 없으므로 재구성
+            self._vectors.clear()
+            self._sum, self._total_weight = None, 0.0
+        self._vectors[asset_id] = (vector, weight)
+        self._sum = vector * weight if self._sum is None else self._sum + vector * weight
+        self._total_weight += weight
+        self.revision += 1
+
+    def _remove_locked(self, asset_id: str) -> bool:
+        entry = self._vectors.pop(asset_id, None)
+        if entry is None:
+            return False
+        vector, weight = entry
+        if self._vectors and self._sum is not None:
+            self._sum = self._sum - vector * weight
+            self._total_weight -= weight
+        else:
+            self._sum, self._total_weight = None, 0.0
+        self.revision += 1
+        return True
+
+    def add(self, asset_id: str, embedding: list[float], weight: float = 1.0) -> None:
+        """자산 벡터 추가 (같은 ID는 교체)"""
+        with self._lock:
+            if self._loaded:
+                if asset_id not in self._asset_ids:
+                    self._asset_ids.add(asset_id)
+                    if self._marker is not None:
+                        self._marker += 1
+                self._add_locked(asset_id, embedding, weight)
+
+    def remove(self, asset_id: str) -> bool:
+        """자산 벡터 제거 (프로필에 없던 ID면 False)"""
+        with self._lock:
+            if asset_id in self._asset_ids:
+                self._asset_ids.discard(asset_id)
+                if self._marker is not None:
+                    self._marker -= 1
+            return self._remove_locked(asset_id)
+
+    def invalidate(self) -> None:
+        """다음 사용 시 벡터 저장소에서 다시 적재"""
+        with self._lock:
+            self._vectors.clear()
+            self._asset_ids.clear()
+            self._sum, self._total_weight = None, 0.0
+            self._marker = None
+            self._loaded = False
+            self.revision += 1
+
+    # ── 조회 ──
+
+    @property
+    def asset_count(self) -> int:
+        self._ensure_loaded()
+        return len(self._vectors)
+
+    def centroid(self) -> list[float] | None:
+        """가중 평균 벡터 (자산이 없으면 None)"""
+        self._ensure_loaded()
+        with self._lock:
+            if self._sum is None or self._total_weight <= 0:
+                return None
+            return (self._sum / self._total_weight).tolist()
+
+    def score_matrix(self, embeddings: Any) -> np.ndarray:
+        """(n, d) 임베딩 행렬의 각 행과 프로필 centroid의 코사인 유사도 (n,)"""
+        matrix = np.asarray(embeddings, dtype=np.float64)
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(1, -1)
+        centroid = self.centroid()
+        if centroid is None or matrix.size == 0:
+            return np.zeros(matrix.shape[0])
+        profile = _unit(centroid)
+        if profile is None or matrix.shape[1] != profile.shape[0]:
+            return np.zeros(matrix.shape[0])
+        norms = np.linalg.norm(matrix, axis=1)
+        norms[norms == 0] = 1.0
+        return (matrix @ profile) / norms
@@ -4,6 +4,22 @@ BioLinker job orchestration service.
 The API uses this manager for long-running tasks that need status polling and
 SSE progress updates. Jobs stay in memory for local execution and are also
 mirrored to Redis when available so snapshots survive transient API reads.
+
+Redis layout per job (both keys expire after 24h):
+
+- ``biolinker:jobs:{id}:state``: hash of the compact job state (no events);
+  updates rewrite only the mutable fields
+- ``biolinker:jobs:{id}:events``: append-only list, one ``RPUSH`` per update
+
+Every update appends exactly one event, so an event's list index plus the
+job's ``events_base`` (0 except for migrated jobs) equals the ``version`` it
+produced. Subscribers resume from an event offset instead of re-reading the
+whole history. Reads and writes go through the ``redis.asyncio`` client so
+they never block the event loop.
+
+Jobs written by older workers as one JSON document under
+``biolinker:jobs:{id}`` are still readable; their first update migrates them
+to the layout above.
 """
 
 from __future__ import annotations
@@ -26,6 +42,20 @@ log = get_logger("biolinker.services.job_manager")
 JobRunner = Callable[["JobContext"], Awaitable[Any]]
 _MISSING = object()
 _TERMINAL_STATUSES = {JobStatus.SUCCEEDED, JobStatus.FAILED}
+_JOB_TTL_SECONDS = 24 * 60 * 60
+# Events kept on the in-memory record and embedded in snapshots.
+_EVENT_WINDOW = 50
+_MUTABLE_FIELDS = (
+    "status",
+    "progress",
+    "message",
+    "result",
+    "error",
+    "started_at",
+    "completed_at",
+    "updated_at",
+    "version",
+)
 
 
 def _utcnow() -> datetime:
@@ -51,6 +81,8 @@ class _JobRecord:
     updated_at: datetime = field(default_factory=_utcnow)
     events: list[JobEvent] = field(default_factory=list)
     version: int = 0
+    # Version of the first event in the Redis event list.
+    events_base: int = 0
 
     def snapshot(self) -> JobSnapshot:
         return JobSnapshot(
@@ -67,9 +99,11 @@ class _JobRecord:
             completed_at=self.completed_at,
             updated_at=self.updated_at,
             events=list(self.events),
+            version=self.version,
         )
 
     def serialize(self) -> dict[str, Any]:
+        """Job state without the event history."""
         return {
             "id": self.id,
             "type": self.type.value,
@@ -86,12 +120,13 @@ class _JobRecord:
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "updated_at": self.updated_at.isoformat(),
-            "events": [event.model_dump(mode="json") for event in self.events],
             "version": self.version,
+            "events_base": self.events_base,
         }
 
     @classmethod
     def deserialize(cls, data: dict[str, Any]) -> _JobRecord:
+        """Rebuild a record from ``serialize()`` output plus an ``events`` list."""
         return cls(
             id=str(data["id"]),
             type=JobType(str(data["type"])),
@@ -110,6 +145,7 @@ class _JobRecord:
             updated_at=datetime.fromisoformat(str(data["updated_at"])),
             events=[JobEvent.model_validate(event) for event in data.get("events", [])],
             version=int(data.get("version", 0) or 0),
+            events_base=int(data.get("events_base", 0) or 0),
         )
 
 
@@ -120,6 +156,7 @@ class JobContext:
         self._manager = manager
         self.job_id = job_id
 
+    # Runners execute in the process that owns the job, so the record is in memory.
     @property
     def payload(self) -> dict[str, Any]:
         record = self._manager.get_record(self.job_id)
@@ -165,6 +202,9 @@ class JobManager:
         self._jobs: dict[str, _JobRecord] = {}
         self._conditions: dict[str, asyncio.Condition] = {}
         self._tasks: dict[str, asyncio.Task[Any]] = {}
+        self._write_locks: dict[str, asyncio.Lock] = {}
+        # Events of legacy single-document jobs, pushed to the event list on their first write.
+        self._legacy_events: dict[str, list[JobEvent]] = {}
 
     def _storage_backend(self) -> str:
         try:
@@ -174,47 +214,108 @@ class JobManager:
         return "redis" if getattr(redis_store, "is_ready", False) else "memory"
 
     def _cache_key(self, job_id: str) -> str:
+        """Pre-split single-document key, still read for jobs written by older workers."""
         return f"biolinker:jobs:{job_id}"
 
-    def _persist_record(self, record: _JobRecord) -> None:
+    def _state_key(self, job_id: str) -> str:
+        return f"biolinker:jobs:{job_id}:state"
+
+    def _events_key(self, job_id: str) -> str:
+        return f"biolinker:jobs:{job_id}:events"
+
+    async def _persist_record(
+        self,
+        record: _JobRecord,
+        *,
+        fields: tuple[str, ...] = _MUTABLE_FIELDS,
+        event: JobEvent | None = None,
+    ) -> None:
+        """Write the given state fields and append ``event`` in one transaction."""
         if record.storage != "redis":
             return
         try:
-            redis_store = get_redis_store()
-            if getattr(redis_store, "is_ready", False):
-                redis_store.set(
-                    self._cache_key(record.id),
-                    json.dumps(record.serialize(), ensure_ascii=False),
-                    ex=24 * 60 * 60,
-                )
+            client = get_redis_store().async_client()
+            if client is None:
+                return
+            state = record.serialize()
+            legacy_events = self._legacy_events.get(record.id)
+            if legacy_events is not None:
+                # No state hash exists yet: write all of it, not just the mutable fields.
+                fields = tuple(state)
+            mapping = {name: json.dumps(state[name], ensure_ascii=False) for name in fields}
+            event_jsons = [legacy.model_dump_json() for legacy in legacy_events or ()]
+            if event is not None:
+                event_jsons.append(event.model_dump_json())
+            # Held across the await so concurrent updates land in version order.
+            lock = self._write_locks.setdefault(record.id, asyncio.Lock())
+            async with lock, client.pipeline(transaction=True) as pipe:
+                pipe.hset(self._state_key(record.id), mapping=mapping)
+                pipe.expire(self._state_key(record.id), _JOB_TTL_SECONDS)
+                if event_jsons:
+                    pipe.rpush(self._events_key(record.id), *event_jsons)
+                    pipe.expire(self._events_key(record.id), _JOB_TTL_SECONDS)
+                if legacy_events is not None:
+                    pipe.delete(self._cache_key(record.id))
+                await pipe.execute()
+            self._legacy_events.pop(record.id, None)
         except Exception as exc:  # noqa: BLE001
             log.warning("job_persist_failed", job_id=record.id, error=str(exc))
+        finally:
+            if record.status in _TERMINAL_STATUSES:
+                self._write_locks.pop(record.id, None)
+
+    async def _read_stored(self, job_id: str) -> tuple[dict[str, Any] | None, bool]:
+        """Stored job data plus whether it came from the legacy single-document key."""
+        client = get_redis_store().async_client()
+        if client is None:
+            return None, False
+
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.hgetall(self._state_key(job_id))
+            pipe.lrange(self._events_key(job_id), -_EVENT_WINDOW, -1)
+            state, events = await pipe.execute()
+        if state:
+            data = {name: json.loads(value) for name, value in state.items()}
+            data["events"] = [json.loads(event) for event in events]
+            return data, False
+
+        legacy = await client.get(self._cache_key(job_id))
+        return (json.loads(legacy), True) if legacy else (None, False)
+
+    def get_record(self, job_id: str) -> _JobRecord | None:
+        """Record already held by this manager (created here or loaded earlier)."""
+        return self._jobs.get(job_id)
 
-    def _load_record(self, job_id: str) -> _JobRecord | None:
+    async def load_record(self, job_id: str) -> _JobRecord | None:
+        """Record from memory, or loaded from Redis for jobs owned by other workers."""
         if job_id in self._jobs:
             return self._jobs[job_id]
 
         try:
-            redis_store = get_redis_store()
-            payload = redis_store.get(self._cache_key(job_id))
+            data, legacy = await self._read_stored(job_id)
         except Exception:  # noqa: BLE001
             return None
 
-        if not payload:
+        if not data:
             return None
 
         try:
-            record = _JobRecord.deserialize(json.loads(payload))
-        except (TypeError, ValueError, json.JSONDecodeError):
+            record = _JobRecord.deserialize(data)
+        except (KeyError, TypeError, ValueError):
             return None
 
+        if job_id in self._jobs:  # loaded concurrently while awaiting Redis
+            return self._jobs[job_id]
+        if legacy:
+            if "version" not in data:
+                record.version = max(0, len(record.events) - 1)
+            record.events_base = max(0, record.version + 1 - len(record.events))
+            self._legacy_events[job_id] = list(record.events)
+            record.events = record.events[-_EVENT_WINDOW:]
         self._jobs[job_id] = record
         self._conditions.setdefault(job_id, asyncio.Condition())
         return record
 
-    def get_record(self, job_id: str) -> _JobRecord | None:
-        return self._load_record(job_id)
-
     async def create_job(
         self,
         *,
@@ -244,7 +345,7 @@ class JobManager:
         )
         self._jobs[job_id] = record
         self._conditions[job_id] = asyncio.Condition()
-        self._persist_record(record)
+        await self._persist_record(record, fields=tuple(record.serialize()), event=record.events[0])
         self._tasks[job_id] = asyncio.create_task(self._run_job(job_id, runner), name=f"biolinker-job-{job_id}")
         log.info("job_created", job_id=job_id, job_type=job_type.value, owner_uid=owner_uid, access=access)
         return JobAcceptedResponse(job=record.snapshot())
@@ -260,7 +361,7 @@ class JobManager:
         error: str | None | object = _MISSING,
         completed: bool = False,
     ) -> JobSnapshot | None:
-        record = self.get_record(job_id)
+        record = await self.load_record(job_id)
         if record is None:
             return None
 
@@ -285,18 +386,17 @@ class JobManager:
 
         record.updated_at = _utcnow()
         record.version += 1
-        record.events.append(
-            JobEvent(
-                timestamp=record.updated_at,
-                status=record.status,
-                progress=record.progress,
-                message=record.message,
-            )
+        event = JobEvent(
+            timestamp=record.updated_at,
+            status=record.status,
+            progress=record.progress,
+            message=record.message,
         )
-        if len(record.events) > 50:
-            record.events = record.events[-50:]
+        record.events.append(event)
+        if len(record.events) > _EVENT_WINDOW:
+            record.events = record.events[-_EVENT_WINDOW:]
 
-        self._persist_record(record)
+        await self._persist_record(record, event=event)
 
         condition = self._conditions.setdefault(job_id, asyncio.Condition())
         async with condition:
@@ -326,22 +426,61 @@ class JobManager:
         finally:
             self._tasks.pop(job_id, None)
 
-    async def stream(self, job_id: str):
-        """Yield successive job snapshots until the job reaches a terminal state."""
+    async def events_since(self, job_id: str, offset: int = 0) -> list[JobEvent]:
+        """Events with index >= ``offset``, oldest first.
 
-        record = self.get_record(job_id)
+        Served from the in-memory window when it reaches back far enough,
+        otherwise from the Redis event list. Memory-only jobs cannot go past
+        the last ``_EVENT_WINDOW`` events.
+        """
+
+        record = await self.load_record(job_id)
+        if record is None:
+            return []
+
+        offset = max(0, offset)
+        first_in_memory = record.version + 1 - len(record.events)
+        if offset >= first_in_memory:
+            return record.events[offset - first_in_memory :]
+
+        if record.storage == "redis":
+            try:
+                client = get_redis_store().async_client()
+                if client is not None:
+                    start = max(0, offset - record.events_base)
+                    stored = await client.lrange(self._events_key(job_id), start, -1)
+                    if stored:
+                        return [JobEvent.model_validate_json(event) for event in stored]
+            except Exception as exc:  # noqa: BLE001
+                log.warning("job_events_read_failed", job_id=job_id, error=str(exc))
+        return list(record.events)
+
+    async def stream(self, job_id: str, offset: int | None = None):
+        """Yield successive job snapshots until the job reaches a terminal state.
+
+        With ``offset`` (an event index, e.g. SSE ``Last-Event-ID`` + 1) the
+        stream resumes: nothing is yielded until the job reaches that event,
+        and each snapshot carries only the events since the previous one, so a
+        reconnecting subscriber receives every missed event exactly once.
+        """
+
+        record = await self.load_record(job_id)
         if record is None:
             return
 
-        last_version = -1
+        last_version = -1 if offset is None else max(0, offset) - 1
         while True:
             current = self.get_record(job_id)
             if current is None:
                 return
 
-            if current.version != last_version:
-                last_version = current.version
-                yield current.snapshot()
+            if current.version > last_version:
+                snapshot = current.snapshot()
+                if offset is not None:
+                    missed = await self.events_since(job_id, last_version + 1)
+                    snapshot.events = missed[: snapshot.version - last_version]
+                last_version = snapshot.version
+                yield snapshot
 
             if current.status in _TERMINAL_STATUSES:
                 return
@@ -361,6 +500,8 @@ class JobManager:
         self._tasks.clear()
         self._jobs.clear()
         self._conditions.clear()
+        self._write_locks.clear()
+        self._legacy_events.clear()
 
 
 _job_manager: JobManager | None = None
@@ -0,0 +1,192 @@
+"""
+BioLinker - Indexed notice store.
+
+Government RFP notices collected by ``NoticeScheduler`` live in an embedded
+SQLite database (``notices.db``) instead of one JSON document, so reads and
+flag updates touch only the rows they need:
+
+- ``url`` is unique, which makes dedup on insert a constraint check
+- ``(source, collected_at)`` and ``collected_at`` back the paginated listings
+- a partial index on ``is_new = 1`` backs the unread view
+
+The full notice dict is kept as a JSON payload; ``collected_at`` and
+``is_new`` are promoted to columns. A legacy ``notices.json`` next to the
+database is imported once on first start and renamed to
+``notices.json.migrated``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from services.logging_config import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+log = get_logger("biolinker.services.notice_store")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS notices (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    url          TEXT NOT NULL UNIQUE,
+    source       TEXT NOT NULL DEFAULT '',
+    collected_at TEXT NOT NULL DEFAULT '',
+    is_new       INTEGER NOT NULL DEFAULT 1,
+    payload      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_notices_collected ON notices(collected_at);
+CREATE INDEX IF NOT EXISTS idx_notices_source_collected ON notices(source, collected_at);
+CREATE INDEX IF NOT EXISTS idx_notices_new ON notices(is_new) WHERE is_new = 1;
+"""
+
+# Both listing indexes end in the implicit rowid, so a backward scan yields this
+# order directly (no temp b-tree sort even with OFFSET).
+_ORDER_RECENT = "ORDER BY collected_at DESC, id DESC"
+
+
+def _row_to_notice(row: sqlite3.Row) -> dict[str, Any]:
+    notice = json.loads(row["payload"])
+    notice["url"] = row["url"]
+    notice["collected_at"] = row["collected_at"]
+    notice["is_new"] = bool(row["is_new"])
+    return notice
+
+
+def _payload(notice: dict[str, Any]) -> str:
+    body = {key: value for key, value in notice.items() if key not in ("collected_at", "is_new")}
+    return json.dumps(body, ensure_ascii=False, default=str)
+
+
+class NoticeStore:
+    """SQLite-backed notice table shared by the API and the scheduler thread."""
+
+    def __init__(self, db_path: str | Path, *, legacy_json: str | Path | None = None):
+        self.db_path = Path(db_path)
+        self.legacy_json = Path(legacy_json) if legacy_json else None
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+            self._migrate_legacy_json(conn)
+        return self._conn
+
+    def _migrate_legacy_json(self, conn: sqlite3.Connection) -> None:
+        if self.legacy_json is None or not self.legacy_json.exists():
+            return
+        try:
+            with open(self.legacy_json, encoding="utf-8") as handle:
+                legacy = json.load(handle)
+        except (OSError, json.JSONDecodeError) as exc:
+            log.warning("notice_store_legacy_unreadable", path=str(self.legacy_json), error=str(exc))
+            return
+
+        rows = [
+            (
+                notice["url"],
+                str(notice.get("source") or ""),
+                str(notice.get("collected_at") or ""),
+                1 if notice.get("is_new", False) else 0,
+                _payload(notice),
+            )
+            for notice in legacy
+            if isinstance(notice, dict) and notice.get("url")
+        ]
+        with conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO notices (url, source, collected_at, is_new, payload) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            imported = conn.total_changes - before
+        os.replace(self.legacy_json, self.legacy_json.with_name(self.legacy_json.name + ".migrated"))
+        log.info("notice_store_legacy_migrated", imported=imported, skipped=len(legacy) - imported)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ── writes ──
+
+    def add_new(self, notices: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Insert notices whose url is not stored yet; return the inserted ones.
+
+        Inserted dicts are stamped with ``collected_at`` and ``is_new`` in place.
+        """
+        inserted: list[dict[str, Any]] = []
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                for notice in notices:
+                    url = notice.get("url")
+                    if not url:
+                        continue
+                    collected_at = datetime.now().isoformat()
+                    cursor = conn.execute(
+                        "INSERT OR IGNORE INTO notices (url, source, collected_at, is_new, payload)"
+                        " VALUES (?, ?, ?, 1, ?)",
+                        (url, str(notice.get("source") or ""), collected_at, _payload(notice)),
+                    )
+                    if cursor.rowcount:
+                        notice["collected_at"] = collected_at
+                        notice["is_new"] = True
+                        inserted.append(notice)
+        return inserted
+
+    def mark_as_read(self, url: str) -> bool:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                cursor = conn.execute("UPDATE notices SET is_new = 0 WHERE url = ? AND is_new = 1", (url,))
+        return cursor.rowcount > 0
+
+    # ── reads ──
+
+    def _query(self, sql: str, params: tuple = ()) -> list[dict[str, Any]]:
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        return [_row_to_notice(row) for row in rows]
+
+    def recent(self, *, source: str | None = None, limit: int = 50, offset: int = 0) -> list[dict[str, Any]]:
+        """Most recently collected first, optionally for one source."""
+        limit, offset = max(0, limit), max(0, offset)
+        if source:
+            return self._query(
+                f"SELECT * FROM notices WHERE source = ? {_ORDER_RECENT} LIMIT ? OFFSET ?",
+                (source, limit, offset),
+            )
+        return self._query(f"SELECT * FROM notices {_ORDER_RECENT} LIMIT ? OFFSET ?", (limit, offset))
+
+    def unread(self, *, limit: int | None = None) -> list[dict[str, Any]]:
+        """Unread notices in insertion order."""
+        if limit is None:
+            return self._query("SELECT * FROM notices WHERE is_new = 1 ORDER BY id")
+        return self._query("SELECT * FROM notices WHERE is_new = 1 ORDER BY id LIMIT ?", (max(0, limit),))
+
+    def all(self) -> list[dict[str, Any]]:
+        return self._query("SELECT * FROM notices ORDER BY id")
+
+    def count(self, *, source: str | None = None) -> int:
+        with self._lock:
+            conn = self._connect()
+            if source:
+                row = conn.execute("SELECT COUNT(*) FROM notices WHERE source = ?", (source,)).fetchone()
+            else:
+                row = conn.execute("SELECT COUNT(*) FROM notices").fetchone()
+        return int(row[0])
@@ -1,11 +1,31 @@
 """
 BioLinker - PDF Parser Service
+
+Parsing runs in one pass per upload: GROBID when configured, otherwise pypdf
+opens the document once and returns text and metadata together. Large
+documents (``PDF_PARALLEL_MIN_PAGES`` pages or more) have their pages
+extracted in parallel by a process pool, since pypdf text extraction is
+CPU-bound.
+
+Results are cached on disk under ``PDF_PARSE_CACHE_DIR`` keyed by the
+SHA-256 of the file content, so re-uploads and re-indexing skip parsing.
+Set ``PDF_PARSE_CACHE_DIR=`` (empty) to disable the cache.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import io
-from dataclasses import dataclass
+import json
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from itertools import repeat
+from pathlib import Path
 from typing import Any
 
 try:
@@ -24,6 +44,12 @@ from .logging_config import get_logger
 
 log = get_logger("biolinker.services.pdf_parser")
 
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "64"))
+PDF_PARSE_WORKERS = int(os.getenv("PDF_PARSE_WORKERS", str(min(4, os.cpu_count() or 1))))
+_DEFAULT_CACHE_DIR = "data/pdf_cache"
+# Bump when the cached result shape or extraction logic changes.
+_CACHE_VERSION = 1
+
 
 @dataclass
 class PDFParseResult:
@@ -34,16 +60,119 @@ class PDFParseResult:
     parser: str
 
 
+def _extract_page_range(file_content: bytes, start: int, stop: int) -> list[str]:
+    """Extract text of pages ``[start, stop)``. Module-level so worker processes can run it."""
+    reader = pypdf.PdfReader(io.BytesIO(file_content))
+    texts = []
+    for index in range(start, min(stop, len(reader.pages))):
+        texts.append(reader.pages[index].extract_text() or "")
+    return texts
+
+
+def _page_ranges(page_count: int, chunks: int) -> list[tuple[int, int]]:
+    size = max(1, math.ceil(page_count / max(1, chunks)))
+    return [(start, min(start + size, page_count)) for start in range(0, page_count, size)]
+
+
+class PDFParseCache:
+    """One JSON file per parsed document, named by content hash."""
+
+    def __init__(self, cache_dir: str | Path):
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> PDFParseResult | None:
+        try:
+            with open(self._path(key), encoding="utf-8") as handle:
+                data = json.load(handle)
+            return PDFParseResult(text=data["text"], metadata=data["metadata"], parser=data["parser"])
+        except FileNotFoundError:
+            return None
+        except (OSError, KeyError, TypeError, json.JSONDecodeError) as exc:
+            log.warning("pdf_parse_cache_unreadable", key=key, error=str(exc))
+            return None
+
+    def put(self, key: str, result: PDFParseResult) -> None:
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(asdict(result), handle, ensure_ascii=False, default=str)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            log.warning("pdf_parse_cache_write_failed", key=key, error=str(exc))
+
+
 class PDFParser:
     """PDF 파일 텍스트 추출 서비스"""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        cache_dir: str | Path | None = None,
+        workers: int = PDF_PARSE_WORKERS,
+        parallel_min_pages: int = PDF_PARALLEL_MIN_PAGES,
+    ) -> None:
         self.grobid_parser = get_grobid_parser()
+        if cache_dir is None:
+            cache_dir = os.getenv("PDF_PARSE_CACHE_DIR", _DEFAULT_CACHE_DIR)
+        self.cache = PDFParseCache(cache_dir) if cache_dir else None
+        self.workers = max(1, workers)
+        self.parallel_min_pages = parallel_min_pages
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+
+    def _executor(self) -> Executor | None:
+        if self.workers < 2:
+            return None
+        with self._pool_lock:
+            if self._pool is None:
+                # spawn: the API process is multi-threaded, forking it is unsafe.
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._pool
+
+    def close(self) -> None:
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+                self._pool = None
+
+    def _cache_mode(self) -> str:
+        # Enabling GROBID changes the result, so it is part of the key.
+        return "grobid" if self.grobid_parser.is_configured else "pypdf"
+
+    def _cache_key(self, file_content: bytes) -> str:
+        digest = hashlib.sha256(file_content).hexdigest()
+        return f"{digest}-{self._cache_mode()}-v{_CACHE_VERSION}"
 
     def parse_document(self, file_content: bytes, filename: str = "document.pdf") -> PDFParseResult:
         """
         PDF 바이트 콘텐츠를 파싱해 텍스트와 메타데이터를 함께 반환한다.
         """
+        key = self._cache_key(file_content) if self.cache else ""
+        if self.cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                log.info("pdf_parse_cache_hit", filename=filename, parser=cached.parser)
+                return cached
+
+        result = self._parse_uncached(file_content, filename)
+        # Empty text usually means a transient GROBID/pypdf failure, and a pypdf
+        # result under the GROBID key means GROBID was down; retry both next time.
+        if self.cache and result.text.strip() and result.parser == self._cache_mode():
+            self.cache.put(key, result)
+        return result
+
+    async def parse_document_async(self, file_content: bytes, filename: str = "document.pdf") -> PDFParseResult:
+        """``parse_document`` off the event loop (GROBID I/O and page extraction both block)."""
+        return await asyncio.to_thread(self.parse_document, file_content, filename)
+
+    def _parse_uncached(self, file_content: bytes, filename: str) -> PDFParseResult:
         grobid_result = self.grobid_parser.parse_document(file_content, filename=filename)
         if grobid_result and grobid_result.text.strip():
             return PDFParseResult(
@@ -55,8 +184,7 @@ class PDFParser:
         if grobid_result is None and self.grobid_parser.is_configured:
             log.info("pdf_parser_fallback_to_pypdf", reason="grobid_unavailable_or_failed")
 
-        text = self._parse_with_pypdf(file_content)
-        metadata = self._extract_metadata_with_pypdf(file_content)
+        text, metadata = self._parse_with_pypdf(file_content)
         return PDFParseResult(text=text, metadata=metadata, parser="pypdf")
 
     def parse(self, file_content: bytes, filename: str = "document.pdf") -> str:
@@ -71,32 +199,52 @@ class PDFParser:
         """
         return self.parse_document(file_content, filename=filename).metadata
 
-    @staticmethod
-    def _parse_with_pypdf(file_content: bytes) -> str:
+    def _parse_with_pypdf(self, file_content: bytes) -> tuple[str, dict[str, Any]]:
+        """Open the document once; return (text, metadata)."""
         try:
-            file_stream = io.BytesIO(file_content)
-            reader = pypdf.PdfReader(file_stream)
-
-            text: list[str] = []
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text.append(page_text)
-
-            return "\n".join(text)
+            reader = pypdf.PdfReader(io.BytesIO(file_content))
         except Exception as exc:
             log.warning("pypdf_parse_failed", error=str(exc))
-            return ""
+            return "", {}
 
-    @staticmethod
-    def _extract_metadata_with_pypdf(file_content: bytes) -> dict[str, Any]:
         try:
-            file_stream = io.BytesIO(file_content)
-            reader = pypdf.PdfReader(file_stream)
             raw_metadata = reader.metadata or {}
-            return {str(key): value for key, value in dict(raw_metadata).items()}
+            metadata = {str(key): value for key, value in dict(raw_metadata).items()}
         except Exception:
-            return {}
+            metadata = {}
+
+        try:
+            page_count = len(reader.pages)
+            pages = None
+            if page_count >= self.parallel_min_pages:
+                pages = self._extract_pages_parallel(file_content, page_count)
+            if pages is None:
+                pages = [page.extract_text() or "" for page in reader.pages]
+        except Exception as exc:
+            log.warning("pypdf_parse_failed", error=str(exc))
+            return "", metadata
+
+        return "\n".join(text for text in pages if text), metadata
+
+    def _extract_pages_parallel(self, file_content: bytes, page_count: int) -> list[str] | None:
+        """Fan page ranges out to the process pool; None means extract serially instead."""
+        executor = self._executor()
+        if executor is None:
+            return None
+        ranges = _page_ranges(page_count, self.workers * 2)
+        try:
+            chunks = executor.map(
+                _extract_page_range,
+                repeat(file_content),
+                [start for start, _ in ranges],
+                [stop for _, stop in ranges],
+            )
+            pages = [text for chunk in chunks for text in chunk]
+        except Exception as exc:
+            log.warning("pypdf_parallel_parse_failed", pages=page_count, error=str(exc))
+            return None
+        log.info("pypdf_parallel_parse", pages=page_count, chunks=len(ranges), workers=self.workers)
+        return pages
 
 
 _parser = PDFParser()
@@ -37,6 +37,7 @@ class QdrantVectorStore(VectorStore):
         self.collection = None
 
         init_embedding_fn(self)
+        self._asset_listeners = []
 
         if not _load_qdrant_support() or QdrantClient is None:
             raise RuntimeError("qdrant-client is not installed")
@@ -214,6 +215,7 @@ class QdrantVectorStore(VectorStore):
             print(f"[오류] Qdrant 자산 저장 실패, JSON fallback 사용: {e}")
             self._save_to_json(asset_id, embedding, final_meta, content[:6000])
 
+        self._notify_asset_listeners(asset_id, embedding, final_meta)
         return asset_id
 
     def add_vc_firm(self, vc: VCFirm) -> str:
@@ -240,10 +242,9 @@ class QdrantVectorStore(VectorStore):
 
     # ── Search override ────────────────────────────────
 
-    def search_similar(
-        self, query: str, n_results: int = 5, filters: dict[str, Any] | None = None
+    def _search_with_embedding(
+        self, query: str, query_embedding: list[float], n_results: int, filters: dict[str, Any] | None
     ) -> list[tuple[RFPDocument, float]]:
-        query_embedding = self._get_embedding(query)
         raw_hits: list[dict[str, Any]] = []
         fetch_limit = max(n_results * 4, n_results)
 
@@ -320,6 +321,7 @@ class QdrantVectorStore(VectorStore):
                     points_selector=qdrant_models.PointIdsList(points=[notice_id]),
                     wait=True,
                 )
+                self._notify_asset_listeners(notice_id)
                 return
         except Exception as e:  # pylint: disable=broad-exception-caught
             print(f"[오류] Qdrant 삭제 실패 {notice_id}: {e}")
@@ -375,3 +377,34 @@ class QdrantVectorStore(VectorStore):
             return items
         except Exception:  # pylint: disable=broad-exception-caught
             return super().get_documents_by_metadata(key, value)
+
+    def get_embeddings_by_metadata(self, key: str, value: Any) -> list[dict[str, Any]]:
+        try:
+            records, _ = self.qdrant_client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=self._build_filter({key: value}),
+                limit=100,
+                with_payload=True,
+                with_vectors=True,
+            )
+            items = []
+            for point in records:
+                payload = dict(getattr(point, "payload", {}) or {})
+                payload.pop("document", None)
+                vector = getattr(point, "vector", None)
+                if vector:
+                    items.append({"id": str(getattr(point, "id", "")), "metadata": payload, "embedding": list(vector)})
+            return items
+        except Exception:  # pylint: disable=broad-exception-caught
+            return super().get_embeddings_by_metadata(key, value)
+
+    def count_by_metadata(self, key: str, value: Any) -> int:
+        try:
+            result = self.qdrant_client.count(
+                collection_name=self.collection_name,
+                count_filter=self._build_filter({key: value}),
+                exact=True,
+            )
+            return int(getattr(result, "count", 0) or 0)
+        except Exception:  # pylint: disable=broad-exception-caught
+            return super().count_by_metadata(key, value)
@@ -18,6 +18,15 @@ from services.logging_config import get_logger
 
 log = get_logger("biolinker.services.rabbitmq_bus")
 
+# Message priority per job type (queues are declared with x-max-priority=10).
+# Quick interactive jobs jump ahead of bulk work sharing the same queue.
+JOB_PRIORITIES: dict[str, int] = {
+    "job.papers.index": 8,
+    "job.match.paper": 6,
+    "job.notices.collect": 3,
+    "job.proposal.generate": 5,
+}
+
 
 class RabbitMQBus:
     """RabbitMQ messaging bus for background jobs."""
@@ -77,6 +86,7 @@ class RabbitMQBus:
                 properties=pika.BasicProperties(
                     delivery_mode=2,  # make message durable
                     content_type="application/json",
+                    priority=JOB_PRIORITIES.get(routing_key, 0),
                 ),
             )
             log.info("job_published", key=routing_key)
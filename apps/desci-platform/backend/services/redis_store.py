@@ -3,9 +3,11 @@ BioLinker - Redis Store Service
 Centralized caching and session management.
 """
 
+import asyncio
 import os
 
 import redis
+import redis.asyncio as redis_asyncio
 
 from services.logging_config import get_logger
 
@@ -18,6 +20,8 @@ class RedisStore:
     def __init__(self):
         self.url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
         self._client = None
+        self._async_client = None
+        self._async_loop = None
         self._is_ready = False
         self._connect()
 
@@ -60,6 +64,20 @@ class RedisStore:
             log.warning("redis_set_error", key=key, error=str(exc))
             return False
 
+    def async_client(self):
+        """Non-blocking client for code running on the event loop.
+
+        redis.asyncio connections bind to the loop that opened them, so one
+        client is kept per running loop. Returns None when Redis is unavailable.
+        """
+        if not self.is_ready:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._async_client = redis_asyncio.from_url(self.url, decode_responses=True)
+            self._async_loop = loop
+        return self._async_client
+
 
 _redis_store = None
 
@@ -8,9 +8,20 @@ as APScheduler or crawler dependencies are not installed.
 from __future__ import annotations
 
 import asyncio
-import json
 import os
+import time
 from datetime import datetime
+from functools import partial
+
+from services.notice_pipeline import (
+    DETAIL_WORKERS,
+    HOST_CONCURRENCY,
+    HOST_RATE,
+    CollectionStats,
+    HostThrottle,
+    fetch_and_index,
+)
+from services.notice_store import NoticeStore
 
 try:
     from apscheduler.schedulers.background import BackgroundScheduler
@@ -58,14 +69,30 @@ def get_vector_store():
     return _load_getter("vector_store", "get_vector_store")()
 
 
+NTIS_KEYWORDS = ("바이오", "신약", "제약", "AI 신약")
+
+
 class NoticeScheduler:
     """Collect and cache government RFP notices."""
 
-    def __init__(self, data_dir: str = "./data"):
+    def __init__(
+        self,
+        data_dir: str = "./data",
+        *,
+        host_concurrency: int = HOST_CONCURRENCY,
+        host_rate: float = HOST_RATE,
+        detail_workers: int = DETAIL_WORKERS,
+    ):
         self.data_dir = data_dir
-        self.notices_file = os.path.join(data_dir, "notices.json")
+        self.host_concurrency = host_concurrency
+        self.host_rate = host_rate
+        self.detail_workers = detail_workers
+        self.last_run_stats: dict | None = None
+        self.notices_file = os.path.join(data_dir, "notices.json")  # legacy, migrated on first use
+        self.notices_db = os.path.join(data_dir, "notices.db")
         self.last_run_file = os.path.join(data_dir, "last_run.txt")
         os.makedirs(data_dir, exist_ok=True)
+        self.store = NoticeStore(self.notices_db, legacy_json=self.notices_file)
 
         self.scheduler = BackgroundScheduler()
         self.scheduler.add_job(
@@ -96,39 +123,18 @@ class NoticeScheduler:
             print(f"[Scheduler] Job failed: {exc}")
 
     async def collect_all_notices(self) -> list[dict]:
-        all_notices: list[dict] = []
+        started = time.perf_counter()
+        stats = CollectionStats()
+        throttle = HostThrottle(concurrency=self.host_concurrency, rate=self.host_rate)
 
         print(f"[Scheduler] Starting collection at {datetime.now().isoformat()}")
 
-        try:
-            kddf = get_kddf_crawler()
-            kddf_notices = await kddf.fetch_notice_list()
-            all_notices.extend(kddf_notices)
-            print(f"[KDDF] Collected {len(kddf_notices)} notices")
-        except Exception as exc:  # noqa: BLE001
-            print(f"[KDDF] Error: {exc}")
-
-        ntis = None
-        try:
-            ntis = get_ntis_crawler()
-            ntis_notices = await ntis.fetch_notice_list("바이오")
-            all_notices.extend(ntis_notices)
-            print(f"[NTIS] Collected {len(ntis_notices)} notices")
-        except Exception as exc:  # noqa: BLE001
-            print(f"[NTIS] Error: {exc}")
-
-        if ntis is not None:
-            for keyword in ["신약", "제약", "AI 신약"]:
-                try:
-                    extra = await ntis.fetch_notice_list(keyword)
-                    existing_urls = {notice["url"] for notice in all_notices if notice.get("url")}
-                    new_notices = [notice for notice in extra if notice.get("url") not in existing_urls]
-                    all_notices.extend(new_notices)
-                    print(f"[NTIS:{keyword}] Added {len(new_notices)} new notices")
-                except Exception as exc:  # noqa: BLE001
-                    print(f"[NTIS:{keyword}] Error: {exc}")
+        all_notices = await self._collect_lists(throttle)
+        stats.listed = len(all_notices)
+        stats.list_seconds = time.perf_counter() - started
 
         new_notices = self._save_notices(all_notices)
+        stats.new = len(new_notices)
         self._update_last_run()
 
         try:
@@ -139,57 +145,84 @@ class NoticeScheduler:
 
         if vector_store is not None and new_notices:
             print(f"[Scheduler] Indexing {len(new_notices)} new notices")
-            for notice in new_notices:
-                try:
-                    rfp = None
-                    source = notice.get("source")
-                    url = notice.get("url")
-                    if not url:
-                        continue
-
-                    if source == "KDDF":
-                        rfp = await get_kddf_crawler().fetch_notice_detail(url)
-                    elif source == "NTIS":
-                        rfp = await get_ntis_crawler().fetch_notice_detail(url)
-
-                    if rfp:
-                        vector_store.add_notice(rfp)
-                        print(f"[Scheduler] Indexed: {getattr(rfp, 'title', '')[:30]}")
-                    await asyncio.sleep(1)
-                except Exception as exc:  # noqa: BLE001
-                    print(f"[Scheduler] Failed to index {notice.get('url')}: {exc}")
-
-        print(f"[Scheduler] Total collected: {len(all_notices)}")
+            detail_started = time.perf_counter()
+            await fetch_and_index(
+                new_notices,
+                fetchers=self._detail_fetchers(),
+                index=vector_store.add_notice,
+                throttle=throttle,
+                stats=stats,
+                workers=self.detail_workers,
+            )
+            stats.detail_seconds = time.perf_counter() - detail_started
+
+        stats.total_seconds = time.perf_counter() - started
+        self.last_run_stats = stats.as_dict()
+        print(
+            f"[Scheduler] Total collected: {len(all_notices)} "
+            f"(new {stats.new}, indexed {stats.indexed}) in {stats.total_seconds:.2f}s "
+            f"[list {stats.list_seconds:.2f}s, detail+index {stats.detail_seconds:.2f}s]"
+        )
         return all_notices
 
-    def _save_notices(self, notices: list[dict]) -> list[dict]:
-        existing = self._load_notices()
-        existing_urls = {notice["url"] for notice in existing if notice.get("url")}
+    async def _collect_lists(self, throttle: HostThrottle) -> list[dict]:
+        """Run every list request concurrently; merge in KDDF, NTIS keyword order."""
+
+        async def fetch(label: str, url: str, request) -> list[dict]:  # noqa: ANN001
+            try:
+                async with throttle.slot(url):
+                    notices = await request()
+            except Exception as exc:  # noqa: BLE001
+                print(f"[{label}] Error: {exc}")
+                return []
+            print(f"[{label}] Collected {len(notices)} notices")
+            return notices
+
+        requests = []
+        try:
+            kddf = get_kddf_crawler()
+            requests.append(fetch("KDDF", kddf.NOTICE_URL, kddf.fetch_notice_list))
+        except Exception as exc:  # noqa: BLE001
+            print(f"[KDDF] Error: {exc}")
+
+        try:
+            ntis = get_ntis_crawler()
+        except Exception as exc:  # noqa: BLE001
+            print(f"[NTIS] Error: {exc}")
+        else:
+            for index, keyword in enumerate(NTIS_KEYWORDS):
+                label = "NTIS" if index == 0 else f"NTIS:{keyword}"
+                requests.append(fetch(label, ntis.SEARCH_URL, partial(ntis.fetch_notice_list, keyword)))
+
+        all_notices: list[dict] = []
+        seen_urls: set[str] = set()
+        for notices in await asyncio.gather(*requests):
+            for notice in notices:
+                url = notice.get("url")
+                if url in seen_urls:
+                    continue
+                if url:
+                    seen_urls.add(url)
+                all_notices.append(notice)
+        return all_notices
 
-        new_items: list[dict] = []
-        for notice in notices:
-            if notice.get("url") and notice["url"] not in existing_urls:
-                notice["collected_at"] = datetime.now().isoformat()
-                notice["is_new"] = True
-                existing.append(notice)
-                new_items.append(notice)
+    def _detail_fetchers(self) -> dict:
+        fetchers = {}
+        for source, getter in (("KDDF", get_kddf_crawler), ("NTIS", get_ntis_crawler)):
+            try:
+                fetchers[source] = getter().fetch_notice_detail
+            except Exception as exc:  # noqa: BLE001
+                print(f"[{source}] Detail crawler unavailable: {exc}")
+        return fetchers
 
+    def _save_notices(self, notices: list[dict]) -> list[dict]:
+        new_items = self.store.add_new(notices)
         if new_items:
-            with open(self.notices_file, "w", encoding="utf-8") as handle:
-                json.dump(existing, handle, ensure_ascii=False, indent=2)
             print(f"[Scheduler] Saved {len(new_items)} new notices")
-
         return new_items
 
     def _load_notices(self) -> list[dict]:
-        if not os.path.exists(self.notices_file):
-            return []
-
-        try:
-            with open(self.notices_file, encoding="utf-8") as handle:
-                return json.load(handle)
-        except (OSError, json.JSONDecodeError):
-            return []
+        return self.store.all()
 
     def _update_last_run(self):
         with open(self.last_run_file, "w", encoding="utf-8") as handle:
@@ -201,26 +234,14 @@ class NoticeScheduler:
                 return handle.read().strip()
         return None
 
-    def get_notices(self, source: str | None = None, limit: int = 50) -> list[dict]:
-        notices = self._load_notices()
-
-        if source:
-            notices = [notice for notice in notices if notice.get("source") == source]
-
-        notices.sort(key=lambda item: item.get("collected_at", ""), reverse=True)
-        return notices[:limit]
+    def get_notices(self, source: str | None = None, limit: int = 50, offset: int = 0) -> list[dict]:
+        return self.store.recent(source=source, limit=limit, offset=offset)
 
     def get_new_notices(self) -> list[dict]:
-        return [notice for notice in self._load_notices() if notice.get("is_new", False)]
+        return self.store.unread()
 
     def mark_as_read(self, url: str):
-        notices = self._load_notices()
-        for notice in notices:
-            if notice.get("url") == url:
-                notice["is_new"] = False
-
-        with open(self.notices_file, "w", encoding="utf-8") as handle:
-            json.dump(notices, handle, ensure_ascii=False, indent=2)
+        self.store.mark_as_read(url)
 
 
 _scheduler: NoticeScheduler | None = None
@@ -3,6 +3,7 @@ from typing import Any
 from models import RFPDocument, UserProfile
 
 from .analyzer import get_analyzer
+from .company_profile import CompanyAssetProfile
 from .vector_store import get_vector_store
 
 
@@ -17,6 +18,8 @@ class SmartMatcher:
     def __init__(self):
         self.vector_store = get_vector_store()
         self.analyzer = get_analyzer()
+        # 회사 자산 centroid: 자산 추가/삭제 시에만 증분 갱신
+        self.profile = CompanyAssetProfile(self.vector_store)
 
     async def match_new_notice(self, notice: dict[str, Any]) -> dict[str, Any] | None:
         """
@@ -100,19 +103,13 @@ class SmartMatcher:
         """
         회사 자산을 기반으로 적합한 VC 추천
         """
-        # 1. 회사 자산 로드
-        assets = self.vector_store.get_documents_by_metadata("type", "company_asset")
-        if not assets:
+        # 1. 회사 프로필 벡터 (캐시된 자산 centroid, 재임베딩 없음)
+        profile_vector = self.profile.centroid()
+        if profile_vector is None:
             return []
 
-        # 2. 검색 쿼리 생성
-        combined_text = " ".join([f"{a['metadata'].get('title', '')} {a['document'][:500]}" for a in assets])
-        query = combined_text[:2000]
-
-        # 3. 관련 VC 검색
-        # type='vc_firm'인 문서 검색
-        # ChromaDB where filter
-        candidates = self.vector_store.search_similar(query, n_results=10, filters={"type": "vc_firm"})
+        # 2. 관련 VC 검색: type='vc_firm' 문서 대상 벡터 검색 한 번
+        candidates = self.vector_store.search_by_embedding(profile_vector, n_results=10, filters={"type": "vc_firm"})
 
         recommendations = []
         for doc, score in candidates:
@@ -132,6 +129,29 @@ class SmartMatcher:
 
         return recommendations
 
+    def score_notices(self, notices: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        다수 공고를 회사 프로필과 일괄 비교 (LLM 분석 전 1차 선별용)
+
+        공고 임베딩은 한 번의 배치 호출로 만들고, 프로필 centroid와의
+        코사인 유사도는 한 번의 행렬 곱으로 계산합니다.
+
+        Returns:
+            List[Dict]: 입력 순서 그대로 {rfp_id, title, profile_score(0~100)}
+        """
+        if not notices:
+            return []
+        texts = [f"{n.get('title', '')}\n{n.get('body_text', '')}"[:2000] for n in notices]
+        scores = self.profile.score_matrix(self.vector_store._get_embeddings(texts))  # pylint: disable=protected-access
+        return [
+            {
+                "rfp_id": notice.get("id"),
+                "title": notice.get("title", ""),
+                "profile_score": round(float(score) * 100, 1),
+            }
+            for notice, score in zip(notices, scores, strict=True)
+        ]
+
     async def match_companies_for_vc(self, vc_id: str) -> list[dict[str, Any]]:
         """
         특정 VC의 투자 철학(Thesis)에 맞는 기업 자산(기술/논문) 추천
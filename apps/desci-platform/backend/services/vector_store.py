@@ -9,6 +9,7 @@ import json
 import os
 import re
 import sys
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any, cast
 
@@ -65,6 +66,9 @@ from .embedding_providers import (
     _load_qdrant_support,
 )
 
+# 회사 자산 변경 리스너: (asset_id, embedding, metadata). 삭제 시 embedding/metadata는 None
+AssetListener = Callable[[str, list[float] | None, dict[str, Any] | None], None]
+
 
 class VectorStore:
     """RFP 공고 벡터 저장소 (ChromaDB + 인메모리 Fallback)"""
@@ -78,6 +82,7 @@ class VectorStore:
         self.embedding_fn: Any | None = None
         self.embedding_model = None
         self.openai_client = None
+        self._asset_listeners: list[AssetListener] = []
 
         # 1. Google Embeddings (우선 순위)
         google_key = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
@@ -148,6 +153,29 @@ class VectorStore:
         # Linter complaining about string slicing, suppressing error
         return [float(int(hash_val[i : i + 2], 16)) / 255.0 for i in range(0, 32, 2)]  # type: ignore
 
+    def _get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """다수 텍스트 임베딩 (임베딩 모델이 있으면 한 번의 배치 호출)"""
+        if not texts:
+            return []
+        if self.embedding_fn:
+            return list(self.embedding_fn(list(texts)))  # type: ignore
+        return [self._get_embedding(text) for text in texts]
+
+    # ── 회사 자산 변경 알림 ──
+
+    def add_asset_listener(self, listener: AssetListener) -> None:
+        """회사 자산 추가/삭제 시 호출될 콜백 등록 (예: CompanyAssetProfile)"""
+        self._asset_listeners.append(listener)
+
+    def _notify_asset_listeners(
+        self, asset_id: str, embedding: list[float] | None = None, metadata: dict[str, Any] | None = None
+    ) -> None:
+        for listener in list(getattr(self, "_asset_listeners", [])):
+            try:
+                listener(asset_id, embedding, metadata)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                print(f"[오류] 자산 변경 리스너 실패 {asset_id}: {e}")
+
     @staticmethod
     def _safe_int(value: Any) -> int | None:
         try:
@@ -276,6 +304,8 @@ class VectorStore:
     ) -> list[dict[str, Any]]:
         hybrid_weight = float(os.getenv("HYBRID_SEARCH_TEXT_WEIGHT", "0.2"))
         hybrid_weight = max(0.0, min(1.0, hybrid_weight))
+        if not (query or "").strip():
+            hybrid_weight = 0.0  # 벡터 검색: 어휘 점수로 희석하지 않음
 
         processed = []
         for item in items:
@@ -450,6 +480,7 @@ class VectorStore:
             # 인메모리 저장
             self._save_to_json(asset_id, embedding, final_meta, content[:6000])
 
+        self._notify_asset_listeners(asset_id, embedding, final_meta)
         return asset_id
 
     def add_vc_firm(self, vc: VCFirm) -> str:
@@ -493,7 +524,18 @@ class VectorStore:
     ) -> list[tuple[RFPDocument, float]]:
         # pylint: disable=too-many-locals
         """유사 공고 검색 (하이브리드 필터 지원)"""
-        query_embedding = self._get_embedding(query)
+        return self._search_with_embedding(query, self._get_embedding(query), n_results, filters)
+
+    def search_by_embedding(
+        self, embedding: list[float], n_results: int = 5, filters: dict[str, Any] | None = None
+    ) -> list[tuple[RFPDocument, float]]:
+        """이미 계산된 벡터로 검색 (질의 텍스트가 없으므로 순수 벡터 유사도)"""
+        return self._search_with_embedding("", embedding, n_results, filters)
+
+    def _search_with_embedding(
+        self, query: str, query_embedding: list[float], n_results: int, filters: dict[str, Any] | None
+    ) -> list[tuple[RFPDocument, float]]:
+        # pylint: disable=too-many-locals
         raw_hits: list[dict[str, Any]] = []
         fetch_limit = max(n_results * 4, n_results)
         backend_filters = self._backend_filters(filters)
@@ -669,6 +711,7 @@ class VectorStore:
 
     def delete_notice(self, notice_id: str) -> None:
         """ID로 공고 삭제"""
+        self._notify_asset_listeners(notice_id)
         # Local variable narrowing
         collection = self.collection
         if CHROMADB_AVAILABLE and collection:
@@ -770,6 +813,60 @@ class VectorStore:
                 pass
         return items
 
+    def get_embeddings_by_metadata(self, key: str, value: Any) -> list[dict[str, Any]]:
+        """메타데이터 키-값으로 문서 임베딩 조회 ({"id", "metadata", "embedding"})"""
+        collection = self.collection
+        if CHROMADB_AVAILABLE and collection:
+            try:
+                result = collection.get(where={key: value}, include=["metadatas", "embeddings"])
+                ids = result.get("ids", []) or []
+                metadatas = result.get("metadatas", []) or []
+                embeddings = result.get("embeddings")
+                if embeddings is None:
+                    embeddings = []
+                return [
+                    {"id": id_, "metadata": metadatas[i] or {}, "embedding": list(embeddings[i])}
+                    for i, id_ in enumerate(ids)
+                    if i < len(embeddings)
+                ]
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                print(f"[오류] ChromaDB 임베딩 조회 실패: {e}")
+                return []
+
+        db_path = os.path.join(self.persist_dir, "db.json")
+        items = []
+        if os.path.exists(db_path):
+            try:
+                with open(db_path, encoding="utf-8") as f:
+                    data = json.load(f)
+                for doc_id, val in data.items():
+                    if val.get("metadata", {}).get(key) == value and val.get("embedding"):
+                        items.append({"id": doc_id, "metadata": val["metadata"], "embedding": val["embedding"]})
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass
+        return items
+
+    def count_by_metadata(self, key: str, value: Any) -> int:
+        """메타데이터 키-값이 일치하는 문서 수 (본문/임베딩은 읽지 않음)"""
+        collection = self.collection
+        if CHROMADB_AVAILABLE and collection:
+            try:
+                result = collection.get(where={key: value}, include=[])
+                return len(result.get("ids", []) or [])
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                print(f"[오류] ChromaDB 개수 조회 실패: {e}")
+                return 0
+
+        db_path = os.path.join(self.persist_dir, "db.json")
+        if os.path.exists(db_path):
+            try:
+                with open(db_path, encoding="utf-8") as f:
+                    data = json.load(f)
+                return sum(1 for val in data.values() if val.get("metadata", {}).get(key) == value)
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass
+        return 0
+
 
 # ── QdrantVectorStore (extracted to qdrant_store.py) ──
 from .qdrant_store import QdrantVectorStore  # noqa: E402,F401
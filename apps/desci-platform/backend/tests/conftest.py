@@ -164,6 +164,13 @@ async def async_client(mock_external_services):
         yield client
 
 
+@pytest.fixture(autouse=True)
+def isolate_pdf_parse_cache(monkeypatch, tmp_path):
+    """Give every PDFParser built in a test its own parse cache directory."""
+
+    monkeypatch.setenv("PDF_PARSE_CACHE_DIR", str(tmp_path / "pdf_cache"))
+
+
 @pytest.fixture(autouse=True)
 def reset_job_state():
     """Keep background job state isolated between tests."""
@@ -197,7 +197,22 @@ async def test_notices_filters_by_source(async_client: AsyncClient, monkeypatch)
     response = await async_client.get("/notices", params={"source": "KDDF", "limit": 10})
 
     assert response.status_code == 200
-    stub_scheduler.get_notices.assert_called_once_with(source="KDDF", limit=10)
+    stub_scheduler.get_notices.assert_called_once_with(source="KDDF", limit=10, offset=0)
+
+
+@pytest.mark.asyncio
+async def test_notices_paginates_with_offset(async_client: AsyncClient, monkeypatch):
+    """GET /notices?offset=N should pass the offset to the scheduler; negative offsets are rejected."""
+    stub_scheduler = MagicMock()
+    stub_scheduler.get_notices.return_value = []
+    monkeypatch.setattr(crawl_router, "get_scheduler", lambda: stub_scheduler)
+
+    response = await async_client.get("/notices", params={"limit": 20, "offset": 40})
+    assert response.status_code == 200
+    stub_scheduler.get_notices.assert_called_once_with(source=None, limit=20, offset=40)
+
+    response = await async_client.get("/notices", params={"offset": -1})
+    assert response.status_code == 422
 
 
 @pytest.mark.asyncio
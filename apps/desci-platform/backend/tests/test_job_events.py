@@ -0,0 +1,162 @@
+"""JobManager persistence: Redis state hash plus append-only event list (fakeredis)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+import services.job_manager as job_manager_module
+import services.redis_store as redis_store_module
+from models import JobType
+
+fakeredis = pytest.importorskip("fakeredis")
+
+STEPS = 60
+# creation + "Job started" + STEPS updates + success
+TOTAL_EVENTS = STEPS + 3
+
+
+@pytest.fixture
+def redis_store(monkeypatch):
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(
+        redis_store_module.redis,
+        "from_url",
+        lambda url, **kwargs: fakeredis.FakeRedis(server=server, **kwargs),
+    )
+    monkeypatch.setattr(
+        redis_store_module.redis_asyncio,
+        "from_url",
+        lambda url, **kwargs: fakeredis.FakeAsyncRedis(server=server, **kwargs),
+    )
+    store = redis_store_module.RedisStore()
+    monkeypatch.setattr(job_manager_module, "get_redis_store", lambda: store)
+    return store
+
+
+async def _run_job(manager: job_manager_module.JobManager, runner) -> str:  # noqa: ANN001
+    accepted = await manager.create_job(
+        job_type=JobType.NOTICE_COLLECTION, payload={"k": "v"}, runner=runner, message="Queued"
+    )
+    job_id = accepted.job.id
+    task = manager._tasks.get(job_id)
+    if task is not None:
+        await task
+    return job_id
+
+
+async def _steps(context: job_manager_module.JobContext) -> dict:
+    for step in range(STEPS):
+        await context.update(step, f"step {step}")
+    return {"done": True}
+
+
+@pytest.mark.asyncio
+async def test_updates_append_events_and_keep_state_compact(redis_store):
+    manager = job_manager_module.JobManager()
+    job_id = await _run_job(manager, _steps)
+    client = redis_store._client
+
+    state = client.hgetall(manager._state_key(job_id))
+    events = client.lrange(manager._events_key(job_id), 0, -1)
+
+    assert "events" not in state
+    assert json.loads(state["status"]) == "succeeded"
+    assert json.loads(state["version"]) == TOTAL_EVENTS - 1
+    assert json.loads(state["payload"]) == {"k": "v"}
+    assert len(events) == TOTAL_EVENTS
+    assert [json.loads(event)["message"] for event in events[2:4]] == ["step 0", "step 1"]
+    assert client.ttl(manager._events_key(job_id)) > 0
+    assert not client.exists(manager._cache_key(job_id))
+
+
+@pytest.mark.asyncio
+async def test_other_worker_rebuilds_record_and_reads_full_history(redis_store):
+    job_id = await _run_job(job_manager_module.JobManager(), _steps)
+
+    other = job_manager_module.JobManager()
+    record = await other.load_record(job_id)
+
+    assert record is not None and record.storage == "redis"
+    assert record.version == TOTAL_EVENTS - 1
+    assert len(record.events) == job_manager_module._EVENT_WINDOW
+    assert record.result == {"done": True}
+
+    history = await other.events_since(job_id, 0)
+    assert len(history) == TOTAL_EVENTS
+    assert history[0].message == "Queued" and history[-1].status == "succeeded"
+
+
+@pytest.mark.asyncio
+async def test_stream_resumes_from_offset_without_gaps_or_repeats(redis_store):
+    manager = job_manager_module.JobManager()
+    gate = asyncio.Event()
+
+    async def gated(context: job_manager_module.JobContext) -> dict:
+        for step in range(STEPS):
+            await context.update(step, f"step {step}")
+            if step == 5:
+                await gate.wait()
+        return {"done": True}
+
+    accepted = await manager.create_job(job_type=JobType.NOTICE_COLLECTION, payload={}, runner=gated, message="Queued")
+    job_id = accepted.job.id
+    while manager.get_record(job_id).version < 7:
+        await asyncio.sleep(0)
+
+    resumed = []
+    versions = []
+    async for snapshot in manager.stream(job_id, offset=3):
+        versions.append(snapshot.version)
+        resumed.extend(snapshot.events)
+        gate.set()
+
+    assert versions[0] == 7 and versions[-1] == TOTAL_EVENTS - 1
+    assert len(resumed) == TOTAL_EVENTS - 3
+    assert resumed[0].message == "step 1"
+
+
+@pytest.mark.asyncio
+async def test_legacy_single_document_jobs_are_still_readable(redis_store):
+    manager = job_manager_module.JobManager()
+    job_id = await _run_job(manager, _steps)
+    record = manager.get_record(job_id)
+    legacy = record.serialize() | {"events": [event.model_dump(mode="json") for event in record.events]}
+    redis_store.set("biolinker:jobs:legacy-1", json.dumps(legacy | {"id": "legacy-1"}))
+
+    loaded = await job_manager_module.JobManager().load_record("legacy-1")
+
+    assert loaded is not None and loaded.version == record.version
+    assert len(loaded.events) == len(record.events)
+
+
+@pytest.mark.asyncio
+async def test_updating_legacy_job_migrates_it_to_state_hash(redis_store):
+    manager = job_manager_module.JobManager()
+    job_id = await _run_job(manager, _steps)
+    record = manager.get_record(job_id)
+    legacy = record.serialize() | {"id": "legacy-2", "status": "running", "result": None, "completed_at": None}
+    for name in ("version", "events_base"):  # written before versioning existed
+        legacy.pop(name)
+    legacy["events"] = [event.model_dump(mode="json") for event in (await manager.events_since(job_id, 0))[:3]]
+    redis_store.set("biolinker:jobs:legacy-2", json.dumps(legacy))
+
+    writer = job_manager_module.JobManager()
+    await writer.update_job("legacy-2", progress=40, message="resumed")
+
+    loaded = await job_manager_module.JobManager().load_record("legacy-2")
+    assert loaded is not None
+    assert (loaded.version, loaded.progress, loaded.payload) == (3, 40, {"k": "v"})
+    history = await job_manager_module.JobManager().events_since("legacy-2", 0)
+    assert [event.message for event in history] == ["Queued", "Job started", "step 0", "resumed"]
+    assert not redis_store._client.exists("biolinker:jobs:legacy-2")
+
+
+@pytest.mark.asyncio
+async def test_write_locks_are_released_when_jobs_finish(redis_store):
+    manager = job_manager_module.JobManager()
+    await _run_job(manager, _steps)
+    await _run_job(manager, _steps)
+
+    assert manager._write_locks == {}
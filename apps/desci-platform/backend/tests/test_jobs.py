@@ -75,6 +75,33 @@ async def test_notice_collection_job_streams_terminal_snapshot(async_client: Asy
     assert events[-1]["result"]["collected"] == 1
 
 
+@pytest.mark.asyncio
+async def test_job_stream_resumes_after_last_event_id(async_client: AsyncClient, monkeypatch):
+    class StubScheduler:
+        async def collect_all_notices(self):
+            return [{"id": "n1", "title": "Notice 1", "source": "KDDF"}]
+
+    monkeypatch.setattr(jobs_router, "get_scheduler", lambda: StubScheduler())
+
+    create_response = await async_client.post("/jobs/notices/collect")
+    job_id = create_response.json()["job"]["id"]
+    terminal = await wait_for_terminal_job(async_client, job_id)
+
+    ids, snapshots = [], []
+    headers = {"Last-Event-ID": "1"}
+    async with async_client.stream("GET", f"/jobs/{job_id}/events", headers=headers) as response:
+        async for line in response.aiter_lines():
+            if line.startswith("id: "):
+                ids.append(int(line[4:]))
+            elif line.startswith("data: "):
+                snapshots.append(json.loads(line[6:]))
+
+    assert ids == [terminal["version"]]
+    # Only the events after the last one the client saw.
+    assert len(snapshots[0]["events"]) == terminal["version"] - 1
+    assert snapshots[0]["events"][-1]["status"] == "succeeded"
+
+
 @pytest.mark.asyncio
 async def test_paper_index_job_requires_auth(mock_external_services, monkeypatch):
     class StubAssetManager:
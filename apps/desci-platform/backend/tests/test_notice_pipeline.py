@@ -0,0 +1,194 @@
+"""Staged notice collection against local stub KDDF / NTIS endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+import services.scheduler as scheduler_module
+from aiohttp import web
+from services.kddf_crawler import KDDFCrawler
+from services.notice_pipeline import HostThrottle, TokenBucket
+from services.ntis_crawler import NTISCrawler
+
+DETAIL_DELAY = 0.05
+INDEX_DELAY = 0.03
+
+
+class StubPortal:
+    """Serves KDDF/NTIS-shaped list and detail pages and records request timing."""
+
+    def __init__(self, kddf_count: int = 6, ntis_per_keyword: int = 4):
+        self.kddf_count = kddf_count
+        self.ntis_per_keyword = ntis_per_keyword
+        self.in_flight: dict[str, int] = {}
+        self.max_in_flight: dict[str, int] = {}
+        self.detail_done: list[float] = []
+        self.list_requests = 0
+        self.kddf_base = ""
+        self.base = ""
+
+    def _enter(self, kind: str) -> None:
+        self.in_flight[kind] = self.in_flight.get(kind, 0) + 1
+        self.max_in_flight[kind] = max(self.max_in_flight.get(kind, 0), self.in_flight[kind])
+
+    async def kddf_list(self, request: web.Request) -> web.Response:
+        self.list_requests += 1
+        rows = "".join(
+            f'<tr><td class="title"><a href="/kddf/view/{i}">KDDF notice {i}</a></td>'
+            f'<td class="date">2025-01-0{i % 9 + 1}</td></tr>'
+            for i in range(self.kddf_count)
+        )
+        return web.Response(text=f'<table class="board_list"><tbody>{rows}</tbody></table>', content_type="text/html")
+
+    async def ntis_search(self, request: web.Request) -> web.Response:
+        self.list_requests += 1
+        form = await request.post()
+        offset = len(form["searchKeyword"])  # keywords overlap partially
+        rows = "".join(
+            f'<tr><td class="title"><a href="{self.base}/ntis/view/{offset + i}">NTIS notice {offset + i}</a></td></tr>'
+            for i in range(self.ntis_per_keyword)
+        )
+        return web.Response(text=f'<table class="board"><tbody>{rows}</tbody></table>', content_type="text/html")
+
+    def detail(self, kind: str):
+        async def handler(request: web.Request) -> web.Response:
+            self._enter(kind)
+            try:
+                await asyncio.sleep(DETAIL_DELAY)
+            finally:
+                self.in_flight[kind] -= 1
+            self.detail_done.append(time.perf_counter())
+            notice_id = request.match_info["notice_id"]
+            html = (
+                f'<div class="view_title">{kind} detail {notice_id}</div>'
+                f'<div class="view_content">신약 바이오 공고 {notice_id}</div>'
+            )
+            return web.Response(text=html, content_type="text/html")
+
+        return handler
+
+
+class StubVectorStore:
+    def __init__(self):
+        self.indexed: list[str] = []
+        self.started: list[float] = []
+        self._lock = threading.Lock()
+
+    def add_notice(self, rfp) -> str:  # noqa: ANN001
+        self.started.append(time.perf_counter())
+        time.sleep(INDEX_DELAY)
+        with self._lock:
+            self.indexed.append(rfp.url)
+        return rfp.url
+
+
+@pytest.fixture
+async def portal():
+    stub = StubPortal()
+    app = web.Application()
+    app.router.add_get("/kddf/list", stub.kddf_list)
+    app.router.add_post("/ntis/search", stub.ntis_search)
+    app.router.add_get("/kddf/view/{notice_id}", stub.detail("kddf"))
+    app.router.add_get("/ntis/view/{notice_id}", stub.detail("ntis"))
+    runner = web.AppRunner(app)
+    await runner.setup()
+    # Two sites on different ports = two hosts for the per-host limits.
+    kddf_site = web.TCPSite(runner, "127.0.0.1", 0)
+    ntis_site = web.TCPSite(runner, "127.0.0.1", 0)
+    await kddf_site.start()
+    await ntis_site.start()
+    stub.kddf_base = kddf_site.name
+    stub.base = ntis_site.name
+    yield stub
+    await runner.cleanup()
+
+
+@pytest.fixture
+async def crawlers(portal: StubPortal, monkeypatch):
+    kddf = KDDFCrawler()
+    kddf.BASE_URL = portal.kddf_base
+    kddf.NOTICE_URL = f"{portal.kddf_base}/kddf/list"
+    ntis = NTISCrawler()
+    ntis.BASE_URL = portal.base
+    ntis.SEARCH_URL = f"{portal.base}/ntis/search"
+    store = StubVectorStore()
+    monkeypatch.setattr(scheduler_module, "get_kddf_crawler", lambda: kddf)
+    monkeypatch.setattr(scheduler_module, "get_ntis_crawler", lambda: ntis)
+    monkeypatch.setattr(scheduler_module, "get_vector_store", lambda: store)
+    yield store
+    await kddf.close()
+    await ntis.close()
+
+
+@pytest.mark.asyncio
+async def test_collect_all_notices_runs_staged_pipeline(tmp_path, portal: StubPortal, crawlers: StubVectorStore):
+    scheduler = scheduler_module.NoticeScheduler(
+        data_dir=str(tmp_path), host_concurrency=2, host_rate=200.0, detail_workers=4
+    )
+
+    notices = await scheduler.collect_all_notices()
+    stats = scheduler.last_run_stats
+
+    urls = [notice["url"] for notice in notices]
+    assert len(urls) == len(set(urls))
+    assert portal.list_requests == 1 + len(scheduler_module.NTIS_KEYWORDS)
+    # KDDF first, then NTIS in keyword order.
+    assert urls[0] == f"{portal.kddf_base}/kddf/view/0"
+
+    assert stats["listed"] == stats["new"] == len(urls)
+    assert stats["indexed"] == stats["fetched"] == len(urls)
+    assert sorted(crawlers.indexed) == sorted(urls)
+    assert stats["total_seconds"] >= stats["list_seconds"] + stats["detail_seconds"] - 0.01
+
+    # Per-host concurrency cap honoured, and both hosts were worked in parallel.
+    assert portal.max_in_flight == {"kddf": 2, "ntis": 2}
+    # Indexing started while details were still being fetched.
+    assert min(crawlers.started) < max(portal.detail_done)
+    serial_estimate = len(urls) * (DETAIL_DELAY + INDEX_DELAY + 1.0)
+    assert stats["detail_seconds"] < serial_estimate / 4
+
+    assert scheduler._save_notices(notices) == []
+    scheduler.store.close()
+
+
+@pytest.mark.asyncio
+async def test_second_run_only_fetches_new_details(tmp_path, portal: StubPortal, crawlers: StubVectorStore):
+    scheduler = scheduler_module.NoticeScheduler(data_dir=str(tmp_path), host_rate=200.0)
+    await scheduler.collect_all_notices()
+    first_indexed = len(crawlers.indexed)
+
+    portal.kddf_count += 2
+    await scheduler.collect_all_notices()
+
+    assert scheduler.last_run_stats["new"] == 2
+    assert len(crawlers.indexed) == first_indexed + 2
+    scheduler.store.close()
+
+
+@pytest.mark.asyncio
+async def test_host_throttle_paces_request_starts_per_host():
+    throttle = HostThrottle(concurrency=4, rate=20.0, burst=1)
+    starts: dict[str, list[float]] = {"a": [], "b": []}
+
+    async def hit(host: str) -> None:
+        async with throttle.slot(f"http://{host}.example/x"):
+            starts[host].append(time.perf_counter())
+
+    began = time.perf_counter()
+    await asyncio.gather(*(hit(host) for host in ("a", "b") for _ in range(4)))
+
+    for host_starts in starts.values():
+        gaps = [b - a for a, b in zip(host_starts, host_starts[1:], strict=False)]
+        assert all(gap >= 0.04 for gap in gaps)
+    # Hosts are paced independently: 4 starts per host take ~3 intervals, not 7.
+    assert time.perf_counter() - began < 0.3
+    assert throttle.requests == {"a.example": 4, "b.example": 4}
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(0)
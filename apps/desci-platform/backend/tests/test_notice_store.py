@@ -0,0 +1,90 @@
+"""Tests for the SQLite-backed notice store used by NoticeScheduler."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from services.notice_store import NoticeStore
+from services.scheduler import NoticeScheduler
+
+
+def _notice(index: int, source: str = "KDDF", **extra) -> dict:
+    return {"title": f"Notice {index}", "url": f"https://example.org/{index}", "source": source, **extra}
+
+
+@pytest.fixture
+def scheduler(tmp_path) -> NoticeScheduler:
+    instance = NoticeScheduler(data_dir=str(tmp_path))
+    yield instance
+    instance.store.close()
+
+
+def test_save_notices_dedups_by_url_and_stamps_new_items(scheduler: NoticeScheduler):
+    first = scheduler._save_notices([_notice(1), _notice(2), {"title": "no url"}])
+    second = scheduler._save_notices([_notice(2), _notice(3)])
+
+    assert [n["url"] for n in first] == ["https://example.org/1", "https://example.org/2"]
+    assert [n["url"] for n in second] == ["https://example.org/3"]
+    assert second[0]["is_new"] is True and second[0]["collected_at"]
+    assert scheduler.store.count() == 3
+
+
+def test_get_notices_filters_by_source_and_paginates_newest_first(scheduler: NoticeScheduler):
+    scheduler._save_notices([_notice(i, "KDDF" if i % 2 else "NTIS") for i in range(10)])
+
+    latest = scheduler.get_notices(limit=3)
+    ntis_page = scheduler.get_notices(source="NTIS", limit=2, offset=1)
+
+    assert [n["title"] for n in latest] == ["Notice 9", "Notice 8", "Notice 7"]
+    assert [n["title"] for n in ntis_page] == ["Notice 6", "Notice 4"]
+    assert all(n["source"] == "NTIS" for n in ntis_page)
+
+
+def test_mark_as_read_updates_only_that_notice(scheduler: NoticeScheduler):
+    scheduler._save_notices([_notice(1), _notice(2)])
+
+    scheduler.mark_as_read("https://example.org/1")
+
+    assert [n["url"] for n in scheduler.get_new_notices()] == ["https://example.org/2"]
+    assert scheduler.store.mark_as_read("https://example.org/1") is False
+
+
+def test_legacy_json_is_migrated_once(tmp_path):
+    legacy = [
+        _notice(1, collected_at="2025-01-01T00:00:00", is_new=False),
+        _notice(2, "NTIS", collected_at="2025-01-02T00:00:00", is_new=True, deadline="2025-03-01"),
+        {"title": "legacy without url"},
+    ]
+    (tmp_path / "notices.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+    scheduler = NoticeScheduler(data_dir=str(tmp_path))
+    notices = scheduler.get_notices()
+    scheduler.store.close()
+
+    assert [n["url"] for n in notices] == ["https://example.org/2", "https://example.org/1"]
+    assert notices[0]["deadline"] == "2025-03-01" and notices[0]["is_new"] is True
+    assert not (tmp_path / "notices.json").exists()
+    assert (tmp_path / "notices.json.migrated").exists()
+
+    reopened = NoticeStore(tmp_path / "notices.db", legacy_json=tmp_path / "notices.json")
+    assert reopened.count() == 2
+    assert [n["url"] for n in reopened.unread()] == ["https://example.org/2"]
+    reopened.close()
+
+
+def test_listing_queries_use_indexes(tmp_path):
+    store = NoticeStore(tmp_path / "notices.db")
+    conn = store._connect()
+
+    def plan(sql: str, params: tuple) -> str:
+        return " ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+
+    by_source = plan(
+        "SELECT * FROM notices WHERE source = ? ORDER BY collected_at DESC, id DESC LIMIT ? OFFSET ?", ("KDDF", 5, 0)
+    )
+    latest = plan("SELECT * FROM notices ORDER BY collected_at DESC, id DESC LIMIT ?", (5,))
+
+    assert "idx_notices_source_collected" in by_source and "TEMP B-TREE" not in by_source
+    assert "idx_notices_collected" in latest and "TEMP B-TREE" not in latest
+    store.close()
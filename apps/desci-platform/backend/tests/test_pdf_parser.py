@@ -39,12 +39,7 @@ def test_parse_document_falls_back_to_pypdf(monkeypatch):
     monkeypatch.setattr(
         pdf_parser_module.PDFParser,
         "_parse_with_pypdf",
-        staticmethod(lambda content: "Fallback text"),
-    )
-    monkeypatch.setattr(
-        pdf_parser_module.PDFParser,
-        "_extract_metadata_with_pypdf",
-        staticmethod(lambda content: {"source": "pypdf"}),
+        lambda self, content: ("Fallback text", {"source": "pypdf"}),
     )
 
     parser = pdf_parser_module.PDFParser()
@@ -53,3 +48,112 @@ def test_parse_document_falls_back_to_pypdf(monkeypatch):
     assert result.parser == "pypdf"
     assert result.text == "Fallback text"
     assert result.metadata["source"] == "pypdf"
+
+
+def _text_pdf(pages: int) -> bytes:
+    """Minimal uncompressed PDF with one line of text per page."""
+    bodies = {1: b"<< /Type /Catalog /Pages 2 0 R >>", 3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"}
+    kids = []
+    for page in range(pages):
+        page_id, content_id = 4 + 2 * page, 5 + 2 * page
+        stream = b"BT /F1 12 Tf 72 720 Td (Page %d assay results) Tj ET" % page
+        bodies[content_id] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        bodies[page_id] = b"<< /Type /Page /Parent 2 0 R /Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (
+            content_id
+        )
+        kids.append(b"%d 0 R" % page_id)
+    bodies[2] = b"<< /Type /Pages /Kids [%s] /Count %d /MediaBox [0 0 612 792] >>" % (b" ".join(kids), pages)
+    info_id = 4 + 2 * pages
+    bodies[info_id] = b"<< /Title (Generated Paper) >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for obj_id in range(1, info_id + 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (obj_id, bodies[obj_id])
+    xref_at = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (info_id + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        info_id + 1,
+        info_id,
+        xref_at,
+    )
+    return bytes(out)
+
+
+def _no_grobid(monkeypatch):
+    stub_grobid = SimpleNamespace(is_configured=False, parse_document=lambda content, filename="document.pdf": None)
+    monkeypatch.setattr(pdf_parser_module, "get_grobid_parser", lambda: stub_grobid)
+
+
+def test_pypdf_returns_text_and_metadata_from_one_open(monkeypatch):
+    _no_grobid(monkeypatch)
+    opened = []
+    real_reader = pdf_parser_module.pypdf.PdfReader
+    monkeypatch.setattr(
+        pdf_parser_module.pypdf, "PdfReader", lambda stream: opened.append(stream) or real_reader(stream)
+    )
+
+    result = pdf_parser_module.PDFParser(cache_dir="", workers=1).parse_document(_text_pdf(3))
+
+    assert result.parser == "pypdf"
+    assert result.text.splitlines() == ["Page 0 assay results", "Page 1 assay results", "Page 2 assay results"]
+    assert result.metadata["/Title"] == "Generated Paper"
+    assert len(opened) == 1
+
+
+def test_large_documents_are_extracted_in_parallel_in_page_order(monkeypatch):
+    _no_grobid(monkeypatch)
+    content = _text_pdf(24)
+    serial = pdf_parser_module.PDFParser(cache_dir="", workers=1).parse_document(content)
+    parallel_parser = pdf_parser_module.PDFParser(cache_dir="", workers=2, parallel_min_pages=8)
+
+    try:
+        parallel = parallel_parser.parse_document(content)
+    finally:
+        parallel_parser.close()
+
+    assert parallel.text == serial.text
+    assert parallel.text.splitlines()[-1] == "Page 23 assay results"
+    assert pdf_parser_module._page_ranges(24, 4) == [(0, 6), (6, 12), (12, 18), (18, 24)]
+
+
+def test_parse_results_are_cached_by_content_hash(monkeypatch, tmp_path):
+    _no_grobid(monkeypatch)
+    calls = []
+    monkeypatch.setattr(
+        pdf_parser_module.PDFParser,
+        "_parse_with_pypdf",
+        lambda self, content: calls.append(content) or (("parsed" if content != b"empty" else ""), {"n": 1}),
+    )
+
+    first = pdf_parser_module.PDFParser(cache_dir=tmp_path)
+    first.parse_document(b"same bytes", filename="a.pdf")
+    again = pdf_parser_module.PDFParser(cache_dir=tmp_path).parse_document(b"same bytes", filename="b.pdf")
+    first.parse_document(b"other bytes")
+    first.parse_document(b"empty")
+    first.parse_document(b"empty")
+
+    assert again == pdf_parser_module.PDFParseResult(text="parsed", metadata={"n": 1}, parser="pypdf")
+    # Cache hits skip parsing; empty results are not cached.
+    assert calls == [b"same bytes", b"other bytes", b"empty", b"empty"]
+
+
+def test_pypdf_fallback_is_not_cached_while_grobid_is_down(monkeypatch, tmp_path):
+    grobid_up = False
+    stub_grobid = SimpleNamespace(
+        is_configured=True,
+        parse_document=lambda content, filename="document.pdf": (
+            SimpleNamespace(text="grobid text", metadata={}) if grobid_up else None
+        ),
+    )
+    monkeypatch.setattr(pdf_parser_module, "get_grobid_parser", lambda: stub_grobid)
+    monkeypatch.setattr(pdf_parser_module.PDFParser, "_parse_with_pypdf", lambda self, content: ("pypdf text", {}))
+    parser = pdf_parser_module.PDFParser(cache_dir=tmp_path)
+
+    assert parser.parse_document(b"paper").parser == "pypdf"
+    grobid_up = True
+    assert parser.parse_document(b"paper").parser == "grobid"
+    grobid_up = False
+    assert parser.parse_document(b"paper").parser == "grobid"  # served from cache
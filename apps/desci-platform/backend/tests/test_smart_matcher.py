@@ -0,0 +1,136 @@
+"""
+Tests for the cached company-asset profile used by SmartMatcher.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import services.smart_matcher as smart_matcher_module
+import services.vector_store as vector_store_module
+
+VECTORS = {
+    "asset-a": [1.0, 0.0, 0.0],
+    "asset-b": [0.0, 2.0, 0.0],
+    "asset-c": [0.0, 0.0, 1.0],
+    "vc-bio": [1.0, 1.0, 0.0],
+    "vc-marine": [0.0, 0.0, 1.0],
+}
+
+
+@pytest.fixture
+def store(monkeypatch, tmp_path):
+    monkeypatch.setattr(vector_store_module, "CHROMADB_AVAILABLE", False)
+    instance = vector_store_module.VectorStore(persist_dir=str(tmp_path))
+    instance.embed_calls = 0
+
+    def fake_embedding(text: str) -> list[float]:
+        instance.embed_calls += 1
+        return VECTORS[text.split("\n", 1)[0]]
+
+    monkeypatch.setattr(instance, "_get_embedding", fake_embedding)
+    return instance
+
+
+@pytest.fixture
+def matcher(monkeypatch, store):
+    monkeypatch.setattr(smart_matcher_module, "get_vector_store", lambda: store)
+    monkeypatch.setattr(smart_matcher_module, "get_analyzer", lambda: None)
+    return smart_matcher_module.SmartMatcher()
+
+
+def _add_asset(store, asset_id: str, **metadata) -> None:
+    store.add_company_asset(asset_id=asset_id, title=asset_id, content="company asset", metadata=metadata)
+
+
+def test_profile_is_loaded_once_and_updated_incrementally(store, matcher, monkeypatch):
+    _add_asset(store, "asset-a")
+    _add_asset(store, "asset-b", profile_weight=3.0)
+
+    loads = []
+    original = store.get_embeddings_by_metadata
+    monkeypatch.setattr(
+        store, "get_embeddings_by_metadata", lambda key, value: loads.append(value) or original(key, value)
+    )
+
+    # unit vectors, weighted 1 : 3
+    assert matcher.profile.centroid() == pytest.approx([0.25, 0.75, 0.0])
+
+    _add_asset(store, "asset-c")
+    assert matcher.profile.centroid() == pytest.approx([0.2, 0.6, 0.2])
+
+    store.delete_notice("asset-b")
+    assert matcher.profile.centroid() == pytest.approx([0.5, 0.0, 0.5])
+    assert matcher.profile.asset_count == 2
+    assert loads == ["company_asset"]
+
+
+def test_profile_reloads_when_another_process_changes_assets(store, monkeypatch, tmp_path):
+    from services.company_profile import CompanyAssetProfile
+
+    _add_asset(store, "asset-a")
+    profile = CompanyAssetProfile(store, check_interval=0)
+    assert profile.centroid() == pytest.approx([1.0, 0.0, 0.0])
+
+    # A second store on the same data stands in for another API worker.
+    other = vector_store_module.VectorStore(persist_dir=str(tmp_path))
+    monkeypatch.setattr(other, "_get_embedding", lambda text: VECTORS[text.split("\n", 1)[0]])
+    _add_asset(other, "asset-c")
+
+    loads = []
+    original = store.get_embeddings_by_metadata
+    monkeypatch.setattr(
+        store, "get_embeddings_by_metadata", lambda key, value: loads.append(value) or original(key, value)
+    )
+    assert profile.centroid() == pytest.approx([0.5, 0.0, 0.5])
+
+    # Local changes keep the expected count in step, so they cause no reload.
+    _add_asset(store, "asset-b")
+    store.delete_notice("asset-a")
+    assert profile.centroid() == pytest.approx([0.0, 0.5, 0.5])
+    assert loads == ["company_asset"]
+
+    # Changes that keep the count (same-ID replacement) show up after max_age.
+    profile.max_age = 0
+    other.delete_notice("asset-b")
+    _add_asset(other, "asset-b", profile_weight=3.0)
+    assert profile.centroid() == pytest.approx([0.0, 0.75, 0.25])
+
+
+@pytest.mark.asyncio
+async def test_match_vcs_uses_profile_vector_without_reembedding(store, matcher):
+    _add_asset(store, "asset-a")
+    _add_asset(store, "asset-b")
+    for vc_id in ("vc-bio", "vc-marine"):
+        store._save_to_json(vc_id, VECTORS[vc_id], {"title": vc_id, "type": "vc_firm"}, f"{vc_id} thesis")
+    embed_calls = store.embed_calls
+
+    recommendations = await matcher.match_vcs_for_company()
+    await matcher.match_vcs_for_company()
+
+    assert [item["id"] for item in recommendations] == ["vc-bio"]
+    assert recommendations[0]["score"] == pytest.approx(100.0)
+    assert store.embed_calls == embed_calls
+
+
+@pytest.mark.asyncio
+async def test_match_vcs_without_assets_returns_empty(matcher):
+    assert await matcher.match_vcs_for_company() == []
+
+
+def test_score_notices_batches_embeddings_into_one_matrix_product(store, matcher, monkeypatch):
+    _add_asset(store, "asset-a")
+    batches = []
+
+    def fake_batch(texts: list[str]) -> list[list[float]]:
+        batches.append(len(texts))
+        return [VECTORS[text.split("\n", 1)[0]] for text in texts]
+
+    monkeypatch.setattr(store, "_get_embeddings", fake_batch)
+    notices = [{"id": f"n-{key}", "title": key, "body_text": "..."} for key in ("vc-marine", "asset-a", "vc-bio")]
+
+    scored = matcher.score_notices(notices)
+
+    assert batches == [3]
+    assert [item["rfp_id"] for item in scored] == ["n-vc-marine", "n-asset-a", "n-vc-bio"]
+    assert [item["profile_score"] for item in scored] == [0.0, 100.0, round(100 / np.sqrt(2), 1)]
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import threading
+import time
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
@@ -54,3 +57,231 @@ def test_handle_job_nacks_unsupported_jobs_without_requeue(bio_worker):
 
     channel.basic_ack.assert_not_called()
     channel.basic_nack.assert_called_once_with(delivery_tag="tag-2", requeue=False)
+
+
+# ── Pooled mode ─────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def pooled_worker(monkeypatch):
+    stub_bus = MagicMock()
+    stub_bus.is_connected = False
+    monkeypatch.setattr(worker_module, "get_rabbitmq_bus", lambda: stub_bus)
+    config = worker_module.WorkerConfig(
+        mode="pooled",
+        concurrency={"job.proposal.generate": 1, "job.papers.index": 4},
+    )
+    bio_worker = worker_module.BioWorker(config=config)
+    bio_worker.start_event_loop()
+    yield bio_worker
+    bio_worker.stop_event_loop(timeout=5)
+
+
+def _delivery(routing_key: str, tag: str):
+    return SimpleNamespace(routing_key=routing_key, delivery_tag=tag)
+
+
+def _pika_channel():
+    """Channel stub whose connection runs threadsafe callbacks immediately."""
+    channel = MagicMock()
+    channel.connection.add_callback_threadsafe.side_effect = lambda callback: callback()
+    return channel
+
+
+def test_worker_config_from_env_parses_concurrency_overrides(monkeypatch):
+    monkeypatch.setenv("WORKER_MODE", "pooled")
+    monkeypatch.setenv("WORKER_CONCURRENCY", "job.papers.index=8, job.proposal.generate=2,bogus")
+    monkeypatch.setenv("WORKER_LIGHT_PREFETCH", "32")
+
+    config = worker_module.WorkerConfig.from_env()
+
+    assert config.mode == "pooled"
+    assert config.concurrency["job.papers.index"] == 8
+    assert config.concurrency["job.proposal.generate"] == 2
+    assert config.concurrency["job.match.paper"] == worker_module.DEFAULT_CONCURRENCY["job.match.paper"]
+    light = next(q for q in config.queues if q.name == "biolinker_worker_light")
+    assert light.prefetch == 32
+    assert "job.papers.index" in light.routing_keys
+
+
+def test_pooled_jobs_share_one_event_loop(pooled_worker, monkeypatch):
+    loops = []
+
+    class StubAssetManager:
+        async def reindex_paper(self, paper_id, user):  # noqa: ARG002
+            loops.append(asyncio.get_running_loop())
+            return {"paper_id": paper_id}
+
+    monkeypatch.setattr(worker_module, "get_asset_manager", lambda: StubAssetManager())
+    channel = _pika_channel()
+
+    for i in range(3):
+        pooled_worker.handle_job_pooled(
+            channel, _delivery("job.papers.index", f"t{i}"), None, json.dumps({"paper_id": f"p{i}"}).encode()
+        )
+
+    assert pooled_worker.drain(timeout=5)
+    assert len(loops) == 3
+    assert all(loop is pooled_worker._loop for loop in loops)
+    assert channel.basic_ack.call_count == 3
+
+
+def test_pooled_light_jobs_are_not_blocked_by_heavy_job(pooled_worker, monkeypatch):
+    release_heavy = threading.Event()
+    light_done = threading.Event()
+
+    class StubGenerator:
+        async def generate_draft(self, rfp, paper):  # noqa: ARG002
+            await asyncio.to_thread(release_heavy.wait, 5)
+            return "draft"
+
+        async def review_draft(self, rfp, paper, draft):  # noqa: ARG002
+            return "ok"
+
+    class StubVectorStore:
+        def get_notice(self, notice_id):
+            return {"id": notice_id}
+
+    class StubAssetManager:
+        async def reindex_paper(self, paper_id, user):  # noqa: ARG002
+            light_done.set()
+            return paper_id
+
+    monkeypatch.setattr(worker_module, "get_proposal_generator", lambda: StubGenerator())
+    monkeypatch.setattr(worker_module, "get_vector_store", lambda: StubVectorStore())
+    monkeypatch.setattr(worker_module, "get_asset_manager", lambda: StubAssetManager())
+    channel = _pika_channel()
+
+    pooled_worker.handle_job_pooled(
+        channel,
+        _delivery("job.proposal.generate", "heavy"),
+        None,
+        json.dumps({"paper_id": "p", "rfp_id": "r"}).encode(),
+    )
+    pooled_worker.handle_job_pooled(
+        channel, _delivery("job.papers.index", "light"), None, json.dumps({"paper_id": "p1"}).encode()
+    )
+
+    assert light_done.wait(timeout=5), "light job should finish while the heavy job is still running"
+    release_heavy.set()
+    assert pooled_worker.drain(timeout=5)
+
+    acked = {call.kwargs["delivery_tag"] for call in channel.basic_ack.call_args_list}
+    assert acked == {"heavy", "light"}
+
+
+def test_pooled_concurrency_limit_per_routing_key(pooled_worker, monkeypatch):
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    class StubGenerator:
+        async def generate_draft(self, rfp, paper):  # noqa: ARG002
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            await asyncio.sleep(0.05)
+            with lock:
+                active -= 1
+            return "draft"
+
+        async def review_draft(self, rfp, paper, draft):  # noqa: ARG002
+            return "ok"
+
+    class StubVectorStore:
+        def get_notice(self, notice_id):
+            return {"id": notice_id}
+
+    monkeypatch.setattr(worker_module, "get_proposal_generator", lambda: StubGenerator())
+    monkeypatch.setattr(worker_module, "get_vector_store", lambda: StubVectorStore())
+    channel = _pika_channel()
+
+    for i in range(3):
+        pooled_worker.handle_job_pooled(
+            channel,
+            _delivery("job.proposal.generate", f"g{i}"),
+            None,
+            json.dumps({"paper_id": "p", "rfp_id": "r"}).encode(),
+        )
+
+    assert pooled_worker.drain(timeout=5)
+    assert peak == 1
+    stats = pooled_worker.metrics.snapshot()["job.proposal.generate"]
+    assert stats["completed"] == 3
+    assert stats["backlog"] == 0
+    assert stats["in_flight"] == 0
+    assert stats["total_seconds"] > 0
+
+
+def test_pooled_nacks_invalid_payload_without_requeue(pooled_worker):
+    channel = _pika_channel()
+
+    pooled_worker.handle_job_pooled(channel, _delivery("job.papers.index", "bad-json"), None, b"{not json")
+    pooled_worker.handle_job_pooled(channel, _delivery("job.papers.index", "missing"), None, b"{}")
+
+    assert pooled_worker.drain(timeout=5)
+    tags = {call.kwargs["delivery_tag"]: call.kwargs["requeue"] for call in channel.basic_nack.call_args_list}
+    assert tags == {"bad-json": False, "missing": False}
+    assert pooled_worker.metrics.snapshot()["job.papers.index"]["failed"] == 1
+
+
+def test_pooled_settles_through_connection_callback(pooled_worker, monkeypatch):
+    monkeypatch.setattr(pooled_worker, "dispatch_job", lambda routing_key, payload: {"ok": True})  # noqa: ARG005
+    callbacks = []
+    channel = MagicMock()
+    channel.connection.add_callback_threadsafe.side_effect = callbacks.append
+
+    pooled_worker.handle_job_pooled(channel, _delivery("job.match.paper", "cb"), None, b"{}")
+
+    assert pooled_worker.drain(timeout=5)
+    channel.basic_ack.assert_not_called()
+    assert len(callbacks) == 1
+    callbacks[0]()
+    channel.basic_ack.assert_called_once_with(delivery_tag="cb")
+
+
+def _pika_connection():
+    """Connection stub that runs threadsafe callbacks only while it processes events."""
+    connection = MagicMock()
+    queued = []
+    connection.add_callback_threadsafe.side_effect = queued.append
+
+    def process_data_events(time_limit=None):  # noqa: ARG001
+        while queued:
+            queued.pop(0)()
+
+    connection.process_data_events.side_effect = process_data_events
+    return connection
+
+
+def test_pooled_drain_flushes_acks_through_connection(pooled_worker, monkeypatch):
+    def slow_job(routing_key, payload):  # noqa: ARG001
+        time.sleep(0.3)
+        return {"ok": True}
+
+    monkeypatch.setattr(pooled_worker, "dispatch_job", slow_job)
+    connection = _pika_connection()
+    channel = MagicMock()
+    channel.connection = connection
+
+    pooled_worker.handle_job_pooled(channel, _delivery("job.match.paper", "late"), None, b"{}")
+
+    assert pooled_worker.drain(timeout=5, connection=connection)
+    channel.basic_ack.assert_called_once_with(delivery_tag="late")
+
+
+def test_stop_while_consuming_cancels_consumers_from_connection_loop(pooled_worker):
+    connection = _pika_connection()
+    connection.is_open = True
+    pooled_worker.bus._connection = connection
+    channels = [MagicMock(), MagicMock()]
+    pooled_worker._consuming_channels = channels
+
+    pooled_worker.stop()
+
+    pooled_worker.bus.close.assert_not_called()
+    channels[0].stop_consuming.assert_not_called()
+    connection.process_data_events()
+    for channel in channels:
+        channel.stop_consuming.assert_called_once_with()
@@ -1,16 +1,42 @@
 """
 BioLinker - Background Worker
 Consumes jobs from RabbitMQ and executes long-running tasks.
+
+Two modes (``WORKER_MODE``):
+
+* ``serial`` (default) — one queue, prefetch 1, ``asyncio.run`` per job.
+* ``pooled`` — one long-lived event loop shared by every job, separate
+  heavy/light priority queues with their own prefetch, a concurrency cap
+  per routing key, and per-job-type latency/backlog metrics.
 """
 
+from __future__ import annotations
+
 import asyncio
+import functools
 import json
 import os
 import signal
 import sys
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import wait as wait_futures
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+try:
+    from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, start_http_server
+
+    PROMETHEUS_AVAILABLE = True
+except ImportError:  # pragma: no cover - used in lean smoke environments
+    PROMETHEUS_AVAILABLE = False
 
 from services.logging_config import get_logger, setup_logging
-from services.rabbitmq_bus import get_rabbitmq_bus
+from services.rabbitmq_bus import JOB_PRIORITIES, get_rabbitmq_bus
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
 
 # Initialize logging
 _is_production = os.getenv("ENV", "development") == "production"
@@ -43,13 +69,186 @@ def get_vector_store():
     return _load_service("services.vector_store", "get_vector_store")
 
 
+# ── Pooled-mode configuration ───────────────────────────────────────────────
+
+HEAVY_ROUTING_KEYS = ("job.proposal.generate", "job.notices.collect")
+LIGHT_ROUTING_KEYS = ("job.papers.index", "job.match.paper")
+
+DEFAULT_CONCURRENCY = {
+    "job.proposal.generate": 1,
+    "job.notices.collect": 1,
+    "job.papers.index": 4,
+    "job.match.paper": 4,
+}
+# Seconds between pika event pumps while draining on the connection's thread.
+DRAIN_POLL_INTERVAL = 0.1
+
+
+@dataclass(frozen=True)
+class JobQueue:
+    """A durable priority queue bound to a fixed set of routing keys."""
+
+    name: str
+    routing_keys: tuple[str, ...]
+    prefetch: int
+
+
+@dataclass
+class WorkerConfig:
+    """Worker tuning knobs, loaded from environment variables."""
+
+    mode: str = "serial"
+    queues: tuple[JobQueue, ...] = ()
+    concurrency: dict[str, int] = field(default_factory=lambda: dict(DEFAULT_CONCURRENCY))
+    max_priority: int = 10
+    metrics_port: int | None = None
+    queue_depth_interval: float = 15.0
+    drain_timeout: float = 30.0
+
+    @classmethod
+    def from_env(cls) -> WorkerConfig:
+        concurrency = dict(DEFAULT_CONCURRENCY)
+        # WORKER_CONCURRENCY="job.papers.index=8,job.proposal.generate=2"
+        for item in os.getenv("WORKER_CONCURRENCY", "").split(","):
+            key, sep, value = item.partition("=")
+            if sep and key.strip() and value.strip().isdigit():
+                concurrency[key.strip()] = max(1, int(value))
+
+        metrics_port = os.getenv("WORKER_METRICS_PORT", "").strip()
+        return cls(
+            mode=os.getenv("WORKER_MODE", "serial").strip().lower() or "serial",
+            queues=(
+                JobQueue(
+                    "biolinker_worker_heavy",
+                    HEAVY_ROUTING_KEYS,
+                    max(1, int(os.getenv("WORKER_HEAVY_PREFETCH", "2"))),
+                ),
+                JobQueue(
+                    "biolinker_worker_light",
+                    LIGHT_ROUTING_KEYS,
+                    max(1, int(os.getenv("WORKER_LIGHT_PREFETCH", "16"))),
+                ),
+            ),
+            concurrency=concurrency,
+            metrics_port=int(metrics_port) if metrics_port.isdigit() else None,
+            queue_depth_interval=float(os.getenv("WORKER_QUEUE_DEPTH_INTERVAL", "15")),
+            drain_timeout=float(os.getenv("WORKER_DRAIN_TIMEOUT", "30")),
+        )
+
+
+class WorkerMetrics:
+    """Per-job-type latency and backlog tracking.
+
+    Always keeps an in-process summary (``snapshot()``); mirrors it into
+    Prometheus collectors when prometheus_client is installed.
+    """
+
+    def __init__(self, registry: Any | None = None):
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict[str, float]] = {}
+        self.registry = None
+        if not PROMETHEUS_AVAILABLE:
+            return
+
+        self.registry = registry or CollectorRegistry()
+        self._latency = Histogram(
+            "biolinker_worker_job_duration_seconds",
+            "Job execution time by job type",
+            ["job_type", "status"],
+            buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+            registry=self.registry,
+        )
+        self._wait = Histogram(
+            "biolinker_worker_job_wait_seconds",
+            "Time between delivery and start of execution by job type",
+            ["job_type"],
+            buckets=(0.01, 0.1, 0.5, 1.0, 5.0, 30.0, 120.0),
+            registry=self.registry,
+        )
+        self._jobs = Counter(
+            "biolinker_worker_jobs_total",
+            "Jobs processed by job type and status",
+            ["job_type", "status"],
+            registry=self.registry,
+        )
+        self._backlog = Gauge(
+            "biolinker_worker_backlog",
+            "Delivered jobs waiting for a concurrency slot, by job type",
+            ["job_type"],
+            registry=self.registry,
+        )
+        self._in_flight = Gauge(
+            "biolinker_worker_in_flight",
+            "Jobs currently executing, by job type",
+            ["job_type"],
+            registry=self.registry,
+        )
+        self._queue_depth = Gauge(
+            "biolinker_worker_queue_depth",
+            "Ready messages in the broker queue",
+            ["queue"],
+            registry=self.registry,
+        )
+
+    def _entry(self, job_type: str) -> dict[str, float]:
+        return self._stats.setdefault(
+            job_type,
+            {"backlog": 0, "in_flight": 0, "completed": 0, "failed": 0, "total_seconds": 0.0, "max_seconds": 0.0},
+        )
+
+    def job_received(self, job_type: str) -> None:
+        with self._lock:
+            self._entry(job_type)["backlog"] += 1
+        if self.registry is not None:
+            self._backlog.labels(job_type=job_type).inc()
+
+    def job_started(self, job_type: str, waited: float) -> None:
+        with self._lock:
+            entry = self._entry(job_type)
+            entry["backlog"] -= 1
+            entry["in_flight"] += 1
+        if self.registry is not None:
+            self._backlog.labels(job_type=job_type).dec()
+            self._in_flight.labels(job_type=job_type).inc()
+            self._wait.labels(job_type=job_type).observe(waited)
+
+    def job_finished(self, job_type: str, elapsed: float, ok: bool) -> None:
+        status = "completed" if ok else "failed"
+        with self._lock:
+            entry = self._entry(job_type)
+            entry["in_flight"] -= 1
+            entry[status] += 1
+            entry["total_seconds"] += elapsed
+            entry["max_seconds"] = max(entry["max_seconds"], elapsed)
+        if self.registry is not None:
+            self._in_flight.labels(job_type=job_type).dec()
+            self._latency.labels(job_type=job_type, status=status).observe(elapsed)
+            self._jobs.labels(job_type=job_type, status=status).inc()
+
+    def set_queue_depth(self, queue: str, depth: int) -> None:
+        if self.registry is not None:
+            self._queue_depth.labels(queue=queue).set(depth)
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            return {job_type: dict(entry) for job_type, entry in self._stats.items()}
+
+
 class BioWorker:
     """RabbitMQ consumer for background processing."""
 
-    def __init__(self):
+    def __init__(self, config: WorkerConfig | None = None):
         self.bus = get_rabbitmq_bus()
         self.queue_name = "biolinker_worker_tasks"
         self.should_stop = False
+        self.config = config or WorkerConfig.from_env()
+        self.metrics = WorkerMetrics()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._pending: set[Future] = set()
+        self._pending_lock = threading.Lock()
+        self._consuming_channels: list = []
 
     def setup_queue(self):
         """Prepare the queue for consumption."""
@@ -96,8 +295,239 @@ class BioWorker:
             raise ValueError(f"Unsupported routing key: {routing_key}")
         return handler(payload)
 
-    def _run_coroutine(self, coroutine):
-        return asyncio.run(coroutine)
+    def _run_coroutine(self, coroutine: Coroutine[Any, Any, Any]):
+        loop = self._loop
+        if loop is None or not loop.is_running():
+            return asyncio.run(coroutine)
+        if threading.current_thread() is self._loop_thread:
+            coroutine.close()
+            raise RuntimeError("_run_coroutine must not be called from the worker event loop thread")
+        # Pooled mode: every job shares one loop, so clients cached by the
+        # services (httpx pools, redis connections) survive between jobs.
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    # ── Pooled mode: persistent event loop ──────────────────────
+
+    def start_event_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the long-lived event loop thread (idempotent)."""
+        if self._loop is not None and self._loop.is_running():
+            return self._loop
+
+        loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def _run() -> None:
+            asyncio.set_event_loop(loop)
+            loop.call_soon(started.set)
+            loop.run_forever()
+            loop.close()
+
+        self._loop = loop
+        self._loop_thread = threading.Thread(target=_run, name="biolinker-worker-loop", daemon=True)
+        self._loop_thread.start()
+        started.wait()
+        return loop
+
+    def stop_event_loop(self, timeout: float | None = None, connection: Any | None = None) -> None:
+        """Wait for in-flight jobs, then stop the event loop thread."""
+        self.drain(timeout if timeout is not None else self.config.drain_timeout, connection=connection)
+        loop, thread = self._loop, self._loop_thread
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+        self._loop = None
+        self._loop_thread = None
+        self._semaphores.clear()
+
+    def drain(self, timeout: float | None = None, connection: Any | None = None) -> bool:
+        """Block until all submitted jobs finished. Returns False on timeout.
+
+        Pass the pika connection when draining on its thread: the acks that
+        finished jobs queued via ``add_callback_threadsafe`` only go out while
+        the connection processes events, so it is pumped between waits.
+        """
+        with self._pending_lock:
+            pending = set(self._pending)
+        if connection is None:
+            if not pending:
+                return True
+            _, not_done = wait_futures(pending, timeout=timeout)
+            return not not_done
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while pending:
+            wait_for = DRAIN_POLL_INTERVAL
+            if deadline is not None:
+                wait_for = min(wait_for, deadline - time.monotonic())
+                if wait_for <= 0:
+                    break
+            _, pending = wait_futures(pending, timeout=wait_for)
+            if not self._pump(connection):
+                return not pending
+        # Jobs settle before their future completes, so this flushes the last acks.
+        self._pump(connection)
+        return not pending
+
+    @staticmethod
+    def _pump(connection: Any) -> bool:
+        try:
+            connection.process_data_events(time_limit=0)
+        except Exception as exc:
+            log.warning("worker_drain_connection_error", error=str(exc))
+            return False
+        return True
+
+    def _semaphore_for(self, routing_key: str) -> asyncio.Semaphore:
+        # Only touched from the loop thread, so no extra locking needed.
+        semaphore = self._semaphores.get(routing_key)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.config.concurrency.get(routing_key, 1))
+            self._semaphores[routing_key] = semaphore
+        return semaphore
+
+    def handle_job_pooled(self, ch, method, properties, body):  # noqa: ARG002
+        """Pika callback for pooled mode: hand the job to the event loop and return."""
+        routing_key = getattr(method, "routing_key", "unknown")
+        delivery_tag = method.delivery_tag
+        try:
+            data = json.loads(body)
+        except (json.JSONDecodeError, ValueError) as exc:
+            log.error("job_rejected", error=str(exc), body_preview=str(body)[:200])
+            ch.basic_nack(delivery_tag=delivery_tag, requeue=False)
+            return
+
+        loop = self._loop or self.start_event_loop()
+        self.metrics.job_received(routing_key)
+        future = asyncio.run_coroutine_threadsafe(
+            self._process_job(ch, routing_key, delivery_tag, data, time.perf_counter()),
+            loop,
+        )
+        with self._pending_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._forget_future)
+
+    def _forget_future(self, future: Future) -> None:
+        with self._pending_lock:
+            self._pending.discard(future)
+
+    async def _process_job(self, ch, routing_key: str, delivery_tag, data: dict, received_at: float):
+        async with self._semaphore_for(routing_key):
+            started_at = time.perf_counter()
+            self.metrics.job_started(routing_key, started_at - received_at)
+            log.info("processing_job", key=routing_key, data=data)
+            ok = False
+            try:
+                # Handlers are sync wrappers around coroutines; run them off the
+                # loop so their _run_coroutine calls can schedule back onto it.
+                result = await asyncio.to_thread(self.dispatch_job, routing_key, data)
+                ok = True
+                self._settle(ch, "basic_ack", delivery_tag=delivery_tag)
+                log.info("job_completed", key=routing_key, result_type=type(result).__name__)
+            except ValueError as exc:
+                log.error("job_rejected", error=str(exc), key=routing_key)
+                self._settle(ch, "basic_nack", delivery_tag=delivery_tag, requeue=False)
+            except Exception as exc:
+                log.error("job_processing_error", error=str(exc), key=routing_key)
+                self._settle(ch, "basic_nack", delivery_tag=delivery_tag, requeue=True)
+            finally:
+                self.metrics.job_finished(routing_key, time.perf_counter() - started_at, ok)
+
+    def _settle(self, ch, action: str, **kwargs) -> None:
+        """Ack/nack from the loop thread; pika channels are not thread-safe."""
+        callback = functools.partial(getattr(ch, action), **kwargs)
+        connection = getattr(ch, "connection", None)
+        if connection is not None and hasattr(connection, "add_callback_threadsafe"):
+            connection.add_callback_threadsafe(callback)
+        else:
+            callback()
+
+    def setup_pooled_queues(self) -> list:
+        """Declare heavy/light priority queues, each on its own channel."""
+        if not self.bus.is_connected:
+            return []
+
+        channels = []
+        try:
+            for queue in self.config.queues:
+                channel = self.bus._connection.channel()
+                channel.queue_declare(
+                    queue=queue.name,
+                    durable=True,
+                    arguments={"x-max-priority": self.config.max_priority},
+                )
+                for routing_key in queue.routing_keys:
+                    channel.queue_bind(exchange="biolinker_events", queue=queue.name, routing_key=routing_key)
+                channel.basic_qos(prefetch_count=queue.prefetch)
+                channel.basic_consume(queue=queue.name, on_message_callback=self.handle_job_pooled)
+                channels.append((queue, channel))
+        except Exception as exc:
+            log.error("worker_setup_error", error=str(exc))
+            return []
+        return channels
+
+    def _poll_queue_depth(self, channels: list) -> None:
+        for queue, channel in channels:
+            try:
+                declared = channel.queue_declare(queue=queue.name, passive=True)
+                self.metrics.set_queue_depth(queue.name, declared.method.message_count)
+            except Exception as exc:
+                log.warning("worker_queue_depth_error", queue=queue.name, error=str(exc))
+        if not self.should_stop:
+            self.bus._connection.call_later(self.config.queue_depth_interval, lambda: self._poll_queue_depth(channels))
+
+    def start_pooled(self):
+        """Start pooled consumption: persistent loop + per-queue channels."""
+        log.info(
+            "worker_starting",
+            mode="pooled",
+            queues=[q.name for q in self.config.queues],
+            concurrency=self.config.concurrency,
+            priorities=JOB_PRIORITIES,
+        )
+
+        channels = self.setup_pooled_queues()
+        if not channels:
+            log.error("worker_startup_failed")
+            return
+
+        if self.config.metrics_port and self.metrics.registry is not None:
+            start_http_server(self.config.metrics_port, registry=self.metrics.registry)
+            log.info("worker_metrics_listening", port=self.config.metrics_port)
+
+        self.start_event_loop()
+        self._poll_queue_depth(channels)
+
+        log.info("worker_listening")
+        self._consuming_channels = [channel for _, channel in channels]
+        try:
+            # All channels share one BlockingConnection; consuming on the
+            # first channel services deliveries for every channel.
+            channels[0][1].start_consuming()
+        except KeyboardInterrupt:
+            pass
+        except Exception as exc:
+            log.error("worker_runtime_error", error=str(exc))
+        finally:
+            self._consuming_channels = []
+        # Consumers are cancelled (or the connection failed): drain on this,
+        # the connection's thread, so in-flight acks still reach the broker.
+        self.stop()
+
+    def _cancel_consumers(self) -> None:
+        """Cancel every pooled consumer; runs inside the connection's event loop."""
+        for channel in self._consuming_channels:
+            try:
+                channel.stop_consuming()
+            except Exception as exc:
+                log.warning("worker_cancel_consumer_error", error=str(exc))
+
+    def _pika_connection(self) -> Any | None:
+        connection = getattr(self.bus, "_connection", None)
+        if connection is None or not getattr(connection, "is_open", False):
+            return None
+        return connection
 
     def _run_notice_collection(self, payload: dict):  # noqa: ARG002
         scheduler = get_scheduler()
@@ -167,6 +597,9 @@ class BioWorker:
 
     def start(self):
         """Start the consumption loop."""
+        if self.config.mode == "pooled":
+            return self.start_pooled()
+
         log.info("worker_starting", queue=self.queue_name)
 
         if not self.setup_queue():
@@ -188,9 +621,16 @@ class BioWorker:
     def stop(self):
         """Gracefully stop the worker."""
         log.info("worker_stopping")
+        self.should_stop = True
+        if self._consuming_channels and self._pika_connection() is not None:
+            # Signal handler interrupting start_consuming(): stop consuming from
+            # the connection's own loop; start_pooled() then drains and exits.
+            self._pika_connection().add_callback_threadsafe(self._cancel_consumers)
+            return
+        if self._loop is not None:
+            self.stop_event_loop(connection=self._pika_connection())
         if self.bus:
             self.bus.close()
-        self.should_stop = True
         sys.exit(0)
 
 
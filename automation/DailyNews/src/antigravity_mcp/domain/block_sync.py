@@ -0,0 +1,116 @@
+"""Block-level diff between a page's existing Notion children and new markdown.
+
+Each block is reduced to a content hash over its type and plain text, the two
+hash sequences are aligned, and the result is a minimal plan of in-place
+updates, deletions and anchored inserts. Notion can only insert *after* an
+existing block, so an insert at the very top of a page that keeps later
+blocks cannot be expressed; such plans fall back to a full rewrite.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from typing import Any
+
+from antigravity_mcp.domain.markdown_blocks import block_plain_text
+
+# Notion accepts at most 100 children per append request.
+MAX_APPEND_CHILDREN = 100
+
+
+def block_hash(block: dict[str, Any]) -> str:
+    """Content hash of a block's type and plain text.
+
+    Works for both blocks built by ``markdown_to_blocks`` and blocks returned
+    by the API. Existing blocks with nested children never match generated
+    ones, so they are replaced rather than updated in place.
+    """
+    block_type = block.get("type", "")
+    nested = "\x01" if block.get("has_children") else ""
+    digest = hashlib.sha1(f"{block_type}\x00{block_plain_text(block)}{nested}".encode()).hexdigest()
+    return digest[:16]
+
+
+@dataclass(slots=True)
+class BlockInsert:
+    """New blocks to append after ``after_id`` (``None`` = end of page)."""
+
+    after_id: str | None
+    blocks: list[dict[str, Any]]
+
+
+@dataclass(slots=True)
+class BlockSyncPlan:
+    updates: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
+    deletes: list[str] = field(default_factory=list)
+    inserts: list[BlockInsert] = field(default_factory=list)
+    unchanged: int = 0
+    full_rewrite: bool = False
+
+    @property
+    def is_noop(self) -> bool:
+        return not (self.updates or self.deletes or self.inserts)
+
+
+def _full_rewrite(existing: list[dict[str, Any]], desired: list[dict[str, Any]]) -> BlockSyncPlan:
+    plan = BlockSyncPlan(deletes=[block["id"] for block in existing], full_rewrite=True)
+    if desired:
+        plan.inserts.append(BlockInsert(after_id=None, blocks=list(desired)))
+    return plan
+
+
+def plan_block_sync(existing: list[dict[str, Any]], desired: list[dict[str, Any]]) -> BlockSyncPlan:
+    """Compute the update/delete/insert plan turning ``existing`` into ``desired``."""
+    plan = BlockSyncPlan()
+    old_hashes = [block_hash(block) for block in existing]
+    new_hashes = [block_hash(block) for block in desired]
+
+    # (anchor position in ``existing`` or -1 for "before everything", new block)
+    pending: list[tuple[int, dict[str, Any]]] = []
+    matcher = SequenceMatcher(None, old_hashes, new_hashes, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            plan.unchanged += i2 - i1
+            continue
+        old_range, new_range = list(range(i1, i2)), list(range(j1, j2))
+        anchor = i1 - 1
+        # Same-type blocks at the same offset are edited in place.
+        while old_range and new_range:
+            old_i, new_j = old_range[0], new_range[0]
+            if existing[old_i].get("type") != desired[new_j].get("type") or existing[old_i].get("has_children"):
+                break
+            block_type = desired[new_j]["type"]
+            plan.updates.append((existing[old_i]["id"], {block_type: desired[new_j][block_type]}))
+            anchor = old_i
+            old_range.pop(0)
+            new_range.pop(0)
+        plan.deletes.extend(existing[old_i]["id"] for old_i in old_range)
+        pending.extend((anchor, desired[new_j]) for new_j in new_range)
+
+    if not pending:
+        return plan
+
+    deleted = set(plan.deletes)
+    surviving = [i for i, block in enumerate(existing) if block["id"] not in deleted]
+    for anchor, block in pending:
+        # Anchor on the closest surviving block at or before the insert point.
+        anchor_id: str | None = None
+        for i in reversed(surviving):
+            if i <= anchor:
+                anchor_id = existing[i]["id"]
+                break
+        if anchor_id is None and surviving:
+            return _full_rewrite(existing, desired)
+        if anchor_id is not None and anchor_id == existing[surviving[-1]]["id"]:
+            anchor_id = None  # after the last surviving block == end of page
+        if plan.inserts and plan.inserts[-1].after_id == anchor_id:
+            plan.inserts[-1].blocks.append(block)
+        else:
+            plan.inserts.append(BlockInsert(after_id=anchor_id, blocks=[block]))
+    return plan
+
+
+def chunk_blocks(blocks: list[dict[str, Any]], size: int = MAX_APPEND_CHILDREN) -> list[list[dict[str, Any]]]:
+    return [blocks[i : i + size] for i in range(0, len(blocks), size)]
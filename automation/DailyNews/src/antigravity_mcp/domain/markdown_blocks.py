@@ -68,11 +68,15 @@ def markdown_to_blocks(markdown: str) -> list[dict[str, Any]]:
     return blocks
 
 
+def block_plain_text(block: dict[str, Any]) -> str:
+    payload = block.get(block.get("type", ""), {})
+    rich_text = payload.get("rich_text", [])
+    return "".join(item.get("plain_text") or item.get("text", {}).get("content", "") for item in rich_text)
+
+
 def block_to_text(block: dict[str, Any]) -> str:
     block_type = block.get("type", "")
-    payload = block.get(block_type, {})
-    rich_text = payload.get("rich_text", [])
-    plain_text = "".join(item.get("plain_text") or item.get("text", {}).get("content", "") for item in rich_text)
+    plain_text = block_plain_text(block)
     if block_type == "heading_1":
         return f"# {plain_text}"
     if block_type == "heading_2":
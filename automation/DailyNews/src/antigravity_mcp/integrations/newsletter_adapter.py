@@ -15,7 +15,12 @@ Required env vars:
   NEWSLETTER_SIGNUP_URL   Landing page URL for CTA injection
 
 Optional:
-  NEWSLETTER_REPLY_TO     Reply-to email for engagement
+  NEWSLETTER_REPLY_TO          Reply-to email for engagement
+  NEWSLETTER_SEND_RATE         Sends per second across all workers (default: 1)
+  NEWSLETTER_SEND_CONCURRENCY  Delivery worker pool size (default: 4)
+  RESEND_API_URL               Resend REST base URL (default: https://api.resend.com)
+
+Without the ``resend`` SDK, emails are posted to the Resend REST API over httpx.
 """
 
 from __future__ import annotations
@@ -28,8 +33,21 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+import httpx
+
 from antigravity_mcp.config import emit_metric, get_settings
 from antigravity_mcp.domain.models import ContentReport
+from antigravity_mcp.integrations.newsletter_delivery import (
+    EMAIL_PLACEHOLDER,
+    UNSUBSCRIBE_PLACEHOLDER,
+    DeliveryEngine,
+    DeliveryJob,
+    TokenBucket,
+    group_by_categories,
+    make_delivery_id,
+    personalize,
+    unsubscribe_url_for,
+)
 from antigravity_mcp.integrations.subscriber_store import Subscriber, SubscriberStore
 
 logger = logging.getLogger(__name__)
@@ -49,7 +67,9 @@ try:
     _resend = _resend_module
     _RESEND_AVAILABLE = True
 except ImportError:
-    logger.debug("resend not installed; newsletter delivery disabled. Run: pip install resend")
+    logger.debug("resend not installed; newsletter delivery falls back to the REST API over httpx")
+
+DEFAULT_RESEND_API_URL = "https://api.resend.com"
 
 
 # ---------------------------------------------------------------------------
@@ -235,6 +255,10 @@ class NewsletterAdapter:
         self._from_name = os.getenv("NEWSLETTER_FROM_NAME", "DailyNews")
         self._reply_to = os.getenv("NEWSLETTER_REPLY_TO", "")
         self._signup_url = os.getenv("NEWSLETTER_SIGNUP_URL", "")
+        self._api_url = os.getenv("RESEND_API_URL", DEFAULT_RESEND_API_URL).rstrip("/")
+        self._send_rate = float(os.getenv("NEWSLETTER_SEND_RATE", "1") or 1)
+        self._send_concurrency = int(os.getenv("NEWSLETTER_SEND_CONCURRENCY", "4") or 4)
+        self._http: httpx.AsyncClient | None = None
 
     @property
     def is_configured(self) -> bool:
@@ -246,6 +270,37 @@ class NewsletterAdapter:
         if _RESEND_AVAILABLE and self._api_key:
             _resend.api_key = self._api_key
 
+    def _build_params(self, to_email: str, payload: EmailPayload) -> dict[str, Any]:
+        params: dict[str, Any] = {
+            "from": f"{self._from_name} <{self._from_email}>",
+            "to": [to_email],
+            "subject": payload.subject,
+            "html": payload.html_body,
+            "text": payload.plain_text,
+        }
+        if self._reply_to:
+            params["reply_to"] = self._reply_to
+        return params
+
+    async def _post_email(self, client: httpx.AsyncClient, params: dict[str, Any]) -> dict[str, str]:
+        """POST one email to the Resend REST API."""
+        response = await client.post(
+            f"{self._api_url}/emails",
+            json=params,
+            headers={"Authorization": f"Bearer {self._api_key}"},
+        )
+        if response.status_code >= 400:
+            # 429 and 5xx are transient; other client errors will not succeed on retry.
+            retryable = response.status_code == 429 or response.status_code >= 500
+            return {
+                "status": "error",
+                "message_id": "",
+                "message": f"HTTP {response.status_code}: {response.text[:200]}",
+                "retryable": "true" if retryable else "false",
+            }
+        data = response.json()
+        return {"status": "sent", "message_id": str(data.get("id", "")) if isinstance(data, dict) else ""}
+
     async def send_single(
         self,
         to_email: str,
@@ -253,40 +308,79 @@ class NewsletterAdapter:
         *,
         dry_run: bool = False,
     ) -> dict[str, str]:
-        """Send a single email via Resend API."""
+        """Send a single email via the Resend SDK, or its REST API when the SDK is absent."""
         if dry_run:
             logger.info("[DRY RUN] Would send '%s' to %s", payload.subject, to_email)
             return {"status": "dry_run", "message_id": "", "subject": payload.subject}
 
-        if not _RESEND_AVAILABLE:
-            return {"status": "error", "message_id": "", "message": "resend not installed"}
-
         if not self.is_configured:
-            return {"status": "error", "message_id": "", "message": "Newsletter not configured"}
-
-        self._init_resend()
+            return {"status": "error", "message_id": "", "message": "Newsletter not configured", "retryable": "false"}
 
+        params = self._build_params(to_email, payload)
         try:
-            params: dict[str, Any] = {
-                "from_": f"{self._from_name} <{self._from_email}>",
-                "to": [to_email],
-                "subject": payload.subject,
-                "html": payload.html_body,
-                "text": payload.plain_text,
-            }
-            if self._reply_to:
-                params["reply_to"] = self._reply_to
-
-            response = await asyncio.to_thread(_resend.Emails.send, params)
-            message_id = response.get("id", "") if isinstance(response, dict) else str(response)
-
-            logger.info("Newsletter sent to %s [%s]", to_email, message_id)
-            return {"status": "sent", "message_id": message_id}
-
+            if _RESEND_AVAILABLE:
+                self._init_resend()
+                sdk_params = {("from_" if key == "from" else key): value for key, value in params.items()}
+                response = await asyncio.to_thread(_resend.Emails.send, sdk_params)
+                message_id = response.get("id", "") if isinstance(response, dict) else str(response)
+                send_result = {"status": "sent", "message_id": message_id}
+            elif self._http is not None:
+                send_result = await self._post_email(self._http, params)
+            else:
+                async with httpx.AsyncClient(timeout=30.0) as client:
+                    send_result = await self._post_email(client, params)
         except Exception as exc:
             logger.error("Newsletter send failed for %s: %s", to_email, exc)
             return {"status": "error", "message_id": "", "message": str(exc)}
 
+        if send_result["status"] == "sent":
+            logger.info("Newsletter sent to %s [%s]", to_email, send_result["message_id"])
+        else:
+            logger.error("Newsletter send failed for %s: %s", to_email, send_result["message"])
+        return send_result
+
+    def _compose_jobs(
+        self,
+        reports: list[ContentReport],
+        subscribers: list[Subscriber],
+        *,
+        edition: str,
+        result: dict[str, Any],
+    ) -> list[DeliveryJob]:
+        """Render once per distinct category set, then personalize per recipient."""
+        jobs: list[DeliveryJob] = []
+        groups = group_by_categories(subscribers)
+        for categories, members in groups.items():
+            try:
+                payload = self.composer.compose_daily_brief(
+                    reports,
+                    subscriber_categories=sorted(categories) or None,
+                    edition=edition,
+                    signup_url=self._signup_url,
+                    unsubscribe_url=UNSUBSCRIBE_PLACEHOLDER if self._signup_url else "",
+                    subscriber_email=EMAIL_PLACEHOLDER,
+                )
+            except Exception as exc:
+                for subscriber in members:
+                    result["failed"] += 1
+                    result["errors"].append(f"{subscriber.email}: {exc}")
+                logger.warning("Newsletter compose failed for categories %s: %s", sorted(categories), exc)
+                continue
+
+            for subscriber in members:
+                jobs.append(
+                    DeliveryJob(
+                        subscriber=subscriber,
+                        payload=personalize(
+                            payload,
+                            email=subscriber.email,
+                            unsubscribe_url=unsubscribe_url_for(self._signup_url, subscriber.email),
+                        ),
+                    )
+                )
+        result["groups"] = len(groups)
+        return jobs
+
     async def send_daily_brief(
         self,
         reports: list[ContentReport],
@@ -294,9 +388,26 @@ class NewsletterAdapter:
         *,
         edition: str = "morning",
         dry_run: bool = False,
+        delivery_id: str | None = None,
     ) -> dict[str, Any]:
-        """Send daily brief to all active subscribers with adaptive content."""
-        result = {"sent": 0, "failed": 0, "skipped": 0, "errors": [], "warnings": []}
+        """Send daily brief to all active subscribers with adaptive content.
+
+        Each distinct category subscription set is rendered once. Sends are
+        rate limited by a token bucket and spread over a bounded worker pool.
+        With a subscriber store, per-recipient state is kept under
+        ``delivery_id`` (derived from edition, date and report ids by default),
+        so calling again after a partial failure only retries the recipients
+        that did not receive the brief yet.
+        """
+        result: dict[str, Any] = {
+            "sent": 0,
+            "failed": 0,
+            "skipped": 0,
+            "already_sent": 0,
+            "groups": 0,
+            "errors": [],
+            "warnings": [],
+        }
 
         if not reports:
             logger.info("No reports to send as newsletter")
@@ -306,53 +417,28 @@ class NewsletterAdapter:
             logger.info("No subscribers to send to")
             return result
 
-        send_delay = 1.0
+        active = [subscriber for subscriber in subscribers if subscriber.is_active]
+        result["skipped"] = len(subscribers) - len(active)
+        jobs = self._compose_jobs(reports, active, edition=edition, result=result)
 
-        for subscriber in subscribers:
-            if not subscriber.is_active:
-                result["skipped"] += 1
-                continue
+        delivery_id = delivery_id or make_delivery_id(edition, [report.report_id for report in reports])
+        result["delivery_id"] = delivery_id
 
-            try:
-                payload = self.composer.compose_daily_brief(
-                    reports,
-                    subscriber_categories=subscriber.categories or None,
-                    edition=edition,
-                    signup_url=self._signup_url,
-                    unsubscribe_url=f"{self._signup_url}/unsubscribe?email={subscriber.email}" if self._signup_url else "",
-                    subscriber_email=subscriber.email,
-                )
-
-                send_result = await self.send_single(subscriber.email, payload, dry_run=dry_run)
-
-                if send_result["status"] in ("sent", "dry_run"):
-                    result["sent"] += 1
-                    if self._subscriber_store and not dry_run:
-                        try:
-                            self._subscriber_store.record_event(
-                                subscriber.id,
-                                "delivered",
-                                newsletter_id=",".join(payload.report_ids),
-                            )
-                        except Exception as exc:
-                            warning = f"{subscriber.email}: audit record failed: {exc}"
-                            result["warnings"].append(warning)
-                            logger.warning(
-                                "Newsletter audit record failed for %s after successful send: %s",
-                                subscriber.email,
-                                exc,
-                            )
-                else:
-                    result["failed"] += 1
-                    result["errors"].append(f"{subscriber.email}: {send_result.get('message', 'unknown')}")
-
-                if not dry_run:
-                    await asyncio.sleep(send_delay)
+        async def send(to_email: str, payload: EmailPayload) -> dict[str, str]:
+            return await self.send_single(to_email, payload, dry_run=dry_run)
 
-            except Exception as exc:
-                result["failed"] += 1
-                result["errors"].append(f"{subscriber.email}: {exc}")
-                logger.warning("Newsletter delivery failed for %s: %s", subscriber.email, exc)
+        engine = DeliveryEngine(
+            send,
+            store=None if dry_run else self._subscriber_store,
+            limiter=None if dry_run else TokenBucket(self._send_rate),
+            concurrency=self._send_concurrency,
+        )
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            self._http = client
+            try:
+                await engine.run(jobs, delivery_id=delivery_id, result=result)
+            finally:
+                self._http = None
 
         emit_metric(
             "newsletter_delivery",
@@ -360,16 +446,20 @@ class NewsletterAdapter:
             sent=result["sent"],
             failed=result["failed"],
             skipped=result["skipped"],
+            already_sent=result["already_sent"],
+            groups=result["groups"],
             warning_count=len(result["warnings"]),
             total_subscribers=len(subscribers),
             report_count=len(reports),
         )
 
         logger.info(
-            "Newsletter delivery complete: sent=%d failed=%d skipped=%d warnings=%d",
+            "Newsletter delivery complete: sent=%d failed=%d skipped=%d already_sent=%d groups=%d warnings=%d",
             result["sent"],
             result["failed"],
             result["skipped"],
+            result["already_sent"],
+            result["groups"],
             len(result["warnings"]),
         )
         return result
@@ -0,0 +1,241 @@
+"""Batched newsletter delivery engine.
+
+Subscribers that share the same category subscription set receive the same
+brief, so the composer renders each distinct set once with placeholder tokens
+for the per-recipient fields (email, unsubscribe link) and the engine only
+substitutes those before sending.
+
+Sends go through a bounded worker pool paced by a token bucket instead of a
+fixed sleep after every email. Per-recipient outcomes are persisted in the
+subscriber store (``newsletter_deliveries``) keyed by a delivery id, so a run
+that stops part-way can be resumed without re-sending to recipients that
+already received the edition.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import html
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
+
+if TYPE_CHECKING:
+    from antigravity_mcp.integrations.newsletter_adapter import EmailPayload
+    from antigravity_mcp.integrations.subscriber_store import Subscriber, SubscriberStore
+
+logger = logging.getLogger(__name__)
+
+# Rendered into the shared template once per group, replaced per recipient.
+EMAIL_PLACEHOLDER = "%%DAILYNEWS_SUBSCRIBER_EMAIL%%"
+UNSUBSCRIBE_PLACEHOLDER = "%%DAILYNEWS_UNSUBSCRIBE_URL%%"
+
+SendFn = Callable[[str, "EmailPayload"], Awaitable[dict[str, str]]]
+
+
+# ---------------------------------------------------------------------------
+# Grouping & personalization
+# ---------------------------------------------------------------------------
+
+
+def group_by_categories(subscribers: Iterable[Subscriber]) -> dict[frozenset[str], list[Subscriber]]:
+    """Group subscribers by their category subscription set (order-insensitive)."""
+    groups: dict[frozenset[str], list[Subscriber]] = {}
+    for subscriber in subscribers:
+        groups.setdefault(frozenset(subscriber.categories), []).append(subscriber)
+    return groups
+
+
+def unsubscribe_url_for(signup_url: str, email: str) -> str:
+    """Per-recipient unsubscribe link; empty when no landing page is configured."""
+    if not signup_url:
+        return ""
+    return f"{signup_url}/unsubscribe?email={quote(email, safe='@')}"
+
+
+def personalize(payload: EmailPayload, *, email: str, unsubscribe_url: str) -> EmailPayload:
+    """Fill the per-recipient placeholders of a group payload."""
+    html_body = payload.html_body.replace(EMAIL_PLACEHOLDER, html.escape(email)).replace(
+        UNSUBSCRIBE_PLACEHOLDER, html.escape(unsubscribe_url)
+    )
+    plain_text = payload.plain_text.replace(EMAIL_PLACEHOLDER, email).replace(UNSUBSCRIBE_PLACEHOLDER, unsubscribe_url)
+    return replace(payload, html_body=html_body, plain_text=plain_text)
+
+
+def make_delivery_id(edition: str, report_ids: Iterable[str], *, day: str | None = None) -> str:
+    """Stable id for one edition send: the same reports on the same day resume the same run."""
+    day = day or datetime.now(UTC).strftime("%Y-%m-%d")
+    digest = hashlib.sha1(",".join(sorted(report_ids)).encode("utf-8")).hexdigest()[:12]
+    return f"{day}:{edition}:{digest}"
+
+
+# ---------------------------------------------------------------------------
+# Rate limiting
+# ---------------------------------------------------------------------------
+
+
+class TokenBucket:
+    """Async token bucket: ``rate`` tokens per second, up to ``burst`` banked.
+
+    Waiters are served in arrival order; the lock is held while sleeping so a
+    burst of workers cannot overshoot the provider limit.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, *, clock: Callable[[], float] = time.monotonic) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._clock = clock
+        self._tokens = float(self.capacity)
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class DeliveryJob:
+    """One recipient and the personalized payload to send them."""
+
+    subscriber: Subscriber
+    payload: EmailPayload
+
+
+class DeliveryEngine:
+    """Sends delivery jobs through a bounded worker pool with retries.
+
+    ``store`` is optional: without it (dry runs, ad-hoc sends) nothing is
+    persisted and every job is attempted.
+    """
+
+    def __init__(
+        self,
+        send: SendFn,
+        *,
+        store: SubscriberStore | None = None,
+        limiter: TokenBucket | None = None,
+        concurrency: int = 4,
+        max_attempts: int = 3,
+        retry_backoff: float = 2.0,
+    ) -> None:
+        self._send = send
+        self._store = store
+        self._limiter = limiter
+        self.concurrency = max(1, concurrency)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_backoff = retry_backoff
+
+    def _already_sent(self, delivery_id: str) -> set[str]:
+        if self._store is None:
+            return set()
+        try:
+            states = self._store.get_delivery_states(delivery_id)
+        except Exception as exc:
+            logger.warning("Newsletter delivery state unavailable for %s; sending to all: %s", delivery_id, exc)
+            return set()
+        return {subscriber_id for subscriber_id, state in states.items() if state["status"] == "sent"}
+
+    def _persist(self, delivery_id: str, job: DeliveryJob, result: dict[str, Any], **fields: str) -> None:
+        if self._store is None:
+            return
+        try:
+            self._store.record_delivery_attempt(delivery_id, job.subscriber.id, **fields)
+        except Exception as exc:
+            result["warnings"].append(f"{job.subscriber.email}: delivery state record failed: {exc}")
+            logger.warning("Newsletter delivery state record failed for %s: %s", job.subscriber.email, exc)
+
+    def _audit(self, job: DeliveryJob, result: dict[str, Any]) -> None:
+        if self._store is None:
+            return
+        try:
+            self._store.record_event(
+                job.subscriber.id,
+                "delivered",
+                newsletter_id=",".join(job.payload.report_ids),
+            )
+        except Exception as exc:
+            warning = f"{job.subscriber.email}: audit record failed: {exc}"
+            result["warnings"].append(warning)
+            logger.warning(
+                "Newsletter audit record failed for %s after successful send: %s",
+                job.subscriber.email,
+                exc,
+            )
+
+    async def _deliver_one(self, delivery_id: str, job: DeliveryJob, result: dict[str, Any]) -> None:
+        email = job.subscriber.email
+        for attempt in range(1, self.max_attempts + 1):
+            if self._limiter is not None:
+                await self._limiter.acquire()
+            try:
+                send_result = await self._send(email, job.payload)
+            except Exception as exc:
+                send_result = {"status": "error", "message_id": "", "message": str(exc)}
+
+            status = send_result.get("status", "error")
+            if status in ("sent", "dry_run"):
+                result["sent"] += 1
+                self._persist(delivery_id, job, result, status="sent", message_id=send_result.get("message_id", ""))
+                self._audit(job, result)
+                return
+
+            message = send_result.get("message", "unknown")
+            retryable = send_result.get("retryable", "true") != "false"
+            if not retryable or attempt == self.max_attempts:
+                result["failed"] += 1
+                result["errors"].append(f"{email}: {message}")
+                self._persist(delivery_id, job, result, status="failed", error=message)
+                logger.warning("Newsletter delivery failed for %s after %d attempt(s): %s", email, attempt, message)
+                return
+
+            self._persist(delivery_id, job, result, status="pending", error=message)
+            await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+
+    async def run(self, jobs: list[DeliveryJob], *, delivery_id: str, result: dict[str, Any]) -> dict[str, Any]:
+        """Deliver ``jobs`` and accumulate counts into ``result``.
+
+        Recipients already marked ``sent`` for ``delivery_id`` are skipped and
+        counted under ``already_sent``.
+        """
+        done = self._already_sent(delivery_id)
+        queue: asyncio.Queue[DeliveryJob] = asyncio.Queue()
+        for job in jobs:
+            if job.subscriber.id in done:
+                result["already_sent"] += 1
+            else:
+                queue.put_nowait(job)
+
+        async def worker() -> None:
+            while True:
+                try:
+                    job = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                await self._deliver_one(delivery_id, job, result)
+
+        workers = min(self.concurrency, queue.qsize())
+        if workers:
+            await asyncio.gather(*(worker() for _ in range(workers)))
+        return result
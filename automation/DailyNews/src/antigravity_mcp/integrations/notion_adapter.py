@@ -9,6 +9,7 @@ import httpx
 from notion_client import AsyncClient
 
 from antigravity_mcp.config import AppSettings, get_settings
+from antigravity_mcp.domain.block_sync import BlockSyncPlan, chunk_blocks, plan_block_sync
 from antigravity_mcp.domain.markdown_blocks import block_to_text, markdown_to_blocks
 from antigravity_mcp.domain.models import PageSummary
 from shared.circuit_breaker import CircuitBreaker
@@ -188,19 +189,49 @@ class NotionAdapter:
 
     @retry_notion_call
     async def replace_page_markdown(self, *, page_id: str, markdown: str) -> int:
-        self._require_client()
-        blocks = await self.list_child_blocks(page_id)
-        if blocks:
-            batch_size = 10
-            for i in range(0, len(blocks), batch_size):
-                batch = blocks[i : i + batch_size]
-                await asyncio.gather(*(self.client.blocks.delete(block_id=block["id"]) for block in batch))
+        """Make the page body match ``markdown`` and return its block count.
 
+        Only changed blocks are touched: unchanged blocks are kept, same-type
+        edits are updated in place, and new blocks are appended in chunks of
+        up to 100 anchored after their predecessor.
+        """
+        self._require_client()
+        existing = await self.list_child_blocks(page_id)
         new_blocks = markdown_to_blocks(markdown)
-        if new_blocks:
-            await self.client.blocks.children.append(block_id=page_id, children=new_blocks)
+        plan = plan_block_sync(existing, new_blocks)
+        await self._apply_block_plan(page_id, plan)
+        logger.debug(
+            "Notion page %s synced: unchanged=%d updated=%d deleted=%d inserted=%d full_rewrite=%s",
+            page_id,
+            plan.unchanged,
+            len(plan.updates),
+            len(plan.deletes),
+            sum(len(insert.blocks) for insert in plan.inserts),
+            plan.full_rewrite,
+        )
         return len(new_blocks)
 
+    async def _apply_block_plan(self, page_id: str, plan: BlockSyncPlan) -> None:
+        # Updates and deletes are single-block endpoints; run them in parallel chunks of 10.
+        batch_size = 10
+        for i in range(0, len(plan.updates), batch_size):
+            batch = plan.updates[i : i + batch_size]
+            await asyncio.gather(*(self.client.blocks.update(block_id=bid, **body) for bid, body in batch))
+        for i in range(0, len(plan.deletes), batch_size):
+            batch = plan.deletes[i : i + batch_size]
+            await asyncio.gather(*(self.client.blocks.delete(block_id=bid) for bid in batch))
+
+        # Chunks anchored on the same block are sent last-first, so each one lands
+        # above the previous and the final order matches the document.
+        for insert in plan.inserts:
+            chunks = chunk_blocks(insert.blocks)
+            if insert.after_id is None:
+                for chunk in chunks:
+                    await self.client.blocks.children.append(block_id=page_id, children=chunk)
+            else:
+                for chunk in reversed(chunks):
+                    await self.client.blocks.children.append(block_id=page_id, children=chunk, after=insert.after_id)
+
     @retry_notion_call
     async def query_database(
         self,
@@ -6,6 +6,7 @@ path to Supabase PostgreSQL when subscriber count warrants it.
 Schema tables:
   - subscribers: email list with category preferences & engagement scores
   - newsletter_events: delivery/open/click tracking for feedback loop
+  - newsletter_deliveries: per-recipient send state for resumable deliveries
 """
 
 from __future__ import annotations
@@ -128,6 +129,20 @@ class SubscriberStore:
                 )
                 """
             )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS newsletter_deliveries (
+                    delivery_id TEXT NOT NULL,
+                    subscriber_id TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    message_id TEXT NOT NULL DEFAULT '',
+                    last_error TEXT NOT NULL DEFAULT '',
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (delivery_id, subscriber_id)
+                )
+                """
+            )
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_subscribers_email ON subscribers(email)"
             )
@@ -413,6 +428,49 @@ class SubscriberStore:
             )
             conn.commit()
 
+    # ── Delivery state ────────────────────────────────────────────────────
+
+    def get_delivery_states(self, delivery_id: str) -> dict[str, dict[str, Any]]:
+        """Per-subscriber send state for one delivery run, keyed by subscriber id."""
+        conn = self._connect()
+        rows = conn.execute(
+            """
+            SELECT subscriber_id, status, attempts, message_id, last_error, updated_at
+            FROM newsletter_deliveries WHERE delivery_id = ?
+            """,
+            (delivery_id,),
+        ).fetchall()
+        return {row["subscriber_id"]: dict(row) for row in rows}
+
+    def record_delivery_attempt(
+        self,
+        delivery_id: str,
+        subscriber_id: str,
+        *,
+        status: str,
+        message_id: str = "",
+        error: str = "",
+    ) -> None:
+        """Upsert the outcome of one send attempt (pending | sent | failed)."""
+        now = self._now_iso()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                """
+                INSERT INTO newsletter_deliveries
+                    (delivery_id, subscriber_id, status, attempts, message_id, last_error, updated_at)
+                VALUES (?, ?, ?, 1, ?, ?, ?)
+                ON CONFLICT(delivery_id, subscriber_id) DO UPDATE SET
+                    status = excluded.status,
+                    attempts = attempts + 1,
+                    message_id = excluded.message_id,
+                    last_error = excluded.last_error,
+                    updated_at = excluded.updated_at
+                """,
+                (delivery_id, subscriber_id, status, message_id, error, now),
+            )
+            conn.commit()
+
     # ── Stats ─────────────────────────────────────────────────────────────
 
     def get_stats(self) -> dict[str, Any]:
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-
 from antigravity_mcp.integrations.newsletter_adapter import (
     EmailPayload,
     NewsletterAdapter,
@@ -239,3 +239,185 @@ class TestNewsletterAdapter:
         assert result["errors"] == []
         assert len(result["warnings"]) == 1
         assert "audit record failed" in result["warnings"][0]
+
+
+class _ResendStub:
+    """Local HTTP stand-in for the Resend ``POST /emails`` endpoint."""
+
+    def __init__(self, *, fail_once: set[str] | None = None, fail_always: set[str] | None = None) -> None:
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        self.received: list[dict] = []
+        self.fail_once = set(fail_once or ())
+        self.fail_always = set(fail_always or ())
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:  # noqa: N802
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                to_email = body["to"][0]
+                if to_email in stub.fail_always:
+                    status = 500
+                elif to_email in stub.fail_once:
+                    stub.fail_once.discard(to_email)
+                    status = 503
+                else:
+                    status = 200
+                    stub.received.append(body)
+                payload = json.dumps({"id": f"msg-{len(stub.received)}"} if status == 200 else {"error": "x"})
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.end_headers()
+                self.wfile.write(payload.encode())
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class TestDeliveryEngine:
+    @pytest.fixture
+    def resend_stub(self):
+        stubs: list[_ResendStub] = []
+
+        def start(**kwargs: set[str]) -> _ResendStub:
+            stub = _ResendStub(**kwargs)
+            stubs.append(stub)
+            return stub
+
+        yield start
+        for stub in stubs:
+            stub.close()
+
+    @staticmethod
+    def _adapter(stub: _ResendStub, store: SubscriberStore, *, signup_url: str = "") -> NewsletterAdapter:
+        env = {
+            "RESEND_API_KEY": "re_test",
+            "NEWSLETTER_FROM_EMAIL": "daily@example.com",
+            "NEWSLETTER_SIGNUP_URL": signup_url,
+            "RESEND_API_URL": stub.url,
+            "NEWSLETTER_SEND_RATE": "1000",
+        }
+        with patch.dict("os.environ", env):
+            return NewsletterAdapter(subscriber_store=store)
+
+    @staticmethod
+    def _subscribers(store: SubscriberStore) -> list[Subscriber]:
+        store.add_subscriber("a@example.com", categories=["Economy_KR"])
+        store.add_subscriber("b@example.com", categories=["Economy_KR"])
+        store.add_subscriber("c+tag@example.com", categories=["Tech", "Economy_KR"])
+        store.add_subscriber("d@example.com", categories=["Economy_KR", "Tech"])
+        return store.get_active_subscribers()
+
+    @pytest.mark.asyncio
+    async def test_renders_once_per_category_set_and_personalizes(
+        self,
+        mock_report: MagicMock,
+        store: SubscriberStore,
+        resend_stub,
+    ) -> None:
+        stub = resend_stub()
+        adapter = self._adapter(stub, store, signup_url="https://news.example.com")
+        subscribers = self._subscribers(store)
+        composer = adapter.composer
+        env = MagicMock()
+        env.get_template.return_value.render.side_effect = lambda **ctx: (
+            f'<p>{ctx["subscriber_email"]}</p><a href="{ctx["unsubscribe_url"]}">x</a>'
+        )
+
+        with (
+            patch("antigravity_mcp.integrations.newsletter_adapter._RESEND_AVAILABLE", False),
+            patch.object(composer, "_get_jinja_env", return_value=env),
+            patch.object(composer, "compose_daily_brief", wraps=composer.compose_daily_brief) as compose,
+        ):
+            result = await adapter.send_daily_brief([mock_report], subscribers)
+
+        assert result["sent"] == 4
+        assert result["failed"] == 0
+        assert result["groups"] == 2
+        assert compose.call_count == 2
+        by_recipient = {body["to"][0]: body for body in stub.received}
+        assert set(by_recipient) == {"a@example.com", "b@example.com", "c+tag@example.com", "d@example.com"}
+        html_c = by_recipient["c+tag@example.com"]["html"]
+        assert "<p>c+tag@example.com</p>" in html_c
+        assert "unsubscribe?email=c%2Btag@example.com" in html_c
+        assert "%%" not in html_c
+
+    @pytest.mark.asyncio
+    async def test_partial_failure_resumes_only_unsent_recipients(
+        self,
+        mock_report: MagicMock,
+        store: SubscriberStore,
+        resend_stub,
+    ) -> None:
+        stub = resend_stub(fail_once={"a@example.com"}, fail_always={"b@example.com"})
+        adapter = self._adapter(stub, store)
+        subscribers = self._subscribers(store)
+
+        with (
+            patch("antigravity_mcp.integrations.newsletter_adapter._RESEND_AVAILABLE", False),
+            patch("antigravity_mcp.integrations.newsletter_delivery.asyncio.sleep", new=AsyncMock()),
+        ):
+            first = await adapter.send_daily_brief([mock_report], subscribers, delivery_id="run-1")
+            assert first["sent"] == 3  # a@ succeeds on retry
+            assert first["failed"] == 1
+            assert first["errors"][0].startswith("b@example.com: HTTP 500")
+
+            states = store.get_delivery_states("run-1")
+            b_id = next(s.id for s in subscribers if s.email == "b@example.com")
+            a_id = next(s.id for s in subscribers if s.email == "a@example.com")
+            assert states[b_id]["status"] == "failed"
+            assert states[b_id]["attempts"] == 3
+            assert states[a_id]["status"] == "sent"
+            assert states[a_id]["attempts"] == 2
+
+            stub.fail_always.clear()
+            second = await adapter.send_daily_brief([mock_report], subscribers, delivery_id="run-1")
+
+        assert second["already_sent"] == 3
+        assert second["sent"] == 1
+        assert second["failed"] == 0
+        assert [body["to"][0] for body in stub.received].count("b@example.com") == 1
+        assert len(stub.received) == 4
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self, mock_report: MagicMock, store: SubscriberStore) -> None:
+        adapter = NewsletterAdapter(subscriber_store=store)
+        calls = AsyncMock(return_value={"status": "error", "message": "invalid to", "retryable": "false"})
+        subscriber = store.add_subscriber("x@example.com")
+
+        with patch.object(adapter, "send_single", new=calls):
+            result = await adapter.send_daily_brief([mock_report], [subscriber])
+
+        assert calls.await_count == 1
+        assert result["failed"] == 1
+        assert result["errors"] == ["x@example.com: invalid to"]
+
+
+class TestTokenBucket:
+    @pytest.mark.asyncio
+    async def test_paces_acquires_after_burst(self) -> None:
+        from antigravity_mcp.integrations.newsletter_delivery import TokenBucket
+
+        now = [0.0]
+        sleeps: list[float] = []
+
+        async def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        bucket = TokenBucket(rate=2.0, burst=2, clock=lambda: now[0])
+        with patch("antigravity_mcp.integrations.newsletter_delivery.asyncio.sleep", new=fake_sleep):
+            for _ in range(4):
+                await bucket.acquire()
+
+        assert sleeps == [0.5, 0.5]
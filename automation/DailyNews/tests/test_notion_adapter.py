@@ -3,6 +3,7 @@ from __future__ import annotations
 from types import SimpleNamespace
 
 import pytest
+from antigravity_mcp.domain.markdown_blocks import block_to_text, markdown_to_blocks
 from antigravity_mcp.integrations.notion_adapter import NotionAdapter
 
 
@@ -138,3 +139,168 @@ async def test_update_page_passes_properties_to_client():
     assert client.pages.update_calls == [
         {"page_id": "page-123", "properties": {"Type": {"select": {"name": "News"}}}}
     ]
+
+
+class _FakeNotionServer:
+    """In-memory Notion page store exposing the client surface the adapter uses.
+
+    Enforces the API's 100-children append limit and pagination, and counts
+    every request so tests can assert on API cost.
+    """
+
+    def __init__(self, markdown: str = "") -> None:
+        from collections import Counter
+
+        self.calls: Counter[str] = Counter()
+        self.children: list[dict] = []
+        self._next_id = 0
+        self.blocks = SimpleNamespace(
+            children=SimpleNamespace(list=self._list, append=self._append),
+            update=self._update,
+            delete=self._delete,
+        )
+        if markdown:
+            self.children = [self._stored(block) for block in markdown_to_blocks(markdown)]
+        self.calls.clear()
+
+    def _stored(self, block: dict) -> dict:
+        self._next_id += 1
+        block_type = block["type"]
+        text = block[block_type]["rich_text"][0]["text"]["content"]
+        return {
+            "id": f"blk-{self._next_id}",
+            "type": block_type,
+            "has_children": False,
+            block_type: {"rich_text": [{"plain_text": text}]},
+        }
+
+    def _index(self, block_id: str) -> int:
+        return next(i for i, block in enumerate(self.children) if block["id"] == block_id)
+
+    async def _list(self, block_id: str, start_cursor=None):
+        self.calls["list"] += 1
+        start = int(start_cursor or 0)
+        page = self.children[start : start + 100]
+        has_more = start + 100 < len(self.children)
+        return {"results": page, "has_more": has_more, "next_cursor": str(start + 100) if has_more else None}
+
+    async def _append(self, block_id: str, children, after=None):
+        self.calls["append"] += 1
+        assert len(children) <= 100, "Notion rejects more than 100 children per request"
+        stored = [self._stored(block) for block in children]
+        at = self._index(after) + 1 if after else len(self.children)
+        self.children[at:at] = stored
+        return {"results": stored}
+
+    async def _update(self, block_id: str, **body):
+        self.calls["update"] += 1
+        block = self.children[self._index(block_id)]
+        ((block_type, payload),) = body.items()
+        assert block_type == block["type"], "Notion cannot change a block's type"
+        block[block_type] = {"rich_text": [{"plain_text": payload["rich_text"][0]["text"]["content"]}]}
+        return block
+
+    async def _delete(self, block_id: str):
+        self.calls["delete"] += 1
+        del self.children[self._index(block_id)]
+        return {"id": block_id}
+
+    def markdown(self) -> str:
+        return "\n".join(block_to_text(block) for block in self.children)
+
+
+def _doc(lines: list[str]) -> str:
+    return "\n".join(lines)
+
+
+def _adapter_for(server: _FakeNotionServer) -> NotionAdapter:
+    settings = SimpleNamespace(notion_api_version="2022-06-28", pipeline_http_timeout_sec=15, notion_api_key="token")
+    return NotionAdapter(settings=settings, api_key="token", client=server)
+
+
+class TestReplacePageMarkdownDiff:
+    @staticmethod
+    def _report(paragraphs: int) -> list[str]:
+        lines = ["# Daily Report", "## Summary"]
+        lines.extend(f"- point {i}" for i in range(paragraphs // 2))
+        lines.append("## Details")
+        lines.extend(f"paragraph {i}" for i in range(paragraphs))
+        return lines
+
+    @pytest.mark.asyncio
+    async def test_single_paragraph_edit_is_one_update(self):
+        lines = self._report(200)
+        server = _FakeNotionServer(_doc(lines))
+        lines[150] = "paragraph edited"
+
+        count = await _adapter_for(server).replace_page_markdown(page_id="page-1", markdown=_doc(lines))
+
+        assert count == len(lines)
+        assert server.markdown() == _doc(lines)
+        assert server.calls == {"list": 4, "update": 1}
+
+    @pytest.mark.asyncio
+    async def test_unchanged_page_only_lists(self):
+        lines = self._report(20)
+        server = _FakeNotionServer(_doc(lines))
+
+        await _adapter_for(server).replace_page_markdown(page_id="page-1", markdown=_doc(lines))
+
+        assert server.calls == {"list": 1}
+
+    @pytest.mark.asyncio
+    async def test_middle_insert_and_delete_touch_only_changed_blocks(self):
+        lines = self._report(40)
+        server = _FakeNotionServer(_doc(lines))
+        del lines[30]
+        lines[10:10] = ["## Inserted section", "- new point"]
+
+        await _adapter_for(server).replace_page_markdown(page_id="page-1", markdown=_doc(lines))
+
+        assert server.markdown() == _doc(lines)
+        assert server.calls == {"list": 1, "append": 1, "delete": 1}
+
+    @pytest.mark.asyncio
+    async def test_large_anchored_insert_is_chunked_and_ordered(self):
+        lines = self._report(10)
+        server = _FakeNotionServer(_doc(lines))
+        lines[3:3] = [f"inserted {i}" for i in range(250)]
+
+        await _adapter_for(server).replace_page_markdown(page_id="page-1", markdown=_doc(lines))
+
+        assert server.markdown() == _doc(lines)
+        assert server.calls == {"list": 1, "append": 3}
+
+    @pytest.mark.asyncio
+    async def test_fresh_page_appends_in_chunks_of_100(self):
+        lines = self._report(300)
+        server = _FakeNotionServer()
+
+        await _adapter_for(server).replace_page_markdown(page_id="page-1", markdown=_doc(lines))
+
+        assert server.markdown() == _doc(lines)
+        assert server.calls == {"list": 1, "append": 5}
+
+    @pytest.mark.asyncio
+    async def test_random_edits_converge(self):
+        import random
+
+        rng = random.Random(7)
+        for _ in range(20):
+            lines = self._report(rng.randint(0, 60))
+            server = _FakeNotionServer(_doc(lines))
+            for _ in range(rng.randint(1, 8)):
+                op = rng.choice(["insert", "delete", "edit", "retype"])
+                pos = rng.randrange(len(lines) + (op == "insert"))
+                if op == "insert":
+                    lines.insert(pos, f"new {rng.random():.6f}")
+                elif op == "delete" and len(lines) > 1:
+                    del lines[pos]
+                elif op == "edit" and pos < len(lines):
+                    lines[pos] = f"edited {rng.random():.6f}"
+                elif pos < len(lines):
+                    lines[pos] = f"## retyped {rng.random():.6f}"
+
+            await _adapter_for(server).replace_page_markdown(page_id="page-1", markdown=_doc(lines))
+
+            assert server.markdown() == _doc(lines)
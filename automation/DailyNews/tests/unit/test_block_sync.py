@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from antigravity_mcp.domain.block_sync import block_hash, plan_block_sync
+from antigravity_mcp.domain.markdown_blocks import markdown_to_blocks
+
+
+def _existing(markdown: str) -> list[dict]:
+    # Shape returned by the API: ids and plain_text instead of text.content.
+    blocks = []
+    for i, block in enumerate(markdown_to_blocks(markdown)):
+        block_type = block["type"]
+        content = block[block_type]["rich_text"][0]["text"]["content"]
+        blocks.append({"id": f"b{i}", "type": block_type, block_type: {"rich_text": [{"plain_text": content}]}})
+    return blocks
+
+
+def test_block_hash_matches_api_and_generated_shapes():
+    generated = markdown_to_blocks("## Heading")[0]
+    assert block_hash(generated) == block_hash(_existing("## Heading")[0])
+    assert block_hash(generated) != block_hash(markdown_to_blocks("Heading")[0])
+
+
+def test_identical_content_is_a_noop():
+    markdown = "# Title\nBody\n- item"
+    plan = plan_block_sync(_existing(markdown), markdown_to_blocks(markdown))
+
+    assert plan.is_noop
+    assert plan.unchanged == 3
+
+
+def test_same_type_edit_updates_in_place():
+    plan = plan_block_sync(_existing("# Title\nold body\n- item"), markdown_to_blocks("# Title\nnew body\n- item"))
+
+    assert plan.updates == [("b1", {"paragraph": {"rich_text": [{"type": "text", "text": {"content": "new body"}}]}})]
+    assert plan.deletes == []
+    assert plan.inserts == []
+
+
+def test_type_change_deletes_and_inserts_after_previous_block():
+    plan = plan_block_sync(_existing("# Title\nbody\n- item"), markdown_to_blocks("# Title\n## body\n- item"))
+
+    assert plan.deletes == ["b1"]
+    assert [(insert.after_id, len(insert.blocks)) for insert in plan.inserts] == [("b0", 1)]
+
+
+def test_trailing_inserts_append_to_end_of_page():
+    plan = plan_block_sync(_existing("# Title"), markdown_to_blocks("# Title\na\nb"))
+
+    assert [(insert.after_id, len(insert.blocks)) for insert in plan.inserts] == [(None, 2)]
+
+
+def test_insert_before_first_kept_block_falls_back_to_full_rewrite():
+    plan = plan_block_sync(_existing("body\n- item"), markdown_to_blocks("# New Title\nbody\n- item"))
+
+    assert plan.full_rewrite
+    assert plan.deletes == ["b0", "b1"]
+    assert len(plan.inserts) == 1 and len(plan.inserts[0].blocks) == 3
@@ -14,8 +14,10 @@ CIE 파이프라인에 주입한다.
 from __future__ import annotations
 
 import sqlite3
+from collections.abc import Iterable, Iterator, Sized
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import batched
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -97,33 +99,63 @@ def _find_gdt_db(config: CIEConfig) -> Path | None:
 # ── 쿼리 함수들 ──────────────────────────────────────
 
 
+_RICH_TREND_SELECT = """
+    SELECT
+        t.id AS trend_id,
+        t.keyword,
+        t.rank,
+        t.viral_potential,
+        COALESCE(t.top_insight, '') AS top_insight,
+        COALESCE(t.suggested_angles, '[]') AS suggested_angles,
+        COALESCE(t.best_hook_starter, '') AS best_hook_starter,
+        COALESCE(t.sentiment, 'neutral') AS sentiment,
+        COALESCE(t.cross_source_confidence, 0) AS confidence,
+        COALESCE(t.trend_acceleration, '+0%') AS trend_acceleration,
+        t.scored_at,
+        COALESCE(AVG(tw.engagement_rate), 0) AS avg_eng,
+        COALESCE(SUM(tw.impressions), 0) AS total_imp
+    FROM trends t
+    LEFT JOIN tweets tw ON tw.trend_id = t.id AND tw.status != '대기중'
+    WHERE {where}
+    GROUP BY t.id
+"""
+
+
+def _row_to_rich_trend(row) -> RichTrend:
+    import json
+
+    angles_raw = row["suggested_angles"]
+    try:
+        angles = json.loads(angles_raw) if angles_raw else []
+    except (json.JSONDecodeError, TypeError):
+        angles = []
+
+    return RichTrend(
+        keyword=row["keyword"],
+        rank=row["rank"] or 0,
+        viral_potential=row["viral_potential"] or 0,
+        top_insight=row["top_insight"],
+        suggested_angles=angles,
+        best_hook_starter=row["best_hook_starter"],
+        sentiment=row["sentiment"],
+        confidence=row["confidence"],
+        trend_acceleration=row["trend_acceleration"],
+        scored_at=row["scored_at"] or "",
+        avg_engagement_rate=row["avg_eng"],
+        total_impressions=int(row["total_imp"]),
+    )
+
+
 def load_rich_trends(
     conn: sqlite3.Connection,
     hours: int = 24,
     limit: int = 15,
 ) -> list[RichTrend]:
     """최근 N시간 이내의 트렌드를 tweets 성과 데이터와 함께 로드한다."""
-    query = """
-        SELECT
-            t.keyword,
-            t.rank,
-            t.viral_potential,
-            COALESCE(t.top_insight, '') AS top_insight,
-            COALESCE(t.suggested_angles, '[]') AS suggested_angles,
-            COALESCE(t.best_hook_starter, '') AS best_hook_starter,
-            COALESCE(t.sentiment, 'neutral') AS sentiment,
-            COALESCE(t.cross_source_confidence, 0) AS confidence,
-            COALESCE(t.trend_acceleration, '+0%') AS trend_acceleration,
-            t.scored_at,
-            COALESCE(AVG(tw.engagement_rate), 0) AS avg_eng,
-            COALESCE(SUM(tw.impressions), 0) AS total_imp
-        FROM trends t
-        LEFT JOIN tweets tw ON tw.trend_id = t.id AND tw.status != '대기중'
-        WHERE t.scored_at >= datetime('now', ? || ' hours')
-        GROUP BY t.id
-        ORDER BY t.viral_potential DESC
-        LIMIT ?
-    """
+    query = (
+        _RICH_TREND_SELECT.format(where="t.scored_at >= datetime('now', ? || ' hours')")
+        + " ORDER BY t.viral_potential DESC LIMIT ?"
+    )
     try:
         rows = conn.execute(query, (f"-{hours}", limit)).fetchall()
     except Exception as e:
@@ -131,33 +163,7 @@ def load_rich_trends(
         # 테이블 구조가 다를 경우 단순 쿼리
         return _load_simple_trends(conn, hours, limit)
 
-    import json
-
-    results = []
-    for row in rows:
-        angles_raw = row["suggested_angles"]
-        try:
-            angles = json.loads(angles_raw) if angles_raw else []
-        except (json.JSONDecodeError, TypeError):
-            angles = []
-
-        results.append(
-            RichTrend(
-                keyword=row["keyword"],
-                rank=row["rank"] or 0,
-                viral_potential=row["viral_potential"] or 0,
-                top_insight=row["top_insight"],
-                suggested_angles=angles,
-                best_hook_starter=row["best_hook_starter"],
-                sentiment=row["sentiment"],
-                confidence=row["confidence"],
-                trend_acceleration=row["trend_acceleration"],
-                scored_at=row["scored_at"] or "",
-                avg_engagement_rate=row["avg_eng"],
-                total_impressions=int(row["total_imp"]),
-            )
-        )
-    return results
+    return [_row_to_rich_trend(row) for row in rows]
 
 
 def _load_simple_trends(
@@ -253,6 +259,196 @@ def load_watchlist_alerts(
         return []
 
 
+# ── 증분 동기화 (change feed) ──────────────────────────────────────
+#
+# GDT는 trends/tweets 변경 시 trend_outbox(seq 단조 증가)에 trend_id를 append한다.
+# CIE는 로컬 DB에 GDT 트렌드 미러와 마지막으로 소비한 seq(high-watermark)를 두고,
+# 매 사이클 ``seq > watermark`` 범위(PK range scan)에 해당하는 트렌드만 다시 읽는다.
+# watermark가 없거나 GDT DB가 초기화된 경우(watermark > 현재 seq)에는 전체 윈도우를 재적재.
+
+_SYNC_SCHEMA = """\
+CREATE TABLE IF NOT EXISTS gdt_sync_state (
+    source      TEXT PRIMARY KEY,
+    last_seq    INTEGER NOT NULL,
+    updated_at  TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS gdt_trend_mirror (
+    trend_id            INTEGER PRIMARY KEY,
+    keyword             TEXT NOT NULL,
+    rank                INTEGER DEFAULT 0,
+    viral_potential     INTEGER DEFAULT 0,
+    top_insight         TEXT DEFAULT '',
+    suggested_angles    TEXT DEFAULT '[]',
+    best_hook_starter   TEXT DEFAULT '',
+    sentiment           TEXT DEFAULT 'neutral',
+    confidence          INTEGER DEFAULT 0,
+    trend_acceleration  TEXT DEFAULT '+0%',
+    scored_at           TEXT DEFAULT '',
+    avg_eng             REAL DEFAULT 0.0,
+    total_imp           INTEGER DEFAULT 0,
+    synced_at           TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_gtm_scored ON gdt_trend_mirror(scored_at, viral_potential);
+"""
+
+_MIRROR_COLUMNS = (
+    "trend_id",
+    "keyword",
+    "rank",
+    "viral_potential",
+    "top_insight",
+    "suggested_angles",
+    "best_hook_starter",
+    "sentiment",
+    "confidence",
+    "trend_acceleration",
+    "scored_at",
+    "avg_eng",
+    "total_imp",
+)
+
+_OUTBOX_ID_CHUNK = 500
+MIRROR_RETENTION_HOURS = 72
+
+
+def ensure_sync_schema(cie_conn: sqlite3.Connection) -> None:
+    """CIE 로컬 DB에 동기화 상태/미러 테이블을 만든다."""
+    cie_conn.executescript(_SYNC_SCHEMA)
+
+
+def get_sync_watermark(cie_conn: sqlite3.Connection, source: str) -> int | None:
+    row = cie_conn.execute("SELECT last_seq FROM gdt_sync_state WHERE source = ?", (source,)).fetchone()
+    return int(row[0]) if row else None
+
+
+def _set_sync_watermark(cie_conn: sqlite3.Connection, source: str, seq: int) -> None:
+    cie_conn.execute(
+        """INSERT INTO gdt_sync_state (source, last_seq, updated_at) VALUES (?, ?, datetime('now'))
+           ON CONFLICT(source) DO UPDATE SET last_seq = excluded.last_seq, updated_at = excluded.updated_at""",
+        (source, seq),
+    )
+
+
+def _outbox_head(gdt_conn: sqlite3.Connection) -> int | None:
+    """trend_outbox의 현재 최대 seq. 테이블이 없으면 None (change feed 미지원 DB)."""
+    try:
+        row = gdt_conn.execute("SELECT COALESCE(MAX(seq), 0) FROM trend_outbox").fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return int(row[0])
+
+
+def _upsert_mirror(cie_conn: sqlite3.Connection, rows: list) -> None:
+    placeholders = ", ".join("?" for _ in _MIRROR_COLUMNS)
+    updates = ", ".join(f"{col} = excluded.{col}" for col in _MIRROR_COLUMNS[1:])
+    cie_conn.executemany(
+        f"""INSERT INTO gdt_trend_mirror ({", ".join(_MIRROR_COLUMNS)}, synced_at)
+            VALUES ({placeholders}, datetime('now'))
+            ON CONFLICT(trend_id) DO UPDATE SET {updates}, synced_at = excluded.synced_at""",
+        [tuple(row[col] for col in _MIRROR_COLUMNS) for row in rows],
+    )
+
+
+def sync_trend_mirror(
+    gdt_conn: sqlite3.Connection,
+    cie_conn: sqlite3.Connection,
+    source: str,
+    hours: int = 24,
+    retention_hours: int = MIRROR_RETENTION_HOURS,
+) -> int | None:
+    """GDT 변경분을 CIE 미러에 반영하고 watermark를 전진시킨다.
+
+    Returns:
+        반영한 트렌드 수. GDT DB에 trend_outbox가 없으면 None (호출 측이 전체 쿼리로 폴백).
+    """
+    head = _outbox_head(gdt_conn)
+    if head is None:
+        return None
+
+    ensure_sync_schema(cie_conn)
+    watermark = get_sync_watermark(cie_conn, source)
+    gdt_cursor = gdt_conn.cursor()
+    gdt_cursor.row_factory = sqlite3.Row
+    try:
+        if watermark is None or watermark > head:
+            # 최초 동기화 또는 GDT DB 재생성 → 윈도우 전체 재적재
+            rows = gdt_cursor.execute(
+                _RICH_TREND_SELECT.format(where="t.scored_at >= datetime('now', ? || ' hours')"),
+                (f"-{hours}",),
+            ).fetchall()
+            cie_conn.execute("DELETE FROM gdt_trend_mirror")
+            _upsert_mirror(cie_conn, rows)
+            changed = len(rows)
+        else:
+            trend_ids = [
+                row[0]
+                for row in gdt_conn.execute(
+                    "SELECT DISTINCT trend_id FROM trend_outbox WHERE seq > ? AND seq <= ?",
+                    (watermark, head),
+                )
+            ]
+            rows = []
+            for chunk in batched(trend_ids, _OUTBOX_ID_CHUNK):
+                where = f"t.id IN ({', '.join('?' for _ in chunk)})"
+                rows.extend(gdt_cursor.execute(_RICH_TREND_SELECT.format(where=where), chunk).fetchall())
+            _upsert_mirror(cie_conn, rows)
+            # outbox에는 있지만 GDT에서 삭제된 트렌드 (cleanup_old_records 등)
+            deleted = set(trend_ids) - {row["trend_id"] for row in rows}
+            cie_conn.executemany("DELETE FROM gdt_trend_mirror WHERE trend_id = ?", [(i,) for i in deleted])
+            changed = len(trend_ids)
+
+        cie_conn.execute(
+            "DELETE FROM gdt_trend_mirror WHERE scored_at < datetime('now', ? || ' hours')",
+            (f"-{retention_hours}",),
+        )
+        _set_sync_watermark(cie_conn, source, head)
+        cie_conn.commit()
+    except Exception:
+        cie_conn.rollback()
+        raise
+    return changed
+
+
+def load_mirrored_trends(
+    cie_conn: sqlite3.Connection,
+    hours: int = 24,
+    limit: int = 15,
+) -> list[RichTrend]:
+    """CIE 미러에서 load_rich_trends와 같은 기준(윈도우 + viral 순)으로 조회한다."""
+    cursor = cie_conn.cursor()
+    cursor.row_factory = sqlite3.Row
+    rows = cursor.execute(
+        """SELECT * FROM gdt_trend_mirror
+           WHERE scored_at >= datetime('now', ? || ' hours')
+           ORDER BY viral_potential DESC
+           LIMIT ?""",
+        (f"-{hours}", limit),
+    ).fetchall()
+    return [_row_to_rich_trend(row) for row in rows]
+
+
+def load_rich_trends_incremental(
+    gdt_conn: sqlite3.Connection,
+    cie_conn: sqlite3.Connection,
+    source: str,
+    hours: int = 24,
+    limit: int = 15,
+) -> list[RichTrend]:
+    """change feed로 미러를 갱신한 뒤 미러에서 로드한다. 불가하면 전체 쿼리로 폴백."""
+    try:
+        changed = sync_trend_mirror(gdt_conn, cie_conn, source, hours=hours)
+    except sqlite3.Error as e:
+        log.warning(f"GDT 증분 동기화 실패 (전체 쿼리 폴백): {e}")
+        changed = None
+
+    if changed is None:
+        return load_rich_trends(gdt_conn, hours, limit)
+    log.debug(f"  GDT change feed: {changed} trends synced")
+    return load_mirrored_trends(cie_conn, hours, limit)
+
+
 # ── 역피드백 쓰기 ──────────────────────────────────────
 
 
@@ -296,61 +492,135 @@ def write_content_feedback(
             conn.close()
 
 
+_FEEDBACK_INSERT_SQL = """INSERT INTO content_feedback
+   (keyword, category, qa_score, regenerated, reason, created_at)
+   VALUES (?, ?, ?, ?, ?, datetime('now'))"""
+
+FEEDBACK_CHUNK_SIZE = 1000
+
+
+def _feedback_row(item: dict) -> tuple[str, str, float, int, str]:
+    return (
+        item.get("keyword", ""),
+        item.get("category", ""),
+        float(item.get("qa_score", 0.0)),
+        int(item.get("regenerated", False)),
+        item.get("reason", ""),
+    )
+
+
+class ContentFeedbackWriter:
+    """content_feedback 대량 쓰기용 단일 커넥션 writer.
+
+    WAL 모드 커넥션 하나를 열고, 입력을 ``chunk_size``씩 잘라 ``executemany``로
+    넣되 전체를 하나의 명시적 트랜잭션으로 묶는다 → 수천 건도 커밋(fsync) 1회.
+    입력은 리스트뿐 아니라 제너레이터도 받아 청크 단위로 소비한다.
+    중간에 DB 오류가 나면 전체 롤백 (부분 주입 없음).
+
+    Usage:
+        with ContentFeedbackWriter(db_path) as writer:
+            writer.write(items)
+    """
+
+    def __init__(self, db_path: str | Path, chunk_size: int = FEEDBACK_CHUNK_SIZE, busy_timeout_ms: int = 5000):
+        self.db_path = Path(db_path)
+        self.chunk_size = max(1, chunk_size)
+        self.busy_timeout_ms = busy_timeout_ms
+        self._conn: sqlite3.Connection | None = None
+
+    def __enter__(self) -> ContentFeedbackWriter:
+        # isolation_level=None: 트랜잭션 경계를 BEGIN/COMMIT으로 직접 관리
+        conn = sqlite3.connect(str(self.db_path), isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+        self._conn = conn
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _chunks(self, items: Iterable[dict]) -> Iterator[list[tuple]]:
+        chunk: list[tuple] = []
+        for item in items:
+            try:
+                chunk.append(_feedback_row(item))
+            except (TypeError, ValueError, AttributeError) as e:
+                log.warning(f"  ⚠️ content_feedback 행 변환 실패 (건너뜀): {e}")
+                continue
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def write(self, items: Iterable[dict]) -> int:
+        """items 전체를 한 트랜잭션으로 쓴다. 반환값은 커밋된 행 수 (실패 시 0)."""
+        if self._conn is None:
+            raise RuntimeError("ContentFeedbackWriter must be used as a context manager")
+
+        conn = self._conn
+        written = 0
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for chunk in self._chunks(items):
+                conn.executemany(_FEEDBACK_INSERT_SQL, chunk)
+                written += len(chunk)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return written
+
+
 def write_content_feedback_batch(
     config: CIEConfig,
-    items: list[dict],
+    items: Iterable[dict],
+    chunk_size: int = FEEDBACK_CHUNK_SIZE,
 ) -> int:
-    """콘텐츠 피드백을 배치로 역주입한다.
+    """콘텐츠 피드백을 배치로 역주입한다 (단일 트랜잭션, 커밋 1회).
 
     Args:
         items: [{"keyword", "category", "qa_score", "regenerated", "reason"}, ...]
+            리스트 또는 제너레이터 (chunk_size 단위로 스트리밍 소비).
 
     Returns:
-        Number of rows written.
+        Number of rows written (0 on error — 부분 주입 없이 전체 롤백).
     """
-    if not items:
+    if isinstance(items, Sized) and not len(items):
         return 0
 
     db_path = _find_gdt_db(config)
     if db_path is None:
         return 0
 
-    written = 0
-    conn = None
     try:
-        conn = sqlite3.connect(str(db_path))
-        for item in items:
-            try:
-                conn.execute(
-                    """INSERT INTO content_feedback
-                       (keyword, category, qa_score, regenerated, reason, created_at)
-                       VALUES (?, ?, ?, ?, ?, datetime('now'))""",
-                    (
-                        item.get("keyword", ""),
-                        item.get("category", ""),
-                        float(item.get("qa_score", 0.0)),
-                        int(item.get("regenerated", False)),
-                        item.get("reason", ""),
-                    ),
-                )
-                written += 1
-            except Exception as e:
-                log.warning(f"  ⚠️ content_feedback 행 쓰기 실패: {e}")
-        conn.commit()
-        if written:
-            log.info(f"  ↩️ GDT 역피드백 배치: {written}건 주입 완료")
+        with ContentFeedbackWriter(db_path, chunk_size=chunk_size) as writer:
+            written = writer.write(items)
     except Exception as e:
         log.warning(f"  ⚠️ GDT content_feedback 배치 실패: {e}")
-    finally:
-        if conn is not None:
-            conn.close()
+        return 0
 
+    if written:
+        log.info(f"  ↩️ GDT 역피드백 배치: {written}건 주입 완료")
     return written
 
 
 # ── 통합 로드 함수 ──────────────────────────────────────
 
 
+def _load_trends_via_change_feed(config: CIEConfig, gdt_conn: sqlite3.Connection, db_path: Path) -> list[RichTrend]:
+    from storage.local_db import get_connection
+
+    cie_conn = get_connection(config)
+    try:
+        return load_rich_trends_incremental(gdt_conn, cie_conn, source=str(db_path.resolve()))
+    finally:
+        cie_conn.close()
+
+
 def load_all(config: CIEConfig) -> GdtBridgeResult | None:
     """GetDayTrends DB에서 모든 데이터를 통합 로드한다.
 
@@ -366,7 +636,10 @@ def load_all(config: CIEConfig) -> GdtBridgeResult | None:
         conn = sqlite3.connect(str(db_path))
         conn.row_factory = sqlite3.Row
 
-        trends = load_rich_trends(conn)
+        if config.gdt_sync_mode == "changefeed":
+            trends = _load_trends_via_change_feed(config, conn, db_path)
+        else:
+            trends = load_rich_trends(conn)
         posting_slots = load_posting_stats(conn)
         top_kw = load_top_performing_keywords(conn)
         watchlist = load_watchlist_alerts(conn)
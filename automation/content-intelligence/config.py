@@ -87,6 +87,8 @@ class CIEConfig:
 
     # ?? v2.0: GetDayTrends DB ?곕룞 ??
     gdt_db_path: str = os.getenv("CIE_GDT_DB_PATH", "")
+    # "changefeed": trend_outbox + watermark incremental sync, "full": re-query the whole window every cycle
+    gdt_sync_mode: str = os.getenv("CIE_GDT_SYNC_MODE", "full")
 
     # ?? v2.0: ?낆옄 ?섎Ⅴ?뚮굹 ??
     personas_file: str = os.getenv("CIE_PERSONAS_FILE", str(_CIE_DIR / "personas.json"))
@@ -0,0 +1,137 @@
+"""content_feedback 배치 쓰기 벤치마크.
+
+기존 경로(행마다 execute, 기본 저널 모드)와 ContentFeedbackWriter
+(WAL + executemany + 단일 트랜잭션)를 합성 배치로 비교해 rows/sec를 출력한다.
+
+Usage:
+    python scripts/benchmark_feedback_writer.py
+    python scripts/benchmark_feedback_writer.py --rows 10000 --repeat 3 --chunk-size 1000
+    python scripts/benchmark_feedback_writer.py --db-dir ./data   # 실제 디스크에서 측정
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# ── PYTHONPATH ──
+_CIE_DIR = Path(__file__).resolve().parents[1]
+if str(_CIE_DIR) not in sys.path:
+    sys.path.insert(0, str(_CIE_DIR))
+
+from collectors.gdt_bridge import ContentFeedbackWriter  # noqa: E402
+
+_SCHEMA = """\
+CREATE TABLE content_feedback (
+    id                INTEGER PRIMARY KEY AUTOINCREMENT,
+    keyword           TEXT NOT NULL,
+    category          TEXT DEFAULT '',
+    qa_score          REAL DEFAULT 0.0,
+    regenerated       INTEGER DEFAULT 0,
+    reason            TEXT DEFAULT '',
+    content_age_hours REAL DEFAULT 0.0,
+    freshness_grade   TEXT DEFAULT 'unknown',
+    created_at        TEXT NOT NULL
+);
+"""
+
+
+def _synthetic_items(rows: int, seed: int = 42) -> list[dict]:
+    rng = random.Random(seed)
+    platforms = ["x", "threads", "naver_blog"]
+    return [
+        {
+            "keyword": f"키워드-{i % 500}",
+            "category": rng.choice(platforms),
+            "qa_score": round(rng.uniform(40, 100), 1),
+            "regenerated": rng.random() < 0.2,
+            "reason": "hook 미달" if rng.random() < 0.1 else "",
+        }
+        for i in range(rows)
+    ]
+
+
+def _fresh_db(directory: Path, name: str) -> Path:
+    db_path = directory / f"{name}.db"
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(_SCHEMA)
+    conn.close()
+    return db_path
+
+
+def _legacy_write(db_path: Path, items: list[dict]) -> int:
+    """이전 write_content_feedback_batch 구현 (행 단위 execute)."""
+    written = 0
+    conn = sqlite3.connect(str(db_path))
+    try:
+        for item in items:
+            conn.execute(
+                """INSERT INTO content_feedback
+                   (keyword, category, qa_score, regenerated, reason, created_at)
+                   VALUES (?, ?, ?, ?, ?, datetime('now'))""",
+                (
+                    item.get("keyword", ""),
+                    item.get("category", ""),
+                    float(item.get("qa_score", 0.0)),
+                    int(item.get("regenerated", False)),
+                    item.get("reason", ""),
+                ),
+            )
+            written += 1
+        conn.commit()
+    finally:
+        conn.close()
+    return written
+
+
+def _bulk_write(db_path: Path, items: list[dict], chunk_size: int) -> int:
+    with ContentFeedbackWriter(db_path, chunk_size=chunk_size) as writer:
+        return writer.write(iter(items))
+
+
+def _measure(label: str, fn, tmp_dir: Path, repeat: int, rows: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        db_path = _fresh_db(tmp_dir, label)
+        start = time.perf_counter()
+        written = fn(db_path)
+        elapsed = time.perf_counter() - start
+        assert written == rows, f"{label}: expected {rows} rows, wrote {written}"
+        best = min(best, elapsed)
+    rate = rows / best if best else float("inf")
+    print(f"  {label:<10} {best * 1000:9.1f} ms  {rate:12,.0f} rows/s")
+    return rate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="content_feedback 배치 쓰기 벤치마크")
+    parser.add_argument("--rows", type=int, default=10_000, help="합성 배치 행 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최고 기록 사용)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="executemany 청크 크기")
+    parser.add_argument(
+        "--db-dir", default=None, help="벤치마크 DB 위치 (기본: 임시 디렉터리, fsync 비용은 디스크에 따라 다름)"
+    )
+    args = parser.parse_args()
+
+    items = _synthetic_items(args.rows)
+    print(f"content_feedback 쓰기 벤치마크: {args.rows:,} rows, best of {args.repeat}")
+
+    with tempfile.TemporaryDirectory(dir=args.db_dir) as tmp:
+        tmp_dir = Path(tmp)
+        legacy_rate = _measure("legacy", lambda db: _legacy_write(db, items), tmp_dir, args.repeat, args.rows)
+        bulk_rate = _measure(
+            "bulk", lambda db: _bulk_write(db, items, args.chunk_size), tmp_dir, args.repeat, args.rows
+        )
+
+    print(f"  speedup    {bulk_rate / legacy_rate:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
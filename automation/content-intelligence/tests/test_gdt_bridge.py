@@ -79,3 +79,208 @@ class TestFindGdtDb:
         config.project_root = Path.cwd() / "nonexistent-root"
         result = _find_gdt_db(config)
         assert result is None
+
+
+class TestContentFeedbackWriter:
+    @staticmethod
+    def _make_db(tmp_path: Path) -> Path:
+        import sqlite3
+
+        db_path = tmp_path / "gdt_feedback.db"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute(
+            """CREATE TABLE content_feedback (
+               id INTEGER PRIMARY KEY AUTOINCREMENT,
+               keyword TEXT NOT NULL,
+               category TEXT DEFAULT '',
+               qa_score REAL DEFAULT 0.0,
+               regenerated INTEGER DEFAULT 0,
+               reason TEXT DEFAULT '',
+               created_at TEXT NOT NULL
+            )"""
+        )
+        conn.commit()
+        conn.close()
+        return db_path
+
+    def test_streams_generator_in_chunks_with_single_commit(self, tmp_path):
+        import sqlite3
+
+        from collectors.gdt_bridge import ContentFeedbackWriter
+
+        db_path = self._make_db(tmp_path)
+        items = ({"keyword": f"kw-{i}", "qa_score": i % 100, "regenerated": i % 2} for i in range(2500))
+
+        with ContentFeedbackWriter(db_path, chunk_size=1000) as writer:
+            assert writer.write(items) == 2500
+            assert writer._conn.total_changes == 2500
+
+        conn = sqlite3.connect(str(db_path))
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("SELECT COUNT(*), SUM(regenerated) FROM content_feedback").fetchone() == (2500, 1250)
+        finally:
+            conn.close()
+
+    def test_skips_unconvertible_rows(self, tmp_path):
+        import sqlite3
+
+        from collectors.gdt_bridge import ContentFeedbackWriter
+
+        db_path = self._make_db(tmp_path)
+        items = [{"keyword": "ok", "qa_score": 80}, {"keyword": "bad", "qa_score": "n/a"}]
+
+        with ContentFeedbackWriter(db_path) as writer:
+            assert writer.write(items) == 1
+
+        conn = sqlite3.connect(str(db_path))
+        try:
+            assert conn.execute("SELECT keyword FROM content_feedback").fetchall() == [("ok",)]
+        finally:
+            conn.close()
+
+    def test_batch_rolls_back_whole_transaction_on_db_error(self, tmp_path):
+        import sqlite3
+
+        from collectors.gdt_bridge import write_content_feedback_batch
+
+        db_path = self._make_db(tmp_path)
+        config = CIEConfig(gdt_db_path=str(db_path))
+        # keyword NOT NULL 위반 → 이미 들어간 청크까지 전부 롤백
+        items = [{"keyword": f"kw-{i}"} for i in range(5)] + [{"keyword": None}]
+
+        assert write_content_feedback_batch(config, items, chunk_size=2) == 0
+
+        conn = sqlite3.connect(str(db_path))
+        try:
+            assert conn.execute("SELECT COUNT(*) FROM content_feedback").fetchone()[0] == 0
+        finally:
+            conn.close()
+
+
+class TestTrendChangeFeed:
+    """GDT DB / CIE DB 두 개의 임시 SQLite 파일로 증분 동기화 검증."""
+
+    @staticmethod
+    def _gdt_db(tmp_path: Path, with_outbox: bool = True):
+        import sqlite3
+
+        conn = sqlite3.connect(str(tmp_path / "gdt.db"))
+        conn.row_factory = sqlite3.Row
+        conn.executescript(
+            """
+            CREATE TABLE trends (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, keyword TEXT NOT NULL, rank INTEGER,
+                viral_potential INTEGER DEFAULT 0, trend_acceleration TEXT DEFAULT '+0%',
+                top_insight TEXT DEFAULT '', suggested_angles TEXT DEFAULT '[]',
+                best_hook_starter TEXT DEFAULT '', sentiment TEXT DEFAULT 'neutral',
+                cross_source_confidence INTEGER DEFAULT 0, scored_at TEXT NOT NULL
+            );
+            CREATE TABLE tweets (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, trend_id INTEGER NOT NULL,
+                status TEXT DEFAULT '대기중', impressions INTEGER DEFAULT 0, engagement_rate REAL DEFAULT 0.0
+            );
+            """
+        )
+        if with_outbox:
+            conn.execute(
+                "CREATE TABLE trend_outbox (seq INTEGER PRIMARY KEY AUTOINCREMENT, trend_id INTEGER NOT NULL, "
+                "created_at TEXT NOT NULL)"
+            )
+        return conn
+
+    @staticmethod
+    def _add_trend(conn, keyword: str, viral: int) -> int:
+        trend_id = conn.execute(
+            "INSERT INTO trends (keyword, rank, viral_potential, scored_at) VALUES (?, 1, ?, datetime('now'))",
+            (keyword, viral),
+        ).lastrowid
+        TestTrendChangeFeed._touch(conn, trend_id)
+        return trend_id
+
+    @staticmethod
+    def _touch(conn, trend_id: int) -> None:
+        # GDT v12 트리거가 하는 일을 흉내 낸다
+        conn.execute("INSERT INTO trend_outbox (trend_id, created_at) VALUES (?, datetime('now'))", (trend_id,))
+        conn.commit()
+
+    @staticmethod
+    def _cie_db(tmp_path: Path):
+        import sqlite3
+
+        return sqlite3.connect(str(tmp_path / "cie.db"))
+
+    def test_first_sync_seeds_then_reads_only_new_rows(self, tmp_path):
+        from collectors.gdt_bridge import get_sync_watermark, load_rich_trends, load_rich_trends_incremental
+
+        gdt, cie = self._gdt_db(tmp_path), self._cie_db(tmp_path)
+        self._add_trend(gdt, "AI", 80)
+        self._add_trend(gdt, "LLM", 60)
+
+        first = load_rich_trends_incremental(gdt, cie, source="gdt")
+        assert [t.keyword for t in first] == [t.keyword for t in load_rich_trends(gdt)] == ["AI", "LLM"]
+        assert get_sync_watermark(cie, "gdt") == 2
+
+        ai_id = 1
+        gdt.execute(
+            "INSERT INTO tweets (trend_id, status, impressions, engagement_rate) VALUES (?, '게시', 500, 0.2)", (ai_id,)
+        )
+        self._touch(gdt, ai_id)
+        self._add_trend(gdt, "Robotics", 90)
+
+        second = load_rich_trends_incremental(gdt, cie, source="gdt")
+        assert [t.keyword for t in second] == ["Robotics", "AI", "LLM"]
+        assert second[1].total_impressions == 500
+        assert get_sync_watermark(cie, "gdt") == 4
+        gdt.close()
+        cie.close()
+
+    def test_incremental_sync_touches_only_changed_trends(self, tmp_path):
+        from collectors.gdt_bridge import sync_trend_mirror
+
+        gdt, cie = self._gdt_db(tmp_path), self._cie_db(tmp_path)
+        for i in range(5):
+            self._add_trend(gdt, f"kw-{i}", i)
+
+        assert sync_trend_mirror(gdt, cie, source="gdt") == 5
+        assert sync_trend_mirror(gdt, cie, source="gdt") == 0
+
+        gdt.execute("UPDATE trends SET viral_potential = 99 WHERE id = 3")
+        self._touch(gdt, 3)
+        gdt.execute("DELETE FROM trends WHERE id = 4")
+        self._touch(gdt, 4)
+
+        assert sync_trend_mirror(gdt, cie, source="gdt") == 2
+        mirror = dict(cie.execute("SELECT trend_id, viral_potential FROM gdt_trend_mirror").fetchall())
+        assert mirror == {1: 0, 2: 1, 3: 99, 5: 4}
+        gdt.close()
+        cie.close()
+
+    def test_falls_back_to_full_query_without_outbox(self, tmp_path):
+        from collectors.gdt_bridge import load_rich_trends_incremental, sync_trend_mirror
+
+        gdt, cie = self._gdt_db(tmp_path, with_outbox=False), self._cie_db(tmp_path)
+        gdt.execute(
+            "INSERT INTO trends (keyword, rank, viral_potential, scored_at) VALUES ('AI', 1, 70, datetime('now'))"
+        )
+        gdt.commit()
+
+        assert sync_trend_mirror(gdt, cie, source="gdt") is None
+        assert [t.keyword for t in load_rich_trends_incremental(gdt, cie, source="gdt")] == ["AI"]
+        gdt.close()
+        cie.close()
+
+    def test_reseeds_when_watermark_is_ahead_of_outbox(self, tmp_path):
+        """GDT DB가 재생성되어 seq가 되감기면 전체 재적재."""
+        from collectors.gdt_bridge import _set_sync_watermark, ensure_sync_schema, sync_trend_mirror
+
+        gdt, cie = self._gdt_db(tmp_path), self._cie_db(tmp_path)
+        self._add_trend(gdt, "AI", 80)
+        ensure_sync_schema(cie)
+        _set_sync_watermark(cie, "gdt", 1000)
+        cie.commit()
+
+        assert sync_trend_mirror(gdt, cie, source="gdt") == 1
+        assert cie.execute("SELECT last_seq FROM gdt_sync_state WHERE source = 'gdt'").fetchone()[0] == 1
+        gdt.close()
+        cie.close()
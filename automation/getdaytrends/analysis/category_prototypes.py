@@ -0,0 +1,165 @@
+"""임베딩 기반 카테고리 사전분류용 프로토타입 벡터.
+
+카테고리 참조 문장(CATEGORY_REFS)의 임베딩은 모델/차원/참조 문장이 같으면
+항상 동일하므로, 버전 키별로 1회만 계산해 data/category_prototypes.json에 저장한다.
+벡터는 L2 정규화된 상태로 보관 → 분류는 트렌드 배치 × 프로토타입 행렬곱 한 번.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from loguru import logger as log
+
+CATEGORY_REFS: dict[str, str] = {
+    "정치": "국회 대통령 정당 선거 법안 정책",
+    "경제": "주가 환율 금리 GDP 실적 무역",
+    "테크": "AI 반도체 스마트폰 앱 서비스 소프트웨어",
+    "사회": "교육 범죄 사고 환경 복지 인구",
+    "스포츠": "축구 야구 농구 올림픽 경기 감독",
+    "연예": "드라마 영화 아이돌 가수 배우 컴백",
+    "국제": "외교 전쟁 유엔 미국 중국 정상회담",
+}
+PROTOTYPE_TASK_TYPE = "SEMANTIC_SIMILARITY"
+MIN_CONFIDENCE = 0.50
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parents[1] / "data" / "category_prototypes.json"
+
+# 프로세스 내 메모 (버전 키 → 프로토타입)
+_MEMO: dict[str, "CategoryPrototypes"] = {}
+
+
+def prototype_version(
+    refs: dict[str, str] | None = None,
+    *,
+    model: str | None = None,
+    dimensions: int | None = None,
+) -> str:
+    """모델 + 차원 + task_type + 참조 문장으로 만든 버전 키. 하나라도 바뀌면 재계산."""
+    if model is None or dimensions is None:
+        from shared.embeddings.core import DEFAULT_DIMENSIONS, EMBEDDING_MODEL
+
+        model = model or EMBEDDING_MODEL
+        dimensions = dimensions or DEFAULT_DIMENSIONS
+    payload = json.dumps(
+        {"model": model, "dimensions": dimensions, "task": PROTOTYPE_TASK_TYPE, "refs": refs or CATEGORY_REFS},
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class CategoryPrototypes:
+    version: str
+    categories: tuple[str, ...]
+    matrix: np.ndarray  # C×D, 행 = 카테고리, L2 정규화됨 (읽기 전용)
+
+    def __post_init__(self) -> None:
+        self.matrix.setflags(write=False)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CategoryPrototypes):
+            return NotImplemented
+        return (
+            self.version == other.version
+            and self.categories == other.categories
+            and np.array_equal(self.matrix, other.matrix)
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.version, self.categories))
+
+    @classmethod
+    def from_vectors(cls, version: str, categories: list[str], vectors: list[list[float]]) -> "CategoryPrototypes":
+        if len(categories) != len(vectors):
+            raise ValueError(f"{len(categories)} categories but {len(vectors)} prototype vectors")
+        matrix = np.asarray(vectors, dtype=np.float64)
+        norms = np.linalg.norm(matrix, axis=1)
+        zero = np.flatnonzero(norms == 0)
+        if zero.size:
+            raise ValueError(f"zero-norm prototype vector for category {categories[zero[0]]}")
+        return cls(version=version, categories=tuple(categories), matrix=matrix / norms[:, None])
+
+    def classify(self, vectors: list[list[float]]) -> list[tuple[str, float]]:
+        """트렌드 벡터 배치 → (최고 카테고리, 코사인 유사도). 0벡터·차원 불일치는 ("", 0.0).
+
+        배치를 N×D로 쌓아 행 정규화 후 ``X @ matrix.T`` 한 번으로 전부 채점한다.
+        """
+        if not vectors:
+            return []
+        dim = self.matrix.shape[1]
+        valid = np.array([v is not None and len(v) == dim for v in vectors], dtype=bool)
+        batch = np.zeros((len(vectors), dim), dtype=np.float64)
+        if valid.any():
+            batch[valid] = np.asarray([vectors[i] for i in np.flatnonzero(valid)], dtype=np.float64)
+        norms = np.linalg.norm(batch, axis=1)
+        valid &= norms > 0
+        batch[valid] /= norms[valid, None]
+
+        scores = batch @ self.matrix.T  # N×C
+        best = scores.argmax(axis=1)
+        best_scores = scores[np.arange(len(vectors)), best]
+        return [
+            (self.categories[b], float(score)) if ok else ("", 0.0)
+            for b, score, ok in zip(best, best_scores, valid, strict=True)
+        ]
+
+    def to_json(self) -> dict:
+        return {"version": self.version, "categories": list(self.categories), "matrix": self.matrix.tolist()}
+
+
+def _load(path: Path, version: str) -> CategoryPrototypes | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != version:
+        return None
+    try:
+        categories = tuple(data["categories"])
+        matrix = np.asarray(data["matrix"], dtype=np.float64)
+    except (KeyError, TypeError, ValueError):
+        return None
+    if matrix.ndim != 2 or matrix.shape[0] != len(categories):
+        return None
+    return CategoryPrototypes(version=version, categories=categories, matrix=matrix)
+
+
+def _save(path: Path, prototypes: CategoryPrototypes) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(prototypes.to_json(), ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as e:
+        log.debug(f"[카테고리 프로토타입] 저장 실패 (메모리 캐시만 사용): {e}")
+
+
+async def get_category_prototypes(cache_path: Path | None = None) -> CategoryPrototypes | None:
+    """현재 모델 버전의 프로토타입. 메모 → 파일 → 임베딩 API 순으로 조회.
+
+    임베딩을 쓸 수 없으면 None (호출 측에서 사전분류를 건너뜀).
+    """
+    path = cache_path or DEFAULT_CACHE_PATH
+    version = prototype_version()
+    if version in _MEMO:
+        return _MEMO[version]
+
+    prototypes = _load(path, version)
+    if prototypes is None:
+        from shared.embeddings import embed_texts_async
+
+        categories = list(CATEGORY_REFS)
+        vectors = await embed_texts_async(list(CATEGORY_REFS.values()), task_type=PROTOTYPE_TASK_TYPE)
+        if not vectors or len(vectors) != len(categories):
+            return None
+        prototypes = CategoryPrototypes.from_vectors(version, categories, vectors)
+        _save(path, prototypes)
+        log.info(f"[카테고리 프로토타입] {len(categories)}개 계산 후 저장 (version={version})")
+
+    _MEMO[version] = prototypes
+    return prototypes
@@ -16,6 +16,8 @@ from shared.llm.models import LLMPolicy
 
 # -- 추출된 모듈 re-export (후방 호환) --
 try:
+    from .analysis.category_prototypes import MIN_CONFIDENCE as _CATEGORY_MIN_CONFIDENCE
+    from .analysis.category_prototypes import PROTOTYPE_TASK_TYPE, get_category_prototypes
     from .analysis.parsing import (
         INSTRUCTOR_AVAILABLE,
         _default_scored_trend,
@@ -25,7 +27,7 @@ try:
         _score_batch_instructor,
     )
     from .config import AppConfig
-    from .db import compute_fingerprint, get_cached_score
+    from .db import compute_fingerprint, get_cached_score, get_cached_score_batch
     from .models import MultiSourceContext, RawTrend, ScoredTrend, TrendSource
     from .trend_clustering import _jaccard_similarity, cluster_trends, cluster_trends_local
     from .trend_genealogy import (
@@ -35,6 +37,8 @@ try:
     )
     from .utils import run_async, sanitize_keyword
 except ImportError:
+    from analysis.category_prototypes import MIN_CONFIDENCE as _CATEGORY_MIN_CONFIDENCE
+    from analysis.category_prototypes import PROTOTYPE_TASK_TYPE, get_category_prototypes
     from analysis.parsing import (  # noqa: F401
         INSTRUCTOR_AVAILABLE,
         _default_scored_trend,
@@ -44,7 +48,7 @@ except ImportError:
         _score_batch_instructor,
     )
     from config import AppConfig
-    from db import compute_fingerprint, get_cached_score
+    from db import compute_fingerprint, get_cached_score, get_cached_score_batch
     from models import MultiSourceContext, RawTrend, ScoredTrend, TrendSource
     from trend_clustering import _jaccard_similarity, cluster_trends, cluster_trends_local  # noqa: F401
     from trend_genealogy import (  # noqa: F401
@@ -143,11 +147,13 @@ def _topic_boost(keyword: str) -> int:
         if not _PACKAGES_PATH_INJECTED:
             import pathlib
             import sys
+
             _pkg_path = str(pathlib.Path(__file__).resolve().parents[3] / "packages")
             if _pkg_path not in sys.path:
                 sys.path.insert(0, _pkg_path)
             _PACKAGES_PATH_INJECTED = True
         from shared.intelligence import get_score_boost
+
         return get_score_boost(keyword)
     except ImportError:
         log.warning("shared.intelligence 모듈 없음 — topic boost 비활성 (packages/ 경로 확인 필요)")
@@ -156,6 +162,7 @@ def _topic_boost(keyword: str) -> int:
         log.warning(f"topic boost 실패 ({keyword}): {e}")
         return 0
 
+
 # ══════════════════════════════════════════════════════
 #  Scoring Prompt
 # ══════════════════════════════════════════════════════
@@ -417,20 +424,26 @@ async def _batch_score_async(
     conn,
     config: "AppConfig | None" = None,
     bucket: int = 5000,
+    cached_scores: dict[str, dict] | None = None,
 ) -> list["ScoredTrend"]:
     """
     트렌드 배치(최대 _BATCH_SIZE개)를 1회 LLM 호출로 스코어링.
     캐시 히트 항목은 LLM 호출에서 제외해 비용 절약.
     실패 시 각 항목을 개별 스코어링으로 폴백.
+
+    cached_scores: 호출 측에서 실행 전체를 1회 배치 조회한 {fingerprint: 캐시 스코어}.
+    None이면 이 배치만 직접 배치 조회한다.
     """
     # ── 캐시 분리 ──
     need_llm: list[tuple[RawTrend, MultiSourceContext]] = []
     cached_results: dict[str, ScoredTrend] = {}
 
     if conn is not None:
-        for trend, ctx in batch:
-            fp = compute_fingerprint(trend.name, trend.volume_numeric, bucket)
-            cached = await get_cached_score(conn, fp, max_age_hours=18)
+        fingerprints = [compute_fingerprint(trend.name, trend.volume_numeric, bucket) for trend, _ in batch]
+        if cached_scores is None:
+            cached_scores = await get_cached_score_batch(conn, fingerprints, max_age_hours=18)
+        for (trend, ctx), fp in zip(batch, fingerprints, strict=True):
+            cached = cached_scores.get(fp)
             if cached:
                 import json as _json
 
@@ -611,7 +624,9 @@ async def _analyze_trends_async(
         threshold = getattr(config, "jaccard_cluster_threshold", 0.35)
         use_emb = getattr(config, "enable_embedding_clustering", True)
         emb_threshold = getattr(config, "embedding_cluster_threshold", 0.75)
-        raw_trends, contexts, clusters = cluster_trends_local(
+        # 임베딩 API 호출(동기)이 포함되므로 이벤트 루프 밖에서 실행
+        raw_trends, contexts, clusters = await asyncio.to_thread(
+            cluster_trends_local,
             raw_trends,
             contexts,
             threshold,
@@ -646,40 +661,25 @@ async def _analyze_trends_async(
         log.info(f"[클러스터 힌트] {len(cluster_map)}개 대표 트렌드에 관련 키워드 정보 주입")
 
     # [v14.1] 임베딩 기반 카테고리 사전 분류 힌트
+    # 카테고리 프로토타입은 모델 버전별로 1회 계산/저장 → 실행마다 트렌드 임베딩 1회 + 행렬곱 1회
     try:
-        from shared.embeddings import cosine_similarity as _cos_sim
-        from shared.embeddings import embed_texts
-
-        _CATEGORY_REFS = {
-            "정치": "국회 대통령 정당 선거 법안 정책",
-            "경제": "주가 환율 금리 GDP 실적 무역",
-            "테크": "AI 반도체 스마트폰 앱 서비스 소프트웨어",
-            "사회": "교육 범죄 사고 환경 복지 인구",
-            "스포츠": "축구 야구 농구 올림픽 경기 감독",
-            "연예": "드라마 영화 아이돌 가수 배우 컴백",
-            "국제": "외교 전쟁 유엔 미국 중국 정상회담",
-        }
-        ref_texts = list(_CATEGORY_REFS.values())
-        ref_keys = list(_CATEGORY_REFS.keys())
-        ref_vectors = embed_texts(ref_texts, task_type="SEMANTIC_SIMILARITY")
-
-        if ref_vectors:
-            trend_names = [t.name for t in raw_trends]
-            trend_vectors = embed_texts(trend_names, task_type="SEMANTIC_SIMILARITY")
-            if trend_vectors:
-                for i, t in enumerate(raw_trends):
-                    scores = {cat: _cos_sim(trend_vectors[i], ref_vectors[j]) for j, cat in enumerate(ref_keys)}
-                    best_cat = max(scores, key=scores.get)
-                    best_score = scores[best_cat]
-                    if best_score >= 0.50:  # 최소 신뢰도
-                        ctx = contexts.get(t.name, MultiSourceContext())
-                        cat_hint = f"\n[카테고리 힌트 (임베딩)]: {best_cat} (신뢰도: {best_score:.2f})"
-                        contexts[t.name] = MultiSourceContext(
-                            twitter_insight=ctx.twitter_insight,
-                            reddit_insight=ctx.reddit_insight,
-                            news_insight=(ctx.news_insight or "") + cat_hint,
-                        )
-                log.info(f"[카테고리 사전분류] {len(raw_trends)}개 트렌드에 임베딩 기반 카테고리 힌트 주입")
+        from shared.embeddings import embed_texts_async
+
+        prototypes = await get_category_prototypes()
+        trend_vectors = None
+        if prototypes is not None:
+            trend_vectors = await embed_texts_async([t.name for t in raw_trends], task_type=PROTOTYPE_TASK_TYPE)
+        if prototypes is not None and trend_vectors:
+            for t, (best_cat, best_score) in zip(raw_trends, prototypes.classify(trend_vectors), strict=False):
+                if best_score >= _CATEGORY_MIN_CONFIDENCE:  # 최소 신뢰도
+                    ctx = contexts.get(t.name, MultiSourceContext())
+                    cat_hint = f"\n[카테고리 힌트 (임베딩)]: {best_cat} (신뢰도: {best_score:.2f})"
+                    contexts[t.name] = MultiSourceContext(
+                        twitter_insight=ctx.twitter_insight,
+                        reddit_insight=ctx.reddit_insight,
+                        news_insight=(ctx.news_insight or "") + cat_hint,
+                    )
+            log.info(f"[카테고리 사전분류] {len(raw_trends)}개 트렌드에 임베딩 기반 카테고리 힌트 주입")
     except (ImportError, RuntimeError, ConnectionError, ValueError) as _e:
         log.debug(f"[카테고리 사전분류] 사용 불가 (무시): {type(_e).__name__}: {_e}")
 
@@ -688,9 +688,21 @@ async def _analyze_trends_async(
     batches = [pairs[i : i + _BATCH_SIZE] for i in range(0, len(pairs), _BATCH_SIZE)]
     bucket = getattr(config, "cache_volume_bucket", 5000)
 
+    # 스코어 캐시는 실행 전체를 1회 배치 조회 (Redis MGET 1회 + SQL IN 1회)
+    cached_scores: dict[str, dict] | None = None
+    if conn is not None:
+        try:
+            cached_scores = await get_cached_score_batch(
+                conn,
+                [compute_fingerprint(t.name, t.volume_numeric, bucket) for t, _ in pairs],
+                max_age_hours=18,
+            )
+        except Exception as _e:  # sqlite/asyncpg/Redis 어느 쪽이든 — 배치별 조회로 대체
+            log.debug(f"스코어 캐시 배치 조회 실패 (배치별 조회로 대체): {type(_e).__name__}: {_e}")
+
     log.info(f"  배치 스코어링 시작: {len(raw_trends)}개 → {len(batches)}배치 (배치크기={_BATCH_SIZE})")
     batch_results = await asyncio.gather(
-        *[_batch_score_async(b, client, conn, config, bucket) for b in batches],
+        *[_batch_score_async(b, client, conn, config, bucket, cached_scores) for b in batches],
         return_exceptions=True,
     )
 
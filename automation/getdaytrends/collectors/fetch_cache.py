@@ -0,0 +1,106 @@
+"""collectors/fetch_cache — 프로세스 간 공유 HTTP 응답 디스크 캐시.
+
+국가별 병렬 잡과 재시작 후에도 같은 페이지를 다시 받지 않도록 응답 본문과
+검증자(ETag / Last-Modified)를 SQLite(WAL)에 저장한다.
+
+- TTL 이내: 네트워크 없이 저장된 본문 사용
+- TTL 경과: 조건부 GET(If-None-Match / If-Modified-Since) → 304면 본문 재사용 + 시각 갱신
+
+SQLite 오류는 캐시 미스로 취급 (수집 자체는 계속 진행).
+"""
+
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from loguru import logger as log
+
+DEFAULT_PATH = Path(__file__).resolve().parents[1] / "data" / "fetch_cache.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS http_cache (
+    url           TEXT PRIMARY KEY,
+    body          TEXT NOT NULL,
+    etag          TEXT NOT NULL DEFAULT '',
+    last_modified TEXT NOT NULL DEFAULT '',
+    fetched_at    REAL NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    url: str
+    body: str
+    etag: str
+    last_modified: str
+    fetched_at: float
+
+    def age(self, now: float | None = None) -> float:
+        return (now if now is not None else time.time()) - self.fetched_at
+
+    def validators(self) -> dict[str, str]:
+        """조건부 GET 요청 헤더."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class FetchCache:
+    """URL → 응답 본문 캐시. 호출마다 연결을 열어 여러 프로세스가 같은 파일을 공유한다."""
+
+    def __init__(self, path: Path | str | None = None):
+        self.path = Path(path or os.getenv("GDT_FETCH_CACHE_PATH") or DEFAULT_PATH)
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=5.0)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._initialized = True
+        return conn
+
+    def get(self, url: str) -> CachedResponse | None:
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT body, etag, last_modified, fetched_at FROM http_cache WHERE url = ?", (url,)
+                ).fetchone()
+            finally:
+                conn.close()
+        except (OSError, sqlite3.Error) as e:
+            log.debug(f"[수집 디스크 캐시] 조회 실패 (무시): {e}")
+            return None
+        if row is None:
+            return None
+        return CachedResponse(url, row[0], row[1], row[2], row[3])
+
+    def store(self, url: str, body: str, *, etag: str = "", last_modified: str = "") -> None:
+        self._write(
+            "INSERT OR REPLACE INTO http_cache (url, body, etag, last_modified, fetched_at) VALUES (?, ?, ?, ?, ?)",
+            (url, body, etag, last_modified, time.time()),
+        )
+
+    def touch(self, url: str) -> None:
+        """304 Not Modified — 본문은 그대로 두고 신선도만 갱신."""
+        self._write("UPDATE http_cache SET fetched_at = ? WHERE url = ?", (time.time(), url))
+
+    def _write(self, sql: str, params: tuple) -> None:
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute(sql, params)
+            finally:
+                conn.close()
+        except (OSError, sqlite3.Error) as e:
+            log.debug(f"[수집 디스크 캐시] 저장 실패 (무시): {e}")
@@ -8,9 +8,11 @@ scraper.py에서 추출한 소스별 트렌드 수집 로직을 모아둔 모듈
 """
 
 import asyncio
+import os
 import re
 import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC
 
 import httpx
@@ -19,7 +21,9 @@ from loguru import logger as log
 try:
     from ..models import RawTrend, TrendSource
     from ..utils import run_async
+    from .fetch_cache import FetchCache
 except ImportError:
+    from collectors.fetch_cache import FetchCache
     from models import RawTrend, TrendSource
     from utils import run_async
 
@@ -44,6 +48,28 @@ _SHORT_TIMEOUT = httpx.Timeout(8.0, connect=4.0)
 _FETCH_CACHE: dict[str, tuple[float, list[RawTrend]]] = {}
 _FETCH_CACHE_TTL = 3600  # 1시간 (초)
 
+# 프로세스 간 공유 디스크 캐시 (ETag/Last-Modified 재검증) — 최초 사용 시 생성
+_DISK_CACHE: FetchCache | None = None
+
+# HTML 파싱은 이벤트 루프 밖 전용 스레드 풀에서 실행 (lxml/selectolax 파싱은 C 레벨)
+_PARSE_WORKERS = max(1, int(os.getenv("GDT_PARSE_WORKERS", "2")))
+_PARSE_POOL: ThreadPoolExecutor | None = None
+
+
+def _disk_cache() -> FetchCache:
+    global _DISK_CACHE
+    if _DISK_CACHE is None:
+        _DISK_CACHE = FetchCache()
+    return _DISK_CACHE
+
+
+async def _run_parser(func, *args):
+    """CPU 바운드 파서를 제한된 스레드 풀에서 실행."""
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        _PARSE_POOL = ThreadPoolExecutor(max_workers=_PARSE_WORKERS, thread_name_prefix="gdt-parse")
+    return await asyncio.get_running_loop().run_in_executor(_PARSE_POOL, func, *args)
+
 
 # [v6.1] RSS pubDate 파싱 헬퍼
 def _parse_rss_date(date_str: str | None) -> "datetime | None":
@@ -101,10 +127,99 @@ def _parse_volume_text(text: str) -> int:
 # ══════════════════════════════════════════════════════
 
 
-async def _async_fetch_getdaytrends(session: httpx.AsyncClient, country_slug: str, limit: int = 50) -> list[RawTrend]:
-    """getdaytrends.com에서 트렌드 수집 (비동기)."""
+def _html_backend() -> str:
+    """사용 가능한 가장 빠른 파서: selectolax → lxml → html.parser."""
+    try:
+        import selectolax.parser  # noqa: F401
+
+        return "selectolax"
+    except ImportError:
+        pass
+    try:
+        import lxml  # noqa: F401
+
+        return "lxml"
+    except ImportError:
+        return "html.parser"
+
+
+_HTML_BACKEND = _html_backend()
+
+
+def _extract_getdaytrends_rows(html: str, backend: str) -> list[tuple[str, str, str]]:
+    """트렌드 표에서 (이름, 볼륨 텍스트, href) 추출."""
+    if backend == "selectolax":
+        from selectolax.parser import HTMLParser
+
+        tree = HTMLParser(html)
+        rows = tree.css("table.trends tbody tr") or tree.css("table tr")
+        extracted = []
+        for row in rows:
+            name_el = row.css_first(".main a") or row.css_first("a")
+            if name_el is None:
+                continue
+            volume_el = row.css_first(".desc")
+            extracted.append(
+                (
+                    name_el.text(strip=True),
+                    volume_el.text(strip=True) if volume_el is not None else "N/A",
+                    name_el.attributes.get("href") or "",
+                )
+            )
+        return extracted
+
     from bs4 import BeautifulSoup
 
+    soup = BeautifulSoup(html, backend)
+    rows = soup.select("table.trends tbody tr") or soup.select("table tr")
+    extracted = []
+    for row in rows:
+        name_el = row.select_one(".main a") or row.select_one("a")
+        if not name_el:
+            continue
+        volume_el = row.select_one(".desc")
+        extracted.append(
+            (
+                name_el.get_text(strip=True),
+                volume_el.get_text(strip=True) if volume_el else "N/A",
+                name_el.get("href", ""),
+            )
+        )
+    return extracted
+
+
+def _parse_getdaytrends_html(html: str, country_slug: str, limit: int, backend: str | None = None) -> list[RawTrend]:
+    """getdaytrends.com HTML → RawTrend 목록 (파싱 스레드 풀에서 실행)."""
+    base_url = "https://getdaytrends.com"
+    trends = []
+    for raw_name, volume_text, href in _extract_getdaytrends_rows(html, backend or _HTML_BACKEND):
+        name = raw_name.lstrip("#").strip()
+        if not name:
+            continue
+
+        link = f"{base_url}{href}" if href and not href.startswith("http") else href
+
+        trends.append(
+            RawTrend(
+                name=name,
+                source=TrendSource.GETDAYTRENDS,
+                volume=volume_text,
+                volume_numeric=_parse_volume_text(volume_text),
+                link=link,
+                country=country_slug or "global",
+            )
+        )
+
+        if len(trends) >= limit:
+            break
+    return trends
+
+
+async def _async_fetch_getdaytrends(session: httpx.AsyncClient, country_slug: str, limit: int = 50) -> list[RawTrend]:
+    """getdaytrends.com에서 트렌드 수집 (비동기).
+
+    캐시 순서: 프로세스 메모리 → 공유 디스크(TTL 이내) → 조건부 GET(304면 디스크 본문 재사용).
+    """
     base_url = "https://getdaytrends.com"
     url = f"{base_url}/{country_slug}/" if country_slug else f"{base_url}/"
 
@@ -119,54 +234,42 @@ async def _async_fetch_getdaytrends(session: httpx.AsyncClient, country_slug: st
             )
             return cached_trends[:limit]
 
-    try:
-        resp = await session.get(url, headers=_COMMON_HEADERS, timeout=_DEFAULT_TIMEOUT)
-        resp.raise_for_status()
-        html = resp.text
-
-        try:
-            soup = BeautifulSoup(html, "lxml")
-        except Exception:
-            soup = BeautifulSoup(html, "html.parser")
-
-        trends = []
-        rows = soup.select("table.trends tbody tr")
-        if not rows:
-            rows = soup.select("table tr")
-
-        for row in rows:
-            name_el = row.select_one(".main a") or row.select_one("a")
-            if not name_el:
-                continue
-
-            name = name_el.get_text(strip=True).lstrip("#").strip()
-            if not name:
-                continue
-
-            volume_el = row.select_one(".desc")
-            volume_text = volume_el.get_text(strip=True) if volume_el else "N/A"
+    disk = _disk_cache()
+    entry = await asyncio.to_thread(disk.get, url)
 
-            href = name_el.get("href", "")
-            link = f"{base_url}{href}" if href and not href.startswith("http") else href
-
-            trends.append(
-                RawTrend(
-                    name=name,
-                    source=TrendSource.GETDAYTRENDS,
-                    volume=volume_text,
-                    volume_numeric=_parse_volume_text(volume_text),
-                    link=link,
-                    country=country_slug or "global",
-                )
-            )
-
-            if len(trends) >= limit:
-                break
+    try:
+        fresh_response = None
+        if entry is not None and entry.age() < _FETCH_CACHE_TTL:
+            html = entry.body
+            log.info(f"[수집 디스크 캐시] getdaytrends.com 재사용 ({cache_key}, {int(entry.age())}초 전)")
+        else:
+            headers = {**_COMMON_HEADERS, **(entry.validators() if entry is not None else {})}
+            resp = await session.get(url, headers=headers, timeout=_DEFAULT_TIMEOUT)
+            if resp.status_code == 304 and entry is not None:
+                html = entry.body
+                await asyncio.to_thread(disk.touch, url)
+                log.info(f"[수집 디스크 캐시] getdaytrends.com 304 재검증 ({cache_key})")
+            else:
+                resp.raise_for_status()
+                html = resp.text
+                fresh_response = resp
+
+        trends = await _run_parser(_parse_getdaytrends_html, html, country_slug, limit)
 
         if not trends:
             log.warning("getdaytrends.com 파싱 실패. 대체 트렌드 사용.")
             return _fallback_trends()
 
+        # 파싱에 성공한 응답만 디스크에 저장 (차단/빈 페이지 캐시 방지)
+        if fresh_response is not None:
+            await asyncio.to_thread(
+                disk.store,
+                url,
+                html,
+                etag=fresh_response.headers.get("etag", ""),
+                last_modified=fresh_response.headers.get("last-modified", ""),
+            )
+
         # Phase 3: 캐시 저장
         _FETCH_CACHE[cache_key] = (time.time(), trends)
         log.info(f"getdaytrends.com 수집 완료: {len(trends)}개 ({country_slug or 'global'})")
@@ -380,6 +380,10 @@ class AppConfig:
     enable_streaming_pipeline: bool = False  # asyncio.Queue ????덉쉐?域밸Ŧ留⑶뜮?癲ル슢?꾤땟?????筌????(????딅쾷??
     streaming_generator_concurrency: int = 3  # ????덉쉐?域밸Ŧ留⑶뜮?癲ル슢?꾤땟???????덈빰 LLM ?嶺뚮ㅎ?????
     streaming_stage_timeout: int = 120  # ???쒒?????읐??? ????ш끽維???(??
+    streaming_max_concurrency: int = 8  # 적응형 동시성 상한 (AIMD)
+    streaming_latency_budget: float = 30.0  # 생성 p95 지연 예산 (초)
+    streaming_error_budget: float = 0.1  # 생성 오류율 예산
+    streaming_queue_max_size: int = 50  # 단계 간 큐 최대 크기
 
     tap_snapshot_max_age_minutes: int = 30
     tap_board_limit: int = 10
@@ -129,6 +129,10 @@ def feature_flags_env() -> dict:
         enable_streaming_pipeline=os.getenv("ENABLE_STREAMING_PIPELINE", "false").lower() == "true",
         streaming_generator_concurrency=int(os.getenv("STREAMING_GENERATOR_CONCURRENCY", "3")),
         streaming_stage_timeout=int(os.getenv("STREAMING_STAGE_TIMEOUT", "120")),
+        streaming_max_concurrency=int(os.getenv("STREAMING_MAX_CONCURRENCY", "8")),
+        streaming_latency_budget=float(os.getenv("STREAMING_LATENCY_BUDGET", "30")),
+        streaming_error_budget=float(os.getenv("STREAMING_ERROR_BUDGET", "0.1")),
+        streaming_queue_max_size=int(os.getenv("STREAMING_QUEUE_MAX_SIZE", "50")),
     )
 
 
@@ -21,17 +21,31 @@ Graceful Degradation:
     - Queue에 에러가 발생해도 다른 트렌드는 계속 처리
     - 모든 Worker에 timeout 설정 → deadlock 방지
     - 이 모듈은 100% 선택적: 기존 _step_generate 경로와 병행 가능
+
+Adaptive Concurrency:
+    Generator 동시성은 고정값이 아니라 AIMD 리미터가 조절한다.
+    p95 지연과 오류율이 예산 안이면 +1, 429/타임아웃이면 ×backoff로 감소.
+    Worker는 상한(max)만큼 띄우고 리미터 슬롯을 얻은 Worker만 LLM을 호출한다.
+    큐 깊이, in-flight 수, 단계별 지연 히스토그램은 metrics()로 조회
+    (prometheus_client가 있으면 Gauge/Histogram에도 기록).
 """
 
 from __future__ import annotations
 
 import asyncio
+import math
+import re
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger as log
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 @dataclass
 class PipelineEvent:
@@ -59,6 +73,274 @@ class PipelineEvent:
 _SENTINEL = object()  # Queue 종료 신호
 
 
+# ══════════════════════════════════════════════════════
+#  Adaptive Concurrency (AIMD)
+# ══════════════════════════════════════════════════════
+
+OUTCOME_OK = "ok"
+OUTCOME_ERROR = "error"
+OUTCOME_OVERLOAD = "overload"  # 429 / 타임아웃 — 즉시 감속 신호
+
+# 상태 코드 속성이 없는 SDK 예외용 — 메시지 속 "HTTP 429" / "status code: 429" / "429 Too Many Requests"만 인정
+_HTTP_429_RE = re.compile(
+    r"\b(?:HTTP(?:/[\d.]+)?|status(?:[ _]code)?|error code)\s*[:=]?\s*429\b|\b429\s+Too Many Requests\b",
+    re.IGNORECASE,
+)
+
+
+def classify_failure(exc: BaseException) -> str:
+    """예외 → 리미터 신호. 타임아웃·레이트리밋은 overload, 나머지는 error."""
+    if isinstance(exc, TimeoutError):
+        return OUTCOME_OVERLOAD
+    status = getattr(exc, "status_code", None) or getattr(getattr(exc, "response", None), "status_code", None)
+    if status == 429 or type(exc).__name__ == "RateLimitError" or _HTTP_429_RE.search(str(exc)):
+        return OUTCOME_OVERLOAD
+    return OUTCOME_ERROR
+
+
+def _percentile(values, q: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD 동시성 리미터.
+
+    - window개 완료마다 평가: p95 지연 ≤ latency_budget 이고 오류율 ≤ error_budget 이며
+      그동안 리미트가 포화됐으면 limit += 1 (additive increase)
+    - p95 지연 초과 → limit -= 1, 오류율 초과 → limit × backoff
+    - overload(429/타임아웃) → 즉시 limit × backoff (cooldown 동안 중복 감속 없음)
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        *,
+        min_limit: int = 1,
+        max_limit: int | None = None,
+        latency_budget: float = 30.0,
+        error_budget: float = 0.1,
+        window: int = 10,
+        backoff: float = 0.5,
+        cooldown: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        initial = max(1, initial)
+        self.min_limit = max(1, min(min_limit, initial))
+        self.max_limit = max(initial, max_limit or initial)
+        self.limit = initial
+        self.latency_budget = latency_budget
+        self.error_budget = error_budget
+        self.window = max(1, window)
+        self.backoff = backoff
+        self.cooldown = cooldown
+        self._clock = clock
+        self.in_flight = 0
+        self.increases = 0
+        self.decreases = 0
+        self._latencies: list[float] = []
+        self._errors = 0
+        self._saturated = False
+        self._last_decrease = -math.inf
+        self._waiters: deque[asyncio.Future] = deque()
+
+    async def acquire(self) -> None:
+        while self.in_flight >= self.limit:
+            self._saturated = True
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self.in_flight += 1
+        if self.in_flight >= self.limit:
+            self._saturated = True
+
+    def release(self, latency: float, outcome: str = OUTCOME_OK) -> None:
+        self.in_flight = max(0, self.in_flight - 1)
+        self._record(latency, outcome)
+        self._wake()
+
+    def _wake(self) -> None:
+        free = self.limit - self.in_flight
+        for waiter in list(self._waiters):
+            if free <= 0:
+                break
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    def _set_limit(self, new_limit: int, reason: str) -> None:
+        new_limit = min(self.max_limit, max(self.min_limit, new_limit))
+        if new_limit == self.limit:
+            return
+        if new_limit > self.limit:
+            self.increases += 1
+        else:
+            self.decreases += 1
+            self._last_decrease = self._clock()
+        log.debug(f"[Streaming] 동시성 {self.limit} → {new_limit} ({reason})")
+        self.limit = new_limit
+
+    def _reset_window(self) -> None:
+        self._latencies = []
+        self._errors = 0
+        self._saturated = False
+
+    def _record(self, latency: float, outcome: str) -> None:
+        if outcome == OUTCOME_OVERLOAD:
+            if self._clock() - self._last_decrease >= self.cooldown:
+                self._set_limit(math.floor(self.limit * self.backoff), "overload")
+            self._reset_window()
+            return
+
+        self._latencies.append(latency)
+        if outcome == OUTCOME_ERROR:
+            self._errors += 1
+        if len(self._latencies) < self.window:
+            return
+
+        p95 = _percentile(self._latencies, 0.95)
+        error_rate = self._errors / len(self._latencies)
+        if error_rate > self.error_budget:
+            self._set_limit(math.floor(self.limit * self.backoff), f"error_rate={error_rate:.2f}")
+        elif p95 > self.latency_budget:
+            self._set_limit(self.limit - 1, f"p95={p95:.2f}s")
+        elif self._saturated:
+            self._set_limit(self.limit + 1, f"p95={p95:.2f}s")
+        self._reset_window()
+
+    def snapshot(self) -> dict:
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
+
+
+# ══════════════════════════════════════════════════════
+#  Metrics
+# ══════════════════════════════════════════════════════
+
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+class LatencyHistogram:
+    """단계별 지연 히스토그램 (누적 버킷 + 최근 샘플 기반 분위수)."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS, sample_size: int = 1024):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 = +Inf
+        self.count = 0
+        self.total = 0.0
+        self._samples: deque[float] = deque(maxlen=sample_size)
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self._samples.append(seconds)
+        for i, upper in enumerate(self.buckets):
+            if seconds <= upper:
+                self.counts[i] += 1
+                return
+        self.counts[-1] += 1
+
+    def snapshot(self) -> dict:
+        cumulative, running = {}, 0
+        for upper, n in zip((*self.buckets, math.inf), self.counts, strict=True):
+            running += n
+            cumulative["+Inf" if upper == math.inf else str(upper)] = running
+        return {
+            "count": self.count,
+            "sum": round(self.total, 4),
+            "p50": _percentile(self._samples, 0.50),
+            "p95": _percentile(self._samples, 0.95),
+            "buckets": cumulative,
+        }
+
+
+_PROM_METRICS: dict | None = None
+
+
+def _prometheus() -> dict:
+    """prometheus_client가 있으면 Gauge/Histogram 생성 (없거나 중복 등록이면 no-op)."""
+    global _PROM_METRICS
+    if _PROM_METRICS is None:
+        try:
+            from prometheus_client import Gauge, Histogram
+
+            _PROM_METRICS = {
+                "queue_depth": Gauge("gdt_streaming_queue_depth", "Streaming pipeline queue depth", ["queue"]),
+                "in_flight": Gauge("gdt_streaming_in_flight", "Streaming generator calls in flight"),
+                "limit": Gauge("gdt_streaming_concurrency_limit", "Adaptive generator concurrency limit"),
+                "stage_seconds": Histogram(
+                    "gdt_streaming_stage_seconds",
+                    "Streaming pipeline stage latency",
+                    ["stage"],
+                    buckets=LATENCY_BUCKETS,
+                ),
+            }
+        except (ImportError, ValueError):
+            _PROM_METRICS = {}
+    return _PROM_METRICS
+
+
+class PipelineMetrics:
+    """큐 깊이(현재/최대), in-flight, 단계별 지연 히스토그램."""
+
+    STAGES = ("scoring", "generating", "saving")
+
+    def __init__(self):
+        self.stage_latency = {stage: LatencyHistogram() for stage in self.STAGES}
+        self.queue_depth: dict[str, int] = {}
+        self.queue_depth_max: dict[str, int] = {}
+        self.in_flight_max = 0
+
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        self.stage_latency[stage].observe(seconds)
+        prom = _prometheus()
+        if prom:
+            prom["stage_seconds"].labels(stage=stage).observe(seconds)
+
+    def observe_queue(self, name: str, queue: asyncio.Queue) -> None:
+        depth = queue.qsize()
+        self.queue_depth[name] = depth
+        self.queue_depth_max[name] = max(depth, self.queue_depth_max.get(name, 0))
+        prom = _prometheus()
+        if prom:
+            prom["queue_depth"].labels(queue=name).set(depth)
+
+    def observe_limiter(self, limiter: AdaptiveConcurrencyLimiter) -> None:
+        self.in_flight_max = max(self.in_flight_max, limiter.in_flight)
+        prom = _prometheus()
+        if prom:
+            prom["in_flight"].set(limiter.in_flight)
+            prom["limit"].set(limiter.limit)
+
+    def snapshot(self) -> dict:
+        return {
+            "queue_depth": dict(self.queue_depth),
+            "queue_depth_max": dict(self.queue_depth_max),
+            "in_flight_max": self.in_flight_max,
+            "stage_latency": {stage: hist.snapshot() for stage, hist in self.stage_latency.items()},
+        }
+
+
+def _config_number(config, name: str, default):
+    """config 속성이 숫자일 때만 사용 (MagicMock 등은 기본값)."""
+    value = getattr(config, name, None)
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return value
+    return default
+
+
 class StreamingPipeline:
     """asyncio.Queue 기반 스트리밍 파이프라인.
 
@@ -71,17 +353,50 @@ class StreamingPipeline:
 
     # 기본 설정
     QUEUE_MAX_SIZE = 50
-    GENERATOR_CONCURRENCY = 3     # 동시 LLM 호출 수
+    GENERATOR_CONCURRENCY = 3     # 초기 동시 LLM 호출 수
+    GENERATOR_MAX_CONCURRENCY = 8  # 적응형 리미터 상한
     STAGE_TIMEOUT_SECONDS = 120   # 단일 트렌드 처리 타임아웃
+    LATENCY_BUDGET_SECONDS = 30.0  # 생성 p95 지연 예산
+    ERROR_BUDGET = 0.1            # 생성 오류율 예산
 
-    def __init__(self, config, conn, *, generator_concurrency: int = 0):
+    def __init__(
+        self,
+        config,
+        conn,
+        *,
+        generator_concurrency: int = 0,
+        max_generator_concurrency: int = 0,
+        adaptive: bool = True,
+        limiter: AdaptiveConcurrencyLimiter | None = None,
+    ):
         self._config = config
         self._conn = conn
-        self._gen_concurrency = generator_concurrency or self.GENERATOR_CONCURRENCY
-        self._scored_queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_MAX_SIZE)
-        self._generated_queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_MAX_SIZE)
+        initial = generator_concurrency or int(
+            _config_number(config, "streaming_generator_concurrency", self.GENERATOR_CONCURRENCY)
+        )
+        if limiter is None:
+            max_limit = initial
+            if adaptive:
+                max_limit = max_generator_concurrency or int(
+                    _config_number(config, "streaming_max_concurrency", self.GENERATOR_MAX_CONCURRENCY)
+                )
+            limiter = AdaptiveConcurrencyLimiter(
+                initial,
+                max_limit=max_limit,
+                latency_budget=float(
+                    _config_number(config, "streaming_latency_budget", self.LATENCY_BUDGET_SECONDS)
+                ),
+                error_budget=float(_config_number(config, "streaming_error_budget", self.ERROR_BUDGET)),
+            )
+        self._limiter = limiter
+        # Worker는 리미터 상한만큼 띄우고, 실제 동시 호출 수는 리미터가 결정
+        self._gen_concurrency = limiter.max_limit
+        self._queue_max_size = int(_config_number(config, "streaming_queue_max_size", self.QUEUE_MAX_SIZE))
+        self._scored_queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_max_size)
+        self._generated_queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_max_size)
         self._results: list[PipelineEvent] = []
         self._errors: list[str] = []
+        self._metrics = PipelineMetrics()
 
     async def run(
         self,
@@ -107,11 +422,12 @@ class StreamingPipeline:
         # [QA 수정] 재실행 시 이전 상태 초기화 — re-entrant safety
         self._results = []
         self._errors = []
-        self._scored_queue = asyncio.Queue(maxsize=self.QUEUE_MAX_SIZE)
-        self._generated_queue = asyncio.Queue(maxsize=self.QUEUE_MAX_SIZE)
+        self._metrics = PipelineMetrics()
+        self._scored_queue = asyncio.Queue(maxsize=self._queue_max_size)
+        self._generated_queue = asyncio.Queue(maxsize=self._queue_max_size)
 
         log.info(f"[Streaming] 파이프라인 시작 — {len(raw_trends)}개 트렌드, "
-                 f"gen_concurrency={self._gen_concurrency}")
+                 f"gen_concurrency={self._limiter.limit} (max {self._limiter.max_limit})")
 
         started_at = datetime.now()
 
@@ -146,7 +462,8 @@ class StreamingPipeline:
             f"[Streaming] 파이프라인 완료 — "
             f"성공 {success_count}/{len(raw_trends)}개, "
             f"소요 {elapsed:.1f}초, "
-            f"에러 {len(self._errors)}건"
+            f"에러 {len(self._errors)}건, "
+            f"최종 동시성 {self._limiter.limit}"
         )
 
         return self._results
@@ -161,6 +478,7 @@ class StreamingPipeline:
         """Stage 1: 트렌드를 하나씩 스코어링하고 scored_queue에 넣는다."""
         for trend in raw_trends:
             event = PipelineEvent(trend=trend, stage="scoring")
+            stage_started = time.perf_counter()
             try:
                 if score_fn:
                     scored = await asyncio.wait_for(
@@ -171,7 +489,9 @@ class StreamingPipeline:
                     scored = trend  # score_fn이 없으면 이미 ScoredTrend로 간주
                 event.stage = "scored"
                 event.complete(result=scored)
+                self._metrics.observe_stage("scoring", time.perf_counter() - stage_started)
                 await self._scored_queue.put(event)
+                self._metrics.observe_queue("scored", self._scored_queue)
             except TimeoutError:
                 event.complete(error="scoring_timeout")
                 self._errors.append(f"[Scorer] 타임아웃: {trend}")
@@ -189,13 +509,18 @@ class StreamingPipeline:
         """Stage 2: scored_queue에서 꺼내 생성하고 generated_queue에 넣는다."""
         while True:
             event = await self._scored_queue.get()
+            self._metrics.observe_queue("scored", self._scored_queue)
             if event is _SENTINEL:
                 await self._generated_queue.put(_SENTINEL)
                 break
 
             scored_trend = event.result
+            await self._limiter.acquire()
+            self._metrics.observe_limiter(self._limiter)
             event.stage = "generating"
             event.started_at = datetime.now()  # 생성 시작 시각 재설정
+            stage_started = time.perf_counter()
+            outcome = OUTCOME_OK
 
             try:
                 if generate_fn:
@@ -207,16 +532,24 @@ class StreamingPipeline:
                     batch = None  # dry-run 모드
                 event.stage = "generated"
                 event.complete(result=batch)
-            except TimeoutError:
+            except TimeoutError as e:
+                outcome = classify_failure(e)
                 event.complete(error="generation_timeout")
                 self._errors.append(f"[Gen-{worker_id}] 타임아웃: {scored_trend}")
                 log.warning(f"[Streaming-{worker_id}] 생성 타임아웃")
             except Exception as e:
+                outcome = classify_failure(e)
                 event.complete(error=f"generation_error: {e}")
                 self._errors.append(f"[Gen-{worker_id}] {type(e).__name__}: {e}")
                 log.warning(f"[Streaming-{worker_id}] 생성 실패: {e}")
+            finally:
+                elapsed = time.perf_counter() - stage_started
+                self._limiter.release(elapsed, outcome)
+                self._metrics.observe_stage("generating", elapsed)
+                self._metrics.observe_limiter(self._limiter)
 
             await self._generated_queue.put(event)
+            self._metrics.observe_queue("generated", self._generated_queue)
 
     async def _saver_worker(self, save_fn, *, expected_count: int):
         """Stage 3: generated_queue에서 꺼내 저장하고 결과를 수집한다."""
@@ -224,6 +557,7 @@ class StreamingPipeline:
 
         while sentinel_count < self._gen_concurrency:
             event = await self._generated_queue.get()
+            self._metrics.observe_queue("generated", self._generated_queue)
             if event is _SENTINEL:
                 sentinel_count += 1
                 continue
@@ -233,6 +567,7 @@ class StreamingPipeline:
                 continue
 
             event.stage = "saving"
+            stage_started = time.perf_counter()
             try:
                 if save_fn and event.result:
                     await asyncio.wait_for(
@@ -248,6 +583,7 @@ class StreamingPipeline:
                 event.complete(error=f"save_error: {e}")
                 self._errors.append(f"[Saver] {type(e).__name__}: {e}")
 
+            self._metrics.observe_stage("saving", time.perf_counter() - stage_started)
             self._results.append(event)
 
     @property
@@ -257,3 +593,15 @@ class StreamingPipeline:
     @property
     def success_count(self) -> int:
         return sum(1 for e in self._results if not e.error)
+
+    @property
+    def limiter(self) -> AdaptiveConcurrencyLimiter:
+        return self._limiter
+
+    def metrics(self) -> dict:
+        """큐 깊이, in-flight, 동시성 리미트, 단계별 지연 히스토그램 스냅샷."""
+        return {
+            **self._metrics.snapshot(),
+            "in_flight": self._limiter.in_flight,
+            "concurrency": self._limiter.snapshot(),
+        }
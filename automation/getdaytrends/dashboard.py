@@ -19,17 +19,19 @@ FastAPI 기반 운영 대시보드: 실시간 차트, 카테고리 분석, 소
 실행: uvicorn dashboard:app --reload --port 8010
 """
 
+import asyncio
+import contextlib
 import json
 import logging
+import os
 import re
 from datetime import date, datetime, timedelta
 from typing import Any, Awaitable, Callable
 from urllib.parse import quote_plus
 
 try:
-    import httpx
     from fastapi import FastAPI, Query, Request
-    from fastapi.responses import HTMLResponse, JSONResponse
+    from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 except ImportError as e:
     raise ImportError(
         "dashboard 실행을 위해 fastapi, uvicorn, httpx가 필요합니다:\n" "  pip install fastapi uvicorn[standard] httpx"
@@ -89,6 +91,11 @@ try:
 except ImportError:
     from dashboard_html import get_dashboard_html
 
+try:
+    from .log_tail import LokiProbe, follow_lines, tail_lines
+except ImportError:
+    from log_tail import LokiProbe, follow_lines, tail_lines
+
 try:
     from .stripe_helpers import (
         _stripe_amount_divisor,
@@ -118,7 +125,14 @@ except ImportError:
         _extract_tap_purchase_from_stripe_event,
     )
 
-app = FastAPI(title="getdaytrends Pro Dashboard", version=VERSION)
+@contextlib.asynccontextmanager
+async def _lifespan(app: FastAPI):
+    yield
+    # 종료 시 Loki 프로브가 재사용하던 httpx 클라이언트를 닫는다
+    await _loki_probe.aclose()
+
+
+app = FastAPI(title="getdaytrends Pro Dashboard", version=VERSION, lifespan=_lifespan)
 
 try:
     from .dashboard_routes_tap import router as tap_router, init_tap_router
@@ -562,43 +576,74 @@ async def api_review_queue(limit: int = Query(50, ge=1, le=200)):
     return await _run_db_json_with_fallback("api_review_queue", _load_review_queue, _review_queue_fallback)
 
 
+_LOKI_QUERY = '{job="getdaytrends"}'
+# Loki 가용성은 요청마다 다시 확인하지 않고 TTL 동안 캐시 (클라이언트도 재사용)
+_loki_probe = LokiProbe(os.environ.get("LOKI_URL", "http://localhost:3100"))
+
+
+def _local_log_path():
+    return _config.base_dir / "tweet_bot.log"
+
+
 @app.get("/api/logs")
 async def api_logs(limit: int = Query(50, ge=1, le=200)):
     """Loki 또는 로컬 파일에서 실시간 로그 수집."""
     logs = []
-    
+
     # 1. Try Loki first (if docker-compose monitoring is running)
-    try:
-        async with httpx.AsyncClient(timeout=1.5) as client:
-            resp = await client.get(
-                "http://localhost:3100/loki/api/v1/query",
-                params={"query": '{job="getdaytrends"}', "limit": limit}
-            )
-            if resp.status_code == 200:
-                data = resp.json()
-                results = data.get("data", {}).get("result", [])
-                if results:
-                    # Parse Loki's matrix/vector
-                    for res in results:
-                        for val in res.get("values", []):
-                            logs.append(val[1])
-                    return JSONResponse({"logs": logs[-limit:], "source": "loki"})
-    except Exception:
-        pass
+    loki_logs = await _loki_probe.query_logs(_LOKI_QUERY, limit)
+    if loki_logs:
+        return JSONResponse({"logs": loki_logs, "source": "loki"})
 
-    # 2. Fallback to local log file
-    log_path = _config.base_dir / "tweet_bot.log"
+    # 2. Fallback to local log file — 끝에서부터 필요한 블록만 읽음
+    log_path = _local_log_path()
     if log_path.exists():
-        try:
-            with open(log_path, encoding="utf-8") as f:
-                lines = f.readlines()
-                logs = [line.strip() for line in lines[-limit:]]
-        except Exception:
-            pass
+        with contextlib.suppress(Exception):
+            logs = await asyncio.to_thread(tail_lines, log_path, limit)
 
     return JSONResponse({"logs": logs, "source": "local"})
 
 
+@app.get("/api/logs/stream")
+async def api_logs_stream(
+    request: Request,
+    backlog: int = Query(20, ge=0, le=200),
+    poll_interval: float = Query(1.0, ge=0.1, le=10.0),
+):
+    """로컬 로그 파일을 Server-Sent Events로 스트리밍 (tail -F).
+
+    연결 직후 마지막 ``backlog``줄을 보내고, 이후 추가되는 줄만 전송한다.
+    """
+    log_path = _local_log_path()
+
+    async def _events():
+        if backlog and log_path.exists():
+            try:
+                for line in await asyncio.to_thread(tail_lines, log_path, backlog):
+                    yield f"data: {line}\n\n"
+            except Exception:
+                logger.warning("Log stream backlog read failed", exc_info=True)
+
+        lines = follow_lines(log_path, poll_interval=poll_interval, from_end=True, heartbeat=15.0)
+        try:
+            async for line in lines:
+                if line:
+                    yield f"data: {line}\n\n"
+                    continue
+                # heartbeat: 새 줄 없음
+                if await request.is_disconnected():
+                    break
+                yield ": keep-alive\n\n"
+        finally:
+            await lines.aclose()
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/api/ab_test")
 def api_ab_test():
     """A/B 테스트 결과 실제 데이터 반환 (DailyNews)."""
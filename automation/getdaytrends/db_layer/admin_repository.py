@@ -13,6 +13,7 @@ async def _cleanup_old_records_unlocked(conn, days: int = 90) -> int:
     await conn.execute(
         "DELETE FROM runs WHERE started_at < ? AND id NOT IN (SELECT DISTINCT run_id FROM trends)", (cutoff,)
     )
+    await conn.execute("DELETE FROM trend_outbox WHERE created_at < ?", (cutoff,))
     await conn.commit()
     await conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
     total = tweets_deleted + trends_deleted
@@ -1,5 +1,5 @@
 """
-getdaytrends — Schema Migrations (v1~v11).
+getdaytrends — Schema Migrations (v1~v13).
 DB 스키마 버전 관리 및 마이그레이션 인프라.
 db_schema.py에서 분리됨.
 """
@@ -10,7 +10,7 @@ from loguru import logger as log
 
 from .pg_adapter import PgAdapter
 
-_CURRENT_SCHEMA_VERSION = 11
+_CURRENT_SCHEMA_VERSION = 13
 
 
 async def _get_schema_version(conn) -> int:
@@ -380,6 +380,72 @@ async def _migrate_v11(conn) -> None:
     await conn.commit()
 
 
+async def _migrate_v12(conn) -> None:
+    """v12: trend_outbox 변경 피드 (CIE gdt_bridge 증분 동기화용).
+
+    trends INSERT/UPDATE 및 tweets 성과·상태 변경 시 트리거가 trend_id를 append한다.
+    save_trend / sync_tweet_metrics / performance_tracker 등 모든 쓰기 경로를
+    코드 수정 없이 포착하기 위해 트리거를 사용. 소비자(CIE)가 SQLite만 읽으므로
+    PostgreSQL에서는 테이블만 만들고 트리거는 생략한다.
+    """
+    await conn.executescript("""
+        CREATE TABLE IF NOT EXISTS trend_outbox (
+            seq         INTEGER PRIMARY KEY AUTOINCREMENT,
+            trend_id    INTEGER NOT NULL,
+            created_at  TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_trend_outbox_created ON trend_outbox(created_at);
+    """)
+    if not isinstance(conn, PgAdapter):
+        await conn.executescript("""
+            CREATE TRIGGER IF NOT EXISTS trg_trend_outbox_trend_insert
+            AFTER INSERT ON trends
+            BEGIN
+                INSERT INTO trend_outbox (trend_id, created_at)
+                VALUES (NEW.id, strftime('%Y-%m-%dT%H:%M:%f', 'now'));
+            END;
+            CREATE TRIGGER IF NOT EXISTS trg_trend_outbox_trend_update
+            AFTER UPDATE ON trends
+            BEGIN
+                INSERT INTO trend_outbox (trend_id, created_at)
+                VALUES (NEW.id, strftime('%Y-%m-%dT%H:%M:%f', 'now'));
+            END;
+            CREATE TRIGGER IF NOT EXISTS trg_trend_outbox_tweet_insert
+            AFTER INSERT ON tweets
+            BEGIN
+                INSERT INTO trend_outbox (trend_id, created_at)
+                VALUES (NEW.trend_id, strftime('%Y-%m-%dT%H:%M:%f', 'now'));
+            END;
+            CREATE TRIGGER IF NOT EXISTS trg_trend_outbox_tweet_update
+            AFTER UPDATE OF status, impressions, engagement_rate ON tweets
+            BEGIN
+                INSERT INTO trend_outbox (trend_id, created_at)
+                VALUES (NEW.trend_id, strftime('%Y-%m-%dT%H:%M:%f', 'now'));
+            END;
+        """)
+    await conn.commit()
+
+
+async def _migrate_v13(conn) -> None:
+    """v13: metrics_collect_cursor (X 메트릭 배치 수집 재개 커서).
+
+    PerformanceTracker.batch_collect가 청크 완료마다 수집한 메트릭을 job_id별로 기록한다.
+    중단된 수집을 같은 job_id로 다시 실행하면 기록된 트윗은 재요청하지 않고,
+    전체 완료 시 해당 job 행을 삭제한다.
+    """
+    await conn.executescript("""
+        CREATE TABLE IF NOT EXISTS metrics_collect_cursor (
+            job_id       TEXT NOT NULL,
+            tweet_id     TEXT NOT NULL,
+            payload      TEXT NOT NULL,
+            collected_at TEXT NOT NULL,
+            PRIMARY KEY (job_id, tweet_id)
+        );
+        CREATE INDEX IF NOT EXISTS idx_metrics_cursor_collected ON metrics_collect_cursor(collected_at);
+    """)
+    await conn.commit()
+
+
 # 마이그레이션 레지스트리 (버전, 설명, 함수)
 _MIGRATIONS: list[tuple[int, str, any]] = [
     (1, "tweets.content_type column", _migrate_v1),
@@ -393,6 +459,8 @@ _MIGRATIONS: list[tuple[int, str, any]] = [
     (9, "TAP premium alert queue", _migrate_v9),
     (10, "TAP deal-room funnel events", _migrate_v10),
     (11, "TAP checkout session ops", _migrate_v11),
+    (12, "trend_outbox change feed", _migrate_v12),
+    (13, "metrics collection resume cursor", _migrate_v13),
 ]
 
 
@@ -407,6 +475,8 @@ async def _reconcile_latest_schema(conn) -> None:
     await _migrate_v9(conn)
     await _migrate_v10(conn)
     await _migrate_v11(conn)
+    await _migrate_v12(conn)
+    await _migrate_v13(conn)
 
 
 async def run_migrations(conn) -> None:
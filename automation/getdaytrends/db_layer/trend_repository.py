@@ -1,5 +1,6 @@
 """Trend Repository"""
 
+import contextlib
 import json
 from datetime import datetime, timedelta
 
@@ -96,10 +97,8 @@ async def is_duplicate_trend(conn, name: str, volume: int, hours: int = 3) -> bo
 
     # Cache the fingerprint if it's a duplicate
     if is_dup and cache is not None:
-        try:
+        with contextlib.suppress(Exception):  # cache write 실패는 무시 — 다음 호출 시 DB에서 재확인
             await cache.set(dedup_key, True, ttl=hours * 3600)
-        except Exception:
-            pass  # cache write 실패는 무시 — 다음 호출 시 DB에서 재확인
 
     return is_dup
 
@@ -128,10 +127,106 @@ async def get_cached_score(conn, fingerprint: str, max_age_hours: int = 6) -> di
 
     # Cache result for 6 hours (match the natural TTL)
     if result and cache is not None:
-        try:
+        with contextlib.suppress(Exception):  # cache write 실패는 무시
             await cache.set(cache_key, result, ttl=max_age_hours * 3600)
+
+    return result
+
+# SQLite 기본 바인딩 한도(999) 아래로 IN 절을 분할
+_IN_CHUNK = 500
+
+_SCORE_COLUMNS = (
+    "keyword, viral_potential, trend_acceleration, top_insight, suggested_angles, best_hook_starter, scored_at"
+)
+
+async def _select_by_fingerprints(conn, columns: str, fingerprints: list[str], cutoff: str, order_by: str = "") -> list:
+    rows: list = []
+    for i in range(0, len(fingerprints), _IN_CHUNK):
+        chunk = fingerprints[i : i + _IN_CHUNK]
+        placeholders = ",".join("?" * len(chunk))
+        cursor = await conn.execute(
+            f"SELECT fingerprint, {columns} FROM trends "
+            f"WHERE fingerprint IN ({placeholders}) AND scored_at >= ?{order_by}",
+            (*chunk, cutoff),
+        )
+        rows.extend(await cursor.fetchall())
+    return rows
+
+async def is_duplicate_trend_batch(conn, fingerprints: list[str], hours: int = 3) -> dict[str, bool]:
+    """
+    여러 fingerprint의 중복 여부를 Redis 파이프라인 EXISTS 1회 + SQL IN 쿼리 1회로 조회.
+    반환: {fingerprint: is_dup}
+    """
+    unique = list(dict.fromkeys(fp for fp in fingerprints if fp))
+    if not unique:
+        return {}
+    result = dict.fromkeys(unique, False)
+    cache = _get_cache_client() if _redis_enabled() else None
+
+    if cache is not None:
+        try:
+            hits = await cache.exists_many([f"gdt:dedup:{fp}" for fp in unique])
+            if isinstance(hits, list) and len(hits) == len(unique):
+                for fp, hit in zip(unique, hits, strict=True):
+                    result[fp] = bool(hit)
         except Exception:
-            pass  # cache write 실패는 무시
+            cache = None  # Redis 불가 — DB fallback
+
+    missing = [fp for fp in unique if not result[fp]]
+    if not missing:
+        return result
+
+    cutoff = (datetime.now() - timedelta(hours=hours)).isoformat()
+    rows = await _select_by_fingerprints(conn, "1", missing, cutoff)
+    found = {row["fingerprint"] for row in rows}
+    for fp in found:
+        result[fp] = True
+
+    if found and cache is not None:
+        with contextlib.suppress(Exception):  # cache write 실패는 무시
+            await cache.set_many({f"gdt:dedup:{fp}": True for fp in found}, ttl=hours * 3600)
+
+    return result
+
+async def get_cached_score_batch(conn, fingerprints: list[str], max_age_hours: int = 6) -> dict[str, dict]:
+    """
+    여러 fingerprint의 캐시 스코어를 Redis MGET 1회 + SQL IN 쿼리 1회로 조회.
+    반환: {fingerprint: get_cached_score와 같은 dict} — 캐시 미스는 키 없음.
+    """
+    unique = list(dict.fromkeys(fp for fp in fingerprints if fp))
+    if not unique:
+        return {}
+    result: dict[str, dict] = {}
+    cache = _get_cache_client() if _redis_enabled() else None
+
+    if cache is not None:
+        try:
+            values = await cache.mget([f"gdt:score:{fp}" for fp in unique])
+            if isinstance(values, list) and len(values) == len(unique):
+                for fp, value in zip(unique, values, strict=True):
+                    if isinstance(value, dict):  # 타입 오염 데이터는 DB에서 재조회
+                        result[fp] = value
+        except Exception:
+            cache = None  # Redis 불가 — DB fallback
+
+    missing = [fp for fp in unique if fp not in result]
+    if not missing:
+        return result
+
+    cutoff = (datetime.now() - timedelta(hours=max_age_hours)).isoformat()
+    rows = await _select_by_fingerprints(conn, _SCORE_COLUMNS, missing, cutoff, " ORDER BY scored_at DESC")
+    from_db: dict[str, dict] = {}
+    for row in rows:
+        fp = row["fingerprint"]
+        if fp not in from_db:  # 최신 행 우선
+            entry = dict(row)
+            entry.pop("fingerprint", None)
+            from_db[fp] = entry
+    result.update(from_db)
+
+    if from_db and cache is not None:
+        with contextlib.suppress(Exception):  # cache write 실패는 무시
+            await cache.set_many({f"gdt:score:{fp}": entry for fp, entry in from_db.items()}, ttl=max_age_hours * 3600)
 
     return result
 
@@ -0,0 +1,191 @@
+"""
+getdaytrends — 로그 tail / follow 헬퍼 (대시보드 /api/logs 용).
+
+- tail_lines(): 파일 끝에서 역방향으로 블록 단위 seek → 필요한 줄만 읽음.
+  수백 MB 로그에서도 readlines() 전체 로드 없이 마지막 N줄을 반환.
+- follow_lines(): stat 폴링으로 파일 증가분만 읽는 async generator.
+  로테이션(inode 변경)/truncate를 감지하면 처음부터 다시 따라간다.
+- LokiProbe: Loki 가용성 체크 결과를 TTL 동안 캐시하고 httpx 클라이언트 1개를 재사용.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+_BLOCK_SIZE = 8192
+
+
+def tail_lines(path: Path, limit: int, block_size: int = _BLOCK_SIZE) -> list[str]:
+    """파일의 마지막 ``limit``줄 (strip 적용). 끝에서부터 필요한 블록만 읽는다."""
+    if limit <= 0:
+        return []
+
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        buf = b""
+        # limit+1개의 개행이 확보되면 마지막 limit줄은 완전하다
+        while pos > 0 and buf.count(b"\n") <= limit:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+
+    lines = buf.splitlines()
+    if pos > 0:
+        lines = lines[1:]  # 첫 줄은 잘린 조각일 수 있음
+    return [line.decode("utf-8", errors="replace").strip() for line in lines[-limit:]]
+
+
+async def follow_lines(
+    path: Path,
+    *,
+    poll_interval: float = 1.0,
+    from_end: bool = True,
+    max_chunk: int = 1 << 20,
+    heartbeat: float | None = None,
+) -> AsyncIterator[str]:
+    """파일에 새로 추가되는 줄을 yield (tail -F 유사, stat 폴링 기반).
+
+    완성되지 않은 마지막 줄은 개행이 들어올 때까지 버퍼에 둔다.
+    ``heartbeat``초 동안 새 줄이 없으면 빈 문자열을 yield — 호출 측이
+    keep-alive 전송이나 연결 종료 확인을 할 수 있게 한다.
+    """
+    offset = 0
+    inode: int | None = None
+    pending = b""
+    first = True
+    last_yield = time.monotonic()
+
+    while True:
+        if heartbeat is not None and time.monotonic() - last_yield >= heartbeat:
+            last_yield = time.monotonic()
+            yield ""
+
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            inode, offset, pending = None, 0, b""
+            await asyncio.sleep(poll_interval)
+            continue
+
+        if inode is not None and (st.st_ino != inode or st.st_size < offset):
+            offset, pending = 0, b""  # 로테이션 또는 truncate
+        if first:
+            offset = st.st_size if from_end else 0
+            first = False
+        inode = st.st_ino
+
+        if st.st_size > offset:
+            chunk = await asyncio.to_thread(_read_range, path, offset, min(st.st_size - offset, max_chunk))
+            offset += len(chunk)
+            pending += chunk
+            *complete, pending = pending.split(b"\n")
+            for raw in complete:
+                line = raw.decode("utf-8", errors="replace").strip()
+                if line:
+                    last_yield = time.monotonic()
+                    yield line
+            if st.st_size > offset:
+                continue  # 남은 증가분은 sleep 없이 이어서 읽음
+
+        await asyncio.sleep(poll_interval)
+
+
+def _read_range(path: Path, offset: int, size: int) -> bytes:
+    with open(path, "rb") as f:
+        f.seek(offset)
+        return f.read(size)
+
+
+class LokiProbe:
+    """Loki 조회 + 가용성 캐시.
+
+    실패하면 ``down_ttl`` 동안 Loki를 건너뛰고 로컬 파일로 바로 간다.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:3100",
+        *,
+        timeout: float = 1.5,
+        up_ttl: float = 30.0,
+        down_ttl: float = 30.0,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.up_ttl = up_ttl
+        self.down_ttl = down_ttl
+        self._available: bool | None = None
+        self._checked_at = 0.0
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # 커넥션 풀은 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만든다
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout)
+            self._client_loop = loop
+        return self._client
+
+    def _mark(self, available: bool) -> None:
+        self._available = available
+        self._checked_at = time.monotonic()
+
+    def should_try(self) -> bool:
+        """캐시된 판정이 유효하면 그대로, 만료됐으면 다시 시도한다."""
+        if self._available is None:
+            return True
+        ttl = self.up_ttl if self._available else self.down_ttl
+        if time.monotonic() - self._checked_at >= ttl:
+            return True
+        return self._available
+
+    async def query_logs(self, query: str, limit: int) -> list[str] | None:
+        """Loki 로그 조회. Loki가 없거나 결과가 없으면 None."""
+        if not self.should_try():
+            return None
+        try:
+            resp = await self._get_client().get(
+                "/loki/api/v1/query",
+                params={"query": query, "limit": limit},
+            )
+        except Exception:
+            self._mark(False)
+            return None
+
+        if resp.status_code != 200:
+            self._mark(False)
+            return None
+        try:
+            data: dict[str, Any] = resp.json()
+        except ValueError:
+            # 200이어도 본문이 잘렸거나 JSON이 아니면 Loki 장애로 취급
+            self._mark(False)
+            return None
+        self._mark(True)
+
+        logs: list[str] = []
+        for res in data.get("data", {}).get("result", []):
+            for val in res.get("values", []):
+                logs.append(val[1])
+        return logs[-limit:] if logs else None
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        if client is None or client.is_closed:
+            return
+        if self._client_loop is not asyncio.get_running_loop():
+            # 다른(이미 끝난) 루프에 묶인 풀은 닫을 수 없으므로 버린다
+            return
+        await client.aclose()
@@ -0,0 +1,110 @@
+"""
+getdaytrends - X API Rate-Limit Scheduler
+
+PerformanceTracker.batch_collect에서 사용하는 응답 헤더 기반 요청 스케줄러.
+고정 sleep 대신 x-rate-limit-remaining / x-rate-limit-reset 헤더로 현재 창(window)의
+남은 쿼터를 추적합니다.
+
+- 쿼터가 남아 있으면 즉시 요청 (청크 동시 실행 수 = min(max_concurrency, remaining))
+- 쿼터 소진 시 reset 시각까지 대기, 대기가 max_wait를 넘으면 RateLimitExhausted
+- 429 응답은 retry-after(없으면 reset 헤더) 시각까지 창을 닫음
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Mapping
+
+_DEFAULT_BLOCK_SECONDS = 60.0  # 429인데 retry-after / reset 헤더가 모두 없을 때
+
+
+class RateLimitExhausted(Exception):
+    """남은 쿼터가 없고 reset까지 max_wait보다 오래 기다려야 함."""
+
+    def __init__(self, wait_seconds: float):
+        super().__init__(f"rate limit exhausted, reset in {wait_seconds:.0f}s")
+        self.wait_seconds = wait_seconds
+
+
+def _header_number(headers: Mapping[str, str], name: str) -> float | None:
+    raw = headers.get(name)
+    if raw is None:
+        return None
+    try:
+        return float(raw)
+    except ValueError:
+        return None
+
+
+class RateLimitScheduler:
+    """앱 단위 X API 쿼터 추적기. 트래커 인스턴스당 1개를 두고 여러 수집 호출이 공유.
+
+    remaining이 None이면 아직 헤더를 보지 못한 상태 → 요청을 막지 않는다.
+    acquire()는 await 없이 확인·차감하므로 같은 이벤트 루프 안에서는 락이 필요 없다.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_wait: float = 900.0,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        self.max_wait = max_wait
+        self.remaining: int | None = None
+        self.limit: int | None = None
+        self.reset_at = 0.0  # epoch seconds (x-rate-limit-reset)
+        self._clock = clock
+        self._sleep = sleep
+
+    def concurrency(self, max_concurrency: int) -> int:
+        """남은 쿼터 기준 동시 실행 가능한 요청 수 (최소 1)."""
+        if self.remaining is None:
+            return 1
+        return max(1, min(max_concurrency, self.remaining))
+
+    async def acquire(self) -> None:
+        """요청 1건분 쿼터 예약. 창이 닫혀 있으면 reset까지 대기."""
+        while True:
+            now = self._clock()
+            if self.remaining is not None and self.reset_at and now >= self.reset_at:
+                # 창이 지났으면 다음 응답 헤더를 볼 때까지 쿼터 미상
+                self.remaining = None
+            if self.remaining is None:
+                return
+            if self.remaining > 0:
+                self.remaining -= 1
+                return
+            wait = self.reset_at - now
+            if wait > self.max_wait:
+                raise RateLimitExhausted(wait)
+            await self._sleep(max(wait, 0.0))
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """응답 헤더로 쿼터 상태 갱신."""
+        remaining = _header_number(headers, "x-rate-limit-remaining")
+        reset = _header_number(headers, "x-rate-limit-reset")
+        limit = _header_number(headers, "x-rate-limit-limit")
+        if limit is not None:
+            self.limit = int(limit)
+
+        if remaining is not None:
+            if reset is not None and reset > self.reset_at:
+                # 새 창: 서버 값을 그대로 신뢰
+                self.remaining = int(remaining)
+            elif self.remaining is None:
+                self.remaining = int(remaining)
+            else:
+                # 같은 창의 늦게 도착한 응답: 이미 예약한 몫을 되돌리지 않는다
+                self.remaining = min(self.remaining, int(remaining))
+        if reset is not None:
+            self.reset_at = max(self.reset_at, reset)
+
+        if status_code == 429:
+            retry_after = _header_number(headers, "retry-after")
+            now = self._clock()
+            if retry_after is not None:
+                # retry-after가 있으면 reset 헤더보다 우선
+                self.reset_at = now + retry_after
+            elif reset is None:
+                self.reset_at = max(self.reset_at, now + _DEFAULT_BLOCK_SECONDS)
+            self.remaining = 0
@@ -35,7 +35,7 @@ class TieredCollectionMixin:
 
     async def collect_early_signal(self, tweet_ids: list[str], tier: str = "1h") -> list[TweetMetrics]:
         """[D] 초기 시그널 수집 (발행 1시간 후). 높은 초기 ER 시 후속 콘텐츠 트리거."""
-        metrics = await self.batch_collect(tweet_ids)
+        metrics = await self.batch_collect(tweet_ids, scope=f"early_{tier}")
         for m in metrics:
             m.collection_tier = tier
         if metrics:
@@ -151,7 +151,7 @@ class TieredCollectionMixin:
                         id_map[x_id] = dict(r)
 
                 if tweet_ids and self.bearer_token:
-                    metrics = await self.batch_collect(tweet_ids)
+                    metrics = await self.batch_collect(tweet_ids, scope=f"tier_{tier}")
                     for m in metrics:
                         m.collection_tier = tier
                         row_info = id_map.get(m.tweet_id, {})
@@ -6,6 +6,8 @@ X/Twitter 게시 트윗의 참여 지표(impressions, likes, retweets, replies,
 """
 
 import asyncio
+import hashlib
+import json
 import os
 import re
 from datetime import UTC, datetime, timedelta
@@ -36,15 +38,19 @@ from perf_models import (  # noqa: F401
     normalize_hook,
     normalize_kick,
 )
+from perf_rate_limit import RateLimitExhausted, RateLimitScheduler
 from perf_tiered import TieredCollectionMixin
 
 # -- X API v2 Constants --
 
 _X_API_BASE = "https://api.twitter.com/2"
 _TWEET_FIELDS = "public_metrics"
-# Rate limit: 300 requests / 15 min (App-level) for GET /2/tweets
-_RATE_LIMIT_DELAY = 1.0  # seconds between batch items (conservative)
+# Rate limit: 300 requests / 15 min (App-level) for GET /2/tweets → 응답 헤더로 추적 (perf_rate_limit)
 _BATCH_CHUNK_SIZE = 100  # X API max IDs per request
+_MAX_CONCURRENT_CHUNKS = 4  # 쿼터가 충분할 때의 청크 동시 요청 상한
+_MAX_CHUNK_ATTEMPTS = 3  # 429 재시도 포함
+_CURSOR_TTL = timedelta(hours=1)  # 이보다 오래된 커서 메트릭은 재수집
+_CURSOR_FIELDS = ("impressions", "likes", "retweets", "replies", "quotes")
 
 
 # -- PerformanceTracker --
@@ -56,9 +62,16 @@ class PerformanceTracker(GoldenReferenceMixin, TrendGenealogyMixin, TieredCollec
     앵글 유형별 가중치를 피드백하는 Phase 3 모듈.
     """
 
-    def __init__(self, db_path: str = "data/getdaytrends.db", bearer_token: str = ""):
+    def __init__(
+        self,
+        db_path: str = "data/getdaytrends.db",
+        bearer_token: str = "",
+        max_concurrency: int = _MAX_CONCURRENT_CHUNKS,
+    ):
         self.db_path = db_path
         self.bearer_token = bearer_token
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate_limiter = RateLimitScheduler()
         self._initialized = False
 
     # -- DB Setup --
@@ -117,10 +130,136 @@ class PerformanceTracker(GoldenReferenceMixin, TrendGenealogyMixin, TieredCollec
             log.error(f"X API 요청 자체 실패: tweet_id={tweet_id} - {type(e).__name__}: {e}")
             return None
 
-    async def batch_collect(self, tweet_ids: list[str]) -> list[TweetMetrics]:
-        """여러 트윗의 메트릭을 배치 수집 (Rate Limit 준수).
+    @staticmethod
+    def _parse_tweet_metrics(data: dict) -> TweetMetrics:
+        metrics = data.get("public_metrics", {})
+        tm = TweetMetrics(
+            tweet_id=data["id"],
+            impressions=metrics.get("impression_count", 0),
+            likes=metrics.get("like_count", 0),
+            retweets=metrics.get("retweet_count", 0),
+            replies=metrics.get("reply_count", 0),
+            quotes=metrics.get("quote_count", 0),
+            collected_at=datetime.now(UTC),
+        )
+        tm.compute_engagement_rate()
+        return tm
+
+    async def _fetch_chunk(self, client: httpx.AsyncClient, chunk: list[str]) -> list[TweetMetrics] | None:
+        """청크 1건 요청. 429는 스케줄러가 창을 닫은 뒤 재시도. 실패 시 None.
 
-        X API v2 GET /2/tweets는 1요청당 100건 지원.
+        RateLimitExhausted는 호출 측으로 전파 (남은 청크는 다음 실행에서 커서로 재개).
+        """
+        params = {"ids": ",".join(chunk), "tweet.fields": _TWEET_FIELDS}
+        for _attempt in range(_MAX_CHUNK_ATTEMPTS):
+            await self.rate_limiter.acquire()
+            try:
+                resp = await client.get(f"{_X_API_BASE}/tweets", params=params)
+            except httpx.HTTPError as e:
+                log.error(f"batch_collect 청크 실패 ({chunk[0]}~{chunk[-1]}, {len(chunk)}건): {e}")
+                return None
+            self.rate_limiter.observe(resp.status_code, resp.headers)
+            if resp.status_code == 429:
+                log.warning(f"Rate Limit 감지 - reset까지 대기 후 재시도 ({len(chunk)}건)")
+                continue
+            try:
+                resp.raise_for_status()
+                return [self._parse_tweet_metrics(data) for data in resp.json().get("data", [])]
+            except Exception as e:
+                log.error(f"batch_collect 청크 실패 ({chunk[0]}~{chunk[-1]}, {len(chunk)}건): {e}")
+                return None
+        log.error(f"batch_collect 청크 재시도 초과 ({chunk[0]}~{chunk[-1]}, {len(chunk)}건)")
+        return None
+
+    # -- Collection Resume Cursor --
+
+    @staticmethod
+    def collect_job_id(tweet_ids: list[str], scope: str = "") -> str:
+        """같은 scope + 같은 트윗 집합이면 같은 job → 중단 후 재실행 시 커서 재사용."""
+        digest = hashlib.sha1(",".join(sorted(set(tweet_ids))).encode("utf-8")).hexdigest()[:16]
+        return f"{scope}:{digest}" if scope else digest
+
+    async def _open_cursor(self, job_id: str):
+        """커서 연결 + 이미 수집된 메트릭. 테이블이 없으면 (None, {}) → 커서 없이 수집."""
+        try:
+            conn = await self._get_conn()
+        except Exception as e:
+            log.debug(f"수집 커서 연결 실패 (커서 없이 진행): {e}")
+            return None, {}
+        try:
+            if not await self._table_exists(conn, "metrics_collect_cursor"):
+                await conn.close()
+                return None, {}
+            cutoff = (datetime.now(UTC) - _CURSOR_TTL).isoformat()
+            async with db_transaction(conn):
+                await conn.execute("DELETE FROM metrics_collect_cursor WHERE collected_at < ?", (cutoff,))
+            cursor = await conn.execute(
+                "SELECT tweet_id, payload, collected_at FROM metrics_collect_cursor WHERE job_id = ?",
+                (job_id,),
+            )
+            rows = await cursor.fetchall()
+        except Exception as e:
+            log.debug(f"수집 커서 조회 실패 (커서 없이 진행): {e}")
+            await conn.close()
+            return None, {}
+
+        done: dict[str, TweetMetrics] = {}
+        for row in rows:
+            try:
+                payload = json.loads(row["payload"])
+                tm = TweetMetrics(tweet_id=row["tweet_id"], collected_at=datetime.fromisoformat(row["collected_at"]))
+                for name in _CURSOR_FIELDS:
+                    setattr(tm, name, int(payload.get(name, 0)))
+                tm.compute_engagement_rate()
+                done[tm.tweet_id] = tm
+            except (TypeError, ValueError) as e:
+                log.debug(f"수집 커서 행 무시: {row['tweet_id']} - {e}")
+        return conn, done
+
+    async def _advance_cursor(self, conn, job_id: str, metrics: list[TweetMetrics]) -> None:
+        if conn is None or not metrics:
+            return
+        rows = [
+            (
+                job_id,
+                m.tweet_id,
+                json.dumps({name: getattr(m, name) for name in _CURSOR_FIELDS}),
+                (m.collected_at or datetime.now(UTC)).isoformat(),
+            )
+            for m in metrics
+        ]
+        try:
+            async with db_transaction(conn):
+                await conn.executemany(
+                    """INSERT INTO metrics_collect_cursor (job_id, tweet_id, payload, collected_at)
+                       VALUES (?, ?, ?, ?)
+                       ON CONFLICT(job_id, tweet_id) DO UPDATE SET
+                           payload=excluded.payload,
+                           collected_at=excluded.collected_at""",
+                    rows,
+                )
+        except Exception as e:
+            log.debug(f"수집 커서 기록 실패 (무시): {e}")
+
+    async def _close_cursor(self, conn, job_id: str, *, completed: bool) -> None:
+        if conn is None:
+            return
+        try:
+            if completed:
+                async with db_transaction(conn):
+                    await conn.execute("DELETE FROM metrics_collect_cursor WHERE job_id = ?", (job_id,))
+        except Exception as e:
+            log.debug(f"수집 커서 정리 실패 (TTL로 만료됨): {e}")
+        finally:
+            await conn.close()
+
+    async def batch_collect(self, tweet_ids: list[str], *, scope: str = "") -> list[TweetMetrics]:
+        """여러 트윗의 메트릭을 배치 수집 (Rate Limit 헤더 기반 동시 수집).
+
+        X API v2 GET /2/tweets는 1요청당 100건 지원. 첫 청크로 쿼터 헤더를 확인한 뒤
+        남은 청크를 min(max_concurrency, remaining)개씩 하나의 풀링된 클라이언트로 동시 요청.
+        청크 완료마다 커서(metrics_collect_cursor)에 기록하므로, 중단 후 같은 scope/ID 집합으로
+        다시 호출하면 이미 수집한 트윗은 재요청하지 않는다.
         """
         if not self.bearer_token:
             log.warning("bearer_token 미설정 - batch_collect 건너뜀")
@@ -129,48 +268,56 @@ class PerformanceTracker(GoldenReferenceMixin, TrendGenealogyMixin, TieredCollec
         if not tweet_ids:
             return []
 
-        results: list[TweetMetrics] = []
-        headers = {"Authorization": f"Bearer {self.bearer_token}"}
-
-        for i in range(0, len(tweet_ids), _BATCH_CHUNK_SIZE):
-            chunk = tweet_ids[i : i + _BATCH_CHUNK_SIZE]
-            ids_param = ",".join(chunk)
-            url = f"{_X_API_BASE}/tweets"
-            params = {"ids": ids_param, "tweet.fields": _TWEET_FIELDS}
-
-            try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    resp = await client.get(url, params=params, headers=headers)
-
-                    if resp.status_code == 429:
-                        retry_after = int(resp.headers.get("retry-after", "60"))
-                        log.warning(f"Rate Limit 감지 - {retry_after}초 대기 후 재시도")
-                        await asyncio.sleep(retry_after)
-                        resp = await client.get(url, params=params, headers=headers)
-
-                    resp.raise_for_status()
-                    data_list = resp.json().get("data", [])
-
-                    for data in data_list:
-                        metrics = data.get("public_metrics", {})
-                        tm = TweetMetrics(
-                            tweet_id=data["id"],
-                            impressions=metrics.get("impression_count", 0),
-                            likes=metrics.get("like_count", 0),
-                            retweets=metrics.get("retweet_count", 0),
-                            replies=metrics.get("reply_count", 0),
-                            quotes=metrics.get("quote_count", 0),
-                            collected_at=datetime.now(UTC),
-                        )
-                        tm.compute_engagement_rate()
-                        results.append(tm)
-
-            except Exception as e:
-                log.error(f"batch_collect 청크 실패 (ids {i}~{i+len(chunk)}): {e}")
+        tweet_ids = list(dict.fromkeys(tweet_ids))
+        job_id = self.collect_job_id(tweet_ids, scope)
+        cursor_conn, collected = await self._open_cursor(job_id)
+        if collected:
+            log.info(f"batch_collect 재개: 커서에서 {len(collected)}건 복원 (job={job_id})")
+
+        pending = [tid for tid in tweet_ids if tid not in collected]
+        chunks = [pending[i : i + _BATCH_CHUNK_SIZE] for i in range(0, len(pending), _BATCH_CHUNK_SIZE)]
+        failed = 0
+        exhausted = False
+
+        async def run_chunk(client: httpx.AsyncClient, chunk: list[str]) -> None:
+            nonlocal failed
+            metrics = await self._fetch_chunk(client, chunk)
+            if metrics is None:
+                failed += 1
+                return
+            for m in metrics:
+                collected[m.tweet_id] = m
+            await self._advance_cursor(cursor_conn, job_id, metrics)
+
+        async def worker(client: httpx.AsyncClient, queue: list[list[str]]) -> None:
+            nonlocal exhausted
+            while queue and not exhausted:
+                chunk = queue.pop(0)
+                try:
+                    await run_chunk(client, chunk)
+                except RateLimitExhausted as e:
+                    exhausted = True
+                    queue.insert(0, chunk)
+                    log.warning(f"X API 쿼터 소진 - 남은 청크는 다음 실행에서 재개 ({e})")
 
-            if i + _BATCH_CHUNK_SIZE < len(tweet_ids):
-                await asyncio.sleep(_RATE_LIMIT_DELAY)
+        try:
+            if chunks:
+                headers = {"Authorization": f"Bearer {self.bearer_token}"}
+                limits = httpx.Limits(
+                    max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency
+                )
+                async with httpx.AsyncClient(timeout=30.0, headers=headers, limits=limits) as client:
+                    queue = list(chunks)
+                    # 첫 청크는 단독 요청 → 응답 헤더로 남은 쿼터 확인 후 동시 실행 폭 결정
+                    await worker(client, [queue.pop(0)])
+                    if queue and not exhausted:
+                        width = min(self.rate_limiter.concurrency(self.max_concurrency), len(queue))
+                        await asyncio.gather(*(worker(client, queue) for _ in range(width)))
+                    failed += len(queue)
+        finally:
+            await self._close_cursor(cursor_conn, job_id, completed=not failed and not exhausted)
 
+        results = [collected[tid] for tid in tweet_ids if tid in collected]
         log.info(f"batch_collect 완료: {len(results)}/{len(tweet_ids)} 트윗 수집")
         return results
 
@@ -430,7 +577,7 @@ class PerformanceTracker(GoldenReferenceMixin, TrendGenealogyMixin, TieredCollec
         all_metrics: list[TweetMetrics] = []
         if tweet_id_map and self.bearer_token:
             x_ids = list(tweet_id_map.keys())
-            metrics_list = await self.batch_collect(x_ids)
+            metrics_list = await self.batch_collect(x_ids, scope="cycle")
 
             for m in metrics_list:
                 row_info = tweet_id_map.get(m.tweet_id, {})
@@ -345,7 +345,7 @@ class TestBatchScoreIsolation(unittest.IsolatedAsyncioTestCase):
             acreate=AsyncMock(
                 return_value=SimpleNamespace(
                     text=(
-                        '{'
+                        "{"
                         '"keyword":"trend",'
                         '"publishable":true,'
                         '"volume_last_24h":1200,'
@@ -608,6 +608,137 @@ class TestBatchScoreIsolation(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(results[0].keyword, "trendrepair")
         self.assertGreater(results[0].viral_potential, 0)
 
+    async def test_batch_score_async_uses_prefetched_cache_scores(self):
+        from analyzer import _batch_score_async
+        from db import compute_fingerprint
+
+        trend = RawTrend(name="cachedtrend", source=TrendSource.GETDAYTRENDS, volume="3000", volume_numeric=3000)
+        fp = compute_fingerprint("cachedtrend", 3000, 5000)
+        cached_scores = {
+            fp: {"keyword": "cachedtrend", "viral_potential": 71, "suggested_angles": '["a"]', "top_insight": "hit"}
+        }
+        client = SimpleNamespace(acreate=AsyncMock())
+        lookup = AsyncMock(return_value={})
+
+        with patch("analyzer.get_cached_score_batch", lookup):
+            results = await _batch_score_async(
+                [(trend, MultiSourceContext())],
+                client=client,
+                conn=object(),
+                config=None,
+                bucket=5000,
+                cached_scores=cached_scores,
+            )
+
+        lookup.assert_not_awaited()
+        client.acreate.assert_not_awaited()
+        self.assertEqual(results[0].viral_potential, 71)
+        self.assertEqual(results[0].suggested_angles, ["a"])
+
+
+    async def test_analyze_falls_back_when_score_prefetch_fails(self):
+        from analyzer import _analyze_trends_async
+
+        trend = RawTrend(name="pgdown", source=TrendSource.GETDAYTRENDS, volume="3000", volume_numeric=3000)
+        config = SimpleNamespace(
+            enable_clustering=False,
+            enable_history_correction=False,
+            enable_emerging_detection=False,
+            long_form_min_score=95,
+            country="korea",
+        )
+        batch_score = AsyncMock(return_value=[])
+
+        with (
+            patch("analyzer.get_client", return_value=object()),
+            patch("analyzer.get_category_prototypes", AsyncMock(return_value=None)),
+            patch("analyzer.get_cached_score_batch", AsyncMock(side_effect=RuntimeError("pg down"))),
+            patch("analyzer._batch_score_async", batch_score),
+        ):
+            results = await _analyze_trends_async([trend], {}, config, conn=object())
+
+        self.assertEqual(results, [])
+        batch_score.assert_awaited_once()
+        self.assertIsNone(batch_score.await_args.args[5])
+
+class TestCategoryPrototypes(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        import tempfile
+        from pathlib import Path
+
+        from analysis import category_prototypes
+
+        self.mod = category_prototypes
+        self.mod._MEMO.clear()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self._tmp.name) / "category_prototypes.json"
+
+    def tearDown(self):
+        self.mod._MEMO.clear()
+        self._tmp.cleanup()
+
+    @staticmethod
+    def _one_hot_vectors(texts, task_type="SEMANTIC_SIMILARITY"):
+        size = len(texts)
+        return [[1.0 if i == j else 0.0 for j in range(size)] for i in range(size)]
+
+    def test_classify_picks_nearest_category(self):
+        protos = self.mod.CategoryPrototypes.from_vectors("v", ["a", "b"], [[2.0, 0.0], [0.0, 3.0]])
+        results = protos.classify([[0.9, 0.1], [0.0, 5.0], [0.0, 0.0], [1.0]])
+        self.assertEqual(results[0][0], "a")
+        self.assertAlmostEqual(results[1][1], 1.0)
+        self.assertEqual(results[2], ("", 0.0))
+        self.assertEqual(results[3], ("", 0.0))
+
+    def test_classify_batch_matches_per_row_cosine(self):
+        import math
+
+        vectors = [[1.0, 2.0, 0.5], [-1.0, 0.0, 4.0], [3.0, 3.0, 3.0]]
+        protos = self.mod.CategoryPrototypes.from_vectors("v", ["a", "b", "c"], vectors)
+        batch = [[0.2, 1.0, 0.1], [], [0.0, 0.0, 0.0], [5.0, -1.0, 2.0], [1.0, 2.0]]
+
+        def cosine(u, v):
+            return sum(x * y for x, y in zip(u, v, strict=True)) / (math.hypot(*u) * math.hypot(*v))
+
+        results = protos.classify(batch)
+        self.assertEqual(results[1:3], [("", 0.0), ("", 0.0)])
+        self.assertEqual(results[4], ("", 0.0))
+        for row in (0, 3):
+            expected = max(zip("abc", (cosine(batch[row], v) for v in vectors), strict=True), key=lambda p: p[1])
+            self.assertEqual(results[row][0], expected[0])
+            self.assertAlmostEqual(results[row][1], expected[1])
+        self.assertEqual(protos.classify([]), [])
+
+    async def test_prototypes_embedded_once_and_persisted(self):
+        embed = AsyncMock(side_effect=self._one_hot_vectors)
+        with patch("shared.embeddings.embed_texts_async", embed):
+            first = await self.mod.get_category_prototypes(self.cache_path)
+            second = await self.mod.get_category_prototypes(self.cache_path)
+            self.mod._MEMO.clear()
+            reloaded = await self.mod.get_category_prototypes(self.cache_path)
+
+        self.assertEqual(embed.await_count, 1)
+        self.assertIs(first, second)
+        self.assertTrue(self.cache_path.exists())
+        self.assertEqual(reloaded, first)
+        self.assertEqual(list(reloaded.categories), list(self.mod.CATEGORY_REFS))
+
+    async def test_version_change_recomputes(self):
+        embed = AsyncMock(side_effect=self._one_hot_vectors)
+        with patch("shared.embeddings.embed_texts_async", embed):
+            await self.mod.get_category_prototypes(self.cache_path)
+            self.mod._MEMO.clear()
+            with patch.object(self.mod, "prototype_version", return_value="other-model"):
+                protos = await self.mod.get_category_prototypes(self.cache_path)
+
+        self.assertEqual(embed.await_count, 2)
+        self.assertEqual(protos.version, "other-model")
+
+    async def test_embedding_unavailable_returns_none(self):
+        with patch("shared.embeddings.embed_texts_async", AsyncMock(return_value=None)):
+            self.assertIsNone(await self.mod.get_category_prototypes(self.cache_path))
+        self.assertFalse(self.cache_path.exists())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,7 +4,6 @@ import importlib.util
 import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import uuid4
 
 import pytest
 
@@ -58,12 +57,9 @@ def client(mock_db_conn):
 
 
 @pytest.fixture
-def local_tmp_path():
-    base_dir = Path.cwd() / "getdaytrends" / ".smoke-tmp" / "pytest-dashboard"
-    base_dir.mkdir(parents=True, exist_ok=True)
-    tmp_dir = base_dir / f"dashboard-{uuid4().hex}"
-    tmp_dir.mkdir(parents=True, exist_ok=True)
-    yield tmp_dir
+def local_tmp_path(tmp_path):
+    # 소스 트리 대신 conftest의 tmp_path(테스트 후 정리됨)에 기록
+    return tmp_path
 
 
 class TestExistingEndpoints:
@@ -156,15 +152,16 @@ class TestDashboardEnhancements:
         base_dir.mkdir(parents=True)
         (base_dir / "tweet_bot.log").write_text("line-1\nline-2\nline-3\n", encoding="utf-8")
 
-        mock_http_client = AsyncMock()
-        mock_http_client.get.side_effect = RuntimeError("loki unavailable")
-
-        with patch("dashboard._config") as mock_config, patch("dashboard.httpx.AsyncClient") as mock_client_cls:
+        with (
+            patch("dashboard._config") as mock_config,
+            patch("dashboard._loki_probe.query_logs", AsyncMock(return_value=None)) as mock_query,
+        ):
             mock_config.base_dir = base_dir
-            mock_client_cls.return_value.__aenter__.return_value = mock_http_client
 
             resp = client.get("/api/logs?limit=2")
 
+        mock_query.assert_awaited_once()
+
         assert resp.status_code == 200
         assert resp.json() == {"logs": ["line-2", "line-3"], "source": "local"}
 
@@ -1088,3 +1085,185 @@ class TestTapOpportunities:
         }
         mock_record.assert_not_awaited()
 
+
+
+class TestLogTail:
+    """log_tail helpers behind /api/logs and /api/logs/stream."""
+
+    def test_tail_lines_reads_only_trailing_blocks(self, tmp_path):
+        from log_tail import tail_lines
+
+        log_path = tmp_path / "big.log"
+        log_path.write_text("".join(f"line-{i}\n" for i in range(5000)), encoding="utf-8")
+
+        assert tail_lines(log_path, 3, block_size=16) == ["line-4997", "line-4998", "line-4999"]
+        assert tail_lines(log_path, 1) == ["line-4999"]
+        assert tail_lines(log_path, 0) == []
+
+    def test_tail_lines_matches_readlines_semantics(self, tmp_path):
+        from log_tail import tail_lines
+
+        log_path = tmp_path / "mixed.log"
+        content = "첫 줄\n\n  padded  \nno-newline-at-end"
+        log_path.write_text(content, encoding="utf-8")
+        expected = [line.strip() for line in content.splitlines(True)]
+
+        for limit in (1, 2, 3, 4, 10):
+            for block_size in (1, 3, 7, 8192):
+                assert tail_lines(log_path, limit, block_size=block_size) == expected[-limit:]
+
+    @pytest.mark.asyncio
+    async def test_follow_lines_yields_appended_lines_and_survives_truncate(self, tmp_path):
+        import asyncio
+
+        from log_tail import follow_lines
+
+        log_path = tmp_path / "follow.log"
+        log_path.write_text("old\n", encoding="utf-8")
+        lines = follow_lines(log_path, poll_interval=0.01)
+
+        async def next_line():
+            return await asyncio.wait_for(anext(lines), timeout=2)
+
+        first = asyncio.ensure_future(next_line())
+        await asyncio.sleep(0.05)
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write("new-1\npart")
+        assert await first == "new-1"
+
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write("ial\n")
+        assert await next_line() == "partial"
+
+        log_path.write_text("after-truncate\n", encoding="utf-8")
+        assert await next_line() == "after-truncate"
+        await lines.aclose()
+
+    @pytest.mark.asyncio
+    async def test_follow_lines_emits_heartbeat_when_idle(self, tmp_path):
+        import asyncio
+
+        from log_tail import follow_lines
+
+        log_path = tmp_path / "idle.log"
+        log_path.write_text("", encoding="utf-8")
+        lines = follow_lines(log_path, poll_interval=0.01, heartbeat=0.05)
+
+        assert await asyncio.wait_for(anext(lines), timeout=2) == ""
+        await lines.aclose()
+
+    @pytest.mark.asyncio
+    async def test_loki_probe_caches_unavailability(self):
+        import httpx
+        from log_tail import LokiProbe
+
+        calls = 0
+
+        def handler(request):
+            nonlocal calls
+            calls += 1
+            return httpx.Response(503)
+
+        probe = LokiProbe("http://loki.test", down_ttl=60)
+        probe._get_client()
+        probe._client = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url=probe.base_url)
+
+        assert await probe.query_logs('{job="x"}', 10) is None
+        assert await probe.query_logs('{job="x"}', 10) is None
+        assert calls == 1
+        await probe.aclose()
+
+    @pytest.mark.asyncio
+    async def test_loki_probe_returns_values_and_reuses_client(self):
+        import httpx
+        from log_tail import LokiProbe
+
+        def handler(request):
+            assert request.url.path == "/loki/api/v1/query"
+            return httpx.Response(
+                200, json={"data": {"result": [{"values": [["1", "a"], ["2", "b"], ["3", "c"]]}]}}
+            )
+
+        probe = LokiProbe("http://loki.test")
+        probe._get_client()
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url=probe.base_url)
+        probe._client = client
+
+        assert await probe.query_logs('{job="x"}', 2) == ["b", "c"]
+        assert await probe.query_logs('{job="x"}', 2) == ["b", "c"]
+        assert probe._client is client
+        await probe.aclose()
+
+    @pytest.mark.asyncio
+    async def test_loki_probe_treats_non_json_body_as_unavailable(self):
+        import httpx
+        from log_tail import LokiProbe
+
+        def handler(request):
+            return httpx.Response(200, content=b'{"data": {"result": [')
+
+        probe = LokiProbe("http://loki.test", down_ttl=60)
+        probe._get_client()
+        probe._client = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url=probe.base_url)
+
+        assert await probe.query_logs('{job="x"}', 10) is None
+        assert probe.should_try() is False
+        await probe.aclose()
+
+    def test_app_shutdown_closes_loki_client(self):
+        from fastapi.testclient import TestClient
+
+        import dashboard
+
+        with patch.object(dashboard._loki_probe, "aclose", AsyncMock()) as mock_aclose, TestClient(dashboard.app):
+            mock_aclose.assert_not_awaited()
+        mock_aclose.assert_awaited_once()
+
+    def test_logs_endpoint_skips_loki_while_marked_down(self, client, local_tmp_path):
+        import dashboard
+
+        base_dir = local_tmp_path / "getdaytrends"
+        base_dir.mkdir(parents=True)
+        (base_dir / "tweet_bot.log").write_text("a\nb\n", encoding="utf-8")
+
+        probe = dashboard._loki_probe
+        with patch("dashboard._config") as mock_config, patch.object(probe, "should_try", return_value=False), \
+             patch.object(probe, "_get_client") as mock_get_client:
+            mock_config.base_dir = base_dir
+            resp = client.get("/api/logs?limit=5")
+
+        assert resp.json() == {"logs": ["a", "b"], "source": "local"}
+        mock_get_client.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_logs_stream_sends_backlog_then_follows(self, local_tmp_path):
+        import asyncio
+
+        import dashboard
+
+        base_dir = local_tmp_path / "getdaytrends"
+        base_dir.mkdir(parents=True)
+        log_path = base_dir / "tweet_bot.log"
+        log_path.write_text("one\ntwo\nthree\n", encoding="utf-8")
+
+        request = MagicMock()
+        request.is_disconnected = AsyncMock(return_value=False)
+        with patch("dashboard._config") as mock_config:
+            mock_config.base_dir = base_dir
+            resp = await dashboard.api_logs_stream(request, backlog=2, poll_interval=0.1)
+
+        assert resp.media_type == "text/event-stream"
+        body = resp.body_iterator
+
+        async def next_event():
+            return await asyncio.wait_for(anext(body), timeout=2)
+
+        assert await next_event() == "data: two\n\n"
+        assert await next_event() == "data: three\n\n"
+
+        pending = asyncio.ensure_future(next_event())
+        await asyncio.sleep(0.2)
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write("four\n")
+        assert await pending == "data: four\n\n"
+        await body.aclose()
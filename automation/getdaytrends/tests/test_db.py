@@ -15,6 +15,7 @@ from db import (
     enqueue_tap_alerts,
     get_cached_content,
     get_cached_score,
+    get_cached_score_batch,
     get_tap_alert_delivery_batch,
     get_tap_alert_queue_snapshot,
     get_tap_checkout_session_summary,
@@ -26,6 +27,7 @@ from db import (
     get_trend_stats,
     init_db,
     is_duplicate_trend,
+    is_duplicate_trend_batch,
     mark_tweet_posted,
     mark_tap_checkout_session_completed,
     record_tap_deal_room_event,
@@ -651,6 +653,39 @@ class TestSaveTweet(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(row["content_type"], "long")
 
 
+class TestTrendOutbox(unittest.IsolatedAsyncioTestCase):
+    """trend_outbox 변경 피드 (v12 트리거)."""
+
+    async def asyncSetUp(self):
+        self.conn = await aiosqlite.connect(":memory:")
+        self.conn.row_factory = aiosqlite.Row
+        await init_db(self.conn)
+        run = RunResult(run_id="outbox-test")
+        self.run_id = await save_run(self.conn, run)
+
+    async def asyncTearDown(self):
+        await self.conn.close()
+
+    async def _outbox(self) -> list[tuple[int, int]]:
+        cursor = await self.conn.execute("SELECT seq, trend_id FROM trend_outbox ORDER BY seq")
+        return [(row["seq"], row["trend_id"]) for row in await cursor.fetchall()]
+
+    @pytest.mark.asyncio
+    async def test_save_trend_and_tweet_metrics_append_to_outbox(self):
+        trend = ScoredTrend(keyword="outbox", rank=1, sources=[TrendSource.GETDAYTRENDS])
+        trend_id = await save_trend(self.conn, trend, self.run_id)
+        await self.conn.commit()
+        self.assertEqual([tid for _, tid in await self._outbox()], [trend_id])
+
+        tweet = GeneratedTweet(tweet_type="공감 유도형", content="outbox tweet")
+        tweet_id = await save_tweet(self.conn, tweet, trend_id, self.run_id)
+        await sync_tweet_metrics(self.conn, tweet_row_id=tweet_id, impressions=100, engagement_rate=0.1)
+
+        outbox = await self._outbox()
+        self.assertEqual([tid for _, tid in outbox], [trend_id] * 3)
+        self.assertEqual([seq for seq, _ in outbox], sorted(seq for seq, _ in outbox))
+
+
 class TestSaveThread(unittest.IsolatedAsyncioTestCase):
     """쓰레드 저장."""
 
@@ -944,6 +979,7 @@ class TestParallelSQLiteWrites(unittest.IsolatedAsyncioTestCase):
 class _FakeCache:
     def __init__(self):
         self.store = {}
+        self.round_trips = 0
 
     async def get(self, key):
         return self.store.get(key)
@@ -954,6 +990,18 @@ class _FakeCache:
     async def exists(self, key):
         return key in self.store
 
+    async def mget(self, keys):
+        self.round_trips += 1
+        return [self.store.get(key) for key in keys]
+
+    async def exists_many(self, keys):
+        self.round_trips += 1
+        return [key in self.store for key in keys]
+
+    async def set_many(self, items, ttl=60):
+        self.round_trips += 1
+        self.store.update(items)
+
 
 class TestSharedCacheIntegration(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
@@ -1036,6 +1084,85 @@ class TestSharedCacheIntegration(unittest.IsolatedAsyncioTestCase):
         second = await get_cached_content(self.conn, fingerprint)
         self.assertEqual(second, first)
 
+    @pytest.mark.asyncio
+    async def test_get_cached_score_batch_one_round_trip_each(self):
+        fingerprints = []
+        for i in range(50):
+            trend = ScoredTrend(
+                keyword=f"batch-{i}",
+                rank=1,
+                volume_last_24h=10000 * (i + 1),
+                viral_potential=50 + i % 40,
+                sources=[TrendSource.GETDAYTRENDS],
+            )
+            await save_trend(self.conn, trend, self.run_id)
+            fingerprints.append(compute_fingerprint(trend.keyword, trend.volume_last_24h))
+        await self.conn.commit()
+        fingerprints.append(compute_fingerprint("never-scored", 1000))
+
+        statements = []
+        await self.conn.set_trace_callback(statements.append)
+        first = await get_cached_score_batch(self.conn, fingerprints)
+        await self.conn.set_trace_callback(None)
+
+        self.assertEqual(len(first), 50)
+        self.assertEqual(first[fingerprints[3]]["keyword"], "batch-3")
+        self.assertEqual(first[fingerprints[3]], await get_cached_score(self.conn, fingerprints[3]))
+        self.assertEqual(len([q for q in statements if q.lstrip().upper().startswith("SELECT")]), 1)
+        self.assertEqual(self.cache.round_trips, 2)  # MGET + pipelined SET
+
+        await self.conn.execute("DELETE FROM trends")
+        await self.conn.commit()
+        second = await get_cached_score_batch(self.conn, fingerprints)
+        self.assertEqual(second, first)
+
+    @pytest.mark.asyncio
+    async def test_get_cached_score_batch_ignores_corrupted_cache_entries(self):
+        trend = ScoredTrend(keyword="batch-corrupt", rank=1, volume_last_24h=30000, sources=[TrendSource.GETDAYTRENDS])
+        await save_trend(self.conn, trend, self.run_id)
+        fingerprint = compute_fingerprint("batch-corrupt", 30000)
+        self.cache.store[f"gdt:score:{fingerprint}"] = "not-a-dict"
+
+        result = await get_cached_score_batch(self.conn, [fingerprint])
+
+        self.assertEqual(result[fingerprint]["keyword"], "batch-corrupt")
+
+    @pytest.mark.asyncio
+    async def test_is_duplicate_trend_batch_matches_single_lookup(self):
+        trend = ScoredTrend(keyword="dup-db", rank=1, volume_last_24h=20000, sources=[TrendSource.GETDAYTRENDS])
+        await save_trend(self.conn, trend, self.run_id)
+        await self.conn.commit()
+        cached_fp = compute_fingerprint("dup-cache", 12000)
+        self.cache.store[f"gdt:dedup:{cached_fp}"] = True
+        db_fp = compute_fingerprint("dup-db", 20000)
+        fresh_fp = compute_fingerprint("fresh", 5000)
+
+        result = await is_duplicate_trend_batch(self.conn, [cached_fp, db_fp, fresh_fp, db_fp])
+
+        self.assertEqual(result, {cached_fp: True, db_fp: True, fresh_fp: False})
+        self.assertIn(f"gdt:dedup:{db_fp}", self.cache.store)
+        self.assertEqual(result[db_fp], await is_duplicate_trend(self.conn, "dup-db", 20000))
+
+    @pytest.mark.asyncio
+    async def test_batch_lookups_fall_back_to_db_when_redis_fails(self):
+        trend = ScoredTrend(keyword="redis-down", rank=1, volume_last_24h=40000, sources=[TrendSource.GETDAYTRENDS])
+        await save_trend(self.conn, trend, self.run_id)
+        await self.conn.commit()
+        fingerprint = compute_fingerprint("redis-down", 40000)
+
+        async def _down(*_args, **_kwargs):
+            raise ConnectionError("Redis down")
+
+        self.cache.mget = _down
+        self.cache.exists_many = _down
+
+        scores = await get_cached_score_batch(self.conn, [fingerprint])
+        dups = await is_duplicate_trend_batch(self.conn, [fingerprint])
+
+        self.assertEqual(scores[fingerprint]["keyword"], "redis-down")
+        self.assertEqual(dups, {fingerprint: True})
+        self.assertNotIn(f"gdt:score:{fingerprint}", self.cache.store)
+
 
 if __name__ == "__main__":
     unittest.main()
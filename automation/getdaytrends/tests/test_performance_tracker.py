@@ -1,10 +1,16 @@
+import asyncio
 import os
 import tempfile
+import time
 from collections.abc import Generator
 from datetime import UTC, datetime
 
+import httpx
 import pytest
 import pytest_asyncio
+from db_layer.migrations import _migrate_v13
+from perf_rate_limit import RateLimitExhausted, RateLimitScheduler
+
 respx = pytest.importorskip("respx")
 
 from perf_models import ANGLE_TYPES, GoldenReference, HOOK_PATTERNS, KICK_PATTERNS, TweetMetrics
@@ -307,3 +313,182 @@ async def test_golden_reference_reads_and_writes_skip_when_table_missing(temp_db
     )
 
     assert await tracker.get_golden_references(limit=3) == []
+
+
+# -- Rate-aware batch_collect (로컬 스텁이 x-rate-limit-* 헤더를 내보냄) --
+
+
+def _tweet_ids(count: int, start: int = 1000000000) -> list[str]:
+    return [str(start + i) for i in range(count)]
+
+
+class _XApiStub:
+    """GET /2/tweets 스텁. 요청별 ids 기록 + rate-limit 헤더 + 동시 요청 수 측정."""
+
+    def __init__(self, remaining: int = 50, reset_in: int = 900, fail_ids: set[str] | None = None):
+        self.remaining = remaining
+        self.reset_at = int(time.time()) + reset_in
+        self.fail_ids = fail_ids or set()
+        self.requested: list[list[str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.throttle_once = False
+
+    def headers(self) -> dict[str, str]:
+        return {
+            "x-rate-limit-limit": "300",
+            "x-rate-limit-remaining": str(self.remaining),
+            "x-rate-limit-reset": str(self.reset_at),
+        }
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        ids = request.url.params["ids"].split(",")
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        if self.throttle_once:
+            self.throttle_once = False
+            return httpx.Response(429, headers={**self.headers(), "retry-after": "0"})
+        self.requested.append(ids)
+        self.remaining = max(0, self.remaining - 1)
+        if self.fail_ids & set(ids):
+            return httpx.Response(503, headers=self.headers())
+        data = [
+            {"id": tid, "public_metrics": {"impression_count": 100, "like_count": 3, "retweet_count": 1}}
+            for tid in ids
+        ]
+        return httpx.Response(200, json={"data": data}, headers=self.headers())
+
+
+async def _enable_cursor(tracker: PerformanceTracker) -> None:
+    conn = await tracker._get_conn()
+    await _migrate_v13(conn)
+    await conn.close()
+
+
+async def _cursor_rows(tracker: PerformanceTracker) -> int:
+    conn = await tracker._get_conn()
+    cursor = await conn.execute("SELECT COUNT(*) AS cnt FROM metrics_collect_cursor")
+    row = await cursor.fetchone()
+    await conn.close()
+    return row["cnt"]
+
+
+def test_rate_limit_scheduler_tracks_headers_and_waits_for_reset() -> None:
+    now = [1000.0]
+    slept: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        slept.append(seconds)
+        now[0] += seconds
+
+    limiter = RateLimitScheduler(max_wait=60, clock=lambda: now[0], sleep=fake_sleep)
+    assert limiter.concurrency(4) == 1  # 헤더를 보기 전에는 단독 요청
+
+    limiter.observe(200, {"x-rate-limit-remaining": "2", "x-rate-limit-reset": "1030"})
+    assert limiter.concurrency(4) == 2
+
+    async def drain() -> None:
+        await limiter.acquire()
+        await limiter.acquire()
+        await limiter.acquire()  # 쿼터 소진 → reset까지 대기 후 통과
+
+    asyncio.run(drain())
+    assert slept == [30.0]
+
+    limiter.observe(200, {"x-rate-limit-remaining": "0", "x-rate-limit-reset": str(int(now[0]) + 600)})
+    with pytest.raises(RateLimitExhausted):
+        asyncio.run(limiter.acquire())
+
+
+def test_rate_limit_scheduler_429_closes_window_for_retry_after() -> None:
+    now = [1000.0]
+    limiter = RateLimitScheduler(clock=lambda: now[0])
+    limiter.observe(200, {"x-rate-limit-remaining": "10", "x-rate-limit-reset": "1900"})
+    limiter.observe(429, {"x-rate-limit-remaining": "0", "x-rate-limit-reset": "1900", "retry-after": "5"})
+    assert limiter.remaining == 0
+    assert limiter.reset_at == 1005
+    assert limiter.concurrency(4) == 1
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_batch_collect_runs_chunks_concurrently_within_quota(tracker: PerformanceTracker) -> None:
+    stub = _XApiStub(remaining=50)
+    respx.get("https://api.twitter.com/2/tweets").mock(side_effect=stub)
+    ids = _tweet_ids(450)
+
+    result = await tracker.batch_collect(ids)
+
+    assert [m.tweet_id for m in result] == ids
+    assert len(stub.requested) == 5
+    assert 1 < stub.max_in_flight <= tracker.max_concurrency
+    assert tracker.rate_limiter.remaining == 45
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_batch_collect_concurrency_limited_by_remaining_quota(tracker: PerformanceTracker) -> None:
+    stub = _XApiStub(remaining=3)
+    respx.get("https://api.twitter.com/2/tweets").mock(side_effect=stub)
+
+    result = await tracker.batch_collect(_tweet_ids(300))
+
+    assert len(result) == 300
+    assert stub.max_in_flight == 2  # 첫 응답 후 remaining=2 → 동시 2개
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_batch_collect_retries_after_429(tracker: PerformanceTracker) -> None:
+    stub = _XApiStub()
+    stub.throttle_once = True
+    respx.get("https://api.twitter.com/2/tweets").mock(side_effect=stub)
+
+    result = await tracker.batch_collect(_tweet_ids(3))
+
+    assert len(result) == 3
+    assert result[0].impressions == 100
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_batch_collect_resumes_from_cursor(tracker: PerformanceTracker) -> None:
+    await _enable_cursor(tracker)
+    ids = _tweet_ids(250)
+    failing = _XApiStub(fail_ids={ids[120]})
+    respx.get("https://api.twitter.com/2/tweets").mock(side_effect=failing)
+
+    first = await tracker.batch_collect(ids, scope="tier_1h")
+    assert len(first) == 150  # 두 번째 청크(100~199) 실패
+    assert await _cursor_rows(tracker) == 150
+
+    respx.reset()
+    stub = _XApiStub()
+    respx.get("https://api.twitter.com/2/tweets").mock(side_effect=stub)
+
+    second = await tracker.batch_collect(list(reversed(ids)), scope="tier_1h")
+
+    assert [sorted(chunk) for chunk in stub.requested] == [ids[100:200]]  # 이미 수집한 트윗은 재요청하지 않음
+    assert {m.tweet_id for m in second} == set(ids)
+    restored = next(m for m in second if m.tweet_id == ids[0])
+    assert restored.impressions == 100 and restored.engagement_rate == pytest.approx(0.04)
+    assert await _cursor_rows(tracker) == 0  # 완료된 job은 커서 삭제
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_batch_collect_stops_when_quota_exhausted_and_keeps_cursor(tracker: PerformanceTracker) -> None:
+    await _enable_cursor(tracker)
+    tracker.rate_limiter.max_wait = 5
+    stub = _XApiStub(remaining=1)
+    respx.get("https://api.twitter.com/2/tweets").mock(side_effect=stub)
+
+    result = await tracker.batch_collect(_tweet_ids(300))
+
+    assert len(result) == 100
+    assert len(stub.requested) == 1
+    assert await _cursor_rows(tracker) == 100
@@ -189,5 +189,112 @@ class TestGoogleTrendsRssResilience(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(trends, [])
 
 
+_GDT_HTML = """
+<html><body>
+<table class="trends"><tbody>
+  <tr><td class="main"><a href="/korea/trend/%23BTS/">#BTS</a><div class="desc">125K tweets</div></td></tr>
+  <tr><td class="main"><a href="https://example.com/x"> 날씨 </a></td></tr>
+  <tr><td class="main">no link</td></tr>
+  <tr><td class="main"><a href="/korea/trend/AI/">AI</a><div class="desc">Under 10K tweets</div></td></tr>
+</tbody></table>
+</body></html>
+"""
+
+
+class TestParseGetdaytrendsHtml(unittest.TestCase):
+    def test_backends_agree(self):
+        from collectors.sources import _parse_getdaytrends_html
+
+        results = {
+            backend: [(t.name, t.volume, t.link) for t in _parse_getdaytrends_html(_GDT_HTML, "korea", 10, backend)]
+            for backend in ("selectolax", "lxml", "html.parser")
+        }
+        self.assertEqual(
+            results["html.parser"],
+            [
+                ("BTS", "125K tweets", "https://getdaytrends.com/korea/trend/%23BTS/"),
+                ("날씨", "N/A", "https://example.com/x"),
+                ("AI", "Under 10K tweets", "https://getdaytrends.com/korea/trend/AI/"),
+            ],
+        )
+        self.assertEqual(results["selectolax"], results["html.parser"])
+        self.assertEqual(results["lxml"], results["html.parser"])
+
+    def test_limit_applied(self):
+        from collectors.sources import _parse_getdaytrends_html
+
+        self.assertEqual(len(_parse_getdaytrends_html(_GDT_HTML, "korea", 2)), 2)
+
+
+class TestGetdaytrendsDiskCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        import tempfile
+        from pathlib import Path
+
+        from collectors import sources
+        from collectors.fetch_cache import FetchCache
+
+        self.sources = sources
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = FetchCache(Path(self._tmp.name) / "fetch_cache.db")
+        self._orig_disk = sources._DISK_CACHE
+        sources._DISK_CACHE = self.cache
+        sources._FETCH_CACHE.clear()
+        self.url = "https://getdaytrends.com/korea/"
+
+    def tearDown(self):
+        self.sources._DISK_CACHE = self._orig_disk
+        self.sources._FETCH_CACHE.clear()
+        self._tmp.cleanup()
+
+    def _session(self, *responses):
+        request = httpx.Request("GET", self.url)
+        session = MagicMock()
+        session.get = AsyncMock(
+            side_effect=[
+                httpx.Response(status, text=text, headers=headers, request=request)
+                for status, text, headers in responses
+            ]
+        )
+        return session
+
+    def _expire(self):
+        import sqlite3
+
+        conn = sqlite3.connect(str(self.cache.path))
+        with conn:
+            conn.execute("UPDATE http_cache SET fetched_at = fetched_at - ?", (_FETCH_CACHE_TTL + 1,))
+        conn.close()
+
+    async def test_survives_restart_and_revalidates_with_etag(self):
+        session = self._session((200, _GDT_HTML, {"ETag": '"v1"'}), (304, "", {}))
+
+        first = await self.sources._async_fetch_getdaytrends(session, "korea", limit=10)
+        self.assertEqual([t.name for t in first], ["BTS", "날씨", "AI"])
+        self.assertEqual(self.cache.get(self.url).etag, '"v1"')
+
+        # 재시작 (메모리 캐시 소실) — TTL 이내면 네트워크 없이 디스크 본문 사용
+        self.sources._FETCH_CACHE.clear()
+        second = await self.sources._async_fetch_getdaytrends(session, "korea", limit=10)
+        self.assertEqual([t.name for t in second], ["BTS", "날씨", "AI"])
+        self.assertEqual(session.get.await_count, 1)
+
+        # TTL 경과 — 조건부 GET, 304면 저장 본문 재사용 + 신선도 갱신
+        self.sources._FETCH_CACHE.clear()
+        self._expire()
+        third = await self.sources._async_fetch_getdaytrends(session, "korea", limit=10)
+        self.assertEqual([t.name for t in third], ["BTS", "날씨", "AI"])
+        self.assertEqual(session.get.await_args.kwargs["headers"]["If-None-Match"], '"v1"')
+        self.assertLess(self.cache.get(self.url).age(), _FETCH_CACHE_TTL)
+
+    async def test_unparseable_page_is_not_cached(self):
+        session = self._session((200, "<html>blocked</html>", {"ETag": '"x"'}))
+
+        trends = await self.sources._async_fetch_getdaytrends(session, "korea", limit=10)
+
+        self.assertEqual([t.name for t in trends], [t.name for t in self.sources._fallback_trends()])
+        self.assertIsNone(self.cache.get(self.url))
+
+
 if __name__ == "__main__":
     unittest.main()
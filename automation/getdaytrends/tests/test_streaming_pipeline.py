@@ -432,6 +432,177 @@ def test_pipeline_event_complete_with_error():
     assert event.result is None
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+#  Adaptive concurrency — 시뮬레이션 백엔드
+# ══════════════════════════════════════════════════════════════════════════════
+
+AdaptiveConcurrencyLimiter = _mod.AdaptiveConcurrencyLimiter
+classify_failure = _mod.classify_failure
+
+
+class _RateLimited(Exception):
+    status_code = 429
+
+
+class _SimulatedBackend:
+    """스크립트된 지연을 내는 LLM 백엔드. capacity 초과 동시 호출은 429."""
+
+    def __init__(self, latency_for_call, capacity: int | None = None):
+        self._latency_for_call = latency_for_call
+        self.capacity = capacity
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self.rate_limited = 0
+
+    async def generate(self, scored_trend):
+        call = self.calls
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            if self.capacity is not None and self.active > self.capacity:
+                self.rate_limited += 1
+                raise _RateLimited("429 Too Many Requests")
+            await asyncio.sleep(self._latency_for_call(call))
+            return FakeBatch(topic=scored_trend.name)
+        finally:
+            self.active -= 1
+
+
+def _adaptive_pipeline(limiter):
+    sp = StreamingPipeline(_FakeConfig(), _FakeConn(), limiter=limiter)
+    sp.STAGE_TIMEOUT_SECONDS = 5
+    return sp
+
+
+def test_classify_failure_signals():
+    assert classify_failure(TimeoutError()) == "overload"
+    assert classify_failure(_RateLimited()) == "overload"
+    assert classify_failure(RuntimeError("HTTP 429 from provider")) == "overload"
+    assert classify_failure(ValueError("bad json")) == "error"
+    assert classify_failure(RuntimeError("Error code: 429 - rate limited")) == "overload"
+    assert classify_failure(RuntimeError("429 Too Many Requests")) == "overload"
+    # 429가 들어간 ID·토큰 수 등은 상태 코드가 아님
+    assert classify_failure(RuntimeError("request id 14290 failed")) == "error"
+    assert classify_failure(ValueError("context length 4290 exceeded")) == "error"
+    assert classify_failure(RuntimeError("HTTP 500 at offset 429")) == "error"
+
+
+@pytest.mark.asyncio
+async def test_limiter_additive_increase_only_when_saturated():
+    limiter = AdaptiveConcurrencyLimiter(2, max_limit=4, window=3, latency_budget=1.0)
+
+    # 포화되지 않은 상태의 빠른 응답 → 증가 없음
+    for _ in range(3):
+        await limiter.acquire()
+        limiter.release(0.01)
+    assert limiter.limit == 2
+
+    # 포화 상태에서 예산 내 응답 → +1
+    for _ in range(3):
+        await limiter.acquire()
+        await limiter.acquire()
+        limiter.release(0.01)
+        limiter.release(0.01)
+    assert limiter.limit >= 3
+    assert limiter.limit <= limiter.max_limit
+
+
+@pytest.mark.asyncio
+async def test_limiter_backs_off_on_overload_with_cooldown():
+    now = [0.0]
+    limiter = AdaptiveConcurrencyLimiter(8, max_limit=8, cooldown=10.0, clock=lambda: now[0])
+
+    await limiter.acquire()
+    limiter.release(0.1, "overload")
+    assert limiter.limit == 4
+
+    await limiter.acquire()
+    limiter.release(0.1, "overload")
+    assert limiter.limit == 4  # cooldown 중 중복 감속 없음
+
+    now[0] = 11.0
+    await limiter.acquire()
+    limiter.release(0.1, "overload")
+    assert limiter.limit == 2
+    assert limiter.decreases == 2
+
+
+@pytest.mark.asyncio
+async def test_limiter_caps_in_flight_and_wakes_waiters():
+    limiter = AdaptiveConcurrencyLimiter(2, max_limit=2)
+    await limiter.acquire()
+    await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    assert limiter.in_flight == 2
+
+    limiter.release(0.01)
+    await asyncio.wait_for(waiter, timeout=1)
+    assert limiter.in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_pipeline_ramps_up_when_backend_is_fast():
+    backend = _SimulatedBackend(lambda call: 0.005)
+    limiter = AdaptiveConcurrencyLimiter(2, max_limit=6, window=4, latency_budget=0.5)
+    sp = _adaptive_pipeline(limiter)
+    trends = [FakeTrend(name=f"fast-{i}") for i in range(60)]
+
+    results = await asyncio.wait_for(sp.run(trends, {}, generate_fn=backend.generate), timeout=30)
+
+    assert sp.success_count == 60
+    assert limiter.limit > 2
+    assert limiter.increases >= 1
+    assert 2 < backend.max_active <= 6
+    metrics = sp.metrics()
+    assert metrics["in_flight"] == 0
+    assert metrics["stage_latency"]["generating"]["count"] == 60
+    assert metrics["stage_latency"]["scoring"]["count"] == 60
+    assert metrics["stage_latency"]["saving"]["count"] == 60
+    assert metrics["in_flight_max"] == backend.max_active
+    assert set(metrics["queue_depth_max"]) == {"scored", "generated"}
+    assert len(results) == 60
+
+
+@pytest.mark.asyncio
+async def test_pipeline_backs_off_on_rate_limits():
+    backend = _SimulatedBackend(lambda call: 0.005, capacity=3)
+    limiter = AdaptiveConcurrencyLimiter(6, max_limit=6, window=4, latency_budget=0.5, cooldown=0.0)
+    sp = _adaptive_pipeline(limiter)
+    trends = [FakeTrend(name=f"rl-{i}") for i in range(40)]
+
+    await asyncio.wait_for(sp.run(trends, {}, generate_fn=backend.generate), timeout=30)
+
+    assert backend.rate_limited >= 1
+    assert limiter.decreases >= 1
+    assert limiter.limit <= 4  # 용량(3) 근처로 수렴
+    assert sp.success_count + sp.error_count == 40
+
+
+@pytest.mark.asyncio
+async def test_pipeline_sheds_concurrency_when_latency_exceeds_budget():
+    # 처음 12건은 빠르고, 이후 백엔드가 느려짐 (p95 예산 초과)
+    backend = _SimulatedBackend(lambda call: 0.002 if call < 12 else 0.06)
+    limiter = AdaptiveConcurrencyLimiter(4, max_limit=4, window=4, latency_budget=0.03)
+    sp = _adaptive_pipeline(limiter)
+    trends = [FakeTrend(name=f"slow-{i}") for i in range(40)]
+
+    await asyncio.wait_for(sp.run(trends, {}, generate_fn=backend.generate), timeout=30)
+
+    assert sp.success_count == 40
+    assert limiter.limit < 4
+    assert sp.metrics()["stage_latency"]["generating"]["p95"] >= 0.03
+
+
+def test_fixed_concurrency_when_adaptive_disabled():
+    sp = StreamingPipeline(_FakeConfig(), _FakeConn(), generator_concurrency=3, adaptive=False)
+    assert sp.limiter.limit == sp.limiter.max_limit == 3
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 #  TAP _is_same_topic — false positive 방지
 # ══════════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,256 @@
+"""SQLite-backed response cache for the DeSci research tools.
+
+Entries are keyed by source + operation + normalized parameters, so the same
+research question phrased with different spacing, casing or list order hits
+the same row. Each source has its own TTL:
+
+- fresh (age < ttl): returned straight from SQLite
+- stale (ttl <= age < ttl + max_stale): returned immediately while a
+  background task refetches it (stale-while-revalidate)
+- expired / missing: fetched inline; concurrent callers share one fetch
+
+Hit/miss counters are kept per source for the ``cache_stats`` tool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger("desci-research.cache")
+
+DEFAULT_TTLS: dict[str, float] = {
+    "arxiv": 12 * 3600,
+    "semantic_scholar": 6 * 3600,
+    "grants": 6 * 3600,
+    "trends": 3600,
+}
+DEFAULT_MAX_STALE = 24 * 3600
+
+# arXiv boolean operators are case-sensitive; everything else is not.
+_QUERY_OPERATORS = {"AND", "OR", "ANDNOT"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key        TEXT PRIMARY KEY,
+    source     TEXT NOT NULL,
+    value_json TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+"""
+
+
+def normalize_query(query: str) -> str:
+    """Collapse whitespace and lowercase terms, keeping arXiv operators intact."""
+    return " ".join(token if token in _QUERY_OPERATORS else token.lower() for token in query.split())
+
+
+def cache_key(source: str, operation: str, params: dict[str, Any]) -> str:
+    normalized: dict[str, Any] = {}
+    for name, value in params.items():
+        if value is None:
+            continue
+        if name == "query" and isinstance(value, str):
+            value = normalize_query(value)
+        elif isinstance(value, str):
+            value = value.strip()
+        elif isinstance(value, list | tuple | set):
+            value = sorted({str(item).strip() for item in value})
+        normalized[name] = value
+    digest = hashlib.sha256(json.dumps(normalized, sort_keys=True).encode("utf-8")).hexdigest()[:32]
+    return f"{source}:{operation}:{digest}"
+
+
+def ttls_from_env() -> dict[str, float]:
+    """Per-source TTLs, overridable with ``DESCI_CACHE_TTL_<SOURCE>`` (seconds)."""
+    ttls = dict(DEFAULT_TTLS)
+    for source in ttls:
+        raw = os.getenv(f"DESCI_CACHE_TTL_{source.upper()}")
+        if raw:
+            ttls[source] = float(raw)
+    return ttls
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        db_path: Path | str,
+        *,
+        ttls: dict[str, float] | None = None,
+        max_stale: float = DEFAULT_MAX_STALE,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.db_path = Path(db_path)
+        self.ttls = ttls or dict(DEFAULT_TTLS)
+        self.max_stale = max_stale
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._background: set[asyncio.Task] = set()
+        self.counters: dict[str, Counter[str]] = {}
+
+    # ── storage ──
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _load(self, key: str) -> tuple[Any, float] | None:
+        with self._lock:
+            row = (
+                self._connect().execute("SELECT value_json, fetched_at FROM responses WHERE key = ?", (key,)).fetchone()
+            )
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def _store(self, key: str, source: str, value: Any) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, source, value_json, fetched_at) VALUES (?, ?, ?, ?)",
+                (key, source, json.dumps(value, ensure_ascii=False), self._clock()),
+            )
+            conn.commit()
+
+    def purge_expired(self) -> int:
+        """Delete rows past ttl + max_stale for their source."""
+        now = self._clock()
+        removed = 0
+        with self._lock:
+            conn = self._connect()
+            for source, ttl in self.ttls.items():
+                cursor = conn.execute(
+                    "DELETE FROM responses WHERE source = ? AND fetched_at < ?",
+                    (source, now - ttl - self.max_stale),
+                )
+                removed += cursor.rowcount
+            conn.commit()
+        return removed
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ── metrics ──
+
+    def _count(self, source: str, outcome: str) -> None:
+        self.counters.setdefault(source, Counter())[outcome] += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Hit-rate summary; stale hits count as hits since they return without waiting."""
+        total: Counter[str] = Counter()
+        per_source: dict[str, Any] = {}
+        for source, counter in self.counters.items():
+            total.update(counter)
+            per_source[source] = _rate(counter)
+        return {**_rate(total), "sources": per_source}
+
+    # ── lookup ──
+
+    async def get_or_fetch(
+        self,
+        source: str,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        *,
+        cacheable: Callable[[Any], bool] = lambda value: True,
+    ) -> Any:
+        """Return the cached value for ``key`` or fetch, store and return it."""
+        ttl = self.ttls.get(source, 0.0)
+        cached = self._load(key) if ttl > 0 else None
+        if cached is not None:
+            value, fetched_at = cached
+            age = self._clock() - fetched_at
+            if age < ttl:
+                self._count(source, "hits")
+                return value
+            if age < ttl + self.max_stale:
+                self._count(source, "stale_hits")
+                self._revalidate(source, key, fetch, cacheable)
+                return value
+
+        self._count(source, "misses")
+        return await asyncio.shield(self._fetch_once(source, key, fetch, cacheable))
+
+    def _fetch_once(
+        self,
+        source: str,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        cacheable: Callable[[Any], bool],
+    ) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._fetch_and_store(source, key, fetch, cacheable))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t, k=key: self._inflight.pop(k, None))
+        return task
+
+    async def _fetch_and_store(
+        self,
+        source: str,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        cacheable: Callable[[Any], bool],
+    ) -> Any:
+        value = await fetch()
+        if self.ttls.get(source, 0.0) > 0 and cacheable(value):
+            self._store(key, source, value)
+        return value
+
+    def _revalidate(
+        self,
+        source: str,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        cacheable: Callable[[Any], bool],
+    ) -> None:
+        if key in self._inflight:
+            return
+        task = self._fetch_once(source, key, fetch, cacheable)
+        self._background.add(task)
+        task.add_done_callback(self._finish_revalidation)
+
+    def _finish_revalidation(self, task: asyncio.Task) -> None:
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Background cache refresh failed: %s", task.exception())
+
+    async def drain(self) -> None:
+        """Wait for pending background refreshes (tests, shutdown)."""
+        while self._background:
+            await asyncio.gather(*list(self._background), return_exceptions=True)
+
+
+def _rate(counter: Counter[str]) -> dict[str, Any]:
+    hits, stale, misses = counter["hits"], counter["stale_hits"], counter["misses"]
+    requests = hits + stale + misses
+    return {
+        "requests": requests,
+        "hits": hits,
+        "stale_hits": stale,
+        "misses": misses,
+        "hit_rate": round((hits + stale) / requests, 4) if requests else 0.0,
+    }
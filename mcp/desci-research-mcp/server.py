@@ -4,20 +4,89 @@ Provides Claude Code with tools to search academic databases
 for the DeSci platform's RFP matching system.
 
 arXiv and Semantic Scholar APIs are free and require no API keys.
+
+All tools share one pooled httpx client for the server lifetime, and their
+results are cached in SQLite (see research_cache.py) with per-source TTLs and
+stale-while-revalidate. Set DESCI_CACHE_PATH to move the cache file or
+DESCI_CACHE_DISABLED=1 to bypass it.
 """
 
+import asyncio
+import os
 import xml.etree.ElementTree as ET
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
 
 import httpx
-
 from mcp.server.fastmcp import FastMCP
-
-mcp = FastMCP("desci-research")
+from research_cache import DEFAULT_MAX_STALE, ResponseCache, cache_key, ttls_from_env
 
 ARXIV_API = "http://export.arxiv.org/api/query"
 S2_API = "https://api.semanticscholar.org/graph/v1"
 GRANTS_API = "https://api.grants.gov/grantsws/rest/opportunities/search"
+GRANTS_SEARCH_API = "https://api.grants.gov/v1/opportunities/search"
+
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Pooled client shared by every tool call; rebuilt only if the event loop changes."""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS)
+        _client_loop = loop
+    return _client
+
+
+def _build_cache() -> ResponseCache:
+    default_path = Path.home() / ".cache" / "desci-research-mcp" / "responses.db"
+    ttls = ttls_from_env()
+    if os.getenv("DESCI_CACHE_DISABLED", "").lower() in ("1", "true", "yes"):
+        ttls = dict.fromkeys(ttls, 0.0)
+    return ResponseCache(
+        os.getenv("DESCI_CACHE_PATH") or default_path,
+        ttls=ttls,
+        max_stale=float(os.getenv("DESCI_CACHE_MAX_STALE") or DEFAULT_MAX_STALE),
+    )
+
+
+cache = _build_cache()
+
+
+def _is_cacheable(value: Any) -> bool:
+    """Error payloads are returned to the caller but never cached."""
+    if isinstance(value, dict):
+        return "error" not in value
+    if isinstance(value, list):
+        return not any(isinstance(item, dict) and "error" in item for item in value)
+    return True
+
+
+async def _cached(source: str, operation: str, params: dict[str, Any], fetch) -> Any:
+    return await cache.get_or_fetch(source, cache_key(source, operation, params), fetch, cacheable=_is_cacheable)
+
+
+@asynccontextmanager
+async def _lifespan(_server: FastMCP) -> AsyncIterator[None]:
+    try:
+        cache.purge_expired()
+        yield
+    finally:
+        await cache.drain()
+        if _client is not None:
+            await _client.aclose()
+        cache.close()
+
+
+mcp = FastMCP("desci-research", lifespan=_lifespan)
 
 # Namespace for arXiv Atom XML
 ATOM_NS = "{http://www.w3.org/2005/Atom}"
@@ -64,6 +133,19 @@ def _parse_arxiv_entry(entry: ET.Element) -> dict:
     }
 
 
+def _s2_paper_summary(p: dict) -> dict:
+    """Flatten a Semantic Scholar paper record into the tools' summary shape."""
+    return {
+        "title": p.get("title", ""),
+        "authors": [a.get("name", "") for a in (p.get("authors") or [])],
+        "abstract": p.get("abstract", ""),
+        "year": p.get("year"),
+        "citation_count": p.get("citationCount", 0),
+        "paper_id": p.get("paperId", ""),
+        "url": p.get("url", ""),
+    }
+
+
 @mcp.tool()
 async def search_arxiv(
     query: str,
@@ -95,14 +177,14 @@ async def search_arxiv(
         "sortOrder": "descending",
     }
 
-    async with httpx.AsyncClient(timeout=30) as client:
-        resp = await client.get(ARXIV_API, params=params)
+    async def fetch() -> list[dict]:
+        resp = await _get_client().get(ARXIV_API, params=params)
         resp.raise_for_status()
+        root = ET.fromstring(resp.text)
+        return [_parse_arxiv_entry(e) for e in root.findall(f"{ATOM_NS}entry")]
 
-    root = ET.fromstring(resp.text)
-    entries = root.findall(f"{ATOM_NS}entry")
-
-    return [_parse_arxiv_entry(e) for e in entries]
+    key_params = {"query": query, "max_results": max_results, "categories": categories}
+    return await _cached("arxiv", "search", key_params, fetch)
 
 
 @mcp.tool()
@@ -126,7 +208,7 @@ async def search_semantic_scholar(
 
     default_fields = ["title", "authors", "abstract", "year", "citationCount", "paperId", "url"]
     if fields:
-        all_fields = list(set(default_fields + fields))
+        all_fields = sorted(set(default_fields + fields))
     else:
         all_fields = default_fields
 
@@ -136,29 +218,13 @@ async def search_semantic_scholar(
         "fields": ",".join(all_fields),
     }
 
-    async with httpx.AsyncClient(timeout=30) as client:
-        resp = await client.get(f"{S2_API}/paper/search", params=params)
+    async def fetch() -> list[dict]:
+        resp = await _get_client().get(f"{S2_API}/paper/search", params=params)
         resp.raise_for_status()
+        return [_s2_paper_summary(p) for p in resp.json().get("data", [])]
 
-    data = resp.json()
-    papers = data.get("data", [])
-
-    results = []
-    for p in papers:
-        authors = [a.get("name", "") for a in (p.get("authors") or [])]
-        results.append(
-            {
-                "title": p.get("title", ""),
-                "authors": authors,
-                "abstract": p.get("abstract", ""),
-                "year": p.get("year"),
-                "citation_count": p.get("citationCount", 0),
-                "paper_id": p.get("paperId", ""),
-                "url": p.get("url", ""),
-            }
-        )
-
-    return results
+    key_params = {"query": query, "max_results": max_results, "fields": all_fields}
+    return await _cached("semantic_scholar", "search", key_params, fetch)
 
 
 @mcp.tool()
@@ -178,87 +244,90 @@ async def get_paper_details(
         Detailed paper metadata including references and citations (when available).
     """
     if source == "arxiv":
-        params = {"id_list": paper_id, "max_results": 1}
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.get(ARXIV_API, params=params)
-            resp.raise_for_status()
+        return await _cached("arxiv", "paper", {"paper_id": paper_id}, lambda: _fetch_arxiv_paper(paper_id))
+    elif source == "semantic_scholar":
+        return await _cached("semantic_scholar", "paper", {"paper_id": paper_id}, lambda: _fetch_s2_paper(paper_id))
+    else:
+        return {"error": f"Unknown source: {source}. Use 'arxiv' or 'semantic_scholar'."}
 
-        root = ET.fromstring(resp.text)
-        entries = root.findall(f"{ATOM_NS}entry")
-        if not entries:
-            return {"error": f"No arXiv paper found for ID: {paper_id}"}
-
-        paper = _parse_arxiv_entry(entries[0])
-
-        # Enrich with Semantic Scholar data if possible
-        s2_fields = "title,authors,abstract,year,citationCount,referenceCount,influentialCitationCount,fieldsOfStudy,publicationTypes,externalIds"
-        async with httpx.AsyncClient(timeout=30) as client:
-            s2_resp = await client.get(
-                f"{S2_API}/paper/ARXIV:{paper_id}",
-                params={"fields": s2_fields},
-            )
-        if s2_resp.status_code == 200:
-            s2_data = s2_resp.json()
-            paper["citation_count"] = s2_data.get("citationCount", 0)
-            paper["reference_count"] = s2_data.get("referenceCount", 0)
-            paper["influential_citation_count"] = s2_data.get("influentialCitationCount", 0)
-            paper["fields_of_study"] = s2_data.get("fieldsOfStudy") or []
-            paper["publication_types"] = s2_data.get("publicationTypes") or []
-            paper["s2_paper_id"] = s2_data.get("paperId", "")
 
-        return paper
+async def _fetch_arxiv_paper(paper_id: str) -> dict:
+    client = _get_client()
+    resp = await client.get(ARXIV_API, params={"id_list": paper_id, "max_results": 1})
+    resp.raise_for_status()
 
-    elif source == "semantic_scholar":
-        fields = "title,authors,abstract,year,citationCount,referenceCount,influentialCitationCount,fieldsOfStudy,publicationTypes,references,citations,externalIds,url"
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.get(
-                f"{S2_API}/paper/{paper_id}",
-                params={"fields": fields},
-            )
-            resp.raise_for_status()
-
-        data = resp.json()
-        authors = [a.get("name", "") for a in (data.get("authors") or [])]
+    root = ET.fromstring(resp.text)
+    entries = root.findall(f"{ATOM_NS}entry")
+    if not entries:
+        return {"error": f"No arXiv paper found for ID: {paper_id}"}
+
+    paper = _parse_arxiv_entry(entries[0])
+
+    # Enrich with Semantic Scholar data if possible
+    s2_fields = "title,authors,abstract,year,citationCount,referenceCount,influentialCitationCount,fieldsOfStudy,publicationTypes,externalIds"
+    s2_resp = await client.get(
+        f"{S2_API}/paper/ARXIV:{paper_id}",
+        params={"fields": s2_fields},
+    )
+    if s2_resp.status_code == 200:
+        s2_data = s2_resp.json()
+        paper["citation_count"] = s2_data.get("citationCount", 0)
+        paper["reference_count"] = s2_data.get("referenceCount", 0)
+        paper["influential_citation_count"] = s2_data.get("influentialCitationCount", 0)
+        paper["fields_of_study"] = s2_data.get("fieldsOfStudy") or []
+        paper["publication_types"] = s2_data.get("publicationTypes") or []
+        paper["s2_paper_id"] = s2_data.get("paperId", "")
+
+    return paper
+
+
+async def _fetch_s2_paper(paper_id: str) -> dict:
+    fields = "title,authors,abstract,year,citationCount,referenceCount,influentialCitationCount,fieldsOfStudy,publicationTypes,references,citations,externalIds,url"
+    resp = await _get_client().get(
+        f"{S2_API}/paper/{paper_id}",
+        params={"fields": fields},
+    )
+    resp.raise_for_status()
 
-        references = []
-        for ref in (data.get("references") or [])[:20]:
-            references.append(
-                {
-                    "title": ref.get("title", ""),
-                    "paper_id": ref.get("paperId", ""),
-                    "year": ref.get("year"),
-                }
-            )
+    data = resp.json()
+    authors = [a.get("name", "") for a in (data.get("authors") or [])]
 
-        citations = []
-        for cit in (data.get("citations") or [])[:20]:
-            citations.append(
-                {
-                    "title": cit.get("title", ""),
-                    "paper_id": cit.get("paperId", ""),
-                    "year": cit.get("year"),
-                }
-            )
+    references = []
+    for ref in (data.get("references") or [])[:20]:
+        references.append(
+            {
+                "title": ref.get("title", ""),
+                "paper_id": ref.get("paperId", ""),
+                "year": ref.get("year"),
+            }
+        )
 
-        return {
-            "title": data.get("title", ""),
-            "authors": authors,
-            "abstract": data.get("abstract", ""),
-            "year": data.get("year"),
-            "citation_count": data.get("citationCount", 0),
-            "reference_count": data.get("referenceCount", 0),
-            "influential_citation_count": data.get("influentialCitationCount", 0),
-            "fields_of_study": data.get("fieldsOfStudy") or [],
-            "publication_types": data.get("publicationTypes") or [],
-            "paper_id": data.get("paperId", ""),
-            "url": data.get("url", ""),
-            "external_ids": data.get("externalIds") or {},
-            "references": references,
-            "citations": citations,
-        }
+    citations = []
+    for cit in (data.get("citations") or [])[:20]:
+        citations.append(
+            {
+                "title": cit.get("title", ""),
+                "paper_id": cit.get("paperId", ""),
+                "year": cit.get("year"),
+            }
+        )
 
-    else:
-        return {"error": f"Unknown source: {source}. Use 'arxiv' or 'semantic_scholar'."}
+    return {
+        "title": data.get("title", ""),
+        "authors": authors,
+        "abstract": data.get("abstract", ""),
+        "year": data.get("year"),
+        "citation_count": data.get("citationCount", 0),
+        "reference_count": data.get("referenceCount", 0),
+        "influential_citation_count": data.get("influentialCitationCount", 0),
+        "fields_of_study": data.get("fieldsOfStudy") or [],
+        "publication_types": data.get("publicationTypes") or [],
+        "paper_id": data.get("paperId", ""),
+        "url": data.get("url", ""),
+        "external_ids": data.get("externalIds") or {},
+        "references": references,
+        "citations": citations,
+    }
 
 
 @mcp.tool()
@@ -290,10 +359,11 @@ async def search_grants(
 
     headers = {"Content-Type": "application/json"}
 
-    async with httpx.AsyncClient(timeout=30) as client:
+    async def fetch() -> list[dict]:
+        client = _get_client()
         try:
             resp = await client.post(
-                "https://api.grants.gov/v1/opportunities/search",
+                GRANTS_SEARCH_API,
                 json=payload,
                 headers=headers,
             )
@@ -315,22 +385,23 @@ async def search_grants(
             except Exception as e:
                 return [{"error": f"grants.gov API unavailable: {e!s}"}]
 
-    opportunities = data.get("opportunities") or data.get("oppHits") or []
+        opportunities = data.get("opportunities") or data.get("oppHits") or []
 
-    results = []
-    for opp in opportunities[:max_results]:
-        results.append(
-            {
-                "title": opp.get("title") or opp.get("oppTitle", ""),
-                "agency": opp.get("agency") or opp.get("agencyCode", ""),
-                "deadline": opp.get("closeDate") or opp.get("closeDateStr", ""),
-                "amount": opp.get("awardCeiling") or opp.get("estimatedFunding", "N/A"),
-                "description": (opp.get("description") or opp.get("synopsis") or "")[:500],
-                "url": f"https://www.grants.gov/search-results-detail/{opp.get('id') or opp.get('oppNumber', '')}",
-            }
-        )
+        results = []
+        for opp in opportunities[:max_results]:
+            results.append(
+                {
+                    "title": opp.get("title") or opp.get("oppTitle", ""),
+                    "agency": opp.get("agency") or opp.get("agencyCode", ""),
+                    "deadline": opp.get("closeDate") or opp.get("closeDateStr", ""),
+                    "amount": opp.get("awardCeiling") or opp.get("estimatedFunding", "N/A"),
+                    "description": (opp.get("description") or opp.get("synopsis") or "")[:500],
+                    "url": f"https://www.grants.gov/search-results-detail/{opp.get('id') or opp.get('oppNumber', '')}",
+                }
+            )
+        return results
 
-    return results
+    return await _cached("grants", "search", {"query": query, "agency": agency, "max_results": max_results}, fetch)
 
 
 @mcp.tool()
@@ -352,7 +423,8 @@ async def find_related_papers(
 
     fields = "title,authors,abstract,year,citationCount,paperId,url"
 
-    async with httpx.AsyncClient(timeout=30) as client:
+    async def fetch() -> list[dict]:
+        client = _get_client()
         resp = await client.get(
             f"{S2_API}/recommendations",
             params={
@@ -375,22 +447,9 @@ async def find_related_papers(
             data = resp.json()
             papers_raw = data.get("recommendedPapers", [])
 
-    results = []
-    for p in papers_raw[:max_results]:
-        authors = [a.get("name", "") for a in (p.get("authors") or [])]
-        results.append(
-            {
-                "title": p.get("title", ""),
-                "authors": authors,
-                "abstract": p.get("abstract", ""),
-                "year": p.get("year"),
-                "citation_count": p.get("citationCount", 0),
-                "paper_id": p.get("paperId", ""),
-                "url": p.get("url", ""),
-            }
-        )
+        return [_s2_paper_summary(p) for p in papers_raw[:max_results]]
 
-    return results
+    return await _cached("semantic_scholar", "related", {"paper_id": paper_id, "max_results": max_results}, fetch)
 
 
 @mcp.tool()
@@ -409,7 +468,12 @@ async def get_research_trends(
         and recent_notable_papers (highest engagement).
     """
     days = min(days, 90)
+    return await _cached(
+        "trends", "arxiv", {"field": field, "days": days}, lambda: _compute_research_trends(field, days)
+    )
+
 
+async def _compute_research_trends(field: str, days: int) -> dict:
     end_date = datetime.now(UTC)
     start_date = end_date - timedelta(days=days)
 
@@ -427,9 +491,8 @@ async def get_research_trends(
         "sortOrder": "descending",
     }
 
-    async with httpx.AsyncClient(timeout=45) as client:
-        resp = await client.get(ARXIV_API, params=params)
-        resp.raise_for_status()
+    resp = await _get_client().get(ARXIV_API, params=params, timeout=45)
+    resp.raise_for_status()
 
     root = ET.fromstring(resp.text)
     entries = root.findall(f"{ATOM_NS}entry")
@@ -618,5 +681,15 @@ async def get_research_trends(
     }
 
 
+@mcp.tool()
+async def cache_stats() -> dict:
+    """Report response-cache hit rates for this server process.
+
+    Returns:
+        Dict with requests, hits, stale_hits, misses and hit_rate overall and per source.
+    """
+    return cache.stats()
+
+
 if __name__ == "__main__":
     mcp.run()
@@ -0,0 +1,198 @@
+"""Response cache + pooled client tests against a local stub of arXiv / Semantic Scholar."""
+
+import asyncio
+import json
+import sys
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import server  # noqa: E402
+from research_cache import ResponseCache, cache_key  # noqa: E402
+
+ATOM_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <entry>
+    <id>http://arxiv.org/abs/2301.07041v1</id>
+    <title>{title}</title>
+    <summary>Protein folding with transformers.</summary>
+    <published>2023-01-17T00:00:00Z</published>
+    <author><name>Ada Lovelace</name></author>
+    <arxiv:primary_category term="q-bio.BM"/>
+    <link title="pdf" href="http://arxiv.org/pdf/2301.07041v1"/>
+  </entry>
+</feed>
+"""
+
+
+class StubUpstream:
+    """Counts requests per path; arXiv titles carry a version that tests can bump."""
+
+    def __init__(self) -> None:
+        self.requests: Counter[str] = Counter()
+        self.version = 1
+        self.fail_grants = False
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _reply(self, status: int, body: str, content_type: str) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.end_headers()
+                self.wfile.write(body.encode())
+
+            def do_GET(self) -> None:  # noqa: N802
+                url = urlparse(self.path)
+                stub.requests[url.path] += 1
+                if url.path == "/arxiv/query":
+                    query = parse_qs(url.query).get("search_query", [""])[0]
+                    self._reply(200, ATOM_FEED.format(title=f"{query} v{stub.version}"), "application/atom+xml")
+                elif url.path == "/s2/paper/search":
+                    papers = [{"title": "S2 paper", "authors": [{"name": "Grace"}], "paperId": "p1", "year": 2024}]
+                    self._reply(200, json.dumps({"data": papers}), "application/json")
+                else:
+                    self._reply(503, "{}", "application/json")
+
+            def do_POST(self) -> None:  # noqa: N802
+                stub.requests[urlparse(self.path).path] += 1
+                self._reply(503, "{}", "application/json")
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base = f"http://127.0.0.1:{self._server.server_address[1]}"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    stub = StubUpstream()
+    monkeypatch.setattr(server, "ARXIV_API", f"{stub.base}/arxiv/query")
+    monkeypatch.setattr(server, "S2_API", f"{stub.base}/s2")
+    monkeypatch.setattr(server, "GRANTS_API", f"{stub.base}/grants/legacy")
+    monkeypatch.setattr(server, "GRANTS_SEARCH_API", f"{stub.base}/grants/v1")
+    yield stub
+    stub.close()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock, monkeypatch):
+    response_cache = ResponseCache(
+        tmp_path / "responses.db", ttls={"arxiv": 60, "semantic_scholar": 60, "grants": 60}, max_stale=600, clock=clock
+    )
+    monkeypatch.setattr(server, "cache", response_cache)
+    yield response_cache
+    response_cache.close()
+
+
+def test_cache_key_normalizes_query_spacing_case_and_list_order():
+    a = cache_key(
+        "arxiv", "search", {"query": "  Protein   Folding AND cat:q-bio ", "categories": ["q-bio.BM", "cs.AI"]}
+    )
+    b = cache_key("arxiv", "search", {"query": "protein folding AND cat:q-bio", "categories": ["cs.AI", "q-bio.BM"]})
+    c = cache_key("arxiv", "search", {"query": "protein folding and cat:q-bio", "categories": ["cs.AI", "q-bio.BM"]})
+
+    assert a == b
+    assert a != c  # arXiv operators are case-sensitive
+
+
+async def test_repeated_query_is_served_from_cache(upstream, cache):
+    first = await server.search_arxiv("Protein folding", max_results=5)
+    second = await server.search_arxiv("  protein   FOLDING ", max_results=5)
+
+    assert first == second
+    assert first[0]["arxiv_id"] == "2301.07041v1"
+    assert upstream.requests["/arxiv/query"] == 1
+    stats = server.cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert (await server.cache_stats())["sources"]["arxiv"]["requests"] == 2
+
+
+async def test_cache_survives_restart(upstream, cache, tmp_path, clock, monkeypatch):
+    await server.search_semantic_scholar("graph neural networks")
+    cache.close()
+
+    reopened = ResponseCache(tmp_path / "responses.db", ttls=cache.ttls, max_stale=600, clock=clock)
+    monkeypatch.setattr(server, "cache", reopened)
+    result = await server.search_semantic_scholar("Graph neural networks")
+
+    assert result[0]["authors"] == ["Grace"]
+    assert upstream.requests["/s2/paper/search"] == 1
+    assert reopened.stats()["hits"] == 1
+    reopened.close()
+
+
+async def test_stale_entry_is_served_then_revalidated(upstream, cache, clock):
+    await server.search_arxiv("crispr")
+    upstream.version = 2
+    clock.now += 120  # past ttl, within max_stale
+
+    stale = await server.search_arxiv("crispr")
+    assert stale[0]["title"] == "crispr v1"
+    await cache.drain()
+
+    fresh = await server.search_arxiv("crispr")
+    assert fresh[0]["title"] == "crispr v2"
+    assert upstream.requests["/arxiv/query"] == 2
+    assert cache.stats()["stale_hits"] == 1
+
+
+async def test_expired_entry_is_fetched_inline(upstream, cache, clock):
+    await server.search_arxiv("crispr")
+    upstream.version = 2
+    clock.now += 60 + 600 + 1
+
+    result = await server.search_arxiv("crispr")
+
+    assert result[0]["title"] == "crispr v2"
+    assert cache.stats()["misses"] == 2
+    assert cache.purge_expired() == 0
+
+
+async def test_concurrent_misses_share_one_upstream_request(upstream, cache):
+    results = await asyncio.gather(*(server.search_arxiv("single flight") for _ in range(5)))
+
+    assert all(result == results[0] for result in results)
+    assert upstream.requests["/arxiv/query"] == 1
+
+
+async def test_error_results_are_not_cached(upstream, cache):
+    first = await server.search_grants("quantum biology")
+    second = await server.search_grants("quantum biology")
+
+    assert "error" in first[0] and "error" in second[0]
+    assert upstream.requests["/grants/v1"] == 2
+
+
+async def test_tools_share_one_pooled_client(upstream, cache):
+    await server.search_arxiv("pooled")
+    client = server._get_client()
+    await server.search_semantic_scholar("pooled")
+
+    assert server._get_client() is client
+    assert not client.is_closed
@@ -69,6 +69,15 @@ class _NoOpCache:
     async def exists(self, key: str) -> bool:
         return False
 
+    async def mget(self, keys: list[str]) -> list[Any]:
+        return [None] * len(keys)
+
+    async def exists_many(self, keys: list[str]) -> list[bool]:
+        return [False] * len(keys)
+
+    async def set_many(self, items: dict[str, Any], ttl: int = 60) -> None:
+        pass
+
     async def incr(self, key: str, ttl: int = 60) -> int:
         return 1
 
@@ -195,6 +204,58 @@ class RedisCache:
                 await self._suspend_cache("EXISTS", key, e)
             return False
 
+    async def mget(self, keys: list[str]) -> list[Any]:
+        """Batch GET in one round trip. Missing or undecodable keys come back as None."""
+        if not keys or self._is_suspended():
+            return [None] * len(keys)
+        try:
+            raw = await (await self._get_conn()).mget(keys)
+        except Exception as e:
+            if self._is_connection_error(e):
+                await self._suspend_cache("MGET", keys[0], e)
+            else:
+                logger.warning("Redis MGET error (%d keys): %s", len(keys), e)
+            return [None] * len(keys)
+        values: list[Any] = []
+        for item in raw:
+            try:
+                values.append(json.loads(item) if item is not None else None)
+            except ValueError:
+                values.append(None)
+        return values
+
+    async def exists_many(self, keys: list[str]) -> list[bool]:
+        """Pipelined EXISTS per key (one round trip)."""
+        if not keys or self._is_suspended():
+            return [False] * len(keys)
+        try:
+            conn = await self._get_conn()
+            async with conn.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.exists(key)
+                results = await pipe.execute()
+            return [bool(r) for r in results]
+        except Exception as e:
+            if self._is_connection_error(e):
+                await self._suspend_cache("EXISTS", keys[0], e)
+            return [False] * len(keys)
+
+    async def set_many(self, items: dict[str, Any], ttl: int = 60) -> None:
+        """Pipelined SETEX for several keys sharing one TTL."""
+        if not items or self._is_suspended():
+            return
+        try:
+            conn = await self._get_conn()
+            async with conn.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.setex(key, ttl, json.dumps(value, ensure_ascii=False, default=str))
+                await pipe.execute()
+        except Exception as e:
+            if self._is_connection_error(e):
+                await self._suspend_cache("SET", next(iter(items)), e)
+            else:
+                logger.warning("Redis pipelined SET error (%d keys): %s", len(items), e)
+
     async def incr(self, key: str, ttl: int = 60) -> int:
         """Increment counter with TTL (for rate limiting)."""
         if self._is_suspended():
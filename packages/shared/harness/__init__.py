@@ -47,6 +47,7 @@ from .token_tracker import (
     TokenBudget,
     TokenBudgetExceededError,
     TokenUsageRecord,
+    read_usage_log,
 )
 
 # Phase 0: Adapter & Sandbox layer
@@ -55,6 +56,7 @@ from .sandbox import (
     DockerSandboxRunner,
     SandboxPolicy,
     SandboxResult,
+    SandboxWorkerPool,
     ToolPermissionLevel,
     SANDBOX_PRESETS,
 )
@@ -97,6 +99,7 @@ __all__ = [
     "DeepAgentsAdapter",
     # Sandbox
     "DockerSandboxRunner",
+    "SandboxWorkerPool",
     "SandboxPolicy",
     "SandboxResult",
     "ToolPermissionLevel",
@@ -112,4 +115,5 @@ __all__ = [
     "TokenBudgetExceededError",
     "TokenUsageRecord",
     "DetailLevel",
+    "read_usage_log",
 ]
@@ -4,13 +4,23 @@ All tool calls pass through the audit logger, creating a tamper-evident
 JSONL trail for compliance, debugging, and observability.
 
 Integrates with shared.structured_logging when available.
+
+File output goes through ``BufferedAuditWriter``: one persistent handle,
+records group-committed by a background thread when ``max_batch`` records
+are pending or ``max_delay`` seconds have passed. DENIED and ERROR records
+are committed synchronously together with everything queued before them,
+and ``flush()``/``close()`` return only after the data is fsync'ed.
 """
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
+import os
 import re
+import threading
+import weakref
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
@@ -31,6 +41,20 @@ _SECRET_PATTERNS: list[re.Pattern] = [
     re.compile(r"(?i)(password|api_key|secret_key|access_token)\s*[:=]\s*['\"]?[^\s'\"]{8,}"),
 ]
 
+# All patterns as one alternation, so redaction is a single scan. Inline flags
+# are scoped ((?i) -> (?i:...)) because global flags must lead the pattern.
+_SECRET_RE = re.compile(
+    "|".join(
+        f"(?i:{pat.pattern[4:]})" if pat.pattern.startswith("(?i)") else f"(?:{pat.pattern})"
+        for pat in _SECRET_PATTERNS
+    )
+)
+
+# Redaction only scans this many characters past the truncation point; longer
+# than any secret pattern's minimum, so a secret that starts inside the kept
+# text is always matched.
+_REDACT_MARGIN = 256
+
 
 class AuditVerdict(str, Enum):
     """Outcome of a governance check."""
@@ -66,6 +90,125 @@ class AuditRecord:
         return json.dumps(asdict(self), ensure_ascii=False, default=str)
 
 
+_open_writers: weakref.WeakSet[BufferedAuditWriter] = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_writers() -> None:
+    for writer in list(_open_writers):
+        writer.close()
+
+
+class BufferedAuditWriter:
+    """Group-commit JSONL appender with a persistent file handle.
+
+    ``write()`` only queues the line; a daemon thread commits the queue when
+    it reaches ``max_batch`` lines or ``max_delay`` seconds after the first
+    queued line. ``write(..., commit=True)``, ``flush()`` and ``close()``
+    commit synchronously. A commit is one ``write`` + ``flush`` (+ ``fsync``
+    when ``fsync=True``), so committed records survive a crash and at most
+    ``max_delay`` seconds of uncommitted records can be lost. A torn last
+    line from an earlier crash is terminated before appending.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_batch: int = 256,
+        max_delay: float = 0.5,
+        fsync: bool = True,
+    ):
+        self.path = Path(path)
+        self.max_batch = max(1, max_batch)
+        self.max_delay = max_delay
+        self.fsync = fsync
+        self.idle_timeout = 30.0
+        self.commits = 0
+        self._pending: list[str] = []
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()
+        self._file: Any = None
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        _open_writers.add(self)
+
+    def write(self, line: str, *, commit: bool = False) -> None:
+        """Queue one JSONL line; ``commit=True`` also commits it before returning."""
+        with self._cond:
+            self._pending.append(line if line.endswith("\n") else line + "\n")
+            pending = len(self._pending)
+            if not self._closed and self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+                self._thread.start()
+            elif pending == 1 or pending >= self.max_batch:
+                self._cond.notify()
+        # Commit in the caller when asked, after close, or when the flusher
+        # has fallen far behind (backpressure instead of unbounded memory).
+        if commit or self._closed or pending >= self.max_batch * 4:
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit every queued line to disk."""
+        with self._io_lock:
+            with self._cond:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return
+            try:
+                handle = self._handle()
+                handle.write("".join(batch))
+                handle.flush()
+                if self.fsync:
+                    os.fsync(handle.fileno())
+                self.commits += 1
+            except OSError as e:
+                logger.warning("audit_write_failed: %s", e)
+
+    def close(self) -> None:
+        """Stop the flusher, commit what is queued and release the file handle."""
+        with self._cond:
+            self._closed = True
+            thread, self._thread = self._thread, None
+            self._cond.notify()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self.flush()
+        with self._io_lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _handle(self) -> Any:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            torn = False
+            if self.path.exists() and self.path.stat().st_size > 0:
+                with open(self.path, "rb") as existing:
+                    existing.seek(-1, os.SEEK_END)
+                    torn = existing.read(1) != b"\n"
+            self._file = open(self.path, "a", encoding="utf-8")  # noqa: SIM115 - kept open across commits
+            if torn:
+                self._file.write("\n")
+        return self._file
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._closed and not self._pending:
+                    self._cond.wait(self.idle_timeout)
+                    if not self._closed and not self._pending:
+                        # Idle writers give their thread back; write() starts a new one.
+                        self._thread = None
+                        return
+                if not self._closed and len(self._pending) < self.max_batch:
+                    self._cond.wait(self.max_delay)  # let the batch fill
+                closing = self._closed
+            self.flush()
+            if closing:
+                return
+
+
 class AuditLogger:
     """Append-only structured audit logger for harness governance.
 
@@ -80,28 +223,37 @@ class AuditLogger:
         log_path: str | Path | None = None,
         emit_to_logging: bool = True,
         max_input_chars: int = 200,
+        max_batch: int = 256,
+        max_delay: float = 0.5,
+        fsync: bool = True,
     ):
         self.agent_name = agent_name
         self.log_path = Path(log_path) if log_path else None
         self.emit_to_logging = emit_to_logging
         self.max_input_chars = max_input_chars
         self._records: list[AuditRecord] = []
+        self._writer: BufferedAuditWriter | None = None
 
         if self.log_path:
             self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = BufferedAuditWriter(
+                self.log_path, max_batch=max_batch, max_delay=max_delay, fsync=fsync
+            )
 
     @staticmethod
     def _redact_secrets(text: str) -> str:
         """Replace known secret patterns with ***REDACTED***."""
-        for pat in _SECRET_PATTERNS:
-            text = pat.sub("***REDACTED***", text)
-        return text
+        return _SECRET_RE.sub("***REDACTED***", text)
 
     def _truncate_input(self, tool_input: Any) -> str:
         """Truncate tool input for privacy/size limits and redact secrets."""
         text = str(tool_input)
+        truncated = len(text) > self.max_input_chars
+        if truncated:
+            # Only the kept prefix (plus a margin for secrets crossing the cut) is scanned.
+            text = text[: self.max_input_chars + _REDACT_MARGIN]
         text = self._redact_secrets(text)
-        if len(text) > self.max_input_chars:
+        if truncated or len(text) > self.max_input_chars:
             return text[: self.max_input_chars] + "..."
         return text
 
@@ -111,12 +263,9 @@ class AuditLogger:
 
         json_line = record.to_json()
 
-        if self.log_path:
-            try:
-                with open(self.log_path, "a", encoding="utf-8") as f:
-                    f.write(json_line + "\n")
-            except OSError as e:
-                logger.warning("audit_write_failed: %s", e)
+        if self._writer is not None:
+            # Denials and errors are committed right away (with everything queued before them).
+            self._writer.write(json_line, commit=record.verdict != AuditVerdict.ALLOWED)
 
         if self.emit_to_logging:
             if record.verdict == AuditVerdict.DENIED:
@@ -188,6 +337,16 @@ class AuditLogger:
         self._write_record(record)
         return record
 
+    def flush(self) -> None:
+        """Commit buffered records to the log file."""
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self) -> None:
+        """Flush and release the log file; later records are written synchronously."""
+        if self._writer is not None:
+            self._writer.close()
+
     @property
     def records(self) -> list[AuditRecord]:
         """In-memory record buffer (for testing and diagnostics)."""
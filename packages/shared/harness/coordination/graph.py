@@ -10,6 +10,12 @@ Architecture:
                                                  │
                                                  └─→ [generate] (retry)
 
+Items are generated concurrently (``max_concurrency``) without letting the
+in-flight calls overrun the session budget, and a retry regenerates only
+the items that failed or scored below ``qa_threshold``.
+``run_streaming()`` lets every item flow through generate → QA → publish
+on its own instead of waiting for the whole batch at each stage.
+
 Usage::
 
     from shared.harness.coordination import build_content_pipeline
@@ -20,10 +26,15 @@ Usage::
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any, Callable, Awaitable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Awaitable, Optional
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +52,7 @@ from ..constitution import Constitution
 from ..adapters.native import NativeHarnessAdapter
 
 
+
 # --- State ---
 
 class PipelineState(dict):
@@ -78,6 +90,54 @@ class PipelineState(dict):
 # --- Node Functions ---
 
 AgentStepFn = Callable[[PipelineState], Awaitable[PipelineState]]
+# Item-level steps: QA maps a generated item to {"item", "score", "passed"};
+# publish receives one generated item.
+ItemQAFn = Callable[[dict], Awaitable[dict]]
+ItemPublishFn = Callable[[dict], Awaitable[Any]]
+
+
+class _GovernedCallGate:
+    """Admits concurrent governed calls only while they fit the session.
+
+    HarnessWrapper checks budget and call limits before a call but books
+    them after it, so calls started together would all pass the check.
+    A call is admitted only if it fits together with the calls already in
+    flight; otherwise it waits for one of them to finish. With nothing in
+    flight it is always admitted, so the harness itself denies (and audits)
+    it exactly as in sequential execution.
+    """
+
+    def __init__(self, adapter: Any, tool_name: str, cost_estimate: float, max_concurrency: int):
+        self._harness = getattr(adapter, "harness", None)
+        self._tool_name = tool_name
+        self._cost = cost_estimate
+        self._limit = max(1, max_concurrency)
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+
+    def _fits(self) -> bool:
+        if self._in_flight >= self._limit:
+            return False
+        if self._in_flight == 0 or self._harness is None:
+            return True
+        harness = self._harness
+        calls = self._in_flight + 1
+        if harness.session_cost + calls * self._cost > harness.constitution.max_budget_usd:
+            return False
+        perm = harness.constitution.get_permission(self._tool_name)
+        return perm is None or harness.call_count(self._tool_name) + calls <= perm.max_calls_per_session
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        async with self._cond:
+            await self._cond.wait_for(self._fits)
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            async with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
 
 
 @dataclass
@@ -87,6 +147,11 @@ class ContentPipelineGraph:
     Each step can be overridden with a custom function, enabling
     the pipeline to be adapted for different content types
     (news, social media, research briefs, etc.).
+
+    ``qa_item_fn``/``publish_item_fn`` override QA and publishing of a
+    single item; the default QA/publish nodes and ``run_streaming()`` use
+    them. ``generate_cost_estimate`` is the per-item cost passed to the
+    budget gate.
     """
 
     adapter: NativeHarnessAdapter
@@ -96,6 +161,10 @@ class ContentPipelineGraph:
     qa_fn: Optional[AgentStepFn] = None
     publish_fn: Optional[AgentStepFn] = None
     qa_threshold: float = 7.0
+    qa_item_fn: Optional[ItemQAFn] = None
+    publish_item_fn: Optional[ItemPublishFn] = None
+    max_concurrency: int = 4
+    generate_cost_estimate: float = 0.01
 
     def _trace_entry(self, step_name: str, status: str, detail: str = "") -> dict:
         return {
@@ -124,60 +193,99 @@ class ContentPipelineGraph:
         state["trace"].append(self._trace_entry("analyze", "success", f"{len(scored)} scored"))
         return state
 
+    def _gate(self) -> _GovernedCallGate:
+        return _GovernedCallGate(self.adapter, "llm_call", self.generate_cost_estimate, self.max_concurrency)
+
+    async def _generate_item(self, item: Any, errors: list[str]) -> dict:
+        try:
+            result = await self.adapter.execute_with_governance(
+                task={"action": "llm_call", "input": {"content": item}},
+                tools=["llm_call"],
+                cost_estimate=self.generate_cost_estimate,
+            )
+            return {
+                "source": item,
+                "content": result.output,
+                "success": result.success,
+            }
+        except Exception as e:
+            errors.append(f"generate:{type(e).__name__}:{e}")
+            return {
+                "source": item,
+                "content": None,
+                "success": False,
+            }
+
+    def _qa_ok(self, qa_result: dict) -> bool:
+        return bool(qa_result.get("passed")) and qa_result.get("score", 0.0) >= self.qa_threshold
+
+    def _retry_indexes(self, state: PipelineState) -> set[int] | None:
+        """Indexes of items to regenerate on a retry; None means all of them."""
+        if not state.get("retry_count"):
+            return None
+        scored = state.get("scored", [])
+        generated = state.get("generated", [])
+        qa_results = state.get("qa_results", [])
+        # A custom generate/QA step may not keep results aligned with items.
+        if not len(scored) == len(generated) == len(qa_results):
+            return None
+        return {i for i, r in enumerate(qa_results) if not self._qa_ok(r)}
+
     async def _default_generate(self, state: PipelineState) -> PipelineState:
-        """Default generate node — uses adapter governance."""
+        """Default generate node — uses adapter governance, items run concurrently."""
         scored = state.get("scored", [])
-        generated = []
-        for item in scored:
-            try:
-                result = await self.adapter.execute_with_governance(
-                    task={"action": "llm_call", "input": {"content": item}},
-                    tools=["llm_call"],
-                    cost_estimate=0.01,
-                )
-                generated.append({
-                    "source": item,
-                    "content": result.output,
-                    "success": result.success,
-                })
-            except Exception as e:
-                state["errors"].append(f"generate:{type(e).__name__}:{e}")
-                generated.append({
-                    "source": item,
-                    "content": None,
-                    "success": False,
-                })
+        previous = state.get("generated", [])
+        retry = self._retry_indexes(state)
+        gate = self._gate()
+
+        async def produce(index: int, item: Any) -> dict:
+            if retry is not None and index not in retry:
+                return previous[index]
+            async with gate.slot():
+                return await self._generate_item(item, state["errors"])
+
+        generated = list(await asyncio.gather(*(produce(i, item) for i, item in enumerate(scored))))
+        regenerated = len(scored) if retry is None else len(retry)
 
         state["generated"] = generated
         state["retry_count"] = state.get("retry_count", 0)
         state["trace"].append(
-            self._trace_entry("generate", "success", f"{len(generated)} items, retry={state['retry_count']}")
+            self._trace_entry(
+                "generate",
+                "success",
+                f"{len(generated)} items, regenerated={regenerated}, retry={state['retry_count']}",
+            )
         )
         return state
 
+    async def _default_qa_item(self, item: dict) -> dict:
+        """Default item QA — failed generations score 0, the rest a neutral 7.5."""
+        if not item.get("success") or item.get("content") is None:
+            return {"item": item, "score": 0.0, "passed": False}
+        return {"item": item, "score": 7.5, "passed": True}
+
+    @staticmethod
+    def _approval(qa_results: list[dict], threshold: float) -> tuple[bool, float, int]:
+        passing = [r for r in qa_results if r["passed"]]
+        avg_score = sum(r["score"] for r in passing) / max(len(passing), 1)
+        return avg_score >= threshold and len(passing) > 0, avg_score, len(passing)
+
     async def _default_qa(self, state: PipelineState) -> PipelineState:
         """Default QA node — checks generated content quality."""
         generated = state.get("generated", [])
-        qa_results = []
-        for item in generated:
-            if not item.get("success") or item.get("content") is None:
-                qa_results.append({"item": item, "score": 0.0, "passed": False})
-                continue
-            # Default: pass everything with a neutral score
-            qa_results.append({"item": item, "score": 7.5, "passed": True})
+        qa_item = self.qa_item_fn or self._default_qa_item
+        qa_results = [await qa_item(item) for item in generated]
 
         state["qa_results"] = qa_results
 
         # Calculate approval
-        passing = [r for r in qa_results if r["passed"]]
-        avg_score = sum(r["score"] for r in passing) / max(len(passing), 1)
-        state["approved"] = avg_score >= self.qa_threshold and len(passing) > 0
+        state["approved"], avg_score, passing = self._approval(qa_results, self.qa_threshold)
 
         state["trace"].append(
             self._trace_entry(
                 "qa",
                 "approved" if state["approved"] else "rejected",
-                f"avg={avg_score:.1f} threshold={self.qa_threshold} passing={len(passing)}/{len(qa_results)}",
+                f"avg={avg_score:.1f} threshold={self.qa_threshold} passing={passing}/{len(qa_results)}",
             )
         )
         return state
@@ -185,11 +293,22 @@ class ContentPipelineGraph:
     async def _default_publish(self, state: PipelineState) -> PipelineState:
         """Default publish node — logs success, actual publishing via override."""
         approved_items = [r["item"] for r in state.get("qa_results", []) if r.get("passed")]
+        if self.publish_item_fn:
+            for item in approved_items:
+                await self._publish_item(item, state["errors"])
         state["trace"].append(
             self._trace_entry("publish", "success", f"{len(approved_items)} items ready")
         )
         return state
 
+    async def _publish_item(self, item: dict, errors: list[str]) -> bool:
+        try:
+            await self.publish_item_fn(item)
+            return True
+        except Exception as e:
+            errors.append(f"publish:{type(e).__name__}:{e}")
+            return False
+
     def _should_retry(self, state: PipelineState) -> str:
         """Conditional edge: retry generation or proceed to publish."""
         if state.get("approved"):
@@ -266,6 +385,70 @@ class ContentPipelineGraph:
         result = await compiled.ainvoke(state)
         return PipelineState(result)
 
+    async def run_streaming(self, initial_state: dict | None = None) -> PipelineState:
+        """Run the pipeline with items flowing through it independently.
+
+        After collect and analyze, each scored item is generated, QA'd
+        (``qa_item_fn``), retried on its own up to ``max_retries`` times and
+        published (``publish_item_fn``) as soon as it passes, so fast items
+        are not held back by slow ones. Generation shares the same bounded,
+        budget-aware concurrency as the batch graph. Does not need langgraph;
+        the state-level generate/qa/publish overrides are not used.
+
+        Returns:
+            Final PipelineState with the same keys as ``run()``.
+        """
+        state = PipelineState(initial_state or PipelineState.initial())
+        state = await (self.collect_fn or self._default_collect)(state)
+        state = await (self.analyze_fn or self._default_analyze)(state)
+
+        max_retries = state.get("max_retries", 2)
+        qa_item = self.qa_item_fn or self._default_qa_item
+        gate = self._gate()
+
+        async def flow(item: Any) -> tuple[dict, dict, int, bool]:
+            attempt = 0
+            while True:
+                async with gate.slot():
+                    generated = await self._generate_item(item, state["errors"])
+                qa_result = await qa_item(generated)
+                if self._qa_ok(qa_result) or attempt >= max_retries:
+                    break
+                attempt += 1
+            published = False
+            if qa_result["passed"] and self.publish_item_fn:
+                published = await self._publish_item(generated, state["errors"])
+            return generated, qa_result, attempt, published
+
+        flows = await asyncio.gather(*(flow(item) for item in state.get("scored", [])))
+
+        state["generated"] = [generated for generated, _, _, _ in flows]
+        state["qa_results"] = [qa_result for _, qa_result, _, _ in flows]
+        state["retry_count"] = max((attempt for _, _, attempt, _ in flows), default=0)
+        regenerated = sum(attempt for _, _, attempt, _ in flows)
+        state["approved"], avg_score, passing = self._approval(state["qa_results"], self.qa_threshold)
+        if not state["approved"]:
+            state["best_effort"] = True
+
+        state["trace"].append(
+            self._trace_entry(
+                "generate", "success", f"{len(flows)} items streamed, regenerated={regenerated}"
+            )
+        )
+        state["trace"].append(
+            self._trace_entry(
+                "qa",
+                "approved" if state["approved"] else "rejected",
+                f"avg={avg_score:.1f} threshold={self.qa_threshold} passing={passing}/{len(flows)}",
+            )
+        )
+        state["trace"].append(
+            self._trace_entry(
+                "publish", "success", f"{sum(published for *_, published in flows)} items published"
+            )
+        )
+        return state
+
 
 # --- Factory ---
 
@@ -278,6 +461,9 @@ def build_content_pipeline(
     generate_fn: Optional[AgentStepFn] = None,
     qa_fn: Optional[AgentStepFn] = None,
     publish_fn: Optional[AgentStepFn] = None,
+    qa_item_fn: Optional[ItemQAFn] = None,
+    publish_item_fn: Optional[ItemPublishFn] = None,
+    max_concurrency: int = 4,
 ) -> ContentPipelineGraph:
     """Factory to create a governed content pipeline.
 
@@ -303,4 +489,7 @@ def build_content_pipeline(
         generate_fn=generate_fn,
         qa_fn=qa_fn,
         publish_fn=publish_fn,
+        qa_item_fn=qa_item_fn,
+        publish_item_fn=publish_item_fn,
+        max_concurrency=max_concurrency,
     )
@@ -219,9 +219,13 @@ class HarnessWrapper:
             )
 
         # ── Step 4a: Token Budget Gate ──
+        # The estimate stays reserved until recorded (or released on failure),
+        # so concurrent calls cannot all pass the gate on the same headroom.
+        reserved_tokens = 0
         if token_estimate > 0 and self._token_budget:
             try:
-                self._token_budget.gate(token_estimate, tool_name=tool_name)
+                self._token_budget.gate(token_estimate, tool_name=tool_name, reserve=True)
+                reserved_tokens = token_estimate
             except Exception as token_err:
                 self._audit.log_denied(
                     tool_name,
@@ -234,8 +238,13 @@ class HarnessWrapper:
         # ── Step 4b: HITL Gate ──
         if self._constitution.requires_human_approval(tool_name):
             if self._config.hitl_callback:
-                approved = await self._config.hitl_callback(tool_name, tool_input)
+                try:
+                    approved = await self._config.hitl_callback(tool_name, tool_input)
+                except BaseException:
+                    self._release_tokens(reserved_tokens)
+                    raise
                 if not approved:
+                    self._release_tokens(reserved_tokens)
                     self._audit.log_denied(tool_name, "HUMAN_REJECTED", tool_input)
                     raise PermissionDeniedError(
                         f"Tool '{tool_name}' rejected by human reviewer",
@@ -258,13 +267,18 @@ class HarnessWrapper:
             result = await self._hooks.run_post_hooks(tool_name, result)
 
         except Exception as e:
+            self._release_tokens(reserved_tokens)
             elapsed_ms = (time.monotonic() - start_time) * 1000
             self._audit.log_error(tool_name, e, tool_input, elapsed_ms=elapsed_ms)
             raise
+        except BaseException:  # cancellation
+            self._release_tokens(reserved_tokens)
+            raise
 
         # ── Step 6: Audit & Bookkeeping ──
         elapsed_ms = (time.monotonic() - start_time) * 1000
-        self._tool_call_counts[tool_name] = current_count + 1
+        # Re-read: other calls may have completed while this one was awaiting.
+        self._tool_call_counts[tool_name] = self._tool_call_counts.get(tool_name, 0) + 1
         self._total_calls += 1
         self._session_cost += cost_estimate
 
@@ -272,7 +286,7 @@ class HarnessWrapper:
         if token_estimate > 0 and self._token_budget:
             detail = self._token_budget.get_detail_level().value
             self._token_budget.record(
-                tool_name, token_estimate, detail_level=detail,
+                tool_name, token_estimate, detail_level=detail, reserved=reserved_tokens,
             )
 
         self._audit.log_allowed(
@@ -285,6 +299,14 @@ class HarnessWrapper:
 
         return result
 
+    def _release_tokens(self, reserved: int) -> None:
+        if reserved and self._token_budget:
+            self._token_budget.release(reserved)
+
+    def call_count(self, tool_name: str) -> int:
+        """Completed governed calls of ``tool_name`` in this session."""
+        return self._tool_call_counts.get(tool_name, 0)
+
     def is_tool_available(self, tool_name: str, token_estimate: int = 0) -> bool:
         """Quick check if a tool can be called (permission + budget + rate + tokens)."""
         if not self._constitution.is_tool_allowed(tool_name):
@@ -1,11 +1,13 @@
 """shared.harness.sandbox — Tool permission tiers and isolated execution.
 
 Provides 3-tier permission classification for tools and Docker-based
-sandboxed execution for high-risk tool calls.
+sandboxed execution for high-risk tool calls, with an optional pool of
+warm subprocess workers for the non-Docker path.
 """
 
 from .policy import ToolPermissionLevel, SandboxPolicy, SANDBOX_PRESETS
 from .docker_runner import DockerSandboxRunner, SandboxResult
+from .worker_pool import SandboxWorkerPool
 
 __all__ = [
     "ToolPermissionLevel",
@@ -13,4 +15,5 @@ __all__ = [
     "SANDBOX_PRESETS",
     "DockerSandboxRunner",
     "SandboxResult",
+    "SandboxWorkerPool",
 ]
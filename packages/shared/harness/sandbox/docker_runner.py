@@ -6,6 +6,8 @@
   - 타임아웃, 메모리/CPU 제한, 네트워크 차단 적용
 
 Docker가 없는 환경에서는 subprocess 기반 폴백을 제공합니다.
+``pool_size`` 를 주면 폴백 실행이 미리 띄워 둔 worker 풀(worker_pool.py)을
+사용해 명령마다 프로세스를 새로 띄우는 비용을 없앱니다.
 
 Usage::
 
@@ -21,12 +23,17 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import shutil
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from .policy import SandboxPolicy
 
+if TYPE_CHECKING:
+    from .worker_pool import SandboxWorkerPool
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,8 +47,10 @@ class SandboxResult:
         stdout: Standard output (truncated to max_output_chars).
         stderr: Standard error (truncated to max_output_chars).
         timed_out: Whether execution was killed due to timeout.
-        execution_method: "docker" or "subprocess".
+        execution_method: "docker", "subprocess" or "subprocess_pool".
         elapsed_seconds: Wall-clock execution time.
+        queue_wait_seconds: Time spent waiting for a pooled worker
+            (not included in elapsed_seconds).
     """
 
     success: bool
@@ -51,13 +60,35 @@ class SandboxResult:
     timed_out: bool = False
     execution_method: str = "subprocess"
     elapsed_seconds: float = 0.0
+    queue_wait_seconds: float = 0.0
+
+
+def clean_subprocess_env(
+    policy: SandboxPolicy | None,
+    env: dict[str, str] | None,
+) -> dict[str, str]:
+    """Minimal environment for subprocess execution (sensitive vars stripped)."""
+    clean_env = {
+        "PATH": os.environ.get("PATH", ""),
+        "HOME": os.environ.get("HOME", os.environ.get("USERPROFILE", "")),
+        "LANG": os.environ.get("LANG", "en_US.UTF-8"),
+    }
+    for var in policy.allowed_env_vars if policy else ():
+        val = os.environ.get(var, "")
+        if val:
+            clean_env[var] = val
+    if env:
+        clean_env.update(env)
+    return clean_env
 
 
 class DockerSandboxRunner:
     """Runs tool commands in Docker containers with resource constraints.
 
     Falls back to subprocess-based execution if Docker is unavailable,
-    applying timeout and basic isolation where possible.
+    applying timeout and basic isolation where possible. With
+    ``pool_size > 0`` that fallback runs on a ``SandboxWorkerPool`` of warm
+    workers, recycled after ``pool_max_uses`` runs; call ``close()`` when done.
     """
 
     DEFAULT_IMAGE = "python:3.12-slim"
@@ -67,10 +98,33 @@ class DockerSandboxRunner:
         self,
         image: str | None = None,
         work_dir: str | Path | None = None,
+        *,
+        pool_size: int = 0,
+        pool_max_uses: int = 100,
     ):
         self._image = image or self.DEFAULT_IMAGE
         self._work_dir = Path(work_dir) if work_dir else None
         self._docker_available: bool | None = None
+        self._pool: SandboxWorkerPool | None = None
+        if pool_size > 0:
+            from .worker_pool import SandboxWorkerPool
+
+            self._pool = SandboxWorkerPool(
+                pool_size,
+                max_uses=pool_max_uses,
+                work_dir=self._work_dir,
+                max_output_chars=self.MAX_OUTPUT_CHARS,
+            )
+
+    @property
+    def pool(self) -> SandboxWorkerPool | None:
+        """The warm worker pool, if enabled."""
+        return self._pool
+
+    async def close(self) -> None:
+        """Shut down the warm worker pool, if any."""
+        if self._pool is not None:
+            await self._pool.close()
 
     @property
     def docker_available(self) -> bool:
@@ -148,8 +202,6 @@ class DockerSandboxRunner:
             cmd_parts.extend(["--network", "none"])
 
         # Environment variables — resolve from host env consistently
-        import os
-
         merged_env = dict(env or {})
         for var in policy.allowed_env_vars:
             if var not in merged_env:
@@ -232,21 +284,13 @@ class DockerSandboxRunner:
         env: dict[str, str] | None = None,
     ) -> SandboxResult:
         """Fallback: execute command as a subprocess with timeout."""
-        import os
         import time
 
+        if self._pool is not None:
+            return await self._pool.run(command, policy, env=env)
+
         # Build clean environment (strip sensitive vars)
-        clean_env = {
-            "PATH": os.environ.get("PATH", ""),
-            "HOME": os.environ.get("HOME", os.environ.get("USERPROFILE", "")),
-            "LANG": os.environ.get("LANG", "en_US.UTF-8"),
-        }
-        for var in policy.allowed_env_vars:
-            val = os.environ.get(var, "")
-            if val:
-                clean_env[var] = val
-        if env:
-            clean_env.update(env)
+        clean_env = clean_subprocess_env(policy, env)
 
         start = time.monotonic()
         try:
@@ -0,0 +1,302 @@
+"""shared.harness.sandbox.worker_pool — Pre-warmed subprocess workers.
+
+비유: 대기 중인 폭발물 처리반
+  - 출동할 때마다 차량을 새로 조립하지 않고, 시동 걸린 차량이 대기
+  - 임무마다 장비를 초기화하고, 일정 횟수 출동하거나 사고가 나면 교체
+
+Each worker is a long-lived ``sh`` in its own session. A run sources the
+command file in a fresh subshell, so the working directory, shell
+variables, functions, traps and exported environment are reset for every
+run, and each run gets an empty ``TMPDIR`` that is deleted afterwards. The
+command's stdout/stderr go to files in the worker's scratch directory,
+never through the control pipe.
+
+Workers are recycled after ``max_uses`` runs and replaced immediately on a
+policy violation: a timeout (the whole process group is killed), output
+over the limit, a protocol error, or a worker that died mid-run.
+Background processes a command leaves behind live until the worker is
+recycled.
+
+Usage::
+
+    pool = SandboxWorkerPool(size=4, max_uses=100)
+    await pool.start()  # optional pre-warm
+    result = await pool.run("echo hi", policy)
+    print(result.queue_wait_seconds, result.elapsed_seconds)
+    await pool.close()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import logging
+import os
+import re
+import secrets
+import shlex
+import shutil
+import signal
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .docker_runner import SandboxResult, clean_subprocess_env
+
+if TYPE_CHECKING:
+    from .policy import SandboxPolicy
+
+logger = logging.getLogger(__name__)
+
+_ENV_NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+class _Violation(Exception):
+    """The run broke the worker's contract; the worker must not be reused."""
+
+
+class _Worker:
+    """One warm ``sh`` process plus its private scratch directory."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, proc: asyncio.subprocess.Process, scratch: Path):
+        self.id = next(self._ids)
+        self.proc = proc
+        self.scratch = scratch
+        self.nonce = secrets.token_hex(8)
+        self.uses = 0
+
+    @classmethod
+    async def spawn(cls, cwd: Path) -> _Worker:
+        scratch = Path(tempfile.mkdtemp(prefix="sandbox-worker-"))
+        proc = await asyncio.create_subprocess_exec(
+            "sh",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            env=clean_subprocess_env(None, None),
+            cwd=str(cwd),
+            start_new_session=True,  # killpg() reaches everything it started
+        )
+        return cls(proc, scratch)
+
+    @property
+    def alive(self) -> bool:
+        return self.proc.returncode is None
+
+    async def kill(self) -> None:
+        if self.alive:
+            with contextlib.suppress(ProcessLookupError, PermissionError):
+                os.killpg(self.proc.pid, signal.SIGKILL)
+            with contextlib.suppress(ProcessLookupError):
+                self.proc.kill()
+            await self.proc.wait()
+        shutil.rmtree(self.scratch, ignore_errors=True)
+
+
+class SandboxWorkerPool:
+    """Fixed-size pool of warm subprocess workers for sandbox runs.
+
+    Workers are spawned lazily up to ``size`` (or all at once by
+    ``start()``). ``run()`` waits for an idle worker; that wait is reported
+    as ``queue_wait_seconds`` and is not counted against
+    ``policy.timeout_seconds`` or ``elapsed_seconds``.
+
+    The pool belongs to the event loop it is first used on.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        *,
+        max_uses: int = 100,
+        work_dir: str | Path | None = None,
+        max_output_chars: int = 50_000,
+    ):
+        self.size = max(1, size)
+        self.max_uses = max(1, max_uses)
+        self.max_output_chars = max_output_chars
+        self._cwd = Path(work_dir) if work_dir else Path.cwd()
+        self._idle: asyncio.Queue[_Worker] | None = None
+        self._spawned = 0  # live workers, idle or busy
+        self._closed = False
+        self._runs = itertools.count(1)
+        self.stats = {"runs": 0, "spawned": 0, "recycled": 0, "violations": 0}
+
+    def _queue(self) -> asyncio.Queue[_Worker]:
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+        return self._idle
+
+    async def _spawn(self) -> _Worker:
+        self._spawned += 1
+        try:
+            worker = await _Worker.spawn(self._cwd)
+        except BaseException:
+            self._spawned -= 1
+            raise
+        self.stats["spawned"] += 1
+        return worker
+
+    async def start(self) -> None:
+        """Pre-warm every worker so the first runs skip process startup."""
+        missing = self.size - self._spawned
+        workers = await asyncio.gather(*(self._spawn() for _ in range(missing)))
+        for worker in workers:
+            self._queue().put_nowait(worker)
+
+    async def _acquire(self) -> _Worker:
+        queue = self._queue()
+        if queue.empty() and self._spawned < self.size:
+            return await self._spawn()
+        return await queue.get()
+
+    async def _release(self, worker: _Worker, *, recycle: bool) -> None:
+        if recycle or self._closed or not worker.alive or worker.uses >= self.max_uses:
+            self._spawned -= 1
+            self.stats["recycled"] += 1
+            await worker.kill()
+            if not self._closed:
+                # Replace it right away so the next run finds a warm worker.
+                try:
+                    self._queue().put_nowait(await self._spawn())
+                except OSError:
+                    logger.exception("Failed to respawn sandbox worker")
+            return
+        self._queue().put_nowait(worker)
+
+    async def close(self) -> None:
+        """Kill idle workers; busy ones are killed when their run finishes."""
+        self._closed = True
+        queue = self._queue()
+        while not queue.empty():
+            worker = queue.get_nowait()
+            self._spawned -= 1
+            await worker.kill()
+
+    async def run(
+        self,
+        command: str,
+        policy: SandboxPolicy,
+        *,
+        env: dict[str, str] | None = None,
+    ) -> SandboxResult:
+        """Execute ``command`` (``sh`` syntax) on a warm worker."""
+        if self._closed:
+            raise RuntimeError("SandboxWorkerPool is closed")
+        exports = clean_subprocess_env(policy, env)
+        bad = [name for name in exports if not _ENV_NAME_RE.match(name)]
+        if bad:
+            return SandboxResult(
+                success=False,
+                stderr=f"Invalid environment variable name(s): {', '.join(bad)}",
+                execution_method="subprocess_pool",
+            )
+
+        queued = time.monotonic()
+        worker = await self._acquire()
+        queue_wait = time.monotonic() - queued
+        self.stats["runs"] += 1
+        recycle = True
+        start = time.monotonic()
+        try:
+            exit_code, stdout, stderr, recycle = await asyncio.wait_for(
+                self._execute(worker, command, exports),
+                timeout=policy.timeout_seconds,
+            )
+            elapsed = time.monotonic() - start
+            return SandboxResult(
+                success=exit_code == 0,
+                exit_code=exit_code,
+                stdout=stdout,
+                stderr=stderr,
+                timed_out=False,
+                execution_method="subprocess_pool",
+                elapsed_seconds=round(elapsed, 3),
+                queue_wait_seconds=round(queue_wait, 3),
+            )
+
+        except TimeoutError:
+            elapsed = time.monotonic() - start
+            self.stats["violations"] += 1
+            logger.warning(
+                "Pooled sandbox run timed out after %ds; recycling worker %d", policy.timeout_seconds, worker.id
+            )
+            return SandboxResult(
+                success=False,
+                exit_code=-1,
+                stderr=f"Subprocess timeout after {policy.timeout_seconds}s",
+                timed_out=True,
+                execution_method="subprocess_pool",
+                elapsed_seconds=round(elapsed, 3),
+                queue_wait_seconds=round(queue_wait, 3),
+            )
+
+        except _Violation as e:
+            elapsed = time.monotonic() - start
+            self.stats["violations"] += 1
+            logger.warning("Sandbox worker %d violated the pool protocol: %s", worker.id, e)
+            return SandboxResult(
+                success=False,
+                exit_code=-1,
+                stderr=str(e),
+                execution_method="subprocess_pool",
+                elapsed_seconds=round(elapsed, 3),
+                queue_wait_seconds=round(queue_wait, 3),
+            )
+
+        finally:
+            await self._release(worker, recycle=recycle)
+
+    async def _execute(self, worker: _Worker, command: str, exports: dict[str, str]) -> tuple[int, str, str, bool]:
+        """Run one command; returns (exit_code, stdout, stderr, recycle)."""
+        run_id = next(self._runs)
+        scratch = worker.scratch
+        cmd_file, out_file, err_file = scratch / "cmd.sh", scratch / "out", scratch / "err"
+        run_tmp = scratch / f"tmp-{run_id}"
+        run_tmp.mkdir()
+        cmd_file.write_text(command, encoding="utf-8")
+        env_args = " ".join(f"{name}={shlex.quote(value)}" for name, value in exports.items())
+        done = f"__sandbox_done__ {worker.nonce} {run_id}"
+        script = (
+            f"( cd -- {shlex.quote(str(self._cwd))} && export {env_args} TMPDIR={shlex.quote(str(run_tmp))}"
+            f" && . {shlex.quote(str(cmd_file))} ) </dev/null >{shlex.quote(str(out_file))}"
+            f' 2>{shlex.quote(str(err_file))}; echo "{done} $?"\n'
+        )
+        worker.uses += 1
+        try:
+            worker.proc.stdin.write(script.encode("utf-8"))
+            await worker.proc.stdin.drain()
+            line = await worker.proc.stdout.readline()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            raise _Violation(f"sandbox worker exited: {e}") from e
+        finally:
+            shutil.rmtree(run_tmp, ignore_errors=True)
+
+        text = line.decode("utf-8", errors="replace").rstrip("\n")
+        if not text.startswith(done + " "):
+            raise _Violation(
+                "sandbox worker exited during the run" if not line else f"unexpected worker output: {text[:200]!r}"
+            )
+        exit_code = int(text.rsplit(" ", 1)[1])
+
+        stdout, out_over = self._read_output(out_file)
+        stderr, err_over = self._read_output(err_file)
+        if out_over or err_over:
+            self.stats["violations"] += 1
+            logger.warning("Sandbox output over %d chars; recycling worker %d", self.max_output_chars, worker.id)
+        return exit_code, stdout, stderr, out_over or err_over
+
+    def _read_output(self, path: Path) -> tuple[str, bool]:
+        """Read at most ``max_output_chars`` characters; flag larger outputs."""
+        limit = self.max_output_chars * 4  # UTF-8 upper bound
+        try:
+            with open(path, "rb") as f:
+                data = f.read(limit + 1)
+        except FileNotFoundError:
+            return "", False
+        text = data[:limit].decode("utf-8", errors="replace")
+        return text[: self.max_output_chars], len(data) > limit or len(text) > self.max_output_chars
@@ -24,6 +24,7 @@ from shared.harness.sandbox.policy import (
     get_tool_level,
 )
 from shared.harness.sandbox.docker_runner import DockerSandboxRunner, SandboxResult
+from shared.harness.sandbox.worker_pool import SandboxWorkerPool
 from shared.harness.adapters.base import AbstractHarnessAdapter, AdapterResult
 from shared.harness.adapters.native import NativeHarnessAdapter
 from shared.harness.constitution import Constitution
@@ -278,6 +279,139 @@ class TestDockerSandboxRunnerSubprocess:
             assert "fallback" in result.stdout
 
 
+# ===========================================================================
+# Test: SandboxWorkerPool (warm subprocess workers)
+# ===========================================================================
+
+class TestSandboxWorkerPool:
+    @pytest.fixture
+    def policy(self):
+        return SandboxPolicy(
+            level=ToolPermissionLevel.READ_ONLY,
+            sandbox=False,
+            timeout_seconds=10,
+        )
+
+    @staticmethod
+    async def _worker_pid(pool, policy) -> str:
+        # Inside the per-run subshell $$ is still the worker shell's pid.
+        return (await pool.run("echo $$", policy)).stdout.strip()
+
+    @pytest.mark.asyncio
+    async def test_runs_reuse_a_warm_worker(self, policy):
+        pool = SandboxWorkerPool(size=1)
+        await pool.start()
+        try:
+            first = await self._worker_pid(pool, policy)
+            result = await pool.run("echo hello", policy)
+            assert result.success
+            assert result.stdout == "hello\n"
+            assert result.execution_method == "subprocess_pool"
+            assert await self._worker_pid(pool, policy) == first
+            assert pool.stats["spawned"] == 1
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_state_is_reset_between_runs(self, policy, tmp_path):
+        pool = SandboxWorkerPool(size=1, work_dir=tmp_path)
+        try:
+            await pool.run(
+                "cd /; FOO=1; export BAR=2; f() { :; }; umask 077; echo x > \"$TMPDIR/left\"",
+                policy,
+            )
+            result = await pool.run(
+                "pwd; echo ${FOO:-unset} ${BAR:-unset}; command -v f || echo nofunc; ls -A \"$TMPDIR\" | wc -l",
+                policy,
+            )
+            assert result.stdout.split() == [str(tmp_path), "unset", "unset", "nofunc", "0"]
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_exit_code_stderr_env_and_multiline_commands(self, policy):
+        pool = SandboxWorkerPool(size=1)
+        try:
+            result = await pool.run("echo oops >&2\nexit 3", policy)
+            assert (result.exit_code, result.stderr, result.success) == (3, "oops\n", False)
+
+            quoted = await pool.run(
+                "cat <<'EOF'\n$GREETING\nEOF\necho \"$GREETING\"",
+                policy,
+                env={"GREETING": "it's \"fine\" $HOME"},
+            )
+            assert quoted.stdout == "$GREETING\nit's \"fine\" $HOME\n"
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_worker_recycled_after_max_uses(self, policy):
+        pool = SandboxWorkerPool(size=1, max_uses=2)
+        try:
+            pids = [await self._worker_pid(pool, policy) for _ in range(3)]
+            assert pids[0] == pids[1] != pids[2]
+            assert pool.stats["recycled"] == 1
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_and_replaces_worker(self):
+        pool = SandboxWorkerPool(size=1)
+        short = SandboxPolicy(level=ToolPermissionLevel.WRITE_SYSTEM, sandbox=False, timeout_seconds=1)
+        try:
+            before = await self._worker_pid(pool, short)
+            result = await pool.run("sleep 5", short)
+            assert result.timed_out and not result.success
+            assert await self._worker_pid(pool, short) != before
+            assert pool.stats["violations"] == 1
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_oversized_output_truncated_and_worker_recycled(self, policy):
+        pool = SandboxWorkerPool(size=1, max_output_chars=10)
+        try:
+            before = await self._worker_pid(pool, policy)
+            result = await pool.run("printf '%0100d' 0", policy)
+            assert result.stdout == "0" * 10
+            assert await self._worker_pid(pool, policy) != before
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_killed_worker_is_replaced(self, policy):
+        pool = SandboxWorkerPool(size=1)
+        try:
+            result = await pool.run("kill -9 $$", policy)
+            assert not result.success
+            assert (await pool.run("echo alive", policy)).stdout == "alive\n"
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_queue_wait_reported_separately(self, policy):
+        pool = SandboxWorkerPool(size=1)
+        await pool.start()
+        try:
+            results = await asyncio.gather(pool.run("sleep 0.3", policy), pool.run("sleep 0.3", policy))
+            waits = sorted(r.queue_wait_seconds for r in results)
+            assert waits[0] < 0.1
+            assert waits[1] >= 0.25
+            assert all(0.25 <= r.elapsed_seconds < 1.0 for r in results)
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_runner_uses_pool_for_subprocess_path(self, policy):
+        runner = DockerSandboxRunner(pool_size=1)
+        try:
+            result = await runner.run("echo pooled", policy)
+            assert result.execution_method == "subprocess_pool"
+            assert result.stdout == "pooled\n"
+        finally:
+            await runner.close()
+
+
 # ===========================================================================
 # Test: AdapterResult
 # ===========================================================================
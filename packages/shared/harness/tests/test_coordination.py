@@ -5,14 +5,19 @@ Covers:
   - ContentPipelineGraph default nodes
   - Conditional retry logic
   - Custom node overrides
+  - Concurrent generation, partial retries and streaming mode
   - Graph build (requires langgraph)
 """
 
 from __future__ import annotations
 
+import asyncio
+import time
+
 import pytest
 from unittest.mock import AsyncMock
 
+from shared.harness.adapters.base import AdapterResult
 from shared.harness.constitution import Constitution
 from shared.harness.adapters.native import NativeHarnessAdapter
 from shared.harness.coordination.graph import (
@@ -44,6 +49,33 @@ def _make_adapter() -> NativeHarnessAdapter:
     return NativeHarnessAdapter(_make_constitution(), tool_executor=executor)
 
 
+class _ScriptedAdapter:
+    """Fake adapter: per-topic latency, scripted failures, call/concurrency tracking."""
+
+    def __init__(self, latencies: dict[str, float], failures: dict[str, int] | None = None):
+        self.latencies = latencies
+        self.failures = dict(failures or {})
+        self.calls: list[str] = []
+        self.finished: dict[str, float] = {}
+        self.in_flight = 0
+        self.peak = 0
+
+    async def execute_with_governance(self, task, tools, *, cost_estimate=0.0):
+        topic = task["input"]["content"]["topic"]
+        self.calls.append(topic)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.latencies.get(topic, 0.0))
+        finally:
+            self.in_flight -= 1
+        self.finished[topic] = time.monotonic()
+        if self.failures.get(topic, 0) > 0:
+            self.failures[topic] -= 1
+            raise RuntimeError(f"scripted failure for {topic}")
+        return AdapterResult(success=True, output=f"post about {topic}")
+
+
 # ===========================================================================
 # Test: PipelineState
 # ===========================================================================
@@ -257,3 +289,122 @@ class TestGraphBuild:
         steps = [t["step"] for t in result["trace"]]
         assert "collect" in steps
         assert "analyze" in steps
+
+
+# ===========================================================================
+# Test: Concurrent generation / partial retries / streaming
+# ===========================================================================
+
+class TestConcurrentGeneration:
+    @pytest.mark.asyncio
+    async def test_generation_is_bounded_and_keeps_item_order(self):
+        adapter = _ScriptedAdapter({"a": 0.15, "b": 0.05, "c": 0.1, "d": 0.05, "e": 0.1})
+        graph = ContentPipelineGraph(adapter=adapter, max_concurrency=2)
+        state = PipelineState.initial()
+        state["scored"] = [{"topic": t} for t in "abcde"]
+
+        started = time.monotonic()
+        result = await graph._default_generate(state)
+        elapsed = time.monotonic() - started
+
+        assert adapter.peak == 2
+        assert elapsed < 0.45  # sequential would take 0.45s
+        assert [g["content"] for g in result["generated"]] == [f"post about {t}" for t in "abcde"]
+
+    @pytest.mark.asyncio
+    async def test_retry_regenerates_only_failed_items(self):
+        adapter = _ScriptedAdapter({}, failures={"b": 1})
+        graph = ContentPipelineGraph(adapter=adapter)
+        state = PipelineState.initial()
+        state["scored"] = [{"topic": t} for t in "abc"]
+
+        state = await graph._default_generate(state)
+        state = await graph._default_qa(state)
+        assert graph._should_retry(state) == "publish"  # a and c pass
+        state["approved"] = False  # force a retry round, as a strict QA would
+        state = await graph._retry_gate(state)
+        state = await graph._default_generate(state)
+        state = await graph._default_qa(state)
+
+        assert adapter.calls == ["a", "b", "c", "b"]
+        assert all(r["passed"] for r in state["qa_results"])
+        assert "regenerated=1" in state["trace"][-2]["detail"]
+
+    @pytest.mark.asyncio
+    async def test_low_scoring_items_are_regenerated(self):
+        adapter = _ScriptedAdapter({})
+        scores = iter([9.0, 4.0, 9.0])
+
+        async def scripted_qa(item):
+            return {"item": item, "score": next(scores), "passed": True}
+
+        graph = ContentPipelineGraph(adapter=adapter, qa_item_fn=scripted_qa)
+        state = PipelineState.initial()
+        state["scored"] = [{"topic": "keep"}, {"topic": "redo"}]
+        state = await graph._default_generate(state)
+        state = await graph._default_qa(state)
+        state["retry_count"] = 1
+        state = await graph._default_generate(state)
+
+        assert adapter.calls == ["keep", "redo", "redo"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_do_not_overrun_budget(self):
+        async def slow_executor(tool_name, tool_input):
+            await asyncio.sleep(0.02)
+            return "ok"
+
+        constitution = Constitution.from_dict({
+            "agent_name": "budget",
+            "max_budget_usd": 0.05,
+            "tools": [{"name": "llm_call", "allowed": True, "max_calls": 100}],
+        })
+        adapter = NativeHarnessAdapter(constitution, tool_executor=slow_executor)
+        graph = ContentPipelineGraph(adapter=adapter, max_concurrency=8, generate_cost_estimate=0.01)
+        state = PipelineState.initial()
+        state["scored"] = [{"topic": str(i)} for i in range(10)]
+
+        result = await graph._default_generate(state)
+
+        assert sum(g["success"] for g in result["generated"]) == 5
+        assert adapter.harness.session_cost == pytest.approx(0.05)
+        assert adapter.harness.call_count("llm_call") == 5
+        assert all("BudgetExceededError" in e for e in result["errors"])
+
+
+class TestStreamingMode:
+    @pytest.mark.asyncio
+    async def test_items_publish_independently(self):
+        adapter = _ScriptedAdapter({"fast": 0.01, "slow": 0.2})
+        published: dict[str, float] = {}
+
+        async def publish(item):
+            published[item["source"]["topic"]] = time.monotonic()
+
+        graph = ContentPipelineGraph(adapter=adapter, publish_item_fn=publish)
+        result = await graph.run_streaming(PipelineState.initial([{"topic": "slow"}, {"topic": "fast"}]))
+
+        assert published["fast"] < adapter.finished["slow"]
+        assert set(published) == {"fast", "slow"}
+        assert result["approved"] is True
+        assert [t["step"] for t in result["trace"]] == ["collect", "analyze", "generate", "qa", "publish"]
+
+    @pytest.mark.asyncio
+    async def test_failed_item_retries_alone(self):
+        adapter = _ScriptedAdapter({}, failures={"flaky": 1, "broken": 5})
+        published = []
+
+        async def publish(item):
+            published.append(item["source"]["topic"])
+
+        graph = ContentPipelineGraph(adapter=adapter, publish_item_fn=publish)
+        result = await graph.run_streaming(
+            PipelineState.initial([{"topic": "ok"}, {"topic": "flaky"}, {"topic": "broken"}])
+        )
+
+        assert adapter.calls.count("ok") == 1
+        assert adapter.calls.count("flaky") == 2
+        assert adapter.calls.count("broken") == 3  # max_retries=2
+        assert sorted(published) == ["flaky", "ok"]
+        assert result["retry_count"] == 2
+        assert [r["passed"] for r in result["qa_results"]] == [True, True, False]
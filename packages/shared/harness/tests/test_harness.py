@@ -10,6 +10,7 @@ from __future__ import annotations
 import asyncio
 import json
 import tempfile
+import time
 from pathlib import Path
 
 import pytest
@@ -231,6 +232,69 @@ class TestAuditLogger:
         record = logger.log_allowed("web_search", "a" * 100)
         assert len(record.tool_input_summary) <= 13  # 10 + "..."
 
+    def test_allowed_records_are_group_committed_on_flush(self, tmp_path):
+        log_file = tmp_path / "audit.jsonl"
+        logger = AuditLogger(agent_name="test", log_path=log_file, emit_to_logging=False, max_delay=60)
+        for i in range(5):
+            logger.log_allowed("web_search", {"q": i})
+        logger.flush()
+
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["tool_input_summary"] for line in lines] == [str({"q": i}) for i in range(5)]
+        assert logger._writer.commits == 1
+        logger.close()
+
+    def test_batch_size_and_delay_trigger_background_commit(self, tmp_path):
+        log_file = tmp_path / "audit.jsonl"
+        by_size = AuditLogger(log_path=log_file, emit_to_logging=False, max_batch=3, max_delay=60)
+        by_delay = AuditLogger(log_path=tmp_path / "delay.jsonl", emit_to_logging=False, max_delay=0.05)
+        for _ in range(3):
+            by_size.log_allowed("web_search", "q")
+        by_delay.log_allowed("web_search", "q")
+
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline and not (by_size._writer.commits and by_delay._writer.commits):
+            time.sleep(0.01)
+
+        assert len(log_file.read_text(encoding="utf-8").splitlines()) == 3
+        assert len((tmp_path / "delay.jsonl").read_text(encoding="utf-8").splitlines()) == 1
+        by_size.close()
+        by_delay.close()
+
+    def test_close_then_write_is_synchronous(self, tmp_path):
+        log_file = tmp_path / "audit.jsonl"
+        logger = AuditLogger(log_path=log_file, emit_to_logging=False, max_delay=60)
+        logger.log_allowed("web_search", "before")
+        logger.close()
+        assert len(log_file.read_text(encoding="utf-8").splitlines()) == 1
+
+        logger.log_allowed("web_search", "after")
+        assert len(log_file.read_text(encoding="utf-8").splitlines()) == 2
+        logger.close()
+
+    def test_torn_last_line_is_terminated(self, tmp_path):
+        log_file = tmp_path / "audit.jsonl"
+        log_file.write_text('{"verdict": "allowed"}\n{"verdict": "al', encoding="utf-8")
+        logger = AuditLogger(log_path=log_file, emit_to_logging=False)
+        logger.log_denied("file_delete", "BLOCKED")
+
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert lines[1] == '{"verdict": "al'
+        assert json.loads(lines[2])["verdict"] == "denied"
+        logger.close()
+
+    def test_secrets_redacted_with_combined_pattern(self):
+        logger = AuditLogger(emit_to_logging=False, max_input_chars=1000)
+        record = logger.log_allowed(
+            "http", "Bearer abcdefghijklmnopqrstuvwx PASSWORD=hunter2hunter2 key sk-" + "a" * 24
+        )
+        assert record.tool_input_summary == "***REDACTED*** ***REDACTED*** key ***REDACTED***"
+
+    def test_secret_crossing_truncation_point_is_redacted(self):
+        logger = AuditLogger(emit_to_logging=False, max_input_chars=20)
+        record = logger.log_allowed("http", "x" * 15 + "ghp_" + "b" * 36 + "y" * 5000)
+        assert record.tool_input_summary == "x" * 15 + "***RE..."
+
 
 # ── Hooks Tests ──
 
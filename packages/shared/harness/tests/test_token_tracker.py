@@ -4,11 +4,16 @@ Tests are structured to match CRG's token-efficient design principles:
   - Budget tracking and auto-minimization
   - Gate enforcement (hard limit)
   - Session management and reporting
+  - Bounded history, spill log, incremental top-N and reservations
   - Integration with HarnessWrapper
 """
 
 from __future__ import annotations
 
+import asyncio
+import random
+import threading
+
 import pytest
 
 from shared.harness.token_tracker import (
@@ -16,6 +21,7 @@ from shared.harness.token_tracker import (
     TokenBudget,
     TokenBudgetExceededError,
     TokenUsageRecord,
+    read_usage_log,
 )
 
 
@@ -223,6 +229,89 @@ class TestEdgeCases:
         assert top == []
 
 
+class TestBoundedHistory:
+    """Ring buffer, spill log and incremental top-N."""
+
+    def test_history_is_bounded(self):
+        budget = TokenBudget(max_tokens=10**9, history_size=3)
+        for i in range(10):
+            budget.record(f"tool_{i % 2}", i)
+        assert [r.tokens for r in budget.records] == [7, 8, 9]
+        assert budget.total_calls == 10
+        assert budget.used_tokens == sum(range(10))
+
+    def test_spill_log_keeps_every_record(self, tmp_path):
+        log_path = tmp_path / "usage.jsonl"
+        budget = TokenBudget(max_tokens=10**9, history_size=2, spill_path=log_path)
+        for i in range(5):
+            budget.record("llm", 100 + i, metadata={"step": i} if i == 4 else None)
+        budget.close()
+
+        records = list(read_usage_log(log_path))
+        assert [r.tokens for r in records] == [100, 101, 102, 103, 104]
+        assert records[0].metadata == {}
+        assert records[4].metadata == {"step": 4}
+        assert all(isinstance(r, TokenUsageRecord) for r in records)
+
+    def test_read_usage_log_skips_torn_line(self, tmp_path):
+        log_path = tmp_path / "usage.jsonl"
+        log_path.write_text('[1.0,"a",5,"standard"]\n[2.0,"b",', encoding="utf-8")
+        assert [r.tool_name for r in read_usage_log(log_path)] == ["a"]
+
+    def test_incremental_top_n_matches_full_sort(self):
+        rng = random.Random(7)
+        budget = TokenBudget(max_tokens=10**12, top_n=5)
+        for _ in range(5_000):
+            budget.record(f"tool_{rng.randrange(40)}", rng.randrange(1, 1_000))
+
+        expected = sorted(budget._tool_usage.values(), reverse=True)
+        for n in (1, 5, 12):
+            assert [t["tokens"] for t in budget.get_top_consumers(n)] == expected[:n]
+
+    def test_negative_record_falls_back_to_sort(self):
+        budget = TokenBudget(max_tokens=10_000, top_n=2)
+        budget.record("a", 500)
+        budget.record("b", 300)
+        budget.record("a", -400)
+        assert [t["tool"] for t in budget.get_top_consumers(2)] == ["b", "a"]
+
+    def test_concurrent_threads_lose_no_updates(self):
+        budget = TokenBudget(max_tokens=10**9, history_size=100)
+
+        def worker(name):
+            for _ in range(5_000):
+                budget.record(name, 3)
+
+        threads = [threading.Thread(target=worker, args=(f"t{i}",)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert budget.used_tokens == 4 * 5_000 * 3
+        assert budget.total_calls == 20_000
+
+
+class TestReservations:
+    """gate(reserve=True) holds headroom until record()/release()."""
+
+    def test_reserved_tokens_block_other_callers(self):
+        budget = TokenBudget(max_tokens=10_000)
+        budget.gate(6_000, reserve=True)
+        assert budget.can_afford(5_000) is False
+        with pytest.raises(TokenBudgetExceededError):
+            budget.gate(5_000)
+
+        budget.record("llm", 5_500, reserved=6_000)
+        assert budget.used_tokens == 5_500
+        assert budget.reserved_tokens == 0
+
+    def test_release_returns_headroom(self):
+        budget = TokenBudget(max_tokens=10_000)
+        budget.gate(8_000, reserve=True)
+        budget.release(8_000)
+        assert budget.gate(8_000) is True
+
+
 # ── Integration Tests: HarnessWrapper + TokenBudget ──
 
 
@@ -289,3 +378,28 @@ class TestHarnessTokenIntegration:
         denied = [r for r in harness.audit_logger.records if r.verdict == "denied"]
         assert len(denied) >= 1
         assert "TOKEN_BUDGET" in denied[-1].reason
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_cannot_share_headroom(self, harness):
+        async def slow(tool_name, tool_input):
+            await asyncio.sleep(0.02)
+            return "ok"
+
+        results = await asyncio.gather(
+            harness.execute_tool("web_search", {"q": 1}, executor=slow, token_estimate=3_000),
+            harness.execute_tool("web_search", {"q": 2}, executor=slow, token_estimate=3_000),
+            return_exceptions=True,
+        )
+        assert sum(isinstance(r, TokenBudgetExceededError) for r in results) == 1
+        assert harness.token_budget.used_tokens == 3_000
+        assert harness.token_budget.reserved_tokens == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_call_releases_reservation(self, harness):
+        async def boom(tool_name, tool_input):
+            raise RuntimeError("fail")
+
+        with pytest.raises(RuntimeError):
+            await harness.execute_tool("web_search", {"q": 1}, executor=boom, token_estimate=3_000)
+        assert harness.token_budget.reserved_tokens == 0
+        assert harness.token_budget.used_tokens == 0
@@ -20,18 +20,36 @@ Usage::
         detail_level = "minimal"  # auto-downshift
 
     budget.gate(estimated=3_000)  # raises TokenBudgetExceededError if over
+
+Memory stays bounded for long-running agents: only the last
+``history_size`` usage records are kept in memory. With ``spill_path``
+set, every record is also appended to a compact JSONL log (one
+``[timestamp, tool, tokens, detail_level(, metadata)]`` array per line)
+that ``read_usage_log()`` reads back for audits.
 """
 
 from __future__ import annotations
 
+import json
 import logging
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from .audit import BufferedAuditWriter
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Shared encoder: json.dumps() with options builds a new encoder per call.
+_LOG_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=str)
+
 
 class DetailLevel(str, Enum):
     """Output verbosity levels, matching CRG's detail_level parameter."""
@@ -68,6 +86,30 @@ class TokenUsageRecord:
     detail_level: str
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    def to_log_line(self) -> str:
+        """Compact JSON array form used by the spill log."""
+        row: list[Any] = [round(self.timestamp, 3), self.tool_name, self.tokens, self.detail_level]
+        if self.metadata:
+            row.append(self.metadata)
+        return _LOG_ENCODER.encode(row)
+
+
+def read_usage_log(path: str | Path) -> Iterator[TokenUsageRecord]:
+    """Yield the records of a TokenBudget spill log, skipping torn lines."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                timestamp, tool_name, tokens, detail_level, *rest = json.loads(line)
+            except (ValueError, TypeError):
+                continue
+            yield TokenUsageRecord(
+                timestamp=timestamp,
+                tool_name=tool_name,
+                tokens=tokens,
+                detail_level=detail_level,
+                metadata=rest[0] if rest else {},
+            )
+
 
 @dataclass
 class TokenBudget:
@@ -82,18 +124,41 @@ class TokenBudget:
         - minimize_threshold: 0.7 → switch to "minimal" at 70% usage
         - warn_threshold: 0.9 → log warning at 90% usage
 
-    Thread-safe for async usage (single-writer pattern).
+    History (configurable):
+        - history_size: 1000 → records kept in memory (None = unbounded)
+        - spill_path: None → JSONL log receiving every record
+        - top_n: 10 → consumers ranked incrementally for get_top_consumers()
+
+    ``record()`` and ``gate()`` are O(1) and lock-protected. Callers that
+    await between gating and recording should pass ``reserve=True`` to
+    ``gate()`` and the same amount as ``reserved=`` to ``record()`` (or
+    ``release()`` it on failure), so concurrent calls cannot all pass the
+    gate on the same headroom.
     """
 
     max_tokens: int = 50_000
     minimize_threshold: float = 0.7
     warn_threshold: float = 0.9
+    history_size: int | None = 1000
+    spill_path: str | Path | None = None
+    top_n: int = 10
     _used_tokens: int = field(default=0, repr=False)
+    _reserved_tokens: int = field(default=0, repr=False)
+    _total_calls: int = field(default=0, repr=False)
     _tool_usage: dict[str, int] = field(default_factory=dict, repr=False)
     _tool_call_counts: dict[str, int] = field(default_factory=dict, repr=False)
-    _records: list[TokenUsageRecord] = field(default_factory=list, repr=False)
+    _records: deque[TokenUsageRecord] = field(init=False, repr=False)
+    _top: list[str] = field(default_factory=list, repr=False)
+    _top_valid: bool = field(default=True, repr=False)
+    _spill: BufferedAuditWriter | None = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
     _forced_level: DetailLevel | None = field(default=None, repr=False)
 
+    def __post_init__(self) -> None:
+        self._records = deque(maxlen=self.history_size)
+        if self.spill_path:
+            self._spill = BufferedAuditWriter(self.spill_path, fsync=False)
+
     @property
     def used_tokens(self) -> int:
         """Total tokens consumed in this session."""
@@ -111,10 +176,20 @@ class TokenBudget:
             return 1.0
         return self._used_tokens / self.max_tokens
 
+    @property
+    def reserved_tokens(self) -> int:
+        """Tokens reserved by ``gate(reserve=True)`` and not yet recorded."""
+        return self._reserved_tokens
+
     @property
     def total_calls(self) -> int:
         """Total tool calls recorded."""
-        return sum(self._tool_call_counts.values())
+        return self._total_calls
+
+    @property
+    def records(self) -> list[TokenUsageRecord]:
+        """The most recent ``history_size`` usage records, oldest first."""
+        return list(self._records)
 
     # --- Detail Level Logic ---
 
@@ -152,12 +227,14 @@ class TokenBudget:
 
     # --- Budget Gate ---
 
-    def gate(self, estimated: int, *, tool_name: str = "") -> bool:
+    def gate(self, estimated: int, *, tool_name: str = "", reserve: bool = False) -> bool:
         """Check if an estimated token usage would exceed the budget.
 
         Args:
             estimated: Expected token count for the upcoming call.
             tool_name: For error reporting.
+            reserve: Hold ``estimated`` tokens until ``record(reserved=...)``
+                or ``release()``; other callers see them as used.
 
         Returns:
             True if the call is within budget.
@@ -165,19 +242,28 @@ class TokenBudget:
         Raises:
             TokenBudgetExceededError: If the call would exceed the budget.
         """
-        if self._used_tokens + estimated > self.max_tokens:
-            raise TokenBudgetExceededError(
-                f"Token budget exceeded: {self._used_tokens + estimated:,} > "
-                f"{self.max_tokens:,} (tool: {tool_name})",
-                used=self._used_tokens,
-                limit=self.max_tokens,
-                tool_name=tool_name,
-            )
+        with self._lock:
+            committed = self._used_tokens + self._reserved_tokens
+            if committed + estimated > self.max_tokens:
+                raise TokenBudgetExceededError(
+                    f"Token budget exceeded: {committed + estimated:,} > "
+                    f"{self.max_tokens:,} (tool: {tool_name})",
+                    used=self._used_tokens,
+                    limit=self.max_tokens,
+                    tool_name=tool_name,
+                )
+            if reserve:
+                self._reserved_tokens += estimated
         return True
 
+    def release(self, reserved: int) -> None:
+        """Return tokens reserved by ``gate(reserve=True)`` for a call that did not run."""
+        with self._lock:
+            self._reserved_tokens = max(0, self._reserved_tokens - reserved)
+
     def can_afford(self, estimated: int) -> bool:
         """Non-raising version of gate(). Returns True if within budget."""
-        return self._used_tokens + estimated <= self.max_tokens
+        return self._used_tokens + self._reserved_tokens + estimated <= self.max_tokens
 
     # --- Recording ---
 
@@ -188,6 +274,7 @@ class TokenBudget:
         *,
         detail_level: str = "standard",
         metadata: dict[str, Any] | None = None,
+        reserved: int = 0,
     ) -> None:
         """Record actual token usage for a completed tool call.
 
@@ -196,19 +283,26 @@ class TokenBudget:
             tokens: Actual token count used.
             detail_level: The detail level that was used.
             metadata: Optional extra context.
+            reserved: Tokens this call reserved in ``gate()``, now released.
         """
-        self._used_tokens += tokens
-        self._tool_usage[tool_name] = self._tool_usage.get(tool_name, 0) + tokens
-        self._tool_call_counts[tool_name] = self._tool_call_counts.get(tool_name, 0) + 1
-        self._records.append(
-            TokenUsageRecord(
-                timestamp=time.time(),
-                tool_name=tool_name,
-                tokens=tokens,
-                detail_level=detail_level,
-                metadata=metadata or {},
-            )
+        record = TokenUsageRecord(
+            timestamp=time.time(),
+            tool_name=tool_name,
+            tokens=tokens,
+            detail_level=detail_level,
+            metadata=metadata or {},
         )
+        with self._lock:
+            if reserved:
+                self._reserved_tokens = max(0, self._reserved_tokens - reserved)
+            self._used_tokens += tokens
+            self._total_calls += 1
+            self._tool_usage[tool_name] = self._tool_usage.get(tool_name, 0) + tokens
+            self._tool_call_counts[tool_name] = self._tool_call_counts.get(tool_name, 0) + 1
+            self._update_top(tool_name, tokens)
+            self._records.append(record)
+            if self._spill is not None:
+                self._spill.write(record.to_log_line())
 
         # Threshold-based logging
         ratio = self.usage_ratio
@@ -228,16 +322,58 @@ class TokenBudget:
                 ratio * 100,
             )
 
+    def _update_top(self, tool_name: str, tokens: int) -> None:
+        """Keep ``_top`` = the ``top_n`` largest tools, descending (caller holds the lock).
+
+        Totals only grow, so a tool can only enter or move up; each update
+        costs at most ``top_n`` steps. A negative record invalidates the
+        ranking until the next full sort.
+        """
+        if tokens < 0:
+            self._top_valid = False
+        if not self._top_valid or self.top_n <= 0:
+            return
+        top, usage = self._top, self._tool_usage
+        total = usage[tool_name]
+        if tool_name in top:
+            i = top.index(tool_name)
+        elif len(top) < self.top_n:
+            top.append(tool_name)
+            i = len(top) - 1
+        elif total > usage[top[-1]]:
+            top[-1] = tool_name
+            i = len(top) - 1
+        else:
+            return
+        while i > 0 and usage[top[i - 1]] < total:
+            top[i - 1], top[i] = top[i], top[i - 1]
+            i -= 1
+
     # --- Session Management ---
 
     def reset(self) -> None:
-        """Reset all session state."""
-        self._used_tokens = 0
-        self._tool_usage.clear()
-        self._tool_call_counts.clear()
-        self._records.clear()
+        """Reset all session state (the spill log is kept)."""
+        with self._lock:
+            self._used_tokens = 0
+            self._reserved_tokens = 0
+            self._total_calls = 0
+            self._tool_usage.clear()
+            self._tool_call_counts.clear()
+            self._records.clear()
+            self._top.clear()
+            self._top_valid = True
         self._forced_level = None
 
+    def flush(self) -> None:
+        """Write pending spill-log records to disk."""
+        if self._spill is not None:
+            self._spill.flush()
+
+    def close(self) -> None:
+        """Flush and close the spill log."""
+        if self._spill is not None:
+            self._spill.close()
+
     # --- Reporting ---
 
     def get_summary(self) -> dict[str, Any]:
@@ -250,6 +386,7 @@ class TokenBudget:
             "detail_level": self.get_detail_level().value,
             "should_minimize": self.should_minimize(),
             "total_calls": self.total_calls,
+            "reserved_tokens": self._reserved_tokens,
             "tool_usage": dict(self._tool_usage),
             "tool_call_counts": dict(self._tool_call_counts),
         }
@@ -259,20 +396,21 @@ class TokenBudget:
 
         Mirrors CRG's philosophy: know where your tokens go.
         """
-        sorted_tools = sorted(
-            self._tool_usage.items(),
-            key=lambda x: x[1],
-            reverse=True,
-        )
+        with self._lock:
+            if self._top_valid and n <= self.top_n:
+                names = self._top[:n]
+            else:
+                names = sorted(self._tool_usage, key=self._tool_usage.__getitem__, reverse=True)[:n]
+            usage = [(name, self._tool_usage[name], self._tool_call_counts.get(name, 0)) for name in names]
         return [
             {
                 "tool": name,
                 "tokens": tokens,
-                "calls": self._tool_call_counts.get(name, 0),
-                "avg_per_call": tokens // max(1, self._tool_call_counts.get(name, 0)),
+                "calls": calls,
+                "avg_per_call": tokens // max(1, calls),
                 "pct_of_total": round(tokens / max(1, self._used_tokens) * 100, 1),
             }
-            for name, tokens in sorted_tools[:n]
+            for name, tokens, calls in usage
         ]
 
     def suggest_next_action(self) -> str:
@@ -188,19 +188,31 @@ class PredictionEngine:
         if not self._initialized:
             await self.initialize()
 
-        ranked: list[RankedPrediction] = []
+        # 피처는 DB 연결 1개 + GROUP BY 집계로 일괄 추출, 모델 추론도 1회
+        requests = [
+            {
+                "content": c.content,
+                "trend_keyword": c.trend_keyword,
+                "viral_potential": c.viral_potential,
+                "qa_scores": c.qa_scores,
+                "category": c.category,
+                "content_type": c.content_type,
+                "language": c.language,
+            }
+            for c in candidates
+        ]
+        features_list, X = await asyncio.to_thread(
+            self._extractor.extract_batch_for_prediction, requests,
+        )
 
-        for candidate in candidates:
-            prediction = await self.predict(
-                content=candidate.content,
-                trend_keyword=candidate.trend_keyword,
-                viral_potential=candidate.viral_potential,
-                qa_scores=candidate.qa_scores,
-                category=candidate.category,
-                content_type=candidate.content_type,
-                language=candidate.language,
-            )
+        if self._model.is_fitted and features_list:
+            predictions = await asyncio.to_thread(self._model.predict_batch, X)
+        else:
+            predictions = [self._rule_based_predict(f) for f in features_list]
+
+        ranked: list[RankedPrediction] = []
 
+        for candidate, prediction in zip(candidates, predictions, strict=True):
             # 종합 스코어 = ER × (1 + viral_prob) × (QA/100)
             qa_factor = max(0.1, candidate.qa_scores.get("total", 70) / 100)
             score = (
@@ -10,14 +10,19 @@ Feature Extractor — 기존 DB에서 ML 피처 추출.
 from __future__ import annotations
 
 import sqlite3
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, UTC
-from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import logging
 
 import numpy as np
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping, Sequence
+    from pathlib import Path
+
 log = logging.getLogger(__name__)
 
 _OPTIONAL_SCHEMA_COLUMNS = {
@@ -162,9 +167,13 @@ class FeatureExtractor:
         if not rows:
             return np.empty((0, 21), dtype=np.float32), np.empty((0,), dtype=np.float32)
 
+        # 카테고리 평균 ER은 행마다 조회하지 않고 GROUP BY 1회로 미리 계산
+        with self._read_session(self._gdt_db) as session:
+            category_avgs = self._batch_category_avg_engagement(session, None)
+
         X_list, y_list = [], []
         for row in rows:
-            features = self._row_to_features(row)
+            features = self._row_to_features(row, category_avgs)
             X_list.append(features.to_array())
             y_list.append(float(row.get("engagement_rate") or 0.0))
 
@@ -216,6 +225,74 @@ class FeatureExtractor:
         )
         return features
 
+    def extract_batch_for_prediction(
+        self,
+        requests: Sequence[Mapping[str, Any]],
+    ) -> tuple[list[ContentFeatures], np.ndarray]:
+        """
+        복수 콘텐츠의 예측용 피처를 한 번에 구성한다.
+
+        각 요청은 ``extract_for_prediction``의 인자(content, trend_keyword, ...)를
+        담은 매핑이다. GDT DB는 read-only 연결 1개로 열고, 키워드/카테고리별
+        집계는 후보 전체에 대해 GROUP BY 쿼리 몇 번으로 계산한다.
+
+        Returns:
+            features: 요청 순서와 동일한 ContentFeatures 리스트
+            X: (N, 21) feature matrix — 모델 일괄 추론용
+        """
+        if not requests:
+            return [], np.empty((0, 21), dtype=np.float32)
+
+        now = datetime.now(UTC)
+        keywords = sorted({str(r["trend_keyword"]) for r in requests})
+        categories = sorted({str(r.get("category") or "other") for r in requests})
+
+        with self._read_session(self._gdt_db) as session:
+            velocity = self._batch_trend_velocity(session, keywords)
+            confidence = self._batch_cross_source_confidence(session, keywords)
+            source_counts = self._batch_source_count(session, keywords)
+            peak_hours = self._batch_hours_since_peak(session, keywords, now)
+            category_avgs = self._batch_category_avg_engagement(session, categories)
+            keyword_imps = self._batch_keyword_prev_impressions(session, keywords)
+            author_avg = self._batch_author_avg_engagement(session)
+
+        features_list: list[ContentFeatures] = []
+        for req in requests:
+            content = str(req.get("content") or "")
+            keyword = str(req["trend_keyword"])
+            category = str(req.get("category") or "other")
+            qa = req.get("qa_scores") or {}
+            publish_hour = req.get("publish_hour")
+
+            features_list.append(ContentFeatures(
+                viral_potential=float(req.get("viral_potential", 50.0)),
+                trend_velocity=velocity.get(keyword, 0.0),
+                cross_source_confidence=confidence.get(keyword, 0.0),
+                category_encoded=CATEGORY_MAP.get(category.lower(), 12),
+                source_count=source_counts.get(keyword, 1),
+                qa_total_score=qa.get("total", 0.0),
+                hook_score=qa.get("hook", 0.0),
+                tone_score=qa.get("tone", 0.0),
+                fact_score=qa.get("fact", 0.0),
+                kick_score=qa.get("kick", 0.0),
+                char_count=len(content),
+                has_hashtags="#" in content,
+                has_numbers=any(c.isdigit() for c in content),
+                has_question="?" in content,
+                content_type=str(req.get("content_type") or "tweet"),
+                language=str(req.get("language") or "ko"),
+                hour_of_day=publish_hour if publish_hour is not None else now.hour,
+                day_of_week=now.weekday(),
+                is_weekend=now.weekday() >= 5,
+                hours_since_trend_peak=peak_hours.get(keyword, 0.0),
+                category_avg_engagement=category_avgs.get(category, 0.0),
+                keyword_prev_impressions=keyword_imps.get(keyword, 0.0),
+                author_avg_engagement=author_avg,
+            ))
+
+        X = np.vstack([f.to_array() for f in features_list])
+        return features_list, X
+
     # ── Private: DB 쿼리 헬퍼 ──────────────────────────────
 
     def _safe_query(self, db_path: Path | None, query: str, params: tuple = ()) -> list[dict]:
@@ -224,20 +301,20 @@ class FeatureExtractor:
         conn = sqlite3.connect(str(db_path), timeout=10)
         conn.row_factory = sqlite3.Row
         try:
-            return [dict(r) for r in conn.execute(query, params).fetchall()]
-        except sqlite3.OperationalError as e:
-            message = str(e).lower()
-            if "no such table" in message:
-                log.info("PEE DB query skipped (%s): %s", db_path.name, e)
-            elif "no such column" in message:
-                missing_column = message.split(":", 1)[-1].strip().split(".")[-1]
-                if missing_column in _OPTIONAL_SCHEMA_COLUMNS:
-                    log.info("PEE DB query skipped (%s): %s", db_path.name, e)
-                else:
-                    log.warning("PEE DB query failed (%s): %s", db_path.name, e)
-            else:
-                log.warning("PEE DB query failed (%s): %s", db_path.name, e)
-            return []
+            return _run_query(conn, db_path, query, params) or []
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _read_session(self, db_path: Path | None) -> Iterator[_ReadSession | None]:
+        """배치 추출용 read-only 연결 1개를 공유한다. DB가 없으면 None."""
+        if not db_path or not db_path.exists():
+            yield None
+            return
+        conn = sqlite3.connect(db_path.resolve().as_uri() + "?mode=ro", uri=True, timeout=10)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield _ReadSession(conn, db_path)
         finally:
             conn.close()
 
@@ -265,8 +342,13 @@ class FeatureExtractor:
 
         return gdt_rows
 
-    def _row_to_features(self, row: dict) -> ContentFeatures:
-        """DB row → ContentFeatures 변환. None-safe."""
+    def _row_to_features(
+        self, row: dict, category_avgs: dict[str, float] | None = None,
+    ) -> ContentFeatures:
+        """DB row → ContentFeatures 변환. None-safe.
+
+        ``category_avgs``가 주어지면 카테고리 평균 ER을 DB 재조회 없이 사용.
+        """
         content = row.get("content") or ""
         category = row.get("category") or "other"
 
@@ -280,7 +362,11 @@ class FeatureExtractor:
             has_question="?" in content,
             hour_of_day=self._extract_hour(row.get("created_at")),
             day_of_week=self._extract_dow(row.get("created_at")),
-            category_avg_engagement=self._get_category_avg_engagement(category),
+            category_avg_engagement=(
+                category_avgs.get(category, 0.0)
+                if category_avgs is not None
+                else self._get_category_avg_engagement(category)
+            ),
         )
 
     def _get_trend_velocity(self, keyword: str) -> float:
@@ -350,6 +436,131 @@ class FeatureExtractor:
         """)
         return float(rows[0].get("avg_er") or 0.0) if rows else 0.0
 
+    # ── Private: 배치 집계 (키워드/카테고리별 GROUP BY) ─────────
+
+    @staticmethod
+    def _placeholders(values: Sequence[str]) -> str:
+        return ",".join("?" for _ in values)
+
+    def _batch_trend_velocity(
+        self, session: _ReadSession | None, keywords: Sequence[str],
+    ) -> dict[str, float]:
+        if session is None or not keywords:
+            return {}
+        rows = session.query(f"""
+            SELECT keyword, viral_potential FROM (
+                SELECT keyword, viral_potential,
+                       ROW_NUMBER() OVER (PARTITION BY keyword ORDER BY run_date DESC) AS rn
+                FROM trends WHERE keyword IN ({self._placeholders(keywords)})
+            ) WHERE rn <= 2 ORDER BY keyword, rn
+        """, tuple(keywords)) or []
+        latest: dict[str, list[float]] = {}
+        for r in rows:
+            latest.setdefault(r["keyword"], []).append(r.get("viral_potential") or 0)
+        return {k: v[0] - v[1] for k, v in latest.items() if len(v) >= 2}
+
+    def _batch_cross_source_confidence(
+        self, session: _ReadSession | None, keywords: Sequence[str],
+    ) -> dict[str, float]:
+        if session is None or not keywords:
+            return {}
+        rows = session.query(f"""
+            SELECT keyword, cross_source_confidence FROM (
+                SELECT keyword, cross_source_confidence,
+                       ROW_NUMBER() OVER (PARTITION BY keyword ORDER BY validated_at DESC) AS rn
+                FROM validated_trends WHERE keyword IN ({self._placeholders(keywords)})
+            ) WHERE rn = 1
+        """, tuple(keywords)) or []
+        return {r["keyword"]: r.get("cross_source_confidence", 0.0) for r in rows}
+
+    def _batch_source_count(
+        self, session: _ReadSession | None, keywords: Sequence[str],
+    ) -> dict[str, int]:
+        if session is None or not keywords:
+            return {}
+        rows = session.query(f"""
+            SELECT keyword, COUNT(DISTINCT source) as cnt FROM raw_trends
+            WHERE keyword IN ({self._placeholders(keywords)})
+              AND fetched_at >= datetime('now', '-24 hours')
+            GROUP BY keyword
+        """, tuple(keywords))
+        if rows is None:
+            return {}
+        # 단건 쿼리와 동일: 테이블이 있으면 매칭 없는 키워드는 0
+        counts = dict.fromkeys(keywords, 0)
+        counts.update({r["keyword"]: r.get("cnt", 0) for r in rows})
+        return counts
+
+    def _batch_hours_since_peak(
+        self, session: _ReadSession | None, keywords: Sequence[str], now: datetime,
+    ) -> dict[str, float]:
+        if session is None or not keywords:
+            return {}
+        rows = session.query(f"""
+            SELECT keyword, run_date FROM (
+                SELECT keyword, run_date,
+                       ROW_NUMBER() OVER (PARTITION BY keyword ORDER BY viral_potential DESC) AS rn
+                FROM trends WHERE keyword IN ({self._placeholders(keywords)})
+            ) WHERE rn = 1
+        """, tuple(keywords)) or []
+        result: dict[str, float] = {}
+        for r in rows:
+            if not r.get("run_date"):
+                continue
+            try:
+                peak_dt = datetime.fromisoformat(r["run_date"])
+            except (ValueError, TypeError):
+                continue
+            if peak_dt.tzinfo is None:
+                peak_dt = peak_dt.replace(tzinfo=UTC)
+            result[r["keyword"]] = (now - peak_dt).total_seconds() / 3600
+        return result
+
+    def _batch_category_avg_engagement(
+        self, session: _ReadSession | None, categories: Sequence[str] | None,
+    ) -> dict[str, float]:
+        """카테고리별 평균 ER. ``categories``가 None이면 전체 카테고리."""
+        if session is None or categories == []:
+            return {}
+        where, params = "", ()
+        if categories is not None:
+            where = f"AND t.category IN ({self._placeholders(categories)})"
+            params = tuple(categories)
+        rows = session.query(f"""
+            SELECT t.category,
+                   AVG(CAST(m.engagement_count AS REAL) / NULLIF(m.impressions, 0)) as avg_er
+            FROM tweets tw
+            JOIN trends t ON tw.keyword = t.keyword
+            JOIN x_tweet_metrics m ON tw.tweet_id = m.tweet_id
+            WHERE m.impressions > 0 {where}
+            GROUP BY t.category
+        """, params) or []
+        return {r["category"]: float(r.get("avg_er") or 0.0) for r in rows}
+
+    def _batch_keyword_prev_impressions(
+        self, session: _ReadSession | None, keywords: Sequence[str],
+    ) -> dict[str, float]:
+        if session is None or not keywords:
+            return {}
+        rows = session.query(f"""
+            SELECT tw.keyword, AVG(m.impressions) as avg_imp
+            FROM tweets tw
+            JOIN x_tweet_metrics m ON tw.tweet_id = m.tweet_id
+            WHERE tw.keyword IN ({self._placeholders(keywords)})
+            GROUP BY tw.keyword
+        """, tuple(keywords)) or []
+        return {r["keyword"]: float(r.get("avg_imp") or 0.0) for r in rows}
+
+    @staticmethod
+    def _batch_author_avg_engagement(session: _ReadSession | None) -> float:
+        if session is None:
+            return 0.0
+        rows = session.query("""
+            SELECT AVG(CAST(engagement_count AS REAL) / NULLIF(impressions, 0)) as avg_er
+            FROM x_tweet_metrics WHERE impressions > 0
+        """)
+        return float(rows[0].get("avg_er") or 0.0) if rows else 0.0
+
     @staticmethod
     def _extract_hour(dt_str: str | None) -> int:
         if not dt_str:
@@ -367,3 +578,38 @@ class FeatureExtractor:
             return datetime.fromisoformat(str(dt_str)).weekday()
         except (ValueError, TypeError):
             return 0
+
+
+# ── SQLite 헬퍼 ───────────────────────────────────────────
+
+
+def _run_query(
+    conn: sqlite3.Connection, db_path: Path, query: str, params: tuple = (),
+) -> list[dict] | None:
+    """쿼리 실행. OperationalError(스키마 불일치 등)는 로그 후 None."""
+    try:
+        return [dict(r) for r in conn.execute(query, params).fetchall()]
+    except sqlite3.OperationalError as e:
+        message = str(e).lower()
+        if "no such table" in message:
+            log.info("PEE DB query skipped (%s): %s", db_path.name, e)
+        elif "no such column" in message:
+            missing_column = message.split(":", 1)[-1].strip().split(".")[-1]
+            if missing_column in _OPTIONAL_SCHEMA_COLUMNS:
+                log.info("PEE DB query skipped (%s): %s", db_path.name, e)
+            else:
+                log.warning("PEE DB query failed (%s): %s", db_path.name, e)
+        else:
+            log.warning("PEE DB query failed (%s): %s", db_path.name, e)
+        return None
+
+
+@dataclass
+class _ReadSession:
+    """배치 추출 동안 공유되는 read-only SQLite 연결."""
+
+    conn: sqlite3.Connection
+    db_path: Path
+
+    def query(self, query: str, params: tuple = ()) -> list[dict] | None:
+        return _run_query(self.conn, self.db_path, query, params)
@@ -219,17 +219,75 @@ class EngagementModel:
 
         X = features.reshape(1, -1)
         predicted_er = float(self._model.predict(X)[0])
+
+        return self._build_result(
+            features,
+            predicted_er,
+            optimal_hours=self._get_optimal_hours(),
+            importance=self._get_feature_importance(feature_names or []),
+            base_impressions=base_impressions,
+        )
+
+    def predict_batch(
+        self,
+        X: np.ndarray,
+        feature_names: list[str] | None = None,
+        base_impressions: int = 1000,
+    ) -> list[PredictionResult]:
+        """
+        복수 콘텐츠 일괄 예측 — 모델 추론은 (N, 21) 행렬에 대해 1회만 실행.
+
+        Args:
+            X: (N, 21) feature matrix (FeatureExtractor.extract_batch_for_prediction)
+            feature_names: importance 리포트용
+            base_impressions: 기본 impression 추정 베이스
+        """
+        if self._model is None:
+            raise RuntimeError("모델 미학습 상태. train() 또는 load()를 먼저 실행하세요.")
+
+        if X.ndim != 2:
+            raise ValueError(f"2D feature matrix 필요: shape={X.shape}")
+        if X.shape[0] == 0:
+            return []
+        if self._n_features and X.shape[1] != self._n_features:
+            raise ValueError(
+                f"Feature 수 불일치: 모델={self._n_features}, 입력={X.shape[1]}"
+            )
+
+        predicted = self._model.predict(X)
+
+        # 후보와 무관한 값은 배치당 1회만 계산
+        optimal_hours = self._get_optimal_hours()
+        importance = self._get_feature_importance(feature_names or [])
+
+        return [
+            self._build_result(
+                X[i],
+                float(predicted[i]),
+                optimal_hours=optimal_hours,
+                importance=dict(importance),
+                base_impressions=base_impressions,
+            )
+            for i in range(X.shape[0])
+        ]
+
+    def _build_result(
+        self,
+        features: np.ndarray,
+        predicted_er: float,
+        optimal_hours: list[int],
+        importance: dict[str, float],
+        base_impressions: int,
+    ) -> PredictionResult:
+        """모델 raw 예측값 → PredictionResult."""
         predicted_er = max(0.0, min(1.0, predicted_er))  # clamp
 
         # 신뢰 구간 (bootstrap approx — 트리 기반 variance 추정)
-        ci_low, ci_high = self._estimate_confidence(X, predicted_er)
+        ci_low, ci_high = self._estimate_confidence(features, predicted_er)
 
         # 바이럴 확률
         viral_prob = self._estimate_viral_probability(predicted_er)
 
-        # 최적 시간대 top-3
-        optimal_hours = self._get_optimal_hours()
-
         # impression 추정 (keyword_prev_impressions가 있으면 활용)
         keyword_imp = features[19] if len(features) > 19 else 0
         est_impressions = int(keyword_imp) if keyword_imp > 0 else base_impressions
@@ -238,9 +296,6 @@ class EngagementModel:
         # 리스크 판단
         risk = "low" if predicted_er > 0.03 else ("medium" if predicted_er > 0.01 else "high")
 
-        # Feature importance top-5
-        importance = self._get_feature_importance(feature_names or [])
-
         # 자연어 추천
         recommendation = self._generate_recommendation(
             predicted_er, viral_prob, optimal_hours, risk,
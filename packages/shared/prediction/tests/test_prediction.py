@@ -131,6 +131,116 @@ class TestFeatureExtractor:
         assert events[0][0] == "info"
 
 
+class TestBatchFeatureExtraction:
+    @pytest.fixture
+    def gdt_db(self, tmp_path):
+        import sqlite3
+
+        db_path = tmp_path / "gdt.db"
+        conn = sqlite3.connect(db_path)
+        conn.executescript("""
+            CREATE TABLE trends (keyword TEXT, run_date TEXT, viral_potential REAL, category TEXT);
+            CREATE TABLE validated_trends (keyword TEXT, cross_source_confidence REAL, validated_at TEXT);
+            CREATE TABLE raw_trends (keyword TEXT, source TEXT, fetched_at TEXT);
+            CREATE TABLE tweets (tweet_id TEXT, keyword TEXT, run_date TEXT, content TEXT,
+                                 char_count INTEGER, tweet_type TEXT, created_at TEXT);
+            CREATE TABLE x_tweet_metrics (tweet_id TEXT, impressions INTEGER, engagement_count INTEGER,
+                                          likes INTEGER, retweets INTEGER, replies INTEGER);
+        """)
+        conn.executemany("INSERT INTO trends VALUES (?, ?, ?, ?)", [
+            ("AI", "2026-01-01T00:00:00", 60, "tech"),
+            ("AI", "2026-01-02T00:00:00", 80, "tech"),
+            ("AI", "2026-01-03T00:00:00", 70, "tech"),
+            ("날씨", "2026-01-03T00:00:00", 30, "other"),
+        ])
+        conn.executemany("INSERT INTO validated_trends VALUES (?, ?, ?)", [
+            ("AI", 40.0, "2026-01-01"),
+            ("AI", 90.0, "2026-01-03"),
+        ])
+        conn.executemany("INSERT INTO raw_trends VALUES (?, ?, datetime('now'))", [
+            ("AI", "google"), ("AI", "x"), ("AI", "x"),
+        ])
+        conn.executemany("INSERT INTO tweets VALUES (?, ?, ?, ?, ?, ?, ?)", [
+            ("t1", "AI", "2026-01-03T00:00:00", "AI 3가지", 6, "tweet", "2026-01-03T09:00:00"),
+            ("t2", "AI", "2026-01-02T00:00:00", "AI?", 3, "tweet", "2026-01-02T18:00:00"),
+            ("t3", "날씨", "2026-01-03T00:00:00", "맑음", 2, "tweet", "2026-01-03T12:00:00"),
+        ])
+        conn.executemany("INSERT INTO x_tweet_metrics VALUES (?, ?, ?, 0, 0, 0)", [
+            ("t1", 1000, 50), ("t2", 500, 10), ("t3", 200, 2),
+        ])
+        conn.commit()
+        conn.close()
+        return db_path
+
+    def test_batch_matches_single_extraction(self, gdt_db):
+        ext = FeatureExtractor(gdt_db=gdt_db)
+        requests = [
+            {"content": "AI 도구 3가지 #AI", "trend_keyword": "AI", "viral_potential": 80.0,
+             "qa_scores": {"total": 85}, "category": "tech", "publish_hour": 9},
+            {"content": "오늘 날씨?", "trend_keyword": "날씨", "viral_potential": 20.0,
+             "category": "other", "publish_hour": 18},
+            {"content": "신규 키워드", "trend_keyword": "없는키워드", "category": "tech", "publish_hour": 12},
+        ]
+
+        features, X = ext.extract_batch_for_prediction(requests)
+
+        assert X.shape == (3, 21)
+        for req, batch_features, row in zip(requests, features, X, strict=True):
+            single = ext.extract_for_prediction(**req)
+            np.testing.assert_allclose(
+                row, single.to_array(), rtol=1e-4,
+                err_msg=f"mismatch for {req['trend_keyword']}",
+            )
+            assert batch_features.trend_velocity == single.trend_velocity
+
+        assert features[0].trend_velocity == pytest.approx(-10.0)
+        assert features[0].cross_source_confidence == pytest.approx(90.0)
+        assert features[0].source_count == 2
+        assert features[2].source_count == 0
+
+    def test_batch_opens_single_read_only_connection(self, gdt_db, monkeypatch):
+        import sqlite3
+
+        ext = FeatureExtractor(gdt_db=gdt_db)
+        real_connect = sqlite3.connect
+        calls: list[tuple] = []
+
+        def counting_connect(*args, **kwargs):
+            calls.append((args, kwargs))
+            return real_connect(*args, **kwargs)
+
+        monkeypatch.setattr("shared.prediction.features.sqlite3.connect", counting_connect)
+
+        ext.extract_batch_for_prediction([
+            {"content": f"후보 {i}", "trend_keyword": "AI", "category": "tech"} for i in range(10)
+        ])
+
+        assert len(calls) == 1
+        assert calls[0][0][0].endswith("?mode=ro")
+        assert calls[0][1]["uri"] is True
+
+    def test_batch_without_db_uses_defaults(self):
+        ext = FeatureExtractor()
+        features, X = ext.extract_batch_for_prediction([
+            {"content": "#AI", "trend_keyword": "AI", "viral_potential": 70.0},
+        ])
+        assert X.shape == (1, 21)
+        assert features[0].source_count == 1
+        assert features[0].has_hashtags is True
+
+    def test_batch_empty_requests(self):
+        features, X = FeatureExtractor().extract_batch_for_prediction([])
+        assert features == []
+        assert X.shape == (0, 21)
+
+    def test_training_set_reuses_grouped_category_averages(self, gdt_db):
+        ext = FeatureExtractor(gdt_db=gdt_db)
+        X, y = ext.extract_training_set(min_impressions=1, days_back=36500)
+        assert X.shape == (3, 21)
+        expected = ext._get_category_avg_engagement("tech")
+        assert X[0, 18] == pytest.approx(expected, rel=1e-4)
+
+
 # ── Model Tests ────────────────────────────────────────────
 
 
@@ -179,6 +289,26 @@ class TestEngagementModel:
         result = model2.predict(X[0])
         assert result.predicted_engagement_rate > 0
 
+    def test_predict_batch_matches_single_predict(self, synthetic_data):
+        X, y = synthetic_data
+        model = EngagementModel()
+        model.train(X, y)
+
+        batch = model.predict_batch(X[:5])
+
+        assert len(batch) == 5
+        for row, result in zip(X[:5], batch, strict=True):
+            single = model.predict(row)
+            assert result.predicted_engagement_rate == single.predicted_engagement_rate
+            assert result.predicted_impressions == single.predicted_impressions
+
+    def test_predict_batch_rejects_wrong_width(self, synthetic_data):
+        X, y = synthetic_data
+        model = EngagementModel()
+        model.train(X, y)
+        with pytest.raises(ValueError, match="Feature 수 불일치"):
+            model.predict_batch(np.zeros((2, 5), dtype=np.float32))
+
     def test_predict_without_training(self):
         model = EngagementModel()
         with pytest.raises(RuntimeError, match="모델 미학습"):
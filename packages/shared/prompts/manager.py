@@ -25,14 +25,20 @@ Few-shot examples live in ``shared/prompts/few_shot_examples/*.json``.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
+import string
 from pathlib import Path
+from typing import Any
 
 log = logging.getLogger(__name__)
 
 _TEMPLATES_DIR = Path(__file__).parent / "templates"
 _EXAMPLES_DIR = Path(__file__).parent / "few_shot_examples"
+# Bump when the cached payload shape changes.
+_CACHE_VERSION = 2
 
 try:
     import yaml as _yaml
@@ -49,10 +55,101 @@ def _load_yaml(path: Path) -> dict:
         return _yaml.safe_load(f) or {}
 
 
+def _default_cache_dir() -> Path:
+    """Per-user cache location; never inside the installed package."""
+    if os.name == "nt":
+        base = os.getenv("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "shared-prompts"
+
+
+class _YamlCache:
+    """Parsed YAML stored as JSON per source file, valid while mtime and size match.
+
+    Only plain data is stored, so a tampered cache file can at worst change
+    the template text, never run code. Documents JSON cannot represent
+    (dates, sets, non-string keys) are not cached. Failing to write the cache
+    (read-only home) only costs a re-parse.
+    """
+
+    def __init__(self, cache_dir: Path | None):
+        self.cache_dir = cache_dir
+
+    def _path(self, source: Path) -> Path:
+        # The directory hash keeps same-named templates from different dirs apart.
+        digest = hashlib.sha1(str(source.parent.resolve()).encode()).hexdigest()[:10]
+        return self.cache_dir / f"{source.stem}.{digest}.json"
+
+    def load(self, source: Path) -> dict:
+        if self.cache_dir is None:
+            return _load_yaml(source)
+        st = source.stat()
+        stamp = [_CACHE_VERSION, st.st_mtime_ns, st.st_size]
+        cache_path = self._path(source)
+        try:
+            with open(cache_path, encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached["stamp"] == stamp:
+                return cached["data"]
+        except FileNotFoundError:
+            pass
+        except Exception as exc:
+            log.debug("Ignoring unreadable prompt cache %s: %s", cache_path.name, exc)
+
+        data = _load_yaml(source)
+        try:
+            payload = json.dumps({"stamp": stamp, "data": data}, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return data
+        if json.loads(payload)["data"] != data:  # e.g. int keys would come back as str
+            return data
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+        except OSError as exc:
+            log.debug("Prompt cache not writable (%s): %s", cache_path.parent, exc)
+        return data
+
+
+_formatter = string.Formatter()
+
+
+def _compile(system: str) -> tuple[tuple[str, str | None], ...] | None:
+    """Split a template into ``(literal, field)`` pairs.
+
+    Returns None for anything beyond plain ``{name}`` fields (format specs,
+    conversions, attribute/index access, positional fields, bad braces);
+    those templates keep rendering through ``str.format_map``.
+    """
+    segments = []
+    try:
+        for literal, field, spec, conversion in _formatter.parse(system):
+            if field is not None and (spec or conversion or not field.isidentifier()):
+                return None
+            segments.append((literal, field))
+    except ValueError:
+        return None
+    return tuple(segments)
+
+
 class PromptTemplate:
     """A single loaded prompt template."""
 
-    __slots__ = ("name", "version", "description", "system", "variables", "few_shot_key", "tags", "source_path")
+    __slots__ = (
+        "name",
+        "version",
+        "description",
+        "system",
+        "variables",
+        "few_shot_key",
+        "tags",
+        "source_path",
+        "_segments",
+        "_compiled_for",
+    )
 
     def __init__(self, data: dict, source_path: Path | None = None):
         self.name: str = data["name"]
@@ -63,9 +160,39 @@ class PromptTemplate:
         self.few_shot_key: str = data.get("few_shot_key", "")
         self.tags: list[str] = data.get("tags", [])
         self.source_path = source_path
+        self._segments = _compile(self.system)
+        self._compiled_for = self.system
 
     def render(self, few_shot_text: str = "", **overrides: str) -> str:
         """Render the system prompt with variable substitution."""
+        if self._compiled_for is not self.system:  # ``system`` was reassigned
+            self._segments = _compile(self.system)
+            self._compiled_for = self.system
+        if self._segments is None:
+            return self._render_format_map(few_shot_text, overrides)
+
+        # Same precedence as the format_map path: overrides, variables, few-shot, "{name}".
+        variables = self.variables
+        parts = []
+        try:
+            for literal, field in self._segments:
+                parts.append(literal)
+                if field is None:
+                    continue
+                if field in overrides:
+                    parts.append(format(overrides[field]))
+                elif field in variables:
+                    parts.append(format(variables[field]))
+                elif field == "few_shot_examples":
+                    parts.append(few_shot_text)
+                else:
+                    parts.append("{" + field + "}")
+        except (KeyError, ValueError) as exc:
+            log.warning("Prompt render error for %s: %s", self.name, exc)
+            return self.system
+        return "".join(parts)
+
+    def _render_format_map(self, few_shot_text: str, overrides: dict[str, Any]) -> str:
         merged = {**self.variables, **overrides}
         merged.setdefault("few_shot_examples", few_shot_text)
         try:
@@ -85,52 +212,110 @@ class _SafeDict(dict):
 class PromptManager:
     """Central prompt template manager.
 
-    Loads all YAML templates from the templates directory and JSON
-    few-shot examples from the examples directory.
+    Templates and few-shot examples are loaded lazily: ``render("x")`` reads
+    only ``x.yaml`` (falling back to a directory scan when no file is named
+    after the template), and parsed YAML is served from a JSON cache while
+    the source mtime is unchanged. Rendered few-shot blocks are memoized.
+
+    ``cache_dir`` defaults to ``$SHARED_PROMPTS_CACHE_DIR`` or a per-user
+    cache (``$XDG_CACHE_HOME/shared-prompts``, ``~/.cache/shared-prompts``,
+    ``%LOCALAPPDATA%\\shared-prompts``); pass ``""`` to disable the cache. With
+    ``auto_reload=True`` edited template/example files are picked up on the
+    next access (one ``stat`` per access); ``reload()`` does it on demand.
     """
 
     def __init__(
         self,
         templates_dir: Path | str | None = None,
         examples_dir: Path | str | None = None,
+        *,
+        cache_dir: Path | str | None = None,
+        auto_reload: bool = False,
     ):
         self._templates_dir = Path(templates_dir) if templates_dir else _TEMPLATES_DIR
         self._examples_dir = Path(examples_dir) if examples_dir else _EXAMPLES_DIR
+        if cache_dir is None:
+            cache_dir = os.getenv("SHARED_PROMPTS_CACHE_DIR", str(_default_cache_dir()))
+        self._yaml_cache = _YamlCache(Path(cache_dir) if cache_dir else None)
+        self._auto_reload = auto_reload
         self._templates: dict[str, PromptTemplate] = {}
+        self._registered: set[str] = set()
         self._examples: dict[str, list[dict]] = {}
-        self._load_all()
+        self._few_shot_text: dict[str, str] = {}
+        self._mtimes: dict[Path, int] = {}
+        self._scanned = False
+
+    def reload(self) -> None:
+        """Drop loaded files; the next access re-reads them. Registered templates stay."""
+        self._templates = {name: tpl for name, tpl in self._templates.items() if name in self._registered}
+        self._examples.clear()
+        self._few_shot_text.clear()
+        self._mtimes.clear()
+        self._scanned = False
 
-    def _load_all(self) -> None:
-        self._load_templates()
-        self._load_examples()
+    @staticmethod
+    def _mtime(path: Path) -> int | None:
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
 
-    def _load_templates(self) -> None:
+    def _is_stale(self, path: Path) -> bool:
+        return self._auto_reload and self._mtime(path) != self._mtimes.get(path)
+
+    def _load_template_file(self, path: Path) -> PromptTemplate | None:
+        try:
+            self._mtimes[path] = self._mtime(path)
+            tpl = PromptTemplate(self._yaml_cache.load(path), source_path=path)
+        except Exception as exc:
+            log.warning("Failed to load template %s: %s", path.name, exc)
+            return None
+        if tpl.name not in self._registered:
+            self._templates[tpl.name] = tpl
+        return tpl
+
+    def _scan_templates(self) -> None:
+        if self._scanned:
+            return
+        self._scanned = True
         if not self._templates_dir.is_dir():
             log.debug("Templates dir not found: %s", self._templates_dir)
             return
         for path in sorted(self._templates_dir.glob("*.yaml")):
-            try:
-                data = _load_yaml(path)
-                tpl = PromptTemplate(data, source_path=path)
-                self._templates[tpl.name] = tpl
-            except Exception as exc:
-                log.warning("Failed to load template %s: %s", path.name, exc)
-
-    def _load_examples(self) -> None:
-        if not self._examples_dir.is_dir():
-            return
-        for path in sorted(self._examples_dir.glob("*.json")):
+            if path not in self._mtimes:
+                self._load_template_file(path)
+
+    def _load_examples(self, key: str) -> list[dict]:
+        path = self._examples_dir / f"{key}.json"
+        self._mtimes[path] = self._mtime(path)
+        self._few_shot_text.pop(key, None)
+        examples: list[dict] = []
+        if path.is_file():
             try:
                 data = json.loads(path.read_text(encoding="utf-8"))
-                key = path.stem
-                self._examples[key] = data if isinstance(data, list) else [data]
+                examples = data if isinstance(data, list) else [data]
             except Exception as exc:
                 log.warning("Failed to load examples %s: %s", path.name, exc)
+        self._examples[key] = examples
+        return examples
 
     def list_templates(self) -> list[str]:
+        self._scan_templates()
         return sorted(self._templates.keys())
 
     def get_template(self, name: str) -> PromptTemplate | None:
+        tpl = self._templates.get(name)
+        if tpl is not None:
+            if tpl.source_path is not None and self._is_stale(tpl.source_path):
+                tpl = self._load_template_file(tpl.source_path) or tpl
+            return tpl
+        if self._scanned:
+            return None
+        path = self._templates_dir / f"{name}.yaml"
+        if path.is_file() and path not in self._mtimes:
+            self._load_template_file(path)
+        if name not in self._templates:
+            self._scan_templates()
         return self._templates.get(name)
 
     def render(self, template_name: str, **kwargs: str) -> str:
@@ -139,18 +324,24 @@ class PromptManager:
         Returns the rendered system prompt string.
         Raises KeyError if template not found.
         """
-        tpl = self._templates.get(template_name)
+        tpl = self.get_template(template_name)
         if tpl is None:
             raise KeyError(f"Prompt template '{template_name}' not found. " f"Available: {self.list_templates()}")
 
         few_shot_text = ""
         fs_key = kwargs.pop("few_shot_key", "") or tpl.few_shot_key
-        if fs_key and fs_key in self._examples:
-            examples = self._examples[fs_key]
-            few_shot_text = self._format_few_shot(examples)
+        if fs_key:
+            few_shot_text = self._few_shot_block(fs_key)
 
         return tpl.render(few_shot_text=few_shot_text, **kwargs)
 
+    def _few_shot_block(self, key: str) -> str:
+        examples = self.get_few_shot(key)
+        text = self._few_shot_text.get(key)
+        if text is None:
+            text = self._few_shot_text[key] = self._format_few_shot(examples)
+        return text
+
     @staticmethod
     def _format_few_shot(examples: list[dict]) -> str:
         parts = []
@@ -164,9 +355,13 @@ class PromptManager:
         """Register a template from a dict (for programmatic use)."""
         tpl = PromptTemplate(data)
         self._templates[tpl.name] = tpl
+        self._registered.add(tpl.name)
 
     def get_few_shot(self, key: str) -> list[dict]:
-        return self._examples.get(key, [])
+        examples = self._examples.get(key)
+        if examples is None or self._is_stale(self._examples_dir / f"{key}.json"):
+            examples = self._load_examples(key)
+        return examples
 
 
 _manager: PromptManager | None = None
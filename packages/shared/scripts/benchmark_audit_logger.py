@@ -0,0 +1,97 @@
+"""Benchmark AuditLogger file output: per-record open/append vs group commit.
+
+Compares records/sec for:
+
+- legacy: every record opens the file, appends one line and closes it;
+  redaction runs each secret pattern over the full input
+- buffered: persistent handle, background group commit (fsync per batch)
+- buffered, no fsync: same, without the fsync per commit
+
+    python scripts/benchmark_audit_logger.py --records 20000 --input-chars 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from shared.harness.audit import _SECRET_PATTERNS, AuditLogger  # noqa: E402
+
+
+class LegacyAuditLogger(AuditLogger):
+    """The pre-buffering behaviour, kept here for comparison only."""
+
+    def __init__(self, log_path: Path):
+        super().__init__(log_path=None, emit_to_logging=False)
+        self.log_path = log_path
+
+    @staticmethod
+    def _redact_secrets(text: str) -> str:
+        for pattern in _SECRET_PATTERNS:
+            text = pattern.sub("***REDACTED***", text)
+        return text
+
+    def _truncate_input(self, tool_input) -> str:
+        text = self._redact_secrets(str(tool_input))
+        if len(text) > self.max_input_chars:
+            return text[: self.max_input_chars] + "..."
+        return text
+
+    def _write_record(self, record) -> None:
+        self._records.append(record)
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(record.to_json() + "\n")
+
+
+def run_one(logger: AuditLogger, records: int, payload: str) -> float:
+    started = time.perf_counter()
+    for i in range(records):
+        logger.log_allowed("web_search", payload, session_tool_calls=i)
+    logger.close()
+    return records / (time.perf_counter() - started)
+
+
+def run(records: int, input_chars: int) -> list[tuple[str, float]]:
+    payload = ("query about market data token=" + "x" * 40 + " ") * (input_chars // 70 + 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        return [
+            ("legacy", run_one(LegacyAuditLogger(base / "legacy.jsonl"), records, payload)),
+            (
+                "buffered",
+                run_one(AuditLogger(log_path=base / "buffered.jsonl", emit_to_logging=False), records, payload),
+            ),
+            (
+                "buffered, no fsync",
+                run_one(
+                    AuditLogger(log_path=base / "nofsync.jsonl", emit_to_logging=False, fsync=False), records, payload
+                ),
+            ),
+        ]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark AuditLogger write throughput.")
+    parser.add_argument("--records", type=int, default=20000, help="Records to log per variant.")
+    parser.add_argument("--input-chars", type=int, default=2000, help="Size of each tool input.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    rows = run(args.records, args.input_chars)
+    legacy_rate = rows[0][1]
+    print(f"records={args.records} input_chars={args.input_chars}")
+    print(f"{'variant':<20}{'records/s':>12}{'speedup':>9}")
+    for name, rate in rows:
+        print(f"{name:<20}{rate:>12.0f}{rate / legacy_rate:>8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
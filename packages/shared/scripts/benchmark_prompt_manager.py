@@ -0,0 +1,116 @@
+"""Benchmark PromptManager startup and render throughput.
+
+Startup (construct a manager and render one template, as a CLI does):
+
+- legacy: every YAML template and few-shot file parsed eagerly
+- lazy, cold: only the requested template parsed, JSON cache written
+- lazy, warm: only the requested template, read from the JSON cache
+
+Render (one template with few-shot examples, renders/sec):
+
+- legacy: ``str.format_map`` + ``_SafeDict`` merge, few-shot block rebuilt
+- compiled: pre-split segments, memoized few-shot block
+
+    python scripts/benchmark_prompt_manager.py --renders 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from shared.prompts.manager import (  # noqa: E402
+    _EXAMPLES_DIR,
+    _TEMPLATES_DIR,
+    PromptManager,
+    PromptTemplate,
+    _load_yaml,
+)
+
+TEMPLATE = "biolinker_analyzer"
+
+
+def legacy_startup() -> str:
+    """The pre-lazy behaviour: parse everything, then render one template."""
+    templates = {}
+    for path in sorted(_TEMPLATES_DIR.glob("*.yaml")):
+        tpl = PromptTemplate(_load_yaml(path), source_path=path)
+        templates[tpl.name] = tpl
+    examples = {path.stem: json.loads(path.read_text(encoding="utf-8")) for path in _EXAMPLES_DIR.glob("*.json")}
+    tpl = templates[TEMPLATE]
+    return tpl._render_format_map(PromptManager._format_few_shot(examples[tpl.few_shot_key]), {})
+
+
+def startup_ms(fn, runs: int) -> float:
+    started = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - started) * 1000 / runs
+
+
+def renders_per_sec(fn, renders: int) -> float:
+    started = time.perf_counter()
+    for _ in range(renders):
+        fn()
+    return renders / (time.perf_counter() - started)
+
+
+def run(runs: int, renders: int) -> tuple[list[tuple[str, float]], list[tuple[str, float]]]:
+    with tempfile.TemporaryDirectory() as tmp:
+        cold_dirs = iter(range(runs))
+
+        def lazy_cold() -> str:
+            return PromptManager(cache_dir=Path(tmp) / f"cold{next(cold_dirs)}").render(TEMPLATE)
+
+        def lazy_warm() -> str:
+            return PromptManager(cache_dir=Path(tmp) / "warm").render(TEMPLATE)
+
+        lazy_warm()
+        startup = [
+            ("legacy", startup_ms(legacy_startup, runs)),
+            ("lazy, cold cache", startup_ms(lazy_cold, runs)),
+            ("lazy, warm cache", startup_ms(lazy_warm, runs)),
+        ]
+
+    pm = PromptManager(cache_dir="")
+    tpl = pm.get_template(TEMPLATE)
+    examples = pm.get_few_shot(tpl.few_shot_key)
+    render = [
+        (
+            "legacy",
+            renders_per_sec(
+                lambda: tpl._render_format_map(PromptManager._format_few_shot(examples), {"role": "analyst"}), renders
+            ),
+        ),
+        ("compiled", renders_per_sec(lambda: pm.render(TEMPLATE, role="analyst"), renders)),
+    ]
+    return startup, render
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark PromptManager startup and render throughput.")
+    parser.add_argument("--runs", type=int, default=50, help="Manager constructions per startup variant.")
+    parser.add_argument("--renders", type=int, default=50000, help="Renders per render variant.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    startup, render = run(args.runs, args.renders)
+    print(f"startup: construct + render '{TEMPLATE}' (ms, mean of {args.runs})")
+    for name, ms in startup:
+        print(f"  {name:<18}{ms:>9.2f}{startup[0][1] / ms:>8.1f}x")
+    print(f"render: '{TEMPLATE}' with few-shot block (renders/s, {args.renders} renders)")
+    for name, rate in render:
+        print(f"  {name:<18}{rate:>9.0f}{rate / render[0][1]:>8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
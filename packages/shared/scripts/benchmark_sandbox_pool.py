@@ -0,0 +1,80 @@
+"""Benchmark warm-pool vs cold-start sandbox execution (subprocess path).
+
+Runs ``--runs`` short commands through DockerSandboxRunner's subprocess
+path (an unsandboxed policy, so Docker is never used):
+
+- cold: one ``sh -c`` process per run (the subprocess fallback)
+- pool: a warm SandboxWorkerPool of ``--pool-size`` workers
+
+Reports runs/sec and median execution time, plus median queue wait for the
+pool when ``--concurrency`` exceeds the pool size.
+
+    python scripts/benchmark_sandbox_pool.py --runs 500 --concurrency 8 --pool-size 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from shared.harness.sandbox.docker_runner import DockerSandboxRunner  # noqa: E402
+from shared.harness.sandbox.policy import SandboxPolicy, ToolPermissionLevel  # noqa: E402
+
+POLICY = SandboxPolicy(level=ToolPermissionLevel.READ_ONLY, sandbox=False, timeout_seconds=30)
+
+
+async def bench(runner: DockerSandboxRunner, command: str, runs: int, concurrency: int) -> tuple[float, float, float]:
+    if runner.pool is not None:
+        await runner.pool.start()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            return await runner.run(command, POLICY)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(one() for _ in range(runs)))
+    elapsed = time.perf_counter() - started
+    await runner.close()
+    assert all(r.success for r in results), results[0]
+    return (
+        runs / elapsed,
+        statistics.median(r.elapsed_seconds for r in results) * 1000,
+        statistics.median(r.queue_wait_seconds for r in results) * 1000,
+    )
+
+
+async def run(runs: int, concurrency: int, pool_size: int, command: str) -> list[tuple[str, float, float, float]]:
+    return [
+        ("cold", *await bench(DockerSandboxRunner(), command, runs, concurrency)),
+        (f"pool x{pool_size}", *await bench(DockerSandboxRunner(pool_size=pool_size), command, runs, concurrency)),
+    ]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark warm-pool vs cold-start sandbox runs.")
+    parser.add_argument("--runs", type=int, default=500, help="Commands per variant.")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent run() calls.")
+    parser.add_argument("--pool-size", type=int, default=4, help="Warm workers.")
+    parser.add_argument("--command", default="echo hello", help="Shell command to run.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    rows = asyncio.run(run(args.runs, args.concurrency, args.pool_size, args.command))
+    print(f"runs={args.runs} concurrency={args.concurrency} command={args.command!r}")
+    print(f"{'variant':<10}{'runs/s':>10}{'exec p50 ms':>13}{'wait p50 ms':>13}{'speedup':>9}")
+    for name, rate, exec_ms, wait_ms in rows:
+        print(f"{name:<10}{rate:>10.0f}{exec_ms:>13.1f}{wait_ms:>13.1f}{rate / rows[0][1]:>8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
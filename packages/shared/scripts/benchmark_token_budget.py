@@ -0,0 +1,79 @@
+"""Benchmark TokenBudget memory and record() throughput over many calls.
+
+Compares, for ``--calls`` recorded calls spread over ``--tools`` tools:
+
+- unbounded: ``history_size=None`` (every record kept, the old behaviour)
+- ring buffer: last ``--history`` records in memory
+- ring + spill: same, every record also appended to the JSONL spill log
+
+Memory is the tracemalloc peak while recording; the spill column is the
+size of the on-disk log.
+
+    python scripts/benchmark_token_budget.py --calls 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from shared.harness.token_tracker import TokenBudget  # noqa: E402
+
+
+def measure(budget: TokenBudget, calls: int, tools: int) -> tuple[float, float]:
+    names = [f"tool_{i}" for i in range(tools)]
+    tracemalloc.start()
+    started = time.perf_counter()
+    for i in range(calls):
+        budget.record(names[i % tools], 100 + i % 50)
+    budget.get_top_consumers(5)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    budget.close()
+    return peak / 2**20, calls / elapsed
+
+
+def run(calls: int, tools: int, history: int) -> list[tuple[str, float, float, float]]:
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        spill_path = Path(tmp) / "usage.jsonl"
+        variants = [
+            ("unbounded", TokenBudget(max_tokens=10**15, history_size=None)),
+            ("ring buffer", TokenBudget(max_tokens=10**15, history_size=history)),
+            ("ring + spill", TokenBudget(max_tokens=10**15, history_size=history, spill_path=spill_path)),
+        ]
+        for name, budget in variants:
+            peak_mb, rate = measure(budget, calls, tools)
+            spill_mb = spill_path.stat().st_size / 2**20 if budget.spill_path else 0.0
+            rows.append((name, peak_mb, rate, spill_mb))
+            del budget
+    return rows
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark TokenBudget memory over many recorded calls.")
+    parser.add_argument("--calls", type=int, default=1_000_000, help="Calls to record per variant.")
+    parser.add_argument("--tools", type=int, default=50, help="Distinct tool names.")
+    parser.add_argument("--history", type=int, default=1000, help="Ring buffer size.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    rows = run(args.calls, args.tools, args.history)
+    print(f"calls={args.calls:,} tools={args.tools} history={args.history}")
+    print(f"{'variant':<14}{'peak MiB':>10}{'records/s':>12}{'spill MiB':>11}")
+    for name, peak_mb, rate, spill_mb in rows:
+        print(f"{name:<14}{peak_mb:>10.1f}{rate:>12.0f}{spill_mb:>11.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
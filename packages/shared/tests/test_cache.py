@@ -43,6 +43,12 @@ class TestNoOpCache:
     async def test_incr_returns_1(self, cache):
         assert await cache.incr("key") == 1
 
+    @pytest.mark.asyncio
+    async def test_batch_operations_are_noops(self, cache):
+        assert await cache.mget(["a", "b"]) == [None, None]
+        assert await cache.exists_many(["a", "b"]) == [False, False]
+        await cache.set_many({"a": 1}, ttl=60)
+
     @pytest.mark.asyncio
     async def test_close_does_not_raise(self, cache):
         await cache.close()
@@ -133,6 +139,76 @@ class TestRedisCacheUnit:
         assert result is None
         assert cache._disabled_until > 0
 
+    @pytest.mark.asyncio
+    async def test_batch_operations_fall_back_on_connection_error(self, cache):
+        assert await cache.mget(["a", "b"]) == [None, None]
+        assert await cache.exists_many(["a"]) == [False]
+        await cache.set_many({"a": 1}, ttl=10)
+
+
+class _FakePipeline:
+    def __init__(self, store):
+        self.store = store
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def exists(self, key):
+        self.ops.append(lambda: int(key in self.store))
+
+    def setex(self, key, ttl, value):
+        self.ops.append(lambda: self.store.__setitem__(key, value))
+
+    async def execute(self):
+        return [op() for op in self.ops]
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.round_trips = 0
+
+    async def mget(self, keys):
+        self.round_trips += 1
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        self.round_trips += 1
+        return _FakePipeline(self.store)
+
+
+class TestRedisCacheBatch:
+    @pytest.fixture
+    def fake(self):
+        return _FakeRedis()
+
+    @pytest.fixture
+    def cache(self, fake):
+        cache = RedisCache(url="redis://localhost:19999/15")
+        cache._get_conn = AsyncMock(return_value=fake)
+        return cache
+
+    @pytest.mark.asyncio
+    async def test_set_many_then_mget_single_round_trip_each(self, cache, fake):
+        await cache.set_many({"k1": {"score": 1}, "k2": [1, 2]}, ttl=60)
+        fake.store["bad"] = "{not json"
+
+        values = await cache.mget(["k1", "missing", "k2", "bad"])
+
+        assert values == [{"score": 1}, None, [1, 2], None]
+        assert fake.round_trips == 2
+
+    @pytest.mark.asyncio
+    async def test_exists_many_is_pipelined(self, cache, fake):
+        fake.store["present"] = "1"
+
+        assert await cache.exists_many(["present", "absent"]) == [True, False]
+        assert fake.round_trips == 1
+
 
 # ─── get_cache singleton tests ───────────────────────────────
 
@@ -0,0 +1,198 @@
+"""
+Tests for shared.prompts.manager — lazy loading, JSON cache and compiled rendering.
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, "packages")
+
+pytest.importorskip("yaml")
+
+from shared.prompts import manager as manager_module
+from shared.prompts.manager import PromptManager, PromptTemplate
+
+
+def _write_template(directory, stem, **data):
+    lines = [f"{key}: {json.dumps(value, ensure_ascii=False)}" for key, value in data.items()]
+    (directory / f"{stem}.yaml").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    templates = tmp_path / "templates"
+    examples = tmp_path / "examples"
+    templates.mkdir()
+    examples.mkdir()
+    _write_template(templates, "greet", name="greet", system="Hi {who}! {few_shot_examples}", variables={"who": "you"})
+    _write_template(templates, "other", name="other", system="other")
+    _write_template(templates, "renamed_file", name="aliased", system="alias {x}")
+    (examples / "demo.json").write_text(json.dumps([{"input": "q", "output": "a"}]), encoding="utf-8")
+    return templates, examples, tmp_path / "cache"
+
+
+@pytest.fixture
+def yaml_loads(monkeypatch):
+    loaded = []
+    original = manager_module._load_yaml
+
+    def tracking(path):
+        loaded.append(path.name)
+        return original(path)
+
+    monkeypatch.setattr(manager_module, "_load_yaml", tracking)
+    return loaded
+
+
+class TestLazyLoading:
+    def test_render_loads_only_requested_template(self, dirs, yaml_loads):
+        templates, examples, cache = dirs
+        pm = PromptManager(templates, examples, cache_dir=cache)
+
+        assert pm.render("greet") == "Hi you! "
+        assert yaml_loads == ["greet.yaml"]
+
+    def test_name_not_matching_filename_falls_back_to_scan(self, dirs):
+        pm = PromptManager(*dirs[:2], cache_dir=dirs[2])
+        assert pm.render("aliased", x="1") == "alias 1"
+        assert pm.list_templates() == ["aliased", "greet", "other"]
+
+    def test_unknown_template_raises(self, dirs):
+        pm = PromptManager(*dirs[:2], cache_dir=dirs[2])
+        with pytest.raises(KeyError, match="Available"):
+            pm.render("missing")
+
+    def test_registered_template_is_not_replaced_by_file(self, dirs):
+        pm = PromptManager(*dirs[:2], cache_dir=dirs[2])
+        pm.register({"name": "greet", "system": "registered"})
+        pm.list_templates()
+        assert pm.render("greet") == "registered"
+
+
+class TestYamlCache:
+    def test_second_manager_reads_cache_instead_of_yaml(self, dirs, yaml_loads):
+        templates, examples, cache = dirs
+        PromptManager(templates, examples, cache_dir=cache).render("greet")
+        second = PromptManager(templates, examples, cache_dir=cache)
+
+        assert second.render("greet", who="me") == "Hi me! "
+        assert yaml_loads == ["greet.yaml"]
+
+    def test_modified_source_invalidates_cache(self, dirs, yaml_loads):
+        templates, examples, cache = dirs
+        PromptManager(templates, examples, cache_dir=cache).render("greet")
+        _write_template(templates, "greet", name="greet", system="Hello {who}")
+        stat = (templates / "greet.yaml").stat()
+        os.utime(templates / "greet.yaml", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert PromptManager(templates, examples, cache_dir=cache).render("greet", who="x") == "Hello x"
+        assert yaml_loads == ["greet.yaml", "greet.yaml"]
+
+    def test_cache_disabled_with_empty_dir(self, dirs, yaml_loads):
+        templates, examples, _ = dirs
+        for _ in range(2):
+            PromptManager(templates, examples, cache_dir="").render("greet")
+        assert yaml_loads == ["greet.yaml", "greet.yaml"]
+        assert not (templates / "__pycache__").exists()
+
+    def test_cache_is_plain_json(self, dirs):
+        templates, examples, cache = dirs
+        PromptManager(templates, examples, cache_dir=cache).render("greet")
+
+        (cached,) = cache.glob("greet.*.json")
+        payload = json.loads(cached.read_text(encoding="utf-8"))
+        assert payload["data"]["system"] == "Hi {who}! {few_shot_examples}"
+
+    def test_corrupt_cache_file_is_reparsed(self, dirs, yaml_loads):
+        templates, examples, cache = dirs
+        PromptManager(templates, examples, cache_dir=cache).render("greet")
+        (cached,) = cache.glob("greet.*.json")
+        cached.write_bytes(b"\x80\x05garbage")
+
+        assert PromptManager(templates, examples, cache_dir=cache).render("greet") == "Hi you! "
+        assert yaml_loads == ["greet.yaml", "greet.yaml"]
+
+    def test_non_json_yaml_is_not_cached(self, dirs, yaml_loads):
+        templates, examples, cache = dirs
+        (templates / "dated.yaml").write_text("name: dated\nsystem: s\ncreated: 2026-01-01\n", encoding="utf-8")
+        for _ in range(2):
+            PromptManager(templates, examples, cache_dir=cache).render("dated")
+
+        assert yaml_loads == ["dated.yaml", "dated.yaml"]
+        assert not list(cache.glob("dated.*"))
+
+    def test_default_cache_dir_is_per_user_not_templates(self, dirs, monkeypatch, tmp_path):
+        templates, examples, _ = dirs
+        monkeypatch.delenv("SHARED_PROMPTS_CACHE_DIR", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+        monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "xdg"))
+        PromptManager(templates, examples).render("greet")
+
+        assert list((tmp_path / "xdg" / "shared-prompts").glob("greet.*.json"))
+        assert not (templates / "__pycache__").exists()
+
+    def test_auto_reload_picks_up_edits(self, dirs):
+        templates, examples, cache = dirs
+        pm = PromptManager(templates, examples, cache_dir=cache, auto_reload=True)
+        assert pm.render("other") == "other"
+        _write_template(templates, "other", name="other", system="edited")
+        stat = (templates / "other.yaml").stat()
+        os.utime(templates / "other.yaml", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert pm.render("other") == "edited"
+
+
+class TestFewShot:
+    def test_few_shot_block_is_memoized(self, dirs, monkeypatch):
+        pm = PromptManager(*dirs[:2], cache_dir=dirs[2])
+        calls = []
+        original = PromptManager._format_few_shot
+        monkeypatch.setattr(PromptManager, "_format_few_shot", staticmethod(lambda ex: calls.append(1) or original(ex)))
+
+        first = pm.render("greet", few_shot_key="demo")
+        second = pm.render("greet", few_shot_key="demo")
+
+        assert first == second == "Hi you! Example 1:\nInput: q\nOutput: a"
+        assert len(calls) == 1
+
+    def test_missing_examples_render_empty(self, dirs):
+        pm = PromptManager(*dirs[:2], cache_dir=dirs[2])
+        assert pm.render("greet", few_shot_key="nope") == "Hi you! "
+        assert pm.get_few_shot("nope") == []
+
+
+class TestCompiledRender:
+    @pytest.mark.parametrize(
+        "system",
+        [
+            "plain text",
+            "Hi {who}, {missing} {few_shot_examples}",
+            "escaped {{braces}} and {who}",
+            "spec {who:>8} and {who!r}",
+            "attr {who.upper}",
+            "positional {} {0}",
+            "broken { brace",
+        ],
+    )
+    def test_matches_format_map(self, system):
+        tpl = PromptTemplate({"name": "t", "system": system, "variables": {"who": "you"}})
+        assert tpl.render("FEW") == tpl._render_format_map("FEW", {})
+
+    def test_override_beats_variable_and_few_shot(self):
+        tpl = PromptTemplate({"name": "t", "system": "{a}|{few_shot_examples}", "variables": {"a": "v"}})
+        assert tpl.render("fs", a="o", few_shot_examples="o2") == "o|o2"
+
+    def test_reassigned_system_is_recompiled(self):
+        tpl = PromptTemplate({"name": "t", "system": "{a}", "variables": {"a": "1"}})
+        assert tpl.render() == "1"
+        tpl.system = "[{a}]"
+        assert tpl.render() == "[1]"
+
+
+def test_bundled_templates_render():
+    pm = PromptManager(cache_dir="")
+    for name in pm.list_templates():
+        assert pm.render(name)
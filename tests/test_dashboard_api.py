@@ -221,3 +221,215 @@ class TestMcpHealth:
         assert "ready" in data
         assert "needs_attention" in data
 
+
+
+# ── /api/overview snapshot + SQLite read pool ──────────────────────
+
+class TestOverviewSnapshot:
+
+    @pytest.mark.asyncio
+    async def test_slow_source_does_not_block_overview(self, monkeypatch):
+        import asyncio
+        import time
+
+        import overview_snapshot
+
+        async def slow_pg_scalar(query):
+            await asyncio.sleep(5)
+            return 99
+
+        monkeypatch.setattr(overview_snapshot, "_pg_scalar", slow_pg_scalar)
+
+        start = time.perf_counter()
+        data = await overview_snapshot.collect_overview(source_timeout=0.2)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 1.0
+        assert data["projects"]["agriguard"]["sensor_readings"] == 0
+        assert data["projects"]["agriguard"]["status"] == "ERROR"
+
+    @pytest.mark.asyncio
+    async def test_sources_are_queried_concurrently(self, monkeypatch):
+        import asyncio
+        import time
+
+        import overview_snapshot
+
+        async def slow_scalar(db_path, query, params=()):
+            await asyncio.sleep(0.2)
+            return 3
+
+        async def slow_read(db_path, query, params=()):
+            await asyncio.sleep(0.2)
+            return [{"started_at": "2026-01-01"}]
+
+        async def slow_pg(query):
+            await asyncio.sleep(0.2)
+            return 7
+
+        monkeypatch.setattr(overview_snapshot, "_sqlite_scalar", slow_scalar)
+        monkeypatch.setattr(overview_snapshot, "_sqlite_read", slow_read)
+        monkeypatch.setattr(overview_snapshot, "_pg_scalar", slow_pg)
+
+        start = time.perf_counter()
+        data = await overview_snapshot.collect_overview(source_timeout=2.0)
+        elapsed = time.perf_counter() - start
+
+        # 6 queries × 0.2s sequentially would take ≥1.2s
+        assert elapsed < 0.8
+        assert data["projects"]["getdaytrends"]["total_runs"] == 3
+        assert data["projects"]["agriguard"]["products"] == 7
+
+    @pytest.mark.asyncio
+    async def test_cache_serves_snapshot_and_refreshes_in_background(self):
+        import asyncio
+
+        from overview_snapshot import OverviewSnapshotCache
+
+        calls = 0
+
+        async def collector():
+            nonlocal calls
+            calls += 1
+            return {"n": calls}
+
+        cache = OverviewSnapshotCache(collector=collector, ttl_seconds=60)
+        assert await cache.get() == {"n": 1}
+        assert await cache.get() == {"n": 1}
+        assert calls == 1
+
+        cache.ttl_seconds = 0
+        stale = await cache.get()
+        assert stale == {"n": 1}  # stale value returned immediately
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert calls == 2
+        cache.ttl_seconds = 60
+        assert await cache.get() == {"n": 2}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refresh_is_single_flight(self):
+        import asyncio
+
+        from overview_snapshot import OverviewSnapshotCache
+
+        calls = 0
+
+        async def collector():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"n": calls}
+
+        cache = OverviewSnapshotCache(collector=collector, ttl_seconds=60)
+        results = await asyncio.gather(*(cache.get() for _ in range(10)))
+
+        assert calls == 1
+        assert all(r == {"n": 1} for r in results)
+
+
+class TestSQLiteReadPool:
+
+    @pytest.fixture
+    def sample_db(self, tmp_path):
+        import sqlite3
+
+        db_path = tmp_path / "sample.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE runs (id INTEGER PRIMARY KEY)")
+        conn.executemany("INSERT INTO runs (id) VALUES (?)", [(1,), (2,), (3,)])
+        conn.commit()
+        conn.close()
+        return db_path
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused(self, sample_db):
+        from db_utils import SQLiteReadPool
+
+        pool = SQLiteReadPool(sample_db, max_size=2)
+        async with pool.acquire() as first:
+            pass
+        async with pool.acquire() as second:
+            pass
+
+        assert first is second
+        assert pool._opened == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_pool_is_read_only(self, sample_db):
+        import sqlite3
+
+        from db_utils import SQLiteReadPool
+
+        pool = SQLiteReadPool(sample_db)
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            async with pool.acquire() as conn:
+                await conn.execute("INSERT INTO runs (id) VALUES (4)")
+        # query errors don't poison the pooled connection
+        assert pool._opened == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_pool_caps_open_connections(self, sample_db):
+        import asyncio
+
+        from db_utils import SQLiteReadPool
+
+        pool = SQLiteReadPool(sample_db, max_size=2)
+        peak = 0
+
+        async def use():
+            nonlocal peak
+            async with pool.acquire() as conn:
+                peak = max(peak, pool._opened)
+                async with conn.execute("SELECT COUNT(*) FROM runs") as cursor:
+                    row = await cursor.fetchone()
+                await asyncio.sleep(0.01)
+                return row[0]
+
+        results = await asyncio.gather(*(use() for _ in range(8)))
+
+        assert results == [3] * 8
+        assert peak <= 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_cancel_during_open_releases_slot(self, sample_db, monkeypatch):
+        import asyncio
+
+        from db_utils import SQLiteReadPool
+
+        pool = SQLiteReadPool(sample_db, max_size=1)
+        real_open = pool._open
+
+        async def hanging_open():
+            await asyncio.sleep(10)
+
+        monkeypatch.setattr(pool, "_open", hanging_open)
+
+        async def use():
+            async with pool.acquire():
+                pass
+
+        for _ in range(3):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(use(), timeout=0.01)
+        assert pool._opened == 0
+
+        monkeypatch.setattr(pool, "_open", real_open)
+        await asyncio.wait_for(use(), timeout=5)
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_helpers_use_pool(self, sample_db):
+        import db_utils
+
+        try:
+            assert await db_utils._sqlite_scalar(sample_db, "SELECT COUNT(*) FROM runs") == 3
+            rows = await db_utils._sqlite_read(sample_db, "SELECT id FROM runs ORDER BY id")
+            assert [r["id"] for r in rows] == [1, 2, 3]
+            assert await db_utils._sqlite_read(sample_db, "SELECT * FROM missing") == []
+            assert db_utils._sqlite_pools[sample_db]._opened == 1
+        finally:
+            await db_utils.close_sqlite_pools()